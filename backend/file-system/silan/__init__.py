@@ -18,14 +18,33 @@ __email__ = "Silan.Hu@u.nus.edu"
 __description__ = "Lightweight database tools for markdown content synchronization"
 __url__ = "https://github.com/Qingbolan/AIPro-Resume"
 
-# Export main components
-from .silan import cli
-from .parsers import ParserFactory, ParsedContentCollection
-from .utils.config import ConfigManager
+# Export main components lazily so `silan --help` does not import parsers or SQLAlchemy
+_LAZY_EXPORTS = {
+    'cli': ('.silan', 'cli'),
+    'ParserFactory': ('.parsers', 'ParserFactory'),
+    'ParsedContentCollection': ('.parsers', 'ParsedContentCollection'),
+    'ConfigManager': ('.utils.config', 'ConfigManager'),
+}
 
 __all__ = [
     'cli',
     'ParserFactory',
     'ParsedContentCollection',
     'ConfigManager'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import exported components on first access"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    module_name, attr_name = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
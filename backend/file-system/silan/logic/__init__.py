@@ -1,16 +1,22 @@
 """Business logic layer for complex implementations"""
 
-from .database_sync_logic import DatabaseSyncLogic
-from .project_init_logic import ProjectInitLogic
-from .backend_logic import BackendLogic
-from .database_config_logic import DatabaseConfigLogic
-from .content_logic import ContentLogic
-from .status_logic import StatusLogic
-from .help_logic import HelpLogic
-from .cli_logic import CLILogic
+# Logic modules pull in heavy dependencies (SQLAlchemy, parsers, psutil), so they
+# are imported on first access instead of when the package is loaded.
+_LAZY_EXPORTS = {
+    'DatabaseSyncLogic': '.database_sync_logic',
+    'MultiRootSyncLogic': '.multi_root_sync_logic',
+    'ProjectInitLogic': '.project_init_logic',
+    'BackendLogic': '.backend_logic',
+    'DatabaseConfigLogic': '.database_config_logic',
+    'ContentLogic': '.content_logic',
+    'StatusLogic': '.status_logic',
+    'HelpLogic': '.help_logic',
+    'CLILogic': '.cli_logic',
+}
 
 __all__ = [
     'DatabaseSyncLogic',
+    'MultiRootSyncLogic',
     'ProjectInitLogic', 
     'BackendLogic',
     'DatabaseConfigLogic',
@@ -18,4 +24,19 @@ __all__ = [
     'StatusLogic',
     'HelpLogic',
     'CLILogic'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import logic classes on first access"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,11 +6,19 @@ import json
 import psutil
 import shutil
 import platform
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 
 from ..core.exceptions import ValidationError
 from ..utils import ModernLogger, FileOperations, DataValidator, CLIInterface
+from ..utils.log_tail import LogFilter, tail_lines, follow as follow_log
+from ..utils.process_monitor import ProcessMonitor, ResourceSample, SUMMARY_METRICS
+from ..server.backend_supervisor import ROLLING_RESTART_REQUEST, SPEC_FILE, STATE_FILE, STOP_TIMEOUT
+from ..utils.readiness import (
+    DEFAULT_HEALTH_PATH, DEFAULT_READY_TIMEOUT, ReadinessResult, port_in_use, wait_until_ready,
+    wait_until_released
+)
 
 
 class BackendLogic(ModernLogger):
@@ -29,6 +37,11 @@ class BackendLogic(ModernLogger):
         self.log_file = self.silan_dir / "backend.log"
         self.config_file = self.silan_dir / "backend_config.json"
         
+        # Multi-instance supervisor files
+        self.supervisor_spec_file = self.silan_dir / SPEC_FILE
+        self.instances_file = self.silan_dir / STATE_FILE
+        self.rolling_restart_file = self.silan_dir / ROLLING_RESTART_REQUEST
+        
         # Ensure directories exist
         self.file_ops.ensure_directory(self.silan_dir)
     
@@ -63,6 +76,8 @@ class BackendLogic(ModernLogger):
                 self._validate_start_config(config)
             elif action == 'logs' and config:
                 self._validate_logs_config(config)
+            elif action == 'top' and config:
+                self._validate_top_config(config)
             
             return True
             
@@ -91,11 +106,35 @@ class BackendLogic(ModernLogger):
             
             if 'port' in server_config:
                 DataValidator.validate_integer(server_config['port'], 'port', 1, 65535)
+        
+        if config.get('instances') is not None:
+            instances = DataValidator.validate_integer(config['instances'], 'instances', 1, 64)
+            base_port = config.get('server', {}).get('port', 8888)
+            if base_port + instances - 1 > 65535:
+                raise ValidationError(f"{instances} instances from port {base_port} run past port 65535", 'instances')
+        
+        if config.get('readiness'):
+            readiness_config = config['readiness']
+            DataValidator.validate_dict(readiness_config, 'readiness_config')
+            
+            if readiness_config.get('timeout') is not None:
+                DataValidator.validate_integer(readiness_config['timeout'], 'ready_timeout', 1, 600)
+    
+    def _validate_top_config(self, config: Dict[str, Any]) -> None:
+        """Validate top configuration"""
+        if config.get('count') is not None:
+            DataValidator.validate_integer(config['count'], 'count', 1)
+        
+        if 'history' in config:
+            DataValidator.validate_integer(config['history'], 'history', 1, 100000)
     
     def _validate_logs_config(self, config: Dict[str, Any]) -> None:
         """Validate logs configuration"""
         if 'lines' in config:
             DataValidator.validate_integer(config['lines'], 'lines', 1, 10000)
+        
+        # Raises ValidationError for an unknown level or a bad pattern
+        LogFilter(config.get('level'), config.get('pattern'))
     
     def start_backend(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """Start the backend server"""
@@ -141,6 +180,24 @@ class BackendLogic(ModernLogger):
             host = server_config.get('host', '0.0.0.0')
             port = server_config.get('port', 8888)
             
+            instances = int(config.get('instances') or 1)
+            # A server left on the port would answer the readiness probe for the new one
+            busy = [item for item in range(port, port + instances) if port_in_use(host, item)]
+            if busy:
+                self.error(f"Port {busy[0]} is already in use; is another backend running?")
+                self.cli.display_error_panel(
+                    "Port In Use",
+                    f"Cannot start the backend on {host}:{busy[0]}",
+                    {
+                        "Solution 1": "Stop the process listening on the port",
+                        "Solution 2": "Start on another port with --server-port"
+                    }
+                )
+                return False
+            
+            if instances > 1:
+                return self._start_supervised(binary_path, config, host, port, instances)
+            
             self.backend_starting(host, port)
             
             # Build command
@@ -157,16 +214,25 @@ class BackendLogic(ModernLogger):
             self._save_backend_config(config)
             self._save_backend_pid(process.pid)
             
-            # Verify startup
-            time.sleep(2)
-            if process.poll() is not None:
-                self.error("Backend process exited immediately")
-                self._show_startup_logs()
+            # Wait until the server accepts requests
+            readiness = self._wait_for_ready(process, host, port, config)
+            if not readiness.ready:
+                if readiness.stage == 'exited':
+                    self.error("Backend process exited before it was ready")
+                    self._show_startup_logs()
+                else:
+                    self.error(
+                        f"Backend not ready after {readiness.elapsed:.1f}s "
+                        f"({readiness.stage} check: {readiness.error})"
+                    )
+                    self._show_startup_logs()
+                    self.info(f"Process {process.pid} is still running; stop it with 'silan backend stop'")
                 return False
             
             # Show success
             url = f"http://{host}:{port}"
             self.backend_started(process.pid, url)
+            self.info(f"⏱️ Ready in {readiness.elapsed_ms} ms ({readiness.attempts} probes)")
             
             self.cli.display_success_panel(
                 "Backend Started",
@@ -174,6 +240,7 @@ class BackendLogic(ModernLogger):
                 {
                     "PID": process.pid,
                     "URL": url,
+                    "Ready In": f"{readiness.elapsed_ms} ms",
                     "Mode": "Daemon" if daemon_mode else "Interactive",
                     "Log File": str(self.log_file)
                 }
@@ -219,6 +286,9 @@ class BackendLogic(ModernLogger):
             except psutil.NoSuchProcess:
                 self.warning(f"Process {pid} no longer exists")
             
+            # Instances left behind if the supervisor had to be killed
+            self._stop_stray_instances()
+            
             # Cleanup
             self._cleanup_backend_files()
             
@@ -237,6 +307,10 @@ class BackendLogic(ModernLogger):
     def restart_backend(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """Restart the backend server"""
         try:
+            # Supervised instances are restarted one at a time, keeping the rest serving
+            if not config and self.is_supervised():
+                return self._rolling_restart()
+            
             self.info("🔄 Restarting backend server...")
             
             # Load previous config if none provided
@@ -247,8 +321,12 @@ class BackendLogic(ModernLogger):
             if not self.stop_backend():
                 self.warning("Failed to stop cleanly, continuing with start")
             
-            # Wait for cleanup
-            time.sleep(2)
+            # Wait until the old instance has released its port
+            server_config = config.get('server', {})
+            host = server_config.get('host', '0.0.0.0')
+            port = server_config.get('port', 8888)
+            if not wait_until_released(host, port):
+                self.warning(f"Port {port} is still in use, starting anyway")
             
             # Start with config
             return self.start_backend(config)
@@ -273,6 +351,8 @@ class BackendLogic(ModernLogger):
                         "Database": status.get('database', 'Unknown')
                     }
                 )
+                if status.get('instances'):
+                    self._display_instances(status['instances'])
             else:
                 self.cli.display_info_panel(
                     "Backend Status - Not Running",
@@ -289,7 +369,8 @@ class BackendLogic(ModernLogger):
             self.error(f"Failed to get backend status: {e}")
             return False
     
-    def show_backend_logs(self, follow: bool = False, lines: int = 50) -> bool:
+    def show_backend_logs(self, follow: bool = False, lines: int = 50,
+                          level: Optional[str] = None, pattern: Optional[str] = None) -> bool:
         """Show backend server logs"""
         try:
             if not self.log_file.exists():
@@ -304,15 +385,24 @@ class BackendLogic(ModernLogger):
                 )
                 return True
             
-            self.info(f"📋 Showing backend logs (last {lines} lines)")
+            line_filter = LogFilter(level, pattern)
+            
+            if line_filter.active:
+                filters = ', '.join(
+                    part for part in (f"level >= {level}" if level else '', f"matching /{pattern}/" if pattern else '')
+                    if part
+                )
+                self.info(f"📋 Showing backend logs (last {lines} lines, {filters})")
+            else:
+                self.info(f"📋 Showing backend logs (last {lines} lines)")
             if follow:
                 self.info("Press Ctrl+C to stop following logs")
             
             # Show logs
             if follow:
-                return self._follow_logs(lines)
+                return self._follow_logs(lines, line_filter if line_filter.active else None)
             else:
-                return self._show_log_tail(lines)
+                return self._show_log_tail(lines, line_filter if line_filter.active else None)
                 
         except KeyboardInterrupt:
             self.info("\\nLog following stopped")
@@ -321,6 +411,161 @@ class BackendLogic(ModernLogger):
             self.error(f"Failed to show logs: {e}")
             return False
     
+    def monitor_backend(self, interval: float = 1.0, count: Optional[int] = None, json_output: bool = False,
+                        history: int = 300, health_path: Optional[str] = None,
+                        instance: Optional[int] = None) -> bool:
+        """Sample the running backend's resources at a fixed interval"""
+        pid = self._get_backend_pid()
+        if not pid or not self._is_process_running(pid):
+            self.error("Backend is not running")
+            return False
+        
+        config = self._load_backend_config()
+        server_config = config.get('server', {})
+        host = server_config.get('host', '0.0.0.0')
+        if health_path is None:
+            health_path = (config.get('readiness') or {}).get('health_path') or '/'
+        
+        targets = self._monitor_targets(pid, server_config.get('port', 8888), instance)
+        if not targets:
+            return False
+        
+        monitors: Dict[Optional[int], ProcessMonitor] = {}
+        for index, target_pid, port in targets:
+            try:
+                monitors[index] = ProcessMonitor(
+                    target_pid,
+                    host=host,
+                    port=port,
+                    health_path=health_path or None,
+                    history=history
+                )
+            except psutil.Error as e:
+                self.error(f"Cannot monitor backend process {target_pid}: {e}")
+                return False
+        
+        if json_output:
+            self._monitor_json(monitors, interval, count)
+        else:
+            self._monitor_live(monitors, interval, count)
+        return True
+    
+    def _monitor_targets(self, pid: int, port: int,
+                         instance: Optional[int]) -> List[Tuple[Optional[int], int, int]]:
+        """(instance index, PID, port) to sample: the supervised instances, or the single server"""
+        instances = self._load_instance_state().get('instances', [])
+        if not instances:
+            if instance is not None:
+                self.error("--instance needs a backend started with --instances")
+                return []
+            return [(None, pid, port)]
+        
+        # The PID file names the supervisor; the Go servers are its children
+        targets = [
+            (item['index'], item['pid'], item['port']) for item in instances
+            if item.get('pid') and (instance is None or item['index'] == instance)
+        ]
+        if not targets:
+            if instance is None:
+                self.error("No backend instance is running")
+            else:
+                self.error(f"Backend instance {instance} is not running")
+        return targets
+    
+    def _monitor_samples(self, monitors: Dict[Optional[int], ProcessMonitor], interval: float,
+                         count: Optional[int]) -> Iterator[Dict[Optional[int], ResourceSample]]:
+        """Yield samples of every monitor on a fixed schedule until count, Ctrl+C or all exited"""
+        live = dict(monitors)
+        taken = 0
+        next_tick = time.monotonic() + interval
+        try:
+            while live and (count is None or taken < count):
+                # Sleep to the next tick so sampling time does not drift the interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+                next_tick += interval
+                samples: Dict[Optional[int], ResourceSample] = {}
+                for index, monitor in list(live.items()):
+                    try:
+                        samples[index] = monitor.sample()
+                    except psutil.NoSuchProcess:
+                        self.warning(f"{self._monitor_label(index)} process {monitor.pid} exited")
+                        del live[index]
+                if not samples:
+                    return
+                taken += 1
+                yield samples
+        except KeyboardInterrupt:
+            return
+    
+    def _monitor_json(self, monitors: Dict[Optional[int], ProcessMonitor], interval: float,
+                      count: Optional[int]) -> None:
+        """Print one JSON line per sample, then a summary line per process"""
+        for samples in self._monitor_samples(monitors, interval, count):
+            for index, sample in samples.items():
+                print(json.dumps({'sample': dict(vars(sample), **self._monitor_ids(index, monitors[index]))}),
+                      flush=True)
+        for index, monitor in monitors.items():
+            print(json.dumps({'summary': monitor.summary(), **self._monitor_ids(index, monitor)}), flush=True)
+    
+    @staticmethod
+    def _monitor_ids(index: Optional[int], monitor: ProcessMonitor) -> Dict[str, Any]:
+        """PID, plus the instance index under a supervisor"""
+        ids: Dict[str, Any] = {'pid': monitor.pid}
+        if index is not None:
+            ids['instance'] = index
+        return ids
+    
+    @staticmethod
+    def _monitor_label(index: Optional[int]) -> str:
+        return "Backend" if index is None else f"Backend instance {index}"
+    
+    def _monitor_live(self, monitors: Dict[Optional[int], ProcessMonitor], interval: float,
+                      count: Optional[int]) -> None:
+        """Redraw a resource table per process after every sample"""
+        from rich.console import Group
+        from rich.live import Live
+        
+        def render(samples: Dict[Optional[int], ResourceSample]) -> Group:
+            return Group(*(
+                self._render_top(index, monitor, samples.get(index)) for index, monitor in monitors.items()
+            ))
+        
+        with Live(render({}), console=self.cli.console, auto_refresh=False) as live:
+            for samples in self._monitor_samples(monitors, interval, count):
+                live.update(render(samples), refresh=True)
+        
+        for index, monitor in monitors.items():
+            growth = monitor.summary()['growth']
+            if growth:
+                self.info(f"{self._monitor_label(index)} growth over window: "
+                          + ", ".join(f"{name} {value:+g}" for name, value in growth.items()))
+    
+    def _render_top(self, index: Optional[int], monitor: ProcessMonitor, sample: Optional[ResourceSample]):
+        """Current values with percentiles over the ring buffer"""
+        from rich.table import Table
+        
+        summary = monitor.summary()
+        table = Table(
+            title=f"{self._monitor_label(index)} PID {monitor.pid} (port {monitor.port}) - "
+                  f"{summary['samples']} samples over {summary['window_seconds']}s",
+            caption=f"health failures: {summary['health_failures']}" if sample else "collecting first sample..."
+        )
+        table.add_column("Metric", style="cyan")
+        for column in ("Now", "p50", "p95", "p99", "Max"):
+            table.add_column(column, justify="right")
+        
+        for name in SUMMARY_METRICS:
+            stats = summary['metrics'].get(name)
+            if not stats:
+                table.add_row(name, "-", "-", "-", "-", "-")
+                continue
+            last = getattr(sample, name) if sample else None
+            table.add_row(name, *(
+                "-" if value is None else f"{value:g}"
+                for value in (last, stats['p50'], stats['p95'], stats['p99'], stats['max'])
+            ))
+        return table
+    
     def install_backend(self) -> bool:
         """Install/build the backend binary"""
         try:
@@ -422,7 +667,8 @@ class BackendLogic(ModernLogger):
                 'pid': pid,
                 'url': f"http://{host}:{port}",
                 'uptime': uptime,
-                'database': database
+                'database': database,
+                'instances': self._load_instance_state().get('instances', [])
             }
             
         except Exception as e:
@@ -501,6 +747,190 @@ class BackendLogic(ModernLogger):
             self.error(f"Failed to start backend process: {e}")
             return None
     
+    def is_supervised(self) -> bool:
+        """Whether the running backend is a supervisor managing several instances"""
+        return self._is_backend_running() and self.instances_file.exists()
+    
+    def _start_supervised(self, binary_path: Path, config: Dict[str, Any], host: str, port: int,
+                          instances: int) -> bool:
+        """Start instances on consecutive ports under a supervisor process"""
+        self.stage(f"Starting {instances} backend instances at {host}:{port}-{port + instances - 1}")
+        
+        readiness_config = config.get('readiness') or {}
+        health_path = readiness_config.get('health_path') or DEFAULT_HEALTH_PATH
+        ready_timeout = float(readiness_config.get('timeout') or DEFAULT_READY_TIMEOUT)
+        
+        spec = {
+            'host': host,
+            'health_path': health_path,
+            'ready_timeout': ready_timeout,
+            'cwd': str(self.project_dir),
+            'log_file': str(self.log_file),
+            'instances': [
+                {
+                    'index': index,
+                    'port': port + index,
+                    'command': self._build_start_command(
+                        binary_path, dict(config, server=dict(config.get('server', {}), port=port + index))
+                    )
+                }
+                for index in range(instances)
+            ]
+        }
+        self.file_ops.write_file(self.supervisor_spec_file, json.dumps(spec, indent=2))
+        if self.instances_file.exists():
+            self.file_ops.delete_file(self.instances_file)
+        
+        cmd = [sys.executable, '-m', 'silan.server.backend_supervisor', str(self.silan_dir)]
+        daemon_mode = config.get('daemon', False)
+        supervisor = self._start_backend_process(cmd, daemon_mode)
+        if not supervisor:
+            return False
+        
+        self._save_backend_config(config)
+        self._save_backend_pid(supervisor.pid)
+        
+        # Instances start together, so they share one deadline and start time
+        started = time.monotonic()
+        deadline = started + ready_timeout
+        ready_ms = {}
+        for index in range(instances):
+            readiness = wait_until_ready(
+                host, port + index,
+                health_path=health_path,
+                timeout=max(0.0, deadline - time.monotonic()),
+                is_alive=lambda: supervisor.poll() is None
+            )
+            if not readiness.ready:
+                self.error(f"Instance {index} on port {port + index} not ready "
+                           f"({readiness.stage} check: {readiness.error})")
+                self._show_startup_logs()
+                if supervisor.poll() is None:
+                    self.info(f"The supervisor (PID {supervisor.pid}) keeps retrying; "
+                              f"stop it with 'silan backend stop'")
+                return False
+            ready_ms[index] = round((time.monotonic() - started) * 1000, 1)
+        
+        instance_state = self._load_instance_state().get('instances', [])
+        self._display_instances(instance_state, ready_ms)
+        
+        self.backend_started(supervisor.pid, f"http://{host}:{port}-{port + instances - 1}")
+        self.cli.display_success_panel(
+            "Backend Started",
+            f"{instances} backend instances started under a supervisor",
+            {
+                "Supervisor PID": supervisor.pid,
+                "URLs": f"http://{host}:{port} ... http://{host}:{port + instances - 1}",
+                "All Ready In": f"{max(ready_ms.values())} ms",
+                "Mode": "Daemon" if daemon_mode else "Interactive",
+                "Log File": str(self.log_file)
+            }
+        )
+        return True
+    
+    def _rolling_restart(self) -> bool:
+        """Ask the supervisor to restart its instances one at a time and wait for it"""
+        state = self._load_instance_state()
+        instances = len(state.get('instances', []))
+        finished = state.get('rollouts_finished', 0)
+        
+        readiness_config = self._load_backend_config().get('readiness') or {}
+        ready_timeout = float(readiness_config.get('timeout') or DEFAULT_READY_TIMEOUT)
+        
+        self.info(f"🔄 Rolling restart of {instances} backend instances...")
+        self.file_ops.write_file(self.rolling_restart_file, str(time.time()))
+        
+        started = time.monotonic()
+        deadline = started + instances * (ready_timeout + STOP_TIMEOUT) + 5
+        while time.monotonic() < deadline:
+            time.sleep(0.25)
+            if not self._is_backend_running():
+                self.error("Backend supervisor exited during the rolling restart")
+                return False
+            state = self._load_instance_state()
+            # Changes when the rollout ends, whether or not every instance came back
+            if state.get('rollouts_finished', 0) > finished:
+                break
+        else:
+            self.error("Timed out waiting for the rolling restart")
+            return False
+        
+        if state.get('last_rollout_error'):
+            self.error(f"Rolling restart stopped: {state['last_rollout_error']}")
+            self._display_instances(state.get('instances', []))
+            return False
+        
+        self._display_instances(state.get('instances', []))
+        self.cli.display_success_panel(
+            "Backend Restarted",
+            f"{instances} instances restarted one at a time",
+            {"Duration": f"{time.monotonic() - started:.1f}s"}
+        )
+        return True
+    
+    def _load_instance_state(self) -> Dict[str, Any]:
+        """Read the supervisor's instance state, empty if there is none"""
+        try:
+            with open(self.instances_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _display_instances(self, instances: List[Dict[str, Any]],
+                           ready_ms: Optional[Dict[int, float]] = None) -> None:
+        """Show supervised instances as a table"""
+        headers = ["Instance", "Port", "PID", "Status", "Restarts"]
+        if ready_ms:
+            headers.append("Ready In")
+        rows = []
+        for instance in instances:
+            row = [
+                str(instance['index']),
+                str(instance['port']),
+                str(instance.get('pid') or '-'),
+                instance.get('status', 'unknown'),
+                str(instance.get('restarts', 0))
+            ]
+            if ready_ms:
+                row.append(f"{ready_ms.get(instance['index'], '-')} ms")
+            rows.append(row)
+        self.cli.display_table("Backend Instances", headers, rows)
+    
+    def _stop_stray_instances(self) -> None:
+        """Stop instances still running from the supervisor's last known state"""
+        binary_path = str(self._get_binary_path())
+        for instance in self._load_instance_state().get('instances', []):
+            pid = instance.get('pid')
+            if not pid:
+                continue
+            try:
+                process = psutil.Process(pid)
+                # Skip PIDs that have since been reused by another program
+                if binary_path not in process.cmdline()[:1]:
+                    continue
+                process.terminate()
+                try:
+                    process.wait(timeout=STOP_TIMEOUT)
+                except psutil.TimeoutExpired:
+                    process.kill()
+                self.warning(f"Stopped stray backend instance {instance['index']} (PID: {pid})")
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    
+    def _wait_for_ready(self, process: subprocess.Popen, host: str, port: int,
+                        config: Dict[str, Any]) -> ReadinessResult:
+        """Poll the new server until it answers, giving up if the process exits"""
+        readiness_config = config.get('readiness') or {}
+        timeout = readiness_config.get('timeout')
+        health_path = readiness_config.get('health_path') or DEFAULT_HEALTH_PATH
+        
+        return wait_until_ready(
+            host, port,
+            health_path=health_path,
+            timeout=float(timeout) if timeout is not None else DEFAULT_READY_TIMEOUT,
+            is_alive=lambda: process.poll() is None
+        )
+    
     def _show_start_configuration(self, config: Dict[str, Any]) -> None:
         """Show backend start configuration"""
         if not config:
@@ -650,8 +1080,9 @@ class BackendLogic(ModernLogger):
     def _cleanup_backend_files(self) -> None:
         """Clean up backend PID and config files"""
         try:
-            if self.pid_file.exists():
-                self.file_ops.delete_file(self.pid_file)
+            for path in (self.pid_file, self.instances_file, self.supervisor_spec_file, self.rolling_restart_file):
+                if path.exists():
+                    self.file_ops.delete_file(path)
         except Exception as e:
             self.error(f"Failed to cleanup backend files: {e}")
     
@@ -664,58 +1095,31 @@ class BackendLogic(ModernLogger):
         except Exception:
             pass
     
-    def _show_log_tail(self, lines: int) -> bool:
+    def _show_log_tail(self, lines: int, line_filter: Optional[LogFilter] = None) -> bool:
         """Show last N lines of logs"""
         try:
-            # Try using tail command first
-            try:
-                result = subprocess.run(
-                    ['tail', '-n', str(lines), str(self.log_file)],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                print(result.stdout)
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # Fallback to Python implementation
-                with open(self.log_file, 'r') as f:
-                    all_lines = f.readlines()
-                    for line in all_lines[-lines:]:
-                        print(line.rstrip())
-                return True
+            for line in tail_lines(str(self.log_file), lines, line_filter):
+                print(line)
+            return True
                 
         except Exception as e:
             self.error(f"Failed to show log tail: {e}")
             return False
     
-    def _follow_logs(self, lines: int) -> bool:
+    def _follow_logs(self, lines: int, line_filter: Optional[LogFilter] = None) -> bool:
         """Follow logs in real-time"""
         try:
             # Show initial lines
-            self._show_log_tail(lines)
-            
-            # Follow new lines
-            process = subprocess.Popen(
-                ['tail', '-f', str(self.log_file)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            self._show_log_tail(lines, line_filter)
             
-            if process.stdout is None:
-                self.error("Failed to capture stdout from tail process")
-                return False
-            
-            try:
-                for line in process.stdout:
-                    print(line.rstrip())
-            except KeyboardInterrupt:
-                process.terminate()
-                return True
+            # Follow new lines, surviving rotation and truncation
+            for line in follow_log(str(self.log_file), line_filter):
+                print(line, flush=True)
             
             return True
                 
+        except KeyboardInterrupt:
+            return True
         except Exception as e:
             self.error(f"Failed to follow logs: {e}")
             return False
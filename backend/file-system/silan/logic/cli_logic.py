@@ -1,10 +1,9 @@
 """CLI application business logic"""
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 
 from ..utils import ModernLogger
-from ..cli.status import execute_status_command
 
 class SilanCLILogger(ModernLogger):
     """Specialized logger for CLI application"""
@@ -53,12 +52,22 @@ class CLILogic(SilanCLILogger):
             'help': self._handle_help
         }
     
-    def run_application(self, ctx, verbose: bool = False) -> None:
+    def run_application(self, ctx, verbose: bool = False, quiet: bool = False,
+                        log_json: Optional[str] = None) -> None:
         """Run the main CLI application"""
         try:
+            # Quiet mode is forced by --quiet, otherwise detected from stdout
+            if quiet:
+                self.set_quiet(True)
+            
+            if log_json:
+                self.enable_json_log(log_json)
+            
             if verbose:
+                self.set_verbose(True)
                 self.debug("Verbose mode enabled")
             
+            self.install_tracebacks()
             self.app_start(self.version)
             
         except Exception as e:
@@ -107,7 +116,11 @@ class CLILogic(SilanCLILogger):
                        password: Optional[str] = None, database: Optional[str] = None,
                        db_path: str = 'portfolio.db', dry_run: bool = False,
                        create_tables: bool = False, start_backend: bool = False,
-                       use_cache: bool = True, **kwargs) -> bool:
+                       use_cache: bool = True, image_derivatives: Optional[bool] = None,
+                       profile: bool = False, profile_output: Optional[str] = None,
+                       since_commit: Optional[str] = None, shard: Optional[str] = None,
+                       finalize: bool = False, resume: bool = False,
+                       roots: Optional[Sequence[str]] = None, **kwargs) -> bool:
         """Handle db-sync command"""
         from .database_sync_logic import DatabaseSyncLogic
         from ..utils import ConfigManager
@@ -138,7 +151,13 @@ class CLILogic(SilanCLILogger):
         config_manager.save_last_sync_config(db_config, sync_options)
         
         # Execute sync
-        sync_logic = DatabaseSyncLogic(db_config, dry_run)
+        logic_options = dict(image_derivatives=image_derivatives, profile=profile, profile_output=profile_output,
+                             since_commit=since_commit, shard=shard, finalize=finalize, resume=resume)
+        if roots:
+            from .multi_root_sync_logic import MultiRootSyncLogic
+            sync_logic = MultiRootSyncLogic(db_config, roots, dry_run, **logic_options)
+        else:
+            sync_logic = DatabaseSyncLogic(db_config, dry_run, **logic_options)
         
         if not sync_logic.validate_configuration():
             return False
@@ -208,7 +227,18 @@ class CLILogic(SilanCLILogger):
         elif action == 'logs':
             return backend_logic.show_backend_logs(
                 follow=config.get('follow', False),
-                lines=config.get('lines', 50)
+                lines=config.get('lines', 50),
+                level=config.get('level'),
+                pattern=config.get('pattern')
+            )
+        elif action == 'top':
+            return backend_logic.monitor_backend(
+                interval=config.get('interval', 1.0),
+                count=config.get('count'),
+                json_output=config.get('json_output', False),
+                history=config.get('history', 300),
+                health_path=config.get('health_path'),
+                instance=config.get('instance')
             )
         elif action == 'install':
             return backend_logic.install_backend()
@@ -218,6 +248,7 @@ class CLILogic(SilanCLILogger):
     
     def _handle_status(self, **kwargs) -> bool:
         """Handle status command"""
+        from ..cli.status import execute_status_command
         return execute_status_command(self)
     
     def _handle_help(self, topic: Optional[str] = None, **kwargs) -> bool:
@@ -260,6 +291,12 @@ class CLILogic(SilanCLILogger):
         try:
             from .backend_logic import BackendLogic
             
+            backend_logic = BackendLogic()
+            if backend_logic.is_supervised():
+                # New content is picked up without dropping capacity to zero
+                self.info("🔄 Rolling restart of backend instances after sync...")
+                return backend_logic.restart_backend()
+            
             self.info("🚀 Starting backend server after sync...")
             
             backend_config = {
@@ -268,7 +305,6 @@ class CLILogic(SilanCLILogger):
                 'daemon': False
             }
             
-            backend_logic = BackendLogic()
             return backend_logic.start_backend(backend_config)
             
         except Exception as e:
@@ -1,12 +1,19 @@
 """Content management business logic"""
 
 import hashlib
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Deque, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..core.exceptions import ParsingError
 from ..parsers import ParserFactory
-from ..utils import ModernLogger, FileOperations, ContentValidator
+from ..parsers.frontmatter_reader import read_frontmatter
+from ..parsers.markdown_renderer import MarkdownRenderer
+from ..utils import ModernLogger, FileOperations, ContentValidator, DirectoryIndex, FolderManifest
+from ..utils.sync_profiler import NULL_PROFILER, SyncProfiler
 
 
 class ContentLogger(ModernLogger):
@@ -21,11 +28,11 @@ class ContentLogger(ModernLogger):
     
     def content_found(self, count: int, content_type: str) -> None:
         """Log content found"""
-        self.debug(f"Found {count} {content_type} files")
+        self.debug("Found %d %s files", count, content_type)
     
     def content_parsed(self, file_path: str) -> None:
         """Log successful content parsing"""
-        self.debug(f"✅ Parsed: {file_path}")
+        self.debug("✅ Parsed: %s", file_path, extra={'path': file_path})
     
     def content_parse_error(self, file_path: str, error: str) -> None:
         """Log content parsing error"""
@@ -35,13 +42,13 @@ class ContentLogger(ModernLogger):
 class ContentLogic(ContentLogger):
     """Business logic for content file operations and management"""
     
-    def __init__(self):
+    def __init__(self, project_dir: Optional[Path] = None):
         super().__init__()
         self.file_ops = FileOperations(self)
         self.parser_factory = ParserFactory()
         
         # Configuration
-        self.project_dir = Path.cwd()
+        self.project_dir = Path(project_dir).resolve() if project_dir else Path.cwd()
         self.content_dir = self.project_dir / "content"
         
         # Content type mappings
@@ -53,8 +60,35 @@ class ContentLogic(ContentLogger):
             'resume': self.content_dir / 'resume'
         }
         
+        # Directory listings are persisted so unchanged folders are not re-walked
+        self.dir_index = DirectoryIndex(
+            self.project_dir,
+            self.project_dir / '.silan' / 'cache' / 'directory_index.json',
+            logger=self
+        )
+        
         # Cache
         self._content_cache: Optional[List[Dict[str, Any]]] = None
+        self._discovery_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._folder_manifests: Dict[str, FolderManifest] = {}
+        self._item_hashes: Dict[str, str] = {}
+        
+        # Set by the sync to render bodies to HTML while parsing
+        self.renderer: Optional[MarkdownRenderer] = None
+        # Set by the sync to time discovery, hashing and parsing stages
+        self.profiler: SyncProfiler = NULL_PROFILER
+        # Set by the sync to limit discovery to items touching these project-relative paths
+        self._changed_paths: Optional[Set[str]] = None
+        self._changed_dirs: Set[str] = set()
+        self._changed_asset_dirs: Set[str] = set()
+        # Set by the sync to keep only the items of shard (index, count)
+        self.shard: Optional[Tuple[int, int]] = None
+        # Set by a resumed sync: content id -> hash of items an interrupted run already wrote
+        self.completed_items: Dict[str, str] = {}
+        self.resumed_ids: Set[str] = set()
+        self.stale_ids: Set[str] = set()
+        # Set by a multi-root sync so every root parses on one shared pool
+        self.parser_pool: Optional[ThreadPoolExecutor] = None
     
     def analyze_content_for_sync(self) -> Dict[str, Any]:
         """Analyze content directory for synchronization"""
@@ -167,25 +201,7 @@ class ContentLogic(ContentLogger):
     def get_all_content_for_sync(self) -> List[Dict[str, Any]]:
         """Get all parsed content ready for database synchronization"""
         try:
-            content_items = []
-            
-            for content_type, type_dir in self.content_types.items():
-                if not type_dir.exists():
-                    continue
-                
-                # Get content items for this type (handles both files and folders)
-                type_content_items = self._get_content_items_for_type(type_dir, content_type)
-                
-                for content_item in type_content_items:
-                    try:
-                        parsed_item = self._parse_content_item(content_item, content_type)
-                        if parsed_item:
-                            content_items.append(parsed_item)
-                            self.content_parsed(content_item['path'])
-                        
-                    except Exception as e:
-                        self.content_parse_error(content_item['path'], str(e))
-                        continue
+            content_items = list(self.iter_content_for_sync())
             
             self.info(f"📝 Parsed {len(content_items)} content files for sync")
             return content_items
@@ -194,26 +210,172 @@ class ContentLogic(ContentLogger):
             self.error(f"Failed to get content for sync: {e}")
             return []
     
+    def iter_content_for_sync(self, lookahead: int = 32, workers: int = 1) -> Iterator[Dict[str, Any]]:
+        """Yield parsed content lazily, parsing at most `lookahead` items ahead of the consumer"""
+        lookahead = max(1, lookahead)
+        
+        # workers=0 parses in the consumer's thread, e.g. so cProfile sees the parsers
+        if workers <= 0:
+            for content_type, content_item in self.iter_content_items():
+                parsed_item = self.parse_sync_item(content_type, content_item)
+                if parsed_item:
+                    yield parsed_item
+            return
+        
+        if self.parser_pool is not None:
+            yield from self._iter_parsed(self.parser_pool, lookahead)
+            return
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="silan-parse") as executor:
+            yield from self._iter_parsed(executor, lookahead)
+    
+    def _iter_parsed(self, executor: ThreadPoolExecutor, lookahead: int) -> Iterator[Dict[str, Any]]:
+        """Submit discovered items to the parser pool, yielding results with `lookahead` in flight"""
+        # Futures are consumed in discovery order so translations follow their English posts
+        pending: Deque["Future[Optional[Dict[str, Any]]]"] = deque()
+        
+        for content_type, content_item in self.iter_content_items():
+            pending.append(executor.submit(self.parse_sync_item, content_type, content_item))
+            
+            if len(pending) >= lookahead:
+                parsed_item = pending.popleft().result()
+                if parsed_item:
+                    yield parsed_item
+        
+        while pending:
+            parsed_item = pending.popleft().result()
+            if parsed_item:
+                yield parsed_item
+    
+    def iter_content_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Discover content items to sync type by type without parsing them"""
+        for content_type, type_dir in self.content_types.items():
+            if not type_dir.exists():
+                continue
+            
+            # Get content items for this type (handles both files and folders)
+            for content_item in self._get_content_items_for_type(type_dir, content_type):
+                if self._changed_paths is not None and not self._item_changed(content_item):
+                    continue
+                if self.shard is not None and not self.in_shard(content_type, content_item):
+                    continue
+                if self.completed_items and self._already_synced(content_type, content_item):
+                    continue
+                yield content_type, content_item
+    
+    def _already_synced(self, content_type: str, content_item: Dict[str, Any]) -> bool:
+        """Whether a checkpointed item is unchanged since it was written"""
+        content_id = self._generate_content_id_from_item(content_type, content_item)
+        completed_hash = self.completed_items.get(content_id)
+        if completed_hash is None:
+            return False
+        if self.item_hash(content_item) == completed_hash:
+            self.resumed_ids.add(content_id)
+            self._release_folder_manifest(content_item)
+            return True
+        # Edited after the interrupted run wrote it
+        self.stale_ids.add(content_id)
+        return False
+    
+    def limit_to_paths(self, paths: Optional[Iterable[str]], deleted: Iterable[str] = ()) -> None:
+        """Only discover items touching these project-relative paths; None discovers everything.
+
+        Deleted paths mark their folders as changed but never match an item themselves.
+        """
+        if paths is None:
+            self._changed_paths = None
+            self._changed_dirs = set()
+            self._changed_asset_dirs = set()
+            return
+        
+        self._changed_paths = {Path(path).as_posix() for path in paths}
+        touched = self._changed_paths | {Path(path).as_posix() for path in deleted}
+        # Folder items (projects, ideas) change when anything inside them changes
+        self._changed_dirs = {
+            parent.as_posix() for path in touched for parent in Path(path).parents
+        }
+        # Posts in a prefixed blog folder share its config and assets, but not each other's text
+        self._changed_asset_dirs = {
+            parent.as_posix() for path in touched if not path.endswith('.md')
+            for parent in Path(path).parents
+        }
+    
+    def _item_changed(self, content_item: Dict[str, Any]) -> bool:
+        """Whether a discovered item is affected by the changed paths"""
+        try:
+            relative = Path(content_item['path']).relative_to(self.project_dir).as_posix()
+        except ValueError:
+            return True
+        
+        if content_item['type'] == 'folder':
+            return relative in self._changed_dirs
+        if content_item.get('folder_prefix'):
+            folder = next(
+                (parent for parent in Path(relative).parents if parent.name == content_item['folder_prefix']), None
+            )
+            if folder is not None and folder.as_posix() in self._changed_asset_dirs:
+                return True
+        return relative in (self._changed_paths or set())
+    
+    def shard_key(self, content_type: str, content_item: Dict[str, Any]) -> str:
+        """Key an item is partitioned on: its content id, or its folder for prefixed blog folders"""
+        if content_item.get('folder_prefix'):
+            # Translations look up the English post in their folder, so a folder stays together
+            return f"{content_type}_{content_item['folder_prefix']}"
+        return self._generate_content_id_from_item(content_type, content_item)
+    
+    def in_shard(self, content_type: str, content_item: Dict[str, Any]) -> bool:
+        """Whether an item belongs to the configured shard, by a hash stable across machines"""
+        if self.shard is None:
+            return True
+        index, count = self.shard
+        digest = hashlib.sha1(self.shard_key(content_type, content_item).encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') % count == index
+    
+    def count_content_items(self) -> int:
+        """Count content items to sync using discovery only"""
+        return sum(1 for _ in self.iter_content_items())
+    
+    def parse_sync_item(self, content_type: str, content_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse a single discovered content item into a sync item"""
+        try:
+            parsed_item = self._parse_content_item(content_item, content_type)
+            if parsed_item:
+                self.content_parsed(content_item['path'])
+            return parsed_item
+        except Exception as e:
+            self.content_parse_error(content_item['path'], str(e))
+            return None
+        finally:
+            self._release_folder_manifest(content_item)
+    
     def _get_content_items_for_type(self, type_dir: Path, content_type: str) -> List[Dict[str, Any]]:
         """Get content items for a specific content type, handling both files and folders"""
+        # Discovery is cached for the rest of this run
+        cache_key = str(type_dir)
+        if cache_key in self._discovery_cache:
+            return self._discovery_cache[cache_key]
+        
         content_items = []
+        dir_names, file_names = self.dir_index.listdir(type_dir)
         
         # Handle different content types with their specific structures
         if content_type in ['projects', 'ideas']:
             # For projects and ideas, look for both folders with README.md files AND standalone .md files
-            for item in type_dir.iterdir():
-                if item.is_dir():
-                    # Check if this folder has a README.md file (main content)
-                    readme_path = item / 'README.md'
-                    if readme_path.exists():
-                        content_items.append({
-                            'type': 'folder',
-                            'path': str(item),
-                            'main_file': str(readme_path),
-                            'name': item.name
-                        })
-                elif item.is_file() and item.suffix == '.md':
+            for dir_name in dir_names:
+                item = type_dir / dir_name
+                # Check if this folder has a README.md file (main content)
+                if 'README.md' in self.dir_index.listdir(item)[1]:
+                    content_items.append({
+                        'type': 'folder',
+                        'path': str(item),
+                        'main_file': str(item / 'README.md'),
+                        'name': item.name
+                    })
+            for file_name in file_names:
+                if file_name.endswith('.md'):
                     # Include standalone .md files as well
+                    item = type_dir / file_name
                     content_items.append({
                         'type': 'file',
                         'path': str(item),
@@ -223,43 +385,43 @@ class ContentLogic(ContentLogger):
         
         elif content_type in ['blog', 'updates']:
             # For blog and updates, handle both files and folders with prefixes
-            for item in type_dir.iterdir():
-                if item.is_dir():
-                    # Check for prefixed folders (vlog.*, blog.*, episode.*)
-                    if any(item.name.startswith(prefix) for prefix in ['vlog.', 'blog.', 'episode.']):
-                        # Look for markdown files in prefixed folder
-                        for md_file in item.rglob('*.md'):
-                            if md_file.is_file():
-                                content_items.append({
-                                    'type': 'file',
-                                    'path': str(md_file),
-                                    'main_file': str(md_file),
-                                    'name': f"{item.name}-{md_file.stem}",
-                                    'folder_prefix': item.name
-                                })
-                    else:
-                        # Recursively find all .md files in subdirectories
-                        for md_file in item.rglob('*.md'):
-                            if md_file.is_file():
-                                # Generate a meaningful name from the file path
-                                relative_path = md_file.relative_to(type_dir)
-                                name = md_file.stem
-                                
-                                # For updates, include date info in name if available
-                                if content_type == 'updates' and len(relative_path.parts) > 1:
-                                    # Extract date components from path like "2024/01/2024-01-01-ziyun2024-plan-launch.md"
-                                    date_parts = [part for part in relative_path.parts[:-1] if part.isdigit()]
-                                    if date_parts:
-                                        name = f"{'-'.join(date_parts)}-{md_file.stem}"
-                                
-                                content_items.append({
-                                    'type': 'file',
-                                    'path': str(md_file),
-                                    'main_file': str(md_file),
-                                    'name': name
-                                })
-                elif item.is_file() and item.suffix == '.md':
+            for dir_name in dir_names:
+                item = type_dir / dir_name
+                # Check for prefixed folders (vlog.*, blog.*, episode.*)
+                if any(item.name.startswith(prefix) for prefix in ['vlog.', 'blog.', 'episode.']):
+                    # Look for markdown files in prefixed folder
+                    for md_file in self.dir_index.walk_files(item, '.md'):
+                        content_items.append({
+                            'type': 'file',
+                            'path': str(md_file),
+                            'main_file': str(md_file),
+                            'name': f"{item.name}-{md_file.stem}",
+                            'folder_prefix': item.name
+                        })
+                else:
+                    # Recursively find all .md files in subdirectories
+                    for md_file in self.dir_index.walk_files(item, '.md'):
+                        # Generate a meaningful name from the file path
+                        relative_path = md_file.relative_to(type_dir)
+                        name = md_file.stem
+                        
+                        # For updates, include date info in name if available
+                        if content_type == 'updates' and len(relative_path.parts) > 1:
+                            # Extract date components from path like "2024/01/2024-01-01-ziyun2024-plan-launch.md"
+                            date_parts = [part for part in relative_path.parts[:-1] if part.isdigit()]
+                            if date_parts:
+                                name = f"{'-'.join(date_parts)}-{md_file.stem}"
+                        
+                        content_items.append({
+                            'type': 'file',
+                            'path': str(md_file),
+                            'main_file': str(md_file),
+                            'name': name
+                        })
+            for file_name in file_names:
+                if file_name.endswith('.md'):
                     # Direct .md files in the blog directory
+                    item = type_dir / file_name
                     content_items.append({
                         'type': 'file',
                         'path': str(item),
@@ -269,19 +431,19 @@ class ContentLogic(ContentLogger):
         
         elif content_type == 'resume':
             # For resume, look for resume.md or any .md file in the resume directory
-            for md_file in type_dir.rglob('*.md'):
-                if md_file.is_file():
-                    content_items.append({
-                        'type': 'file',
-                        'path': str(md_file),
-                        'main_file': str(md_file),
-                        'name': md_file.stem
-                    })
+            for md_file in self.dir_index.walk_files(type_dir, '.md'):
+                content_items.append({
+                    'type': 'file',
+                    'path': str(md_file),
+                    'main_file': str(md_file),
+                    'name': md_file.stem
+                })
         
         else:
             # Default: check for standalone markdown files in the root directory
-            for md_file in type_dir.glob('*.md'):
-                if md_file.is_file():
+            for file_name in file_names:
+                if file_name.endswith('.md'):
+                    md_file = type_dir / file_name
                     content_items.append({
                         'type': 'file',
                         'path': str(md_file),
@@ -289,6 +451,8 @@ class ContentLogic(ContentLogger):
                         'name': md_file.stem
                     })
         
+        self._discovery_cache[cache_key] = content_items
+        self.dir_index.save()
         return content_items
     
     def _parse_content_item(self, content_item: Dict[str, Any], content_type: str) -> Optional[Dict[str, Any]]:
@@ -301,6 +465,10 @@ class ContentLogic(ContentLogger):
             
             # Create parser instance
             parser = parser_class(self.content_dir)
+            parser.renderer = self.renderer
+            parser.profiler = self.profiler
+            self.profiler.instrument(parser, f"parse.{parser._get_content_type()}",
+                                     lambda name: name.startswith('_extract'))
             
             # Parse content based on type
             if content_item['type'] == 'folder':
@@ -314,9 +482,6 @@ class ContentLogic(ContentLogger):
                 
                 extracted_content = parser.parse_file(main_file_path, parser_metadata)
                 
-                # Calculate hash of the entire folder content
-                content_hash = self._calculate_folder_hash(Path(content_item['path']))
-                
             else:
                 # Use file parsing for standalone files
                 file_path = Path(content_item['main_file'])
@@ -327,14 +492,12 @@ class ContentLogic(ContentLogger):
                     parser_metadata['folder_prefix'] = content_item['folder_prefix']
                 
                 extracted_content = parser.parse_file(file_path, parser_metadata)
-                
-                # Calculate hash of the file content
-                content = self.file_ops.read_file(file_path)
-                content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
             
             if not extracted_content:
                 return None
             
+            content_hash = self.item_hash(content_item)
+            
             parsed_data = extracted_content.main_entity
             
             # For blog posts, ensure categories and tags are included in the data
@@ -349,6 +512,25 @@ class ContentLogic(ContentLogger):
             elif content_type == 'projects':
                 if hasattr(extracted_content, 'technologies') and extracted_content.technologies:
                     parsed_data['technologies'] = extracted_content.technologies
+                
+                # Gallery images: embedded ones plus the folder's assets
+                images = list(extracted_content.images)
+                if content_item['type'] == 'folder' and hasattr(parser, 'collect_asset_images'):
+                    folder_path = Path(content_item['path'])
+                    images.extend(parser.collect_asset_images(folder_path, self.get_folder_manifest(folder_path)))
+                if images:
+                    for i, image in enumerate(images):
+                        image['sort_order'] = i
+                    parsed_data['images'] = images
+            
+            # Carry the rendered body so the sync stores HTML instead of raw markdown only
+            if extracted_content.content_html:
+                parsed_data['content_html'] = extracted_content.content_html
+                parsed_data['toc'] = extracted_content.toc
+            
+            # Carry frontmatter dates parsed by the parser so the sync does not re-parse them
+            if extracted_content.dates:
+                parsed_data['dates'] = extracted_content.dates
             
             # Preserve original frontmatter for all content types
             if hasattr(extracted_content, 'metadata') and extracted_content.metadata:
@@ -359,7 +541,8 @@ class ContentLogic(ContentLogger):
             if hasattr(ContentValidator, f'validate_{content_type}_frontmatter'):
                 validator_method = getattr(ContentValidator, f'validate_{content_type}_frontmatter')
                 try:
-                    validated_frontmatter = validator_method(parsed_data.get('frontmatter', {}))
+                    with self.profiler.stage('validation'):
+                        validated_frontmatter = validator_method(parsed_data.get('frontmatter', {}))
                     parsed_data['frontmatter'] = validated_frontmatter
                 except Exception as e:
                     self.warning(f"Frontmatter validation failed for {content_item['path']}: {e}")
@@ -384,20 +567,37 @@ class ContentLogic(ContentLogger):
             self.error(f"Failed to parse content item {content_item['path']}: {e}")
             return None
     
+    def get_folder_manifest(self, folder_path: Path) -> FolderManifest:
+        """Get the single-walk file manifest of a content folder, kept until its item is parsed"""
+        key = str(folder_path)
+        manifest = self._folder_manifests.get(key)
+        if manifest is None:
+            manifest = FolderManifest.build(folder_path)
+            self._folder_manifests[key] = manifest
+        return manifest
+    
+    def _release_folder_manifest(self, content_item: Dict[str, Any]) -> None:
+        """Drop a folder's manifest once its item no longer needs it, so a run holds one per item in flight"""
+        self._folder_manifests.pop(str(Path(content_item['path'])), None)
+    
+    def item_hash(self, content_item: Dict[str, Any]) -> str:
+        """Hash of an item's content: the whole folder for folder items, else the main file"""
+        key = content_item['path']
+        content_hash = self._item_hashes.get(key)
+        if content_hash is None:
+            with self.profiler.stage('hashing'):
+                if content_item['type'] == 'folder':
+                    content_hash = self._calculate_folder_hash(Path(content_item['path']))
+                else:
+                    content = self.file_ops.read_file(Path(content_item['main_file']))
+                    content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+            self._item_hashes[key] = content_hash
+        return content_hash
+    
     def _calculate_folder_hash(self, folder_path: Path) -> str:
         """Calculate hash of folder content for change detection"""
-        hash_md5 = hashlib.md5()
-        
         # Hash all relevant files in the folder
-        for file_path in sorted(folder_path.rglob('*')):
-            if file_path.is_file() and file_path.suffix in ['.md', '.yaml', '.yml']:
-                try:
-                    content = self.file_ops.read_file(file_path)
-                    hash_md5.update(content.encode('utf-8'))
-                except Exception:
-                    continue
-        
-        return hash_md5.hexdigest()
+        return self.get_folder_manifest(folder_path).content_hash(self.file_ops.read_file)
     
     def _generate_content_id_from_item(self, content_type: str, content_item: Dict[str, Any]) -> str:
         """Generate unique content ID from content item"""
@@ -550,41 +750,54 @@ class ContentLogic(ContentLogger):
             summary = {
                 'total_files': 0,
                 'content_types': {},
+                'languages': {},
                 'recent_files': []
             }
             
-            all_content = self.get_all_content_with_hashes()
-            summary['total_files'] = len(all_content)
-            
-            # Count by type
-            for item in all_content:
-                content_type = item['type']
+            # Discovery and frontmatter headers are enough here; bodies are never read
+            recent = []
+            for content_type, content_item in self.iter_content_items():
+                summary['total_files'] += 1
                 summary['content_types'][content_type] = summary['content_types'].get(content_type, 0) + 1
+                
+                # Group by language from the frontmatter header
+                metadata = read_frontmatter(content_item['main_file'])
+                language = str(metadata.get('language', 'en'))
+                summary['languages'][language] = summary['languages'].get(language, 0) + 1
+                
+                try:
+                    modified = datetime.fromtimestamp(os.stat(content_item['path']).st_mtime)
+                except OSError:
+                    continue
+                recent.append((modified, content_item['name'], content_type))
             
             # Get recent files (last 5 modified)
-            sorted_content = sorted(all_content, 
-                                  key=lambda x: x['file_info']['modified'], 
-                                  reverse=True)
+            recent.sort(key=lambda entry: entry[0], reverse=True)
             summary['recent_files'] = [
                 {
-                    'name': item['name'],
-                    'type': item['type'],
-                    'modified': item['file_info']['modified'].isoformat()
+                    'name': name,
+                    'type': content_type,
+                    'modified': modified.isoformat()
                 }
-                for item in sorted_content[:5]
+                for modified, name, content_type in recent[:5]
             ]
             
             return summary
             
         except Exception as e:
             self.error(f"Failed to get content summary: {e}")
-            return {'total_files': 0, 'content_types': {}, 'recent_files': []}
+            return {'total_files': 0, 'content_types': {}, 'languages': {}, 'recent_files': []}
     
     def refresh_cache(self) -> None:
         """Clear and refresh content cache"""
         self._content_cache = None
+        self._discovery_cache = {}
+        self._folder_manifests = {}
+        self.dir_index.invalidate()
         self.get_all_content_with_hashes()
     
     def cleanup(self) -> None:
         """Clean up resources"""
-        self._content_cache = None
\ No newline at end of file
+        self._content_cache = None
+        self._discovery_cache = {}
+        self._folder_manifests = {}
\ No newline at end of file
@@ -1,25 +1,59 @@
 """Database synchronization business logic implementation"""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Union, List, Optional, cast
+from typing import Dict, Any, Union, List, Optional, Sequence, Tuple, cast
 from datetime import datetime, date
-from rich.progress import TaskID
-from sqlalchemy import create_engine, and_, text
+from rich.progress import Progress, TaskID
+from sqlalchemy import Column, Table, create_engine, and_, bindparam, delete, func, inspect, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker, Session
 
-from ..core.exceptions import DatabaseError, ValidationError
+from ..core.exceptions import ConfigurationError, DatabaseError, ValidationError
 from ..models import (
     Base, User, BlogPost, BlogTag, BlogPostTag, BlogPostTranslation,
     BlogCategory, BlogSeries, BlogSeriesTranslation, Project, ProjectTechnology,
-    ProjectDetail, Idea, RecentUpdate, PersonalInfo,
+    ProjectDetail, ProjectImage, Idea, RecentUpdate, PersonalInfo,
     Education, EducationDetail, WorkExperience, WorkExperienceDetail, Award, Publication, PublicationAuthor,
-    ResearchProject, ResearchProjectDetail, SocialLink
+    ResearchProject, ResearchProjectDetail, SocialLink, generate_uuid
 )
 from ..parsers import ParserFactory
-from ..utils import ModernLogger, CLIInterface, FileOperations, ConfigManager
+from ..parsers.frontmatter_reader import read_frontmatter
+from ..parsers.markdown_renderer import DEFAULT_BACKEND, MarkdownRenderer, create_backend
+from ..utils import (
+    ModernLogger, CLIInterface, FileOperations, ConfigManager, CollectionDiff, DataValidator,
+    diff_ordered_collection, parse_date, parse_datetime
+)
+from ..utils.git_changes import changed_since, dirty_paths, head_commit
+from ..utils.image_derivatives import ImageDerivativeStage, PIL_AVAILABLE
+from ..utils.logger import ThrottledProgress
+from ..utils.sql_stats import SCHEMA_TABLE, SQLStats
+from ..utils.sync_checkpoint import SyncCheckpoint
+from ..utils.sync_profiler import SyncProfiler
 from .content_logic import ContentLogic
 
+# Paths whose changes --since-commit looks at; anything outside content/ forces a full sync
+GIT_SYNC_PATHSPECS = ['content', 'silan.yaml']
+
+# create_all runs are retried this often when concurrent shards create the schema together
+SCHEMA_CREATE_ATTEMPTS = 5
+
+# ProjectImage columns written only when the image derivative stage runs
+IMAGE_DERIVATIVE_FIELDS = ('content_hash', 'width', 'height', 'blurhash', 'derivatives')
+
+
+@dataclass
+class SharedSyncResources:
+    """Database and parsing resources shared by the syncs of several portfolio roots"""
+    engine: Any
+    session_factory: Any
+    parser_pool: ThreadPoolExecutor
+    progress: Progress
+    # (table, lookup) -> id of committed shared rows such as tags, categories and series
+    shared_ids: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = field(default_factory=dict)
+
 
 class DatabaseSyncLogger(ModernLogger):
     """Specialized logger for database sync operations"""
@@ -34,7 +68,7 @@ class DatabaseSyncLogger(ModernLogger):
     
     def sync_progress(self, current: int, total: int, item_name: str) -> None:
         """Log sync progress"""
-        self.debug(f"Syncing ({current}/{total}): {item_name}")
+        self.debug("Syncing (%d/%d): %s", current, total, item_name, extra={'item': item_name})
     
     def sync_complete(self, success_count: int, error_count: int) -> None:
         """Log sync completion"""
@@ -47,21 +81,53 @@ class DatabaseSyncLogger(ModernLogger):
 class DatabaseSyncLogic(DatabaseSyncLogger):
     """Complex business logic for database synchronization"""
     
-    def __init__(self, database_config: Union[str, Dict[str, Any]], dry_run: bool = False):
+    def __init__(self, database_config: Union[str, Dict[str, Any]], dry_run: bool = False,
+                 image_derivatives: Optional[bool] = None, profile: bool = False,
+                 profile_output: Optional[str] = None, since_commit: Optional[str] = None,
+                 shard: Optional[str] = None, finalize: bool = False, resume: bool = False,
+                 project_dir: Optional[Path] = None, shared: Optional[SharedSyncResources] = None):
         super().__init__()
         self.database_config = database_config
         self.dry_run = dry_run
+        # None defers to the images.derivatives setting in silan.yaml
+        self.image_derivatives = image_derivatives
+        self.image_stage: Optional[ImageDerivativeStage] = None
+        # Commit to sync changes since; 'last' reads it from .silan/last_sync.json
+        self.since_commit = since_commit
+        self.git_state: Dict[str, Any] = {}
+        # 'i/N' syncs only the i-th of N hash partitions; finalize recomputes aggregates after all shards
+        self.shard_spec = shard
+        self.shard: Optional[Tuple[int, int]] = None
+        self.finalize = finalize
+        # Committed batches are journaled so --resume can skip what an interrupted run wrote
+        self.resume = resume
+        self.checkpoint: Optional[SyncCheckpoint] = None
         self.cli = CLIInterface(self)
         self.file_ops = FileOperations(self)
         
         # Initialize sub-components
-        self.content_logic = ContentLogic()
-        self.config_manager = ConfigManager(Path.cwd())
+        self.content_logic = ContentLogic(project_dir)
+        self.config_manager = ConfigManager(self.content_logic.project_dir)
+        
+        # Set when this sync is one root of a multi-root run sharing engine, parser pool and caches
+        self.shared = shared
+        # Ids of tags, categories and series, published to the cache only once their transaction commits
+        self.shared_ids = shared.shared_ids if shared else {}
+        self._pending_shared_ids: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+        
+        # Stage timings for --profile; the writers are wrapped as write._sync_*
+        self.profiler = SyncProfiler(profile, Path(profile_output) if profile_output else None)
+        self.content_logic.profiler = self.profiler
+        self.profiler.instrument(self, 'write', lambda name: name.startswith('_sync_'))
         
         # Database components
         self.engine = None
         self.session_factory = None
         self.current_user_id = None
+        # Lookups and updates are limited to our own rows once the database holds several owners
+        self.scope_to_owner = bool(shared)
+        # Statement counts and latency, collected from engine events
+        self.sql_stats = SQLStats()
         
         # Sync statistics
         self.sync_stats = {
@@ -70,12 +136,23 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             'success_count': 0,
             'error_count': 0,
             'skipped_count': 0,
+            'resumed_count': 0,
             'created_count': 0,
             'updated_count': 0,
             'deleted_count': 0,
+            'images_rendered': 0,
+            'images_reused': 0,
+            'html_rendered': 0,
+            'html_cached': 0,
             'sync_errors': [],
             'sync_warnings': []
         }
+        
+        # Parents of denormalized counters touched in this run, recomputed after sync
+        self.touched_aggregates: Dict[str, set] = {
+            'series': set(),
+            'tags': set()
+        }
     
     def validate_configuration(self) -> bool:
         """Validate database configuration"""
@@ -88,6 +165,10 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             else:
                 raise ValidationError("Database config must be dict or string")
             
+            if self.shard_spec:
+                self.shard = self._parse_shard(self.shard_spec)
+                self.content_logic.shard = self.shard
+            
             return True
             
         except ValidationError as e:
@@ -115,6 +196,15 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 config['path'] = 'portfolio.db'
                 self.info(f"No SQLite path specified, using default: {config['path']}")
     
+    def _parse_shard(self, spec: str) -> Tuple[int, int]:
+        """Parse 'i/N' (1-based) into a 0-based shard index and the shard count"""
+        index_text, separator, count_text = spec.partition('/')
+        if not separator:
+            raise ValidationError(f"Shard must look like i/N, e.g. 1/4, got '{spec}'", 'shard')
+        count = DataValidator.validate_integer(count_text.strip(), "Shard count", 1, 1024)
+        index = DataValidator.validate_integer(index_text.strip(), "Shard index", 1, count)
+        return index - 1, count
+    
     def show_sync_overview(self) -> None:
         """Display synchronization overview"""
         self.section("Database Synchronization Overview")
@@ -149,68 +239,102 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
     
     def execute_sync(self, create_tables: bool = False) -> bool:
         """Execute the database synchronization"""
+        self.profiler.start()
         try:
-            # Initialize database connection
-            if not self._initialize_database():
+            if self.shared:
+                # The multi-root coordinator prepared the schema once for all roots
+                self.engine = self.shared.engine
+                self.session_factory = self.shared.session_factory
+                self.content_logic.parser_pool = self.shared.parser_pool
+            elif not self.prepare_database(create_tables):
                 return False
             
-            # Always check if basic tables exist, create if needed
-            try:
-                if self.session_factory:
-                    with self.session_factory() as session:
-                        # Test if basic tables exist by trying to query users table
-                        session.execute(text("SELECT COUNT(*) FROM users LIMIT 1"))
-                else:
-                    raise DatabaseError("Session factory not initialized")
-            except Exception as e:
-                # If query fails, tables likely don't exist
-                self.warning(f"Database tables not found or incomplete: {e}")
-                self.info("🔧 Automatically creating database tables...")
-                create_tables = True
-            
-            # Create tables if requested or if they don't exist
-            if create_tables:
-                self._create_database_tables()
+            if self.finalize:
+                return self._finalize_shards()
             
-            # Get content to sync
-            content_items = self.content_logic.get_all_content_for_sync()
-            self.sync_stats['total_items'] = len(content_items)
+            # Record the synced commit, then limit discovery to content changed since a commit
+            self.git_state = self._current_git_state()
+            if self.since_commit:
+                self._apply_git_changes()
             
-            if not content_items:
-                self.info("📋 No content found to sync")
+            if not self.dry_run:
+                self._open_checkpoint()
+            
+            # Count content to sync (discovery only, parsing is streamed below)
+            with self.profiler.stage('discovery'):
+                total_items = self.content_logic.count_content_items()
+            self.sync_stats['total_items'] = total_items
+            self._report_resumed_items()
+            
+            if not total_items and not self.sync_stats['resumed_count']:
+                if self.git_state.get('since'):
+                    self.info(f"📋 No content changed since {self.git_state['since'][:12]}")
+                    if not self.dry_run:
+                        self.save_sync_summary()
+                else:
+                    self.info("📋 No content found to sync")
                 return True
             
             # Start sync process
             self.sync_start(
                 self._get_database_type(),
-                len(content_items)
+                total_items
             )
             
-            # Process content items
-            progress, raw_task_id = self.progress(len(content_items), "Syncing content")
-            task_id = cast(TaskID, raw_task_id)
-            progress.start()
+            # Make sure the owning user exists before the writer starts batching
+            if not self.dry_run:
+                self._ensure_current_user()
+            
+            # Optional image derivative stage, run per batch before writing
+            self.image_stage = self._create_image_stage()
+            
+            # Render markdown bodies to HTML while parsing, cached by content hash
+            self.content_logic.renderer = self._create_renderer()
+            
+            # Process content items: parsed items are streamed to the batching writer
+            if self.shared:
+                # Each root is one bar of the coordinator's progress display
+                progress = self.shared.progress
+                raw_task_id = progress.add_task(self.content_logic.project_dir.name, total=total_items)
+            else:
+                progress, raw_task_id = self.progress(total_items, "Syncing content")
+                progress.start()
+            # Per-item advances are batched so large syncs do not redraw for every item
+            tracker = ThrottledProgress(progress, cast(TaskID, raw_task_id))
             try:
-                for i, item in enumerate(content_items):
-                    try:
-                        if self.dry_run:
-                            self._simulate_sync_item(item)
-                        else:
-                            self._sync_content_item(item)
-                        
-                        self.sync_stats['success_count'] += 1
-                        self.sync_progress(i + 1, len(content_items), item['name'])
-                        
-                    except Exception as e:
-                        error_msg = f"Failed to sync {item['path']}: {e}"
-                        self.error(error_msg)
-                        self.sync_stats['error_count'] += 1
-                        self.sync_stats['sync_errors'].append(error_msg)
-                    
-                    self.sync_stats['processed_items'] += 1
-                    progress.update(task_id, advance=1)
+                self._run_sync_pipeline(tracker)
             finally:
-                progress.stop()
+                tracker.flush()
+                if not self.shared:
+                    progress.stop()
+                if self.image_stage:
+                    self.sync_stats['images_rendered'] = self.image_stage.rendered_count
+                    self.sync_stats['images_reused'] = self.image_stage.reused_count
+                    self.image_stage.close()
+                renderer = self.content_logic.renderer
+                if renderer:
+                    self.sync_stats['html_rendered'] = renderer.rendered_count
+                    self.sync_stats['html_cached'] = renderer.cached_count
+            
+            # Interrupted runs leave a checkpoint for --resume; a clean run needs none
+            if self.checkpoint:
+                if self.sync_stats['error_count'] == 0:
+                    self.checkpoint.remove()
+                else:
+                    self.info("Checkpoint kept: 'silan db-sync --resume' retries only the failed items")
+            
+            # Recompute denormalized counters for what this run touched
+            if self.shard:
+                # Other shards may still be writing, so the counters are recomputed once by --finalize
+                self.info("Aggregate counters are left to 'silan db-sync --finalize' after all shards finish")
+            elif not self.dry_run:
+                # Parents touched before the interruption are unknown, so a resumed run recounts all
+                if self.sync_stats['resumed_count']:
+                    self._touch_all_aggregates()
+                with self.profiler.stage('aggregates'):
+                    self._recompute_aggregates()
+            
+            self.profiler.stop()
             
             # Log completion
             self.sync_complete(
@@ -222,8 +346,11 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             if not self.dry_run:
                 self.save_sync_summary()
             
-            # Display final statistics
-            self._display_sync_results()
+            # Display final statistics; the multi-root coordinator shows one table for all roots
+            if not self.shared:
+                self._display_sync_results()
+                if self.profiler.enabled:
+                    self._display_profile()
             
             return self.sync_stats['error_count'] == 0
             
@@ -231,8 +358,146 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             self.error(f"Sync execution failed: {e}")
             return False
         finally:
+            self.profiler.stop()
+            if self.checkpoint:
+                self.checkpoint.close()
             self._cleanup_database()
     
+    def prepare_database(self, create_tables: bool = False) -> bool:
+        """Connect and create missing tables; --create-tables also adds new columns"""
+        # Initialize database connection
+        if not self._initialize_database():
+            return False
+        
+        # Always check if basic tables exist, create if needed
+        try:
+            if self.session_factory:
+                with self.session_factory() as session:
+                    # Test if basic tables exist by trying to query users table
+                    session.execute(text("SELECT COUNT(*) FROM users LIMIT 1"))
+            else:
+                raise DatabaseError("Session factory not initialized")
+        except Exception as e:
+            # If query fails, tables likely don't exist
+            self.warning(f"Database tables not found or incomplete: {e}")
+            self.info("🔧 Automatically creating database tables...")
+            create_tables = True
+        
+        # Create tables if requested or if they don't exist
+        if create_tables:
+            self._create_database_tables()
+            # Columns introduced since the tables were created are only added on request
+            if not self.dry_run:
+                self._add_missing_columns()
+        
+        missing = self._missing_columns()
+        if missing:
+            names = ', '.join(f"{table.name}.{column.name}" for table, column in missing)
+            if not self.dry_run:
+                self.error(f"Database tables are missing columns: {names}")
+                self.info("Run 'silan db-sync --create-tables' to add them")
+                return False
+            self.warning(f"Database tables are missing columns: {names}")
+        
+        return True
+    
+    def _apply_git_changes(self) -> None:
+        """Restrict the sync to items changed since the requested commit, or fall back to a full sync"""
+        project_dir = self.content_logic.project_dir
+        base = self.since_commit
+        previous = self._load_git_state() if base == 'last' else {}
+        if base == 'last':
+            base = previous.get('commit')
+            if not base:
+                self.info("No previous git sync recorded for this database; running a full sync")
+                return
+        
+        changes = changed_since(project_dir, base, GIT_SYNC_PATHSPECS)
+        if changes is None:
+            warning_msg = f"Git history for {base} is unavailable; running a full sync"
+            self.warning(warning_msg)
+            self.sync_stats['sync_warnings'].append(warning_msg)
+            return
+        
+        # Uncommitted edits synced last time may since have been reverted
+        changed = sorted(set(changes.changed) | set(previous.get('dirty_paths', [])))
+        outside = [path for path in changed + changes.deleted if not path.startswith('content/')]
+        if outside:
+            self.info(f"{outside[0]} changed since {changes.base[:12]}; running a full sync")
+            return
+        
+        self.git_state.update({'since': changes.base, 'changed': changed, 'deleted': changes.deleted})
+        self.content_logic.limit_to_paths(changed, deleted=changes.deleted)
+        self.info(f"🔀 Syncing content changed since {changes.base[:12]}: "
+                  f"{len(changed)} changed, {len(changes.deleted)} deleted, {len(changes.renamed)} renamed paths")
+        if changes.deleted:
+            # A full sync does not prune rows for removed files either
+            self.info(f"Rows for {len(changes.deleted)} deleted paths are kept: {', '.join(changes.deleted[:5])}"
+                      f"{' ...' if len(changes.deleted) > 5 else ''}")
+    
+    def _open_checkpoint(self) -> None:
+        """Start the batch journal, first loading the items an interrupted run wrote when resuming"""
+        name = 'sync_checkpoint.jsonl'
+        if self.shard:
+            name = f"sync_checkpoint.shard-{self.shard[0] + 1}-of-{self.shard[1]}.jsonl"
+        checkpoint = SyncCheckpoint(
+            self.config_manager.project_dir / '.silan' / name,
+            {
+                'database': self.database_config if isinstance(self.database_config, dict) else 'custom',
+                'shard': self.shard_spec
+            }
+        )
+        
+        if self.resume:
+            if checkpoint.load() and checkpoint.completed:
+                self.content_logic.completed_items = checkpoint.completed
+                self.info(f"⏯️ Resuming from checkpoint: {len(checkpoint.completed)} items "
+                          f"in {checkpoint.batches} batches were written")
+            else:
+                self.info("No checkpoint for this database to resume from; running a full sync")
+        elif checkpoint.exists:
+            self.info("Starting over; an unfinished sync's checkpoint is discarded (use --resume to continue it)")
+        
+        checkpoint.open(resume=self.resume)
+        self.checkpoint = checkpoint
+    
+    def _report_resumed_items(self) -> None:
+        """Log how many checkpointed items were verified and skipped"""
+        resumed = len(self.content_logic.resumed_ids)
+        stale = len(self.content_logic.stale_ids)
+        self.sync_stats['resumed_count'] = resumed
+        if resumed or stale:
+            self.info(f"Skipping {resumed} items already synced with matching hashes"
+                      + (f"; {stale} changed since and are synced again" if stale else ""))
+    
+    def _checkpoint_items(self, items: List[Dict[str, Any]]) -> None:
+        """Journal items whose transaction has committed"""
+        if self.checkpoint and items:
+            with self.profiler.stage('write.checkpoint'):
+                self.checkpoint.record_batch({item['id']: item['hash'] for item in items})
+    
+    def _current_git_state(self) -> Dict[str, Any]:
+        """HEAD and uncommitted content paths, taken before syncing so later edits count as changes"""
+        project_dir = self.content_logic.project_dir
+        commit = head_commit(project_dir)
+        if commit is None:
+            return {}
+        return {'commit': commit, 'dirty_paths': dirty_paths(project_dir, GIT_SYNC_PATHSPECS) or []}
+    
+    def _load_git_state(self) -> Dict[str, Any]:
+        """Git section of the last sync summary, if it synced to the same database"""
+        summary_file = self.config_manager.project_dir / '.silan' / 'last_sync.json'
+        try:
+            with open(summary_file, 'r') as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        database_config = self.database_config if isinstance(self.database_config, dict) else 'custom'
+        if summary.get('database_config') != database_config or summary.get('dry_run'):
+            return {}
+        return summary.get('git') or {}
+    
     def _initialize_database(self) -> bool:
         """Initialize database connection"""
         try:
@@ -245,6 +510,7 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 # Disable insertmanyvalues optimization to avoid sentinel mismatch on SQLite
                 **({} if not connection_string.startswith("sqlite") else {"connect_args": {"check_same_thread": False}})
             )
+            self.sql_stats.attach(self.engine)
             # ------------------------------------------------------------------
             # SQLAlchemy 2.0 enables the insertmanyvalues optimization by default
             # which relies on RETURNING clauses to bulk-insert several rows at
@@ -315,59 +581,294 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             if not self.engine:
                 raise DatabaseError("Database engine not initialized")
             
-            Base.metadata.create_all(self.engine)
+            # Concurrent shards race to create the schema; a retry skips the tables the others created
+            for attempt in range(SCHEMA_CREATE_ATTEMPTS):
+                try:
+                    Base.metadata.create_all(self.engine)
+                    break
+                except Exception as e:
+                    if attempt == SCHEMA_CREATE_ATTEMPTS - 1:
+                        raise
+                    self.debug(f"Creating tables raced with another runner, retrying: {e}")
             self.info("✅ Database tables created/verified")
         except Exception as e:
             raise DatabaseError(f"Failed to create tables: {e}")
     
-    def _sync_content_item(self, item: Dict[str, Any]) -> None:
-        """Sync a single content item to database"""
+    def _missing_columns(self) -> List[Tuple[Table, Column]]:
+        """Nullable model columns that existing tables do not have yet"""
+        if not self.engine:
+            return []
+        
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+        missing = []
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            missing.extend(
+                (table, column) for column in table.columns
+                if column.nullable and column.name not in existing_columns
+            )
+        return missing
+    
+    def _add_missing_columns(self) -> None:
+        """Add nullable model columns to existing tables, the upgrade step of --create-tables"""
         try:
-            if not self.session_factory:
-                raise DatabaseError("Database session factory not initialized")
+            missing = self._missing_columns()
+            if not missing:
+                return
             
-            with self.session_factory() as session:
-                # Ensure user exists
-                if not self.current_user_id:
-                    user = self._get_or_create_user(session)
-                    self.current_user_id = user.id
-                
-                if not self.current_user_id:
-                    raise DatabaseError("Failed to get or create user")
-                
-                content_type = item['type']
-                content_data = item['data']
+            preparer = self.engine.dialect.identifier_preparer
+            added = 0
+            for table, column in missing:
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                try:
+                    with self.engine.begin() as connection:
+                        connection.execute(text(
+                            f"ALTER TABLE {preparer.format_table(table)} "
+                            f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                        ))
+                    added += 1
+                except Exception:
+                    # A concurrent shard may have added it first ("duplicate column")
+                    existing = {item['name'] for item in inspect(self.engine).get_columns(table.name)}
+                    if column.name not in existing:
+                        raise
+                    self.debug(f"Column {table.name}.{column.name} was added by another runner")
+            if added:
+                self.info(f"🔧 Added {added} new database columns")
+        except Exception as e:
+            raise DatabaseError(f"Failed to upgrade tables: {e}")
+    
+    def _create_image_stage(self) -> Optional[ImageDerivativeStage]:
+        """Build the image derivative stage when it is enabled"""
+        enabled = self.image_derivatives
+        if enabled is None:
+            enabled = bool(self.config_manager.get_config_value('images.derivatives', False))
+        if not enabled or self.dry_run:
+            return None
+        
+        if not PIL_AVAILABLE:
+            warning_msg = "Image derivatives are enabled but Pillow is not installed; skipping"
+            self.warning(warning_msg)
+            self.sync_stats['sync_warnings'].append(warning_msg)
+            return None
+        
+        get = self.config_manager.get_config_value
+        return ImageDerivativeStage(
+            output_dir=self.config_manager.project_dir / get('images.output_dir', '.silan/derivatives'),
+            url_prefix=get('images.url_prefix', '/derivatives'),
+            widths=get('images.widths', [480, 960, 1600]),
+            quality=get('images.quality', 80),
+            workers=get('images.workers', 0),
+            logger=self
+        )
+    
+    def _create_renderer(self) -> Optional[MarkdownRenderer]:
+        """Build the markdown renderer for the configured backend when HTML generation is on"""
+        if not self.config_manager.get_config_value('sync.generate_html', True):
+            return None
+        
+        backend_name = self.config_manager.get_config_value('sync.markdown_renderer', DEFAULT_BACKEND)
+        try:
+            backend = create_backend(backend_name)
+        except ConfigurationError as e:
+            warning_msg = f"{e.message}; falling back to {DEFAULT_BACKEND}"
+            self.warning(warning_msg)
+            self.sync_stats['sync_warnings'].append(warning_msg)
+            backend = create_backend(DEFAULT_BACKEND)
+        
+        return MarkdownRenderer(self.config_manager.project_dir / '.silan' / 'cache' / 'render', backend=backend)
+    
+    def _process_batch_images(self, batch: List[Dict[str, Any]]) -> None:
+        """Generate derivatives for every project image in a batch in one pool round"""
+        if not self.image_stage:
+            return
+        
+        images = [
+            image
+            for item in batch if item['type'] == 'projects'
+            for image in item['data'].get('images', [])
+        ]
+        if images:
+            with self.profiler.stage('images'):
+                self.image_stage.process(images)
+    
+    def _get_pipeline_settings(self) -> Tuple[int, int, int]:
+        """Get writer batch size, parser worker count and parse look-ahead from configuration"""
+        settings = []
+        for key, default in (('batch_size', 100), ('parse_workers', 4), ('lookahead', 32)):
+            value = self.config_manager.get_config_value(f'performance.{key}', default)
+            try:
+                settings.append(max(1, int(value)))
+            except (TypeError, ValueError):
+                settings.append(default)
+        
+        batch_size, parse_workers, lookahead = settings
+        return batch_size, parse_workers, lookahead
+    
+    def _run_sync_pipeline(self, tracker: ThrottledProgress) -> None:
+        """Overlap content parsing with batched database writes"""
+        batch_size, parse_workers, lookahead = self._get_pipeline_settings()
+        
+        # cProfile only sees the thread it runs in, so parse inline while it is on
+        if self.profiler.cprofile_output:
+            parse_workers = 0
+        
+        # Parser workers keep at most `lookahead` items in flight while the writer commits
+        content_stream = self.content_logic.iter_content_for_sync(
+            lookahead=max(lookahead, parse_workers, 1),
+            workers=parse_workers
+        )
+        
+        batch: List[Dict[str, Any]] = []
+        for item in content_stream:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                self._write_sync_batch(batch, tracker)
+                batch = []
+        
+        if batch:
+            self._write_sync_batch(batch, tracker)
+        
+        # Items that failed to parse were reported by the content logic
+        skipped = self.sync_stats['total_items'] - self.sync_stats['processed_items']
+        if skipped > 0:
+            self.sync_stats['skipped_count'] += skipped
+            self.sync_stats['processed_items'] += skipped
+            tracker.advance(skipped)
+    
+    def _write_sync_batch(self, batch: List[Dict[str, Any]], tracker: ThrottledProgress) -> None:
+        """Write a batch of sync items in one transaction, falling back to per-item writes"""
+        if self.dry_run:
+            for item in batch:
+                self._simulate_sync_item(item)
+                self._record_item_success(item)
+                tracker.advance()
+            return
+        
+        if not self.session_factory:
+            raise DatabaseError("Database session factory not initialized")
+        
+        self._process_batch_images(batch)
+        
+        if len(batch) > 1:
+            snapshot = self._snapshot_write_state()
+            try:
+                with self.session_factory() as session:
+                    for item in batch:
+                        self._sync_content_item(session, item)
+                    with self.profiler.stage('write.commit'):
+                        session.commit()
+                self._publish_shared_ids(committed=True)
                 
-                # Sync based on content type
-                if content_type == 'blog':
-                    # Check if this is a translation (non-English content)
-                    frontmatter = content_data.get('frontmatter', content_data)
-                    language = frontmatter.get('language', 'en')
-                    
-                    if language != 'en':
-                        # This is translation content, find the main English post and add translation
-                        self._sync_blog_translation_only(session, content_data, item)
-                    else:
-                        # This is main English content, create/update the blog post
-                        self._sync_blog_post(session, content_data, item)
-                elif content_type == 'projects':
-                    self._sync_project(session, content_data, item)
-                elif content_type == 'ideas':
-                    self._sync_idea(session, content_data, item)
-                elif content_type == 'updates':
-                    self._sync_update(session, content_data, item)
-                elif content_type == 'resume':
-                    self._sync_resume(session, content_data, item)
-                else:
-                    self.warning(f"Unknown content type: {content_type}")
-                    return
+                self._checkpoint_items(batch)
+                for item in batch:
+                    self.sync_stats['created_count'] += 1
+                    self._record_item_success(item)
+                    tracker.advance()
+                return
+            except Exception as e:
+                self._publish_shared_ids(committed=False)
+                # Counts and touched parents of the rolled-back attempt are redone by the retry
+                self._restore_write_state(snapshot)
+                # Retry the batch item by item so one bad item does not sink the others
+                self.debug(f"Batch of {len(batch)} items failed, retrying individually: {e}")
+        
+        committed = []
+        for item in batch:
+            snapshot = self._snapshot_write_state()
+            try:
+                with self.session_factory() as session:
+                    try:
+                        self._sync_content_item(session, item)
+                        with self.profiler.stage('write.commit'):
+                            session.commit()
+                        self._publish_shared_ids(committed=True)
+                    except Exception as e:
+                        session.rollback()
+                        self._publish_shared_ids(committed=False)
+                        raise DatabaseError(f"Failed to sync content item: {e}")
                 
-                session.commit()
                 self.sync_stats['created_count'] += 1
-                
-        except Exception as e:
-            session.rollback()
-            raise DatabaseError(f"Failed to sync content item: {e}")
+                self._record_item_success(item)
+                committed.append(item)
+            except Exception as e:
+                self._restore_write_state(snapshot)
+                error_msg = f"Failed to sync {item['path']}: {e}"
+                self.error(error_msg)
+                self.sync_stats['error_count'] += 1
+                self.sync_stats['sync_errors'].append(error_msg)
+                self.sync_stats['processed_items'] += 1
+            
+            tracker.advance()
+        
+        self._checkpoint_items(committed)
+    
+    def _snapshot_write_state(self) -> Dict[str, Any]:
+        """Row counters and touched aggregate parents before a transaction"""
+        return {
+            'counts': {key: self.sync_stats[key] for key in ('created_count', 'updated_count', 'deleted_count')},
+            'touched': {key: set(ids) for key, ids in self.touched_aggregates.items()},
+        }
+    
+    def _restore_write_state(self, snapshot: Dict[str, Any]) -> None:
+        """Undo the counting of a transaction that was rolled back"""
+        self.sync_stats.update(snapshot['counts'])
+        self.touched_aggregates = snapshot['touched']
+    
+    def _record_item_success(self, item: Dict[str, Any]) -> None:
+        """Update statistics for a successfully synced item"""
+        self.sync_stats['success_count'] += 1
+        self.sync_stats['processed_items'] += 1
+        self.sync_progress(self.sync_stats['processed_items'], self.sync_stats['total_items'], item['name'])
+    
+    def _ensure_current_user(self) -> None:
+        """Get or create the content owner once before writing"""
+        if self.current_user_id:
+            return
+        
+        if not self.session_factory:
+            raise DatabaseError("Database session factory not initialized")
+        
+        with self.session_factory() as session:
+            user = self._get_or_create_user(session)
+            session.commit()
+            self.current_user_id = user.id
+            if not self.scope_to_owner:
+                self.scope_to_owner = (session.query(func.count(User.id)).scalar() or 0) > 1
+        
+        if not self.current_user_id:
+            raise DatabaseError("Failed to get or create user")
+    
+    def _sync_content_item(self, session: Session, item: Dict[str, Any]) -> None:
+        """Sync a single content item within the given session"""
+        content_type = item['type']
+        content_data = item['data']
+        
+        # Sync based on content type
+        if content_type == 'blog':
+            # Check if this is a translation (non-English content)
+            frontmatter = content_data.get('frontmatter', content_data)
+            language = frontmatter.get('language', 'en')
+            
+            if language != 'en':
+                # This is translation content, find the main English post and add translation
+                self._sync_blog_translation_only(session, content_data, item)
+            else:
+                # This is main English content, create/update the blog post
+                self._sync_blog_post(session, content_data, item)
+        elif content_type == 'projects':
+            self._sync_project(session, content_data, item)
+        elif content_type == 'ideas':
+            self._sync_idea(session, content_data, item)
+        elif content_type == 'updates':
+            self._sync_update(session, content_data, item)
+        elif content_type == 'resume':
+            self._sync_resume(session, content_data, item)
+        else:
+            self.warning(f"Unknown content type: {content_type}")
     
     def _sync_blog_post(self, session: Session, content_data: Dict[str, Any], item: Dict[str, Any]) -> None:
         """Sync blog post to database"""
@@ -406,12 +907,15 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             
             # Check if blog post exists
             existing_post = session.query(BlogPost).filter_by(slug=slug).first()
+            self._check_owner(existing_post, 'Blog post', slug)
             
             if existing_post:
                 # Update existing post
                 from ..models.blog import BlogStatus, BlogContentType
                 existing_post.title = title
                 existing_post.content = content
+                existing_post.content_html = content_data.get('content_html')
+                existing_post.toc = content_data.get('toc')
                 existing_post.excerpt = frontmatter.get('excerpt', frontmatter.get('summary', frontmatter.get('description', '')))
                 existing_post.is_featured = frontmatter.get('featured', False)
                 existing_post.content_type = BlogContentType(content_type.lower())
@@ -423,7 +927,9 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 existing_post.like_count = frontmatter.get('likes', existing_post.like_count)
                 
                 if frontmatter.get('date'):
-                    existing_post.published_at = self._parse_datetime(frontmatter['date'])
+                    existing_post.published_at = self._parse_datetime(
+                        self._carried_date(content_data, 'date', frontmatter['date'])
+                    )
                 
                 blog_post = existing_post
                 self.sync_stats['updated_count'] += 1
@@ -436,13 +942,17 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                     title=title,
                     slug=slug,
                     content=content,
+                    content_html=content_data.get('content_html'),
+                    toc=content_data.get('toc'),
                     excerpt=frontmatter.get('excerpt', frontmatter.get('summary', frontmatter.get('description', ''))),
                     is_featured=frontmatter.get('featured', False),
                     content_type=BlogContentType(content_type.lower()),
                     status=BlogStatus(status.lower()),
                     view_count=frontmatter.get('views', 0),
                     like_count=frontmatter.get('likes', 0),
-                    published_at=self._parse_datetime(frontmatter.get('date', datetime.utcnow()))
+                    published_at=self._parse_datetime(
+                        self._carried_date(content_data, 'date', frontmatter.get('date'))
+                    )
                 )
                 session.add(blog_post)
                 session.flush()  # Get the ID
@@ -533,23 +1043,21 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             series_slug = self._generate_slug(series_name)
             
             # Get or create series
-            series = session.query(BlogSeries).filter_by(slug=series_slug).first()
-            if not series:
-                series = BlogSeries(
-                    title=series_name,
-                    slug=series_slug,
-                    description=series_description
-                )
-                session.add(series)
-                session.flush()
+            series_id = self._shared_row_id(
+                session, BlogSeries, [{'slug': series_slug}],
+                {'title': series_name, 'slug': series_slug, 'description': series_description}
+            )
+            
+            # A post moving between series changes both episode counts
+            if blog_post.series_id and str(blog_post.series_id) != str(series_id):
+                self.touched_aggregates['series'].add(str(blog_post.series_id))
             
             # Update blog post with series info
-            blog_post.series_id = series.id
+            blog_post.series_id = series_id
             blog_post.series_order = part_number
             
-            # Update episode count for the series
-            episode_count = session.query(BlogPost).filter_by(series_id=series.id).count()
-            series.episode_count = episode_count
+            # Episode count is recomputed by the post-sync aggregate stage
+            self.touched_aggregates['series'].add(str(series_id))
             
         except Exception as e:
             self.warning(f"Failed to sync blog series: {e}")
@@ -578,6 +1086,7 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             
             # Check if project exists
             existing_project = session.query(Project).filter_by(slug=slug).first()
+            self._check_owner(existing_project, 'Project', slug)
             
             if existing_project:
                 # Update existing project
@@ -628,9 +1137,17 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                         tech_names = technologies_data
                     self._sync_project_technologies(session, project, tech_names)
             
+            # Handle gallery images, including derivative metadata when generated
+            images_data = content_data.get('images', [])
+            if images_data:
+                self._sync_project_images(session, project, images_data)
+            
             # Handle project details
-            if content:
-                self._sync_project_details(session, project, content)
+            if content or content_data.get('content_html'):
+                self._sync_project_details(
+                    session, project, content,
+                    content_data.get('content_html'), content_data.get('toc')
+                )
             
         except Exception as e:
             raise DatabaseError(f"Failed to sync project: {e}")
@@ -652,12 +1169,15 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             
             # Check if idea exists
             existing_idea = session.query(Idea).filter_by(slug=slug).first()
+            self._check_owner(existing_idea, 'Idea', slug)
             
             if existing_idea:
                 # Update existing idea
                 existing_idea.title = title
                 existing_idea.abstract = frontmatter.get('abstract', frontmatter.get('description', ''))
                 existing_idea.is_public = True  # Set as public so it shows in API
+                existing_idea.content_html = content_data.get('content_html')
+                existing_idea.toc = content_data.get('toc')
                 existing_idea.updated_at = datetime.utcnow()
                 
                 idea = existing_idea
@@ -671,6 +1191,8 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                     slug=slug,
                     abstract=frontmatter.get('abstract', frontmatter.get('description', '')),
                     motivation=content if content else None,
+                    content_html=content_data.get('content_html'),
+                    toc=content_data.get('toc'),
                     is_public=True  # Set as public so it shows in API
                 )
                 session.add(idea)
@@ -693,15 +1215,21 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 content = content_data.get('content', '')
             
             title = frontmatter.get('title', 'Untitled Update')
-            update_date = self._parse_date(frontmatter.get('date', datetime.utcnow().date()))
+            update_date = self._parse_date(
+                self._carried_date(content_data, 'date', frontmatter.get('date'))
+            ) or datetime.utcnow().date()
             
             # Check if update exists (by title and date)
-            existing_update = session.query(RecentUpdate).filter(
+            update_query = session.query(RecentUpdate).filter(
                 and_(
                     RecentUpdate.title == title,
                     RecentUpdate.date == update_date
                 )
-            ).first()
+            )
+            if self.scope_to_owner:
+                # Other owners may post updates with the same title and date
+                update_query = update_query.filter(RecentUpdate.user_id == self.current_user_id)
+            existing_update = update_query.first()
             
             if existing_update:
                 # Update existing update
@@ -740,7 +1268,11 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             
             # Resume content is typically stored in personal_info table
             # Check if personal info exists
-            existing_info = session.query(PersonalInfo).first()
+            info_query = session.query(PersonalInfo)
+            if self.scope_to_owner:
+                # Each owner in the database has its own personal info
+                info_query = info_query.filter_by(user_id=self.current_user_id)
+            existing_info = info_query.first()
             
             if existing_info:
                 # Update existing personal info
@@ -881,8 +1413,8 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             # Sync education details if present
             details = edu_item.get('details', [])
             if details:
+                # The parent row must exist before its details are bulk inserted
                 session.flush()
-                session.refresh(education)
                 # Now sync education details
                 self._sync_education_details(session, education, details)
     
@@ -930,9 +1462,8 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             # Sync work experience details immediately after creating the record
             details = exp_item.get('details', [])
             if details:
-                # Flush instead of commit to keep all inserts in one transaction
+                # The parent row must exist before its details are bulk inserted
                 session.flush()
-                session.refresh(work_experience)
                 # Now sync work experience details
                 self._sync_work_experience_details(session, work_experience, details)
     
@@ -967,63 +1498,171 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
     
     def _sync_education_details(self, session: Session, education: Education, details: List[str]) -> None:
         """Sync education details to database"""
+        rows = [
+            {'detail_text': detail_text.strip(), 'sort_order': i}
+            for i, detail_text in enumerate(details)
+            if detail_text and detail_text.strip()
+        ]
         
-        # Check if details already exist
-        existing_count = session.query(EducationDetail).filter(
-            EducationDetail.education_id == education.id
-        ).count()
+        self._sync_child_rows(
+            session, EducationDetail, 'education_id', education.id, rows,
+            key_fields=('detail_text',),
+            compare_fields=('sort_order',)
+        )
+    
+    def _sync_work_experience_details(self, session: Session, work_experience: WorkExperience, details: List[str]) -> None:
+        """Sync work experience details to database"""
+        rows = [
+            {'detail_text': detail_text.strip(), 'sort_order': i}
+            for i, detail_text in enumerate(details)
+            if detail_text and detail_text.strip()
+        ]
+        
+        self._sync_child_rows(
+            session, WorkExperienceDetail, 'work_experience_id', work_experience.id, rows,
+            key_fields=('detail_text',),
+            compare_fields=('sort_order',)
+        )
+    
+    def _insert_child_rows(self, session: Session, model: Any, rows: List[Dict[str, Any]]) -> int:
+        """Insert child rows with a single executemany and return the row count"""
+        if not rows:
+            return 0
+        
+        # A Core insert with a parameter list is a plain executemany on SQLite, MySQL and
+        # PostgreSQL; with client-side ids it never needs RETURNING or sentinel matching.
+        session.execute(model.__table__.insert(), rows)
+        return len(rows)
+    
+    def _sync_child_rows(self, session: Session, model: Any, parent_column: str, parent_id: Any,
+                         rows: List[Dict[str, Any]], key_fields: Sequence[str],
+                         compare_fields: Sequence[str] = ()) -> CollectionDiff:
+        """Bring a child collection in line with the desired ordered rows"""
+        table = model.__table__
+        
+        # Load the existing children in one query
+        existing = session.execute(
+            select(table).where(table.c[parent_column] == parent_id)
+        ).mappings().all()
+        
+        diff = diff_ordered_collection(existing, rows, key_fields, compare_fields)
+        if diff.is_empty:
+            return diff
         
-        if existing_count > 0:
+        pk_columns = [column.name for column in table.primary_key.columns]
+        
+        if diff.deletes:
+            session.execute(
+                delete(table).where(and_(*[table.c[name] == bindparam(f"pk_{name}") for name in pk_columns])),
+                [{f"pk_{name}": row[name] for name in pk_columns} for row in diff.deletes]
+            )
+            self.sync_stats['deleted_count'] += len(diff.deletes)
+        
+        # Group updates by the set of changed columns so each group is one executemany
+        update_groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for stored, changes in diff.updates:
+            params = {f"pk_{name}": stored[name] for name in pk_columns}
+            params.update({f"new_{name}": value for name, value in changes.items()})
+            update_groups.setdefault(tuple(sorted(changes)), []).append(params)
+        
+        for changed_columns, params in update_groups.items():
+            session.execute(
+                update(table)
+                .where(and_(*[table.c[name] == bindparam(f"pk_{name}") for name in pk_columns]))
+                .values({name: bindparam(f"new_{name}") for name in changed_columns}),
+                params
+            )
+            self.sync_stats['updated_count'] += len(params)
+        
+        inserts = []
+        for row in diff.inserts:
+            insert_row = dict(row)
+            insert_row[parent_column] = parent_id
+            if 'id' in table.c and 'id' not in insert_row:
+                insert_row['id'] = generate_uuid()
+            inserts.append(insert_row)
+        self.sync_stats['created_count'] += self._insert_child_rows(session, model, inserts)
+        
+        return diff
+    
+    def _recompute_aggregates(self) -> None:
+        """Recompute series episode counts and tag usage counts touched in this run"""
+        series_ids = sorted(self.touched_aggregates['series'])
+        tag_ids = sorted(self.touched_aggregates['tags'])
+        if not (series_ids or tag_ids) or not self.session_factory:
             return
         
-        # Create new details
-        for i, detail_text in enumerate(details):
-            if not detail_text or not detail_text.strip():
-                continue
-                
-            try:
-                education_detail = EducationDetail(
-                    education_id=education.id,
-                    detail_text=detail_text.strip(),
-                    sort_order=i
+        try:
+            with self.session_factory() as session:
+                self._recompute_counter(
+                    session, BlogSeries, 'episode_count', series_ids,
+                    BlogPost.__table__.c.series_id
                 )
-                session.add(education_detail)
-                # Force individual insert to avoid insertmanyvalues bulk processing
-                session.flush()
-                self.sync_stats['created_count'] += 1
-            except Exception as e:
-                self.warning(f"Failed to create education detail: {e}")
-                continue
+                self._recompute_counter(
+                    session, BlogTag, 'usage_count', tag_ids,
+                    BlogPostTag.__table__.c.blog_tag_id
+                )
+                session.commit()
+            
+            self.debug(f"Recomputed counters for {len(series_ids)} series and {len(tag_ids)} tags")
+        except Exception as e:
+            warning_msg = f"Failed to recompute aggregate counters: {e}"
+            self.warning(warning_msg)
+            self.sync_stats['sync_warnings'].append(warning_msg)
     
-    def _sync_work_experience_details(self, session: Session, work_experience: WorkExperience, details: List[str]) -> None:
-        """Sync work experience details to database"""
+    def _finalize_shards(self) -> bool:
+        """Recompute every series and tag counter once, after all shards have written"""
+        if not self.session_factory:
+            raise DatabaseError("Database session factory not initialized")
+        
+        self._touch_all_aggregates()
+        
+        if self.dry_run:
+            self.info(f"Would recompute counters for {len(self.touched_aggregates['series'])} series "
+                      f"and {len(self.touched_aggregates['tags'])} tags")
+            return True
         
-        # Check if details already exist
-        existing_count = session.query(WorkExperienceDetail).filter(
-            WorkExperienceDetail.work_experience_id == work_experience.id
-        ).count()
+        warnings_before = len(self.sync_stats['sync_warnings'])
+        with self.profiler.stage('aggregates'):
+            self._recompute_aggregates()
+        if len(self.sync_stats['sync_warnings']) > warnings_before:
+            return False
         
-        if existing_count > 0:
+        self.success(f"✅ Recomputed counters for {len(self.touched_aggregates['series'])} series "
+                     f"and {len(self.touched_aggregates['tags'])} tags")
+        return True
+    
+    def _touch_all_aggregates(self) -> None:
+        """Mark every series and tag for counter recomputation"""
+        if not self.session_factory:
             return
+        with self.session_factory() as session:
+            self.touched_aggregates['series'] = {str(row) for row in session.scalars(select(BlogSeries.id))}
+            self.touched_aggregates['tags'] = {str(row) for row in session.scalars(select(BlogTag.id))}
+    
+    def _recompute_counter(self, session: Session, model: Any, counter_column: str,
+                           parent_ids: List[str], child_fk: Any) -> None:
+        """Set a counter column from one GROUP BY over the child table"""
+        table = model.__table__
         
-        # Create new details
-        for i, detail_text in enumerate(details):
-            if not detail_text or not detail_text.strip():
-                continue
-                
-            try:
-                work_experience_detail = WorkExperienceDetail(
-                    work_experience_id=work_experience.id,
-                    detail_text=detail_text.strip(),
-                    sort_order=i
-                )
-                session.add(work_experience_detail)
-                # Force individual insert to avoid insertmanyvalues bulk processing
-                session.flush()
-                self.sync_stats['created_count'] += 1
-            except Exception as e:
-                self.warning(f"Failed to create work experience detail: {e}")
-                continue
+        # Chunk the IN list to stay under driver parameter limits
+        for start in range(0, len(parent_ids), 500):
+            chunk = parent_ids[start:start + 500]
+            counts = {
+                str(parent_id): count
+                for parent_id, count in session.execute(
+                    select(child_fk, func.count())
+                    .where(child_fk.in_(chunk))
+                    .group_by(child_fk)
+                ).all()
+            }
+            
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam('pk_id'))
+                .values({counter_column: bindparam('new_count')}),
+                [{'pk_id': parent_id, 'new_count': counts.get(parent_id, 0)} for parent_id in chunk]
+            )
     
     def _sync_publications(self, session: Session, publications_data: List[Dict[str, Any]]) -> None:
         """Sync publications data to database"""
@@ -1062,62 +1701,38 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 session.refresh(publication)  # Refresh to ensure UUID is properly loaded
                 self.sync_stats['created_count'] += 1
             
-            # Check if publication authors already exist for this publication
-            existing_authors_count = session.query(PublicationAuthor).filter_by(
-                publication_id=publication.id
-            ).count()
-            
-            if existing_authors_count > 0:
-                continue
-            
             # Sync publication authors
-            authors = pub_item.get('authors', [])
-            for i, author in enumerate(authors):
-                # Handle both string and dict format for authors
-                if isinstance(author, str):
-                    author_name = author
-                    is_corresponding = False
-                    affiliation = ''
-                else:
-                    author_name = author.get('name', '')
-                    is_corresponding = author.get('is_corresponding', False)
-                    affiliation = author.get('affiliation', '')
-                
-                publication_author = PublicationAuthor(
-                    publication_id=publication.id,
-                    author_name=author_name,
-                    author_order=i,
-                    is_corresponding=is_corresponding,
-                    affiliation=affiliation
-                )
-                session.add(publication_author)
-                self.sync_stats['created_count'] += 1
+            self._sync_publication_authors(session, publication, pub_item.get('authors', []))
     
-    def _sync_publication_authors(self, session: Session, publication: Publication, authors: List[str]) -> None:
+    def _sync_publication_authors(self, session: Session, publication: Publication, authors: List[Any]) -> None:
         """Sync publication authors for a publication"""
-        # Check if authors already exist to avoid duplicates
-        try:
-            existing_count = session.query(PublicationAuthor).filter(
-                PublicationAuthor.publication_id == str(publication.id)
-            ).count()
-            if existing_count > 0:
-                self.debug(f"Publication authors already exist for publication {publication.id}, skipping")
-                return
-        except Exception as e:
-            self.warning(f"Error checking existing publication authors, proceeding: {e}")
-        
-        for i, author_name in enumerate(authors):
-            if not author_name or not author_name.strip():
+        rows = []
+        for author in authors:
+            # Handle both string and dict format for authors
+            if isinstance(author, str):
+                author_name = author.strip()
+                is_corresponding = False
+                affiliation = ''
+            else:
+                author_name = str(author.get('name', '')).strip()
+                is_corresponding = author.get('is_corresponding', False)
+                affiliation = author.get('affiliation', '')
+            
+            if not author_name:
                 continue
-                
-            # Create author record
-            author = PublicationAuthor(
-                publication_id=publication.id,
-                author_name=author_name.strip(),
-                author_order=i + 1,
-                is_corresponding=False  # Could be enhanced to detect corresponding author
-            )
-            session.add(author)
+            
+            rows.append({
+                'author_name': author_name,
+                'author_order': len(rows),
+                'is_corresponding': is_corresponding,
+                'affiliation': affiliation
+            })
+        
+        self._sync_child_rows(
+            session, PublicationAuthor, 'publication_id', publication.id, rows,
+            key_fields=('author_name',),
+            compare_fields=('author_order', 'is_corresponding', 'affiliation')
+        )
     
     def _sync_research_projects(self, session: Session, research_data: List[Dict[str, Any]]) -> None:
         """Sync research projects data to database"""
@@ -1161,110 +1776,126 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             # Sync research project details if present
             details = research_item.get('details', [])
             if details:
+                # The parent row must exist before its details are bulk inserted
                 session.flush()
-                session.refresh(research_project)
                 # Now sync research project details
                 self._sync_research_project_details(session, research_project, details)
     
     def _sync_research_project_details(self, session: Session, research_project: ResearchProject, details: List[str]) -> None:
         """Sync research project details to database"""
+        rows = [
+            {'detail_text': detail_text.strip(), 'sort_order': i}
+            for i, detail_text in enumerate(details)
+            if detail_text and detail_text.strip()
+        ]
         
-        # Check if details already exist
-        existing_count = session.query(ResearchProjectDetail).filter(
-            ResearchProjectDetail.research_project_id == research_project.id
-        ).count()
-        
-        if existing_count > 0:
-            return
-        
-        # Create research project details
-        for i, detail_text in enumerate(details):
-            if not detail_text or not detail_text.strip():
-                continue
-            
-            try:
-                research_project_detail = ResearchProjectDetail(
-                    research_project_id=research_project.id,
-                    detail_text=detail_text.strip(),
-                    sort_order=i
-                )
-                session.add(research_project_detail)
-                # Force individual insert to avoid insertmanyvalues bulk processing
-                session.flush()
-                self.sync_stats['created_count'] += 1
-            except Exception as e:
-                self.warning(f"Failed to create research project detail: {e}")
-                continue
+        self._sync_child_rows(
+            session, ResearchProjectDetail, 'research_project_id', research_project.id, rows,
+            key_fields=('detail_text',),
+            compare_fields=('sort_order',)
+        )
     
     def _sync_social_links(self, session: Session, personal_info: PersonalInfo, social_links_data: List[Dict[str, Any]]) -> None:
         """Sync social links data to database"""
-        # Check if social links already exist for this personal info
-        existing_links_count = session.query(SocialLink).filter_by(
-            personal_info_id=personal_info.id
-        ).count()
-        
-        if existing_links_count > 0:
-            return
+        rows = [
+            {
+                'platform': link_data.get('platform', ''),
+                'url': link_data.get('url', ''),
+                'display_name': link_data.get('display_name', ''),
+                'is_active': link_data.get('is_active', True),
+                'sort_order': i
+            }
+            for i, link_data in enumerate(social_links_data)
+        ]
         
-        # Create new social links
-        for i, link_data in enumerate(social_links_data):
-            social_link = SocialLink(
-                personal_info_id=personal_info.id,
-                platform=link_data.get('platform', ''),
-                url=link_data.get('url', ''),
-                display_name=link_data.get('display_name', ''),
-                is_active=link_data.get('is_active', True),
-                sort_order=i
-            )
-            session.add(social_link)
-            self.sync_stats['created_count'] += 1
-    
-
+        self._sync_child_rows(
+            session, SocialLink, 'personal_info_id', personal_info.id, rows,
+            key_fields=('platform', 'url'),
+            compare_fields=('display_name', 'is_active', 'sort_order')
+        )
     
     def _simulate_sync_item(self, item: Dict[str, Any]) -> None:
         """Simulate syncing an item (dry run)"""
-        self.debug(f"[DRY RUN] Would sync {item['type']}: {item['name']}")
+        self.debug("[DRY RUN] Would sync %s: %s", item['type'], item['name'])
     
     def _get_or_create_user(self, session: Session) -> User:
         """Get or create default user for content.
         More defensive than the previous version:
         1. Always look up by *username* first to avoid UNIQUE collisions.
-        2. If a concurrent insert slipped through, catch IntegrityError,
-           rollback and fetch the existing row instead of crashing.
+        2. If a concurrent insert slipped through (e.g. another shard),
+           the savepoint is rolled back and the existing record fetched.
         """
         # Workspace owner configuration (defaults to "admin")
         cfg = self.config_manager.load_config().get('workspace', {}).get('owner', {})
         username = cfg.get('username', 'admin')
 
-        # 1) Try to fetch by username (UNIQUE)
-        user: Optional[User] = session.query(User).filter_by(username=username).one_or_none()
-
-        if user is None:
-            # 2) Not found ‑> attempt to create
-            user = User(
-                username=username,
-                email=cfg.get('email', 'admin@example.com'),
-                password_hash=cfg.get('password_hash', 'default_hash'),
-                first_name=cfg.get('first_name', 'Admin'),
-                last_name=cfg.get('last_name', 'User'),
-                is_active=True,
-                is_admin=True,
-            )
-            session.add(user)
-            try:
-                session.flush()  # May raise IntegrityError if race condition
-            except Exception as exc:
-                # Rollback partial insert and fetch the existing record
-                session.rollback()
-                self.debug(f"Race creating user '{username}', fetching existing: {exc}")
-                user = session.query(User).filter_by(username=username).one()
-
-        return user
+        return self._get_or_create_shared(session, User, [{'username': username}], {
+            'username': username,
+            'email': cfg.get('email', 'admin@example.com'),
+            'password_hash': cfg.get('password_hash', 'default_hash'),
+            'first_name': cfg.get('first_name', 'Admin'),
+            'last_name': cfg.get('last_name', 'User'),
+            'is_active': True,
+            'is_admin': True,
+        })
+    
+    def _get_or_create_shared(self, session: Session, model: Any, lookups: Sequence[Dict[str, Any]],
+                              values: Dict[str, Any]) -> Any:
+        """Get a row shared between content items by any unique lookup, or insert it conflict-safely.
+        
+        Concurrent runners (see --shard) may insert the same tag or series at the
+        same time; the loser's savepoint is rolled back and the winner's row used.
+        If the transaction cannot see that row yet, the IntegrityError propagates
+        and the batch is retried item by item in fresh transactions.
+        """
+        for lookup in lookups:
+            row = session.query(model).filter_by(**lookup).first()
+            if row is not None:
+                return row
+        
+        try:
+            with session.begin_nested():
+                row = model(**values)
+                session.add(row)
+            return row
+        except IntegrityError as exc:
+            for lookup in lookups:
+                row = session.query(model).filter_by(**lookup).first()
+                if row is not None:
+                    self.debug("Concurrent insert of %s %s, using the existing row: %s", model.__name__, lookup, exc)
+                    return row
+            raise
+    
+    def _check_owner(self, row: Any, kind: str, slug: str) -> None:
+        """Refuse to update a row that another owner in the database owns"""
+        # Slugs are unique across the whole database, not per user
+        if self.scope_to_owner and row is not None and str(row.user_id) != str(self.current_user_id):
+            raise DatabaseError(f"{kind} slug '{slug}' already belongs to another portfolio")
+    
+    def _shared_row_id(self, session: Session, model: Any, lookups: Sequence[Dict[str, Any]],
+                       values: Dict[str, Any]) -> Any:
+        """Id of a shared row, from the cache of committed rows before asking the database"""
+        keys = [(model.__tablename__, tuple(sorted(lookup.items()))) for lookup in lookups]
+        for key in keys:
+            row_id = self._pending_shared_ids.get(key) or self.shared_ids.get(key)
+            if row_id is not None:
+                return row_id
+        
+        row_id = self._get_or_create_shared(session, model, lookups, values).id
+        for key in keys:
+            self._pending_shared_ids[key] = row_id
+        return row_id
+    
+    def _publish_shared_ids(self, committed: bool) -> None:
+        """Share the ids a transaction used once it committed; forget them if it rolled back"""
+        if committed:
+            self.shared_ids.update(self._pending_shared_ids)
+        self._pending_shared_ids.clear()
     
     def _sync_blog_tags(self, session: Session, blog_post: BlogPost, tags: List[str]) -> None:
         """Sync blog tags for a post"""
-        # Clear existing tags
-        session.query(BlogPostTag).filter_by(blog_post_id=blog_post.id).delete()
+        rows: List[Dict[str, Any]] = []
+        seen_tag_ids = set()
         
         for tag_name in tags:
             if not tag_name or not tag_name.strip():
@@ -1274,34 +1905,24 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             generated_slug = self._generate_slug(tag_name)
             
             # Get or create tag - check both name and slug to avoid conflicts
-            tag = session.query(BlogTag).filter_by(name=tag_name).first()
-            if not tag:
-                # Check if a tag with this slug already exists
-                tag_by_slug = session.query(BlogTag).filter_by(slug=generated_slug).first()
-                if tag_by_slug:
-                    # Use existing tag with same slug
-                    tag = tag_by_slug
-                else:
-                    # Create new tag
-                    tag = BlogTag(
-                        name=tag_name,
-                        slug=generated_slug
-                    )
-                    session.add(tag)
-                    session.flush()
-            
-            # Create association if not already exists
-            existing_association = session.query(BlogPostTag).filter_by(
-                blog_post_id=blog_post.id,
-                blog_tag_id=tag.id
-            ).first()
+            tag_id = self._shared_row_id(
+                session, BlogTag, [{'name': tag_name}, {'slug': generated_slug}],
+                {'name': tag_name, 'slug': generated_slug}
+            )
             
-            if not existing_association:
-                blog_post_tag = BlogPostTag(
-                    blog_post_id=blog_post.id,
-                    blog_tag_id=tag.id
-                )
-                session.add(blog_post_tag)
+            # Collect each tag once; associations are diffed below
+            if str(tag_id) not in seen_tag_ids:
+                seen_tag_ids.add(str(tag_id))
+                rows.append({'blog_tag_id': tag_id})
+        
+        diff = self._sync_child_rows(
+            session, BlogPostTag, 'blog_post_id', blog_post.id, rows,
+            key_fields=('blog_tag_id',)
+        )
+        
+        # Usage counts of added or removed tags are recomputed after sync
+        for row in diff.inserts + diff.deletes:
+            self.touched_aggregates['tags'].add(str(row['blog_tag_id']))
     
     def _sync_blog_categories(self, session: Session, blog_post: BlogPost, categories: List[str]) -> None:
         """Sync blog categories for a post"""
@@ -1310,52 +1931,71 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
             generated_slug = self._generate_slug(category_name)
             
             # Get or create category - check both name and slug to avoid conflicts
-            category = session.query(BlogCategory).filter_by(name=category_name).first()
-            if not category:
-                # Check if a category with this slug already exists
-                category_by_slug = session.query(BlogCategory).filter_by(slug=generated_slug).first()
-                if category_by_slug:
-                    # Use existing category with same slug
-                    category = category_by_slug
-                else:
-                    # Create new category
-                    category = BlogCategory(
-                        name=category_name,
-                        slug=generated_slug
-                    )
-                    session.add(category)
-                    session.flush()
-            
-            blog_post.category_id = category.id
+            blog_post.category_id = self._shared_row_id(
+                session, BlogCategory, [{'name': category_name}, {'slug': generated_slug}],
+                {'name': category_name, 'slug': generated_slug}
+            )
     
     def _sync_project_technologies(self, session: Session, project: Project, technologies: List[str]) -> None:
         """Sync project technologies"""
-        # Clear existing technologies
-        session.query(ProjectTechnology).filter_by(project_id=project.id).delete()
+        rows = [
+            {'technology_name': tech_name.strip(), 'sort_order': i}
+            for i, tech_name in enumerate(technologies)
+            if tech_name and tech_name.strip()
+        ]
         
-        for i, tech_name in enumerate(technologies):
-            if not tech_name or not tech_name.strip():
-                continue
-                
-            tech = ProjectTechnology(
-                project_id=project.id,
-                technology_name=tech_name,
-                sort_order=i
-            )
-            session.add(tech)
+        self._sync_child_rows(
+            session, ProjectTechnology, 'project_id', project.id, rows,
+            key_fields=('technology_name',),
+            compare_fields=('sort_order',)
+        )
+    
+    def _sync_project_images(self, session: Session, project: Project, images: List[Dict[str, Any]]) -> None:
+        """Sync project images"""
+        rows = [
+            {
+                'image_url': image['image_url'][:500],
+                'alt_text': (image.get('alt_text') or '')[:200],
+                'caption': image.get('caption', ''),
+                'image_type': image.get('image_type'),
+                'sort_order': i
+            }
+            for i, image in enumerate(images)
+            if image.get('image_url')
+        ]
+        compare_fields = ('alt_text', 'caption', 'image_type', 'sort_order')
+        
+        # Derivative columns belong to the opt-in image stage; without it they are left alone
+        if self.image_stage:
+            for row, image in zip(rows, (image for image in images if image.get('image_url'))):
+                row.update({field: image.get(field) for field in IMAGE_DERIVATIVE_FIELDS})
+            compare_fields += IMAGE_DERIVATIVE_FIELDS
+        
+        self._sync_child_rows(
+            session, ProjectImage, 'project_id', project.id, rows,
+            key_fields=('image_url',),
+            compare_fields=compare_fields
+        )
     
-    def _sync_project_details(self, session: Session, project: Project, content: str) -> None:
+    def _sync_project_details(self, session: Session, project: Project, content: str,
+                              content_html: Optional[str] = None,
+                              toc: Optional[List[Dict[str, Any]]] = None) -> None:
         """Sync project details from content"""
         # Check if details exist
         details = session.query(ProjectDetail).filter_by(project_id=project.id).first()
         if not details:
             details = ProjectDetail(
                 project_id=project.id,
-                detailed_description=content
+                detailed_description=content or None,
+                content_html=content_html,
+                toc=toc
             )
             session.add(details)
         else:
-            details.detailed_description = content
+            if content:
+                details.detailed_description = content
+            details.content_html = content_html
+            details.toc = toc
             details.updated_at = datetime.utcnow()
     
     def _generate_slug(self, title: str) -> str:
@@ -1371,40 +2011,18 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
         
         return slug or 'untitled'
     
-    def _parse_datetime(self, date_str: Union[str, datetime]) -> datetime:
+    def _parse_datetime(self, date_str: Union[str, datetime, date, None]) -> datetime:
         """Parse datetime from string or return datetime object"""
-        if isinstance(date_str, datetime):
-            return date_str
-        
-        if isinstance(date_str, str):
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                try:
-                    return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    return datetime.utcnow()
-        
-        return datetime.utcnow()
+        return parse_datetime(date_str) or datetime.utcnow()
     
     def _parse_date(self, date_str: Union[str, datetime, date, None]) -> Optional[date]:
         """Parse date from string"""
-        if not date_str:
-            return None
-        
-        if isinstance(date_str, date):
-            return date_str
-        
-        if isinstance(date_str, datetime):
-            return date_str.date()
-        
-        if isinstance(date_str, str):
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                return None
-        
-        return None
+        return parse_date(date_str)
+    
+    def _carried_date(self, content_data: Dict[str, Any], key: str, fallback: Any = None) -> Any:
+        """Return a frontmatter date already parsed by the parser, else the raw fallback"""
+        dates = content_data.get('dates') or {}
+        return dates.get(key, fallback)
     
     def _get_database_type(self) -> str:
         """Get database type for logging"""
@@ -1421,8 +2039,22 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 'database_config': self.database_config if isinstance(self.database_config, dict) else 'custom',
                 'dry_run': self.dry_run
             }
+            if self.sql_stats.statement_count:
+                sync_summary['sql'] = self.sql_stats.summary()
+            if self.profiler.enabled:
+                sync_summary['profile'] = self.profiler.summary()
+            if self.shard:
+                sync_summary['shard'] = f"{self.shard[0] + 1}/{self.shard[1]}"
+            elif self.git_state.get('commit'):
+                # Failed items must be retried, so the base only advances on a clean run
+                git_state = self.git_state if self.sync_stats['error_count'] == 0 else self._load_git_state()
+                if git_state:
+                    sync_summary['git'] = git_state
             
             summary_file = self.config_manager.project_dir / '.silan' / 'last_sync.json'
+            if self.shard:
+                # Shards sharing a checkout must not overwrite each other's summary
+                summary_file = summary_file.with_name(f"last_sync.shard-{self.shard[0] + 1}-of-{self.shard[1]}.json")
             with open(summary_file, 'w') as f:
                 json.dump(sync_summary, f, indent=2)
             
@@ -1431,6 +2063,56 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
         except Exception as e:
             self.error(f"Failed to save sync summary: {e}")
     
+    def _display_profile(self, limit: int = 30) -> None:
+        """Display the slowest stages collected with --profile"""
+        profiler = self.profiler
+        stages = profiler.report()
+        rows = [
+            [
+                stage['stage'],
+                str(stage['calls']),
+                f"{stage['wall_seconds']:.3f}",
+                f"{stage['cpu_seconds']:.3f}",
+                f"{stage['mean_ms']:.2f}",
+                f"{stage['wall_seconds'] / profiler.wall_seconds * 100:.1f}%" if profiler.wall_seconds else "-"
+            ]
+            for stage in stages[:limit]
+        ]
+        self.cli.display_table(
+            f"Sync profile: {profiler.wall_seconds:.3f}s wall, {profiler.cpu_seconds:.3f}s CPU",
+            ["Stage", "Calls", "Wall (s)", "CPU (s)", "Mean (ms)", "% Wall"],
+            rows
+        )
+        self._display_sql_profile()
+        if len(stages) > limit:
+            self.info(f"{len(stages) - limit} faster stages omitted; all stages are in .silan/last_sync.json")
+        if profiler.cprofile_output:
+            self.info(f"cProfile stats written to {profiler.cprofile_output} "
+                      f"(inspect with: python -m pstats {profiler.cprofile_output})")
+    
+    def _display_sql_profile(self, limit: int = 15) -> None:
+        """Display SQL statement shapes by total time, to spot per-item query loops"""
+        shapes = self.sql_stats.by_shape(limit)
+        if not shapes:
+            return
+        rows = [
+            [
+                shape['table'],
+                shape['verb'],
+                str(shape['count']),
+                f"{shape['total_ms']:.1f}",
+                f"{shape['p95_ms']:.2f}",
+                str(shape['rows']),
+                shape['shape'][:60] + ('…' if len(shape['shape']) > 60 else '')
+            ]
+            for shape in shapes
+        ]
+        self.cli.display_table(
+            f"SQL: {self.sql_stats.statement_count} statements, {self.sql_stats.total_seconds * 1000:.1f} ms",
+            ["Table", "Verb", "Count", "Total (ms)", "p95 (ms)", "Rows", "Statement"],
+            rows
+        )
+    
     def _display_sync_results(self) -> None:
         """Display comprehensive sync results"""
         try:
@@ -1444,6 +2126,19 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                 "Errors": self.sync_stats['error_count']
             }
             
+            if self.sync_stats['resumed_count']:
+                stats_data["Resumed (Hash Verified)"] = self.sync_stats['resumed_count']
+            
+            if self.image_stage:
+                stats_data["Images Rendered"] = self.sync_stats['images_rendered']
+                stats_data["Images Reused"] = self.sync_stats['images_reused']
+            
+            if self.content_logic.renderer:
+                stats_data["HTML Rendered"] = self.sync_stats['html_rendered']
+                stats_data["HTML From Cache"] = self.sync_stats['html_cached']
+            
+            stats_data.update(self._sql_stats_data())
+            
             if self.dry_run:
                 self.cli.display_info_panel("Dry Run Results", stats_data)
             else:
@@ -1466,6 +2161,27 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
         except Exception as e:
             self.error(f"Failed to display sync results: {e}")
     
+    def _sql_stats_data(self) -> Dict[str, Any]:
+        """Panel rows summarizing the SQL statements issued on the engine"""
+        sql_stats = self.sql_stats
+        if not sql_stats.statement_count:
+            return {}
+        
+        data: Dict[str, Any] = {
+            "SQL Statements": sql_stats.statement_count,
+            "SQL Time": f"{sql_stats.total_seconds * 1000:.1f} ms",
+            "Rows Affected": sql_stats.rows_affected,
+        }
+        tables = [row for row in sql_stats.by_table() if row['table'] not in ('-', SCHEMA_TABLE)]
+        if tables:
+            busiest = tables[0]
+            data["Busiest Table"] = (
+                f"{busiest['table']} ({busiest['count']} statements, p95 {busiest['p95_ms']:.2f} ms)"
+            )
+        slowest = sql_stats.slowest()[0]
+        data["Slowest Statement"] = f"{slowest['ms']:.2f} ms on {slowest['table']}"
+        return data
+    
     def _sync_blog_translations(self, session: Session, blog_post: BlogPost, content_data: Dict[str, Any], item: Dict[str, Any]) -> None:
         """Sync blog post translations for multi-language support"""
         try:
@@ -1497,7 +2213,9 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                     existing_translation.title = title
                     existing_translation.excerpt = excerpt
                     existing_translation.content = content
-                    self.debug(f"Updated {language} translation for blog post: {blog_post.slug}")
+                    existing_translation.content_html = content_data.get('content_html')
+                    existing_translation.toc = content_data.get('toc')
+                    self.debug("Updated %s translation for blog post: %s", language, blog_post.slug)
                 else:
                     # Create new translation
                     translation = BlogPostTranslation(
@@ -1505,10 +2223,12 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                         language_code=language,
                         title=title,
                         excerpt=excerpt,
-                        content=content
+                        content=content,
+                        content_html=content_data.get('content_html'),
+                        toc=content_data.get('toc')
                     )
                     session.add(translation)
-                    self.debug(f"Created {language} translation for blog post: {blog_post.slug}")
+                    self.debug("Created %s translation for blog post: %s", language, blog_post.slug)
                     
         except Exception as e:
             self.warning(f"Failed to sync translations for blog post {blog_post.slug}: {e}")
@@ -1549,60 +2269,72 @@ class DatabaseSyncLogic(DatabaseSyncLogger):
                     english_file = folder_path / 'en.md'
                     
                     if english_file.exists():
-                        # Read English file to get its title for matching
-                        import frontmatter as fm
-                        with open(english_file, 'r', encoding='utf-8') as f:
-                            english_post = fm.load(f)
-                            english_title = english_post.metadata.get('title', '')
-                            english_slug = english_post.metadata.get('slug', self._generate_slug(str(english_title)))
+                        # Read only the English file's frontmatter to get its title for matching
+                        english_metadata = read_frontmatter(english_file)
+                        english_title = english_metadata.get('title', '')
+                        english_slug = english_metadata.get('slug', self._generate_slug(str(english_title)))
+                        
+                        # Find the English blog post
+                        english_blog_post = session.query(BlogPost).filter_by(slug=english_slug).first()
+                        self._check_owner(english_blog_post, "Blog post", english_slug)
+                        if not english_blog_post:
+                            # Try to find by title; titles are not unique, so only among our own posts
+                            query = session.query(BlogPost).filter_by(title=english_title)
+                            if self.scope_to_owner:
+                                query = query.filter_by(user_id=self.current_user_id)
+                            english_blog_post = query.first()
+                        
+                        if english_blog_post:
+                            # Create or update translation
+                            title = frontmatter.get('title', '')
+                            excerpt = frontmatter.get('excerpt', frontmatter.get('summary', frontmatter.get('description', '')))
+                            content = content_data.get('content', '')
                             
-                            # Find the English blog post
-                            english_blog_post = session.query(BlogPost).filter_by(slug=english_slug).first()
-                            if not english_blog_post:
-                                # Try to find by title
-                                english_blog_post = session.query(BlogPost).filter_by(title=english_title).first()
+                            existing_translation = session.query(BlogPostTranslation).filter_by(
+                                blog_post_id=english_blog_post.id,
+                                language_code=language
+                            ).first()
                             
-                            if english_blog_post:
-                                # Create or update translation
-                                title = frontmatter.get('title', '')
-                                excerpt = frontmatter.get('excerpt', frontmatter.get('summary', frontmatter.get('description', '')))
-                                content = content_data.get('content', '')
-                                
-                                existing_translation = session.query(BlogPostTranslation).filter_by(
+                            if existing_translation:
+                                # Update existing translation
+                                existing_translation.title = title
+                                existing_translation.excerpt = excerpt
+                                existing_translation.content = content
+                                existing_translation.content_html = content_data.get('content_html')
+                                existing_translation.toc = content_data.get('toc')
+                                self.debug("Updated %s translation for blog post: %s", language, english_blog_post.slug)
+                            else:
+                                # Create new translation
+                                translation = BlogPostTranslation(
                                     blog_post_id=english_blog_post.id,
-                                    language_code=language
-                                ).first()
+                                    language_code=language,
+                                    title=title,
+                                    excerpt=excerpt,
+                                    content=content,
+                                    content_html=content_data.get('content_html'),
+                                    toc=content_data.get('toc')
+                                )
+                                session.add(translation)
+                                self.debug("Created %s translation for blog post: %s", language, english_blog_post.slug)
                                 
-                                if existing_translation:
-                                    # Update existing translation
-                                    existing_translation.title = title
-                                    existing_translation.excerpt = excerpt
-                                    existing_translation.content = content
-                                    self.debug(f"Updated {language} translation for blog post: {english_blog_post.slug}")
-                                else:
-                                    # Create new translation
-                                    translation = BlogPostTranslation(
-                                        blog_post_id=english_blog_post.id,
-                                        language_code=language,
-                                        title=title,
-                                        excerpt=excerpt,
-                                        content=content
-                                    )
-                                    session.add(translation)
-                                    self.debug(f"Created {language} translation for blog post: {english_blog_post.slug}")
-                                    
-                                session.commit()
-                                return
+                            # The writer commits the surrounding batch
+                            session.flush()
+                            return
                 
                 self.warning(f"Could not find corresponding English blog post for {language} translation: {item_name}")
             
+        except DatabaseError:
+            # Another portfolio's post: fail the item instead of writing into it
+            raise
         except Exception as e:
             self.warning(f"Failed to sync blog translation {item.get('name', '')}: {e}")
 
     def _cleanup_database(self) -> None:
         """Clean up database resources"""
         try:
-            if self.engine:
+            # A shared engine is disposed by the multi-root coordinator
+            if self.engine and not self.shared:
+                self.sql_stats.detach()
                 self.engine.dispose()
                 self.debug("Database connection disposed")
         except Exception as e:
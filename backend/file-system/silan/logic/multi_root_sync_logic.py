@@ -0,0 +1,196 @@
+"""Synchronization of several portfolio roots into one database"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from ..core.exceptions import ValidationError
+from ..utils import ConfigManager
+from .database_sync_logic import DatabaseSyncLogger, DatabaseSyncLogic, SharedSyncResources
+
+
+class MultiRootSyncLogic(DatabaseSyncLogger):
+    """Syncs several content roots, each owned by its own user, in one process.
+
+    The engine is created and the schema checked once. Roots then run
+    concurrently, each in its own DatabaseSyncLogic, parsing on one shared
+    parser pool and sharing the ids of committed tags, categories and series.
+    """
+
+    def __init__(self, database_config: Union[str, Dict[str, Any]], roots: Sequence[str],
+                 dry_run: bool = False, **sync_options: Any):
+        super().__init__()
+        self.database_config = database_config
+        self.roots = [Path(root).resolve() for root in roots]
+        self.dry_run = dry_run
+        self.sync_options = sync_options
+
+        # Owns the engine and the schema checks; the roots borrow its connection pool.
+        # Pipeline settings come from the current project, else from the first root
+        settings_dir = Path.cwd() if (Path.cwd() / 'silan.yaml').exists() or not self.roots else self.roots[0]
+        self.primary = DatabaseSyncLogic(database_config, dry_run, project_dir=settings_dir, **sync_options)
+        self.cli = self.primary.cli
+        self.owners: Dict[Path, str] = {}
+        self.results: List[Dict[str, Any]] = []
+
+    def validate_configuration(self) -> bool:
+        """Validate the database configuration and that every root has its own owner"""
+        if not self.primary.validate_configuration():
+            return False
+
+        try:
+            if self.sync_options.get('profile_output'):
+                raise ValidationError("--profile-output cannot be combined with --roots", 'profile_output')
+
+            if len(set(self.roots)) != len(self.roots):
+                raise ValidationError("The same content root was given more than once", 'roots')
+
+            claimed: Dict[str, Path] = {}
+            for root in self.roots:
+                if not (root / 'content').is_dir():
+                    raise ValidationError(f"No content directory in {root}", 'roots')
+
+                # Users are unique by username and by email
+                owner = ConfigManager(root).load_config().get('workspace', {}).get('owner', {})
+                username = owner.get('username', 'admin')
+                email = owner.get('email', 'admin@example.com')
+                other = claimed.get(f"username:{username}") or claimed.get(f"email:{email}")
+                if other is not None:
+                    raise ValidationError(
+                        f"{root} and {other} have the same workspace.owner; "
+                        f"give each root its own username and email in silan.yaml", 'roots'
+                    )
+                self.owners[root] = username
+                claimed[f"username:{username}"] = root
+                claimed[f"email:{email}"] = root
+
+            return True
+
+        except ValidationError as e:
+            self.error(f"Configuration validation failed: {e}")
+            return False
+
+    def show_sync_overview(self) -> None:
+        """Display the database and the roots to sync"""
+        self.section("Multi-Portfolio Synchronization Overview")
+        self.cli.display_info_panel("Database Configuration", self.primary._get_database_info())
+        self.cli.display_table(
+            "Content Roots", ["Root", "Owner"],
+            [[str(root), self.owners.get(root, '')] for root in self.roots]
+        )
+
+        if self.dry_run:
+            self.info("🧪 Running in DRY RUN mode - no changes will be made")
+
+    def _get_concurrency(self) -> int:
+        """Number of roots synced at the same time"""
+        value = self.primary.config_manager.get_config_value('performance.root_workers', 4)
+        try:
+            workers = max(1, int(value))
+        except (TypeError, ValueError):
+            workers = 4
+        return min(workers, len(self.roots))
+
+    def execute_sync(self, create_tables: bool = False) -> bool:
+        """Prepare the database once, then sync the roots concurrently"""
+        try:
+            # The primary's SQLStats listens on the engine every root shares
+            if not self.primary.prepare_database(create_tables):
+                return False
+
+            # Counters are database-wide, so one recomputation covers every root
+            if self.sync_options.get('finalize'):
+                return self.primary._finalize_shards()
+
+            _, parse_workers, _ = self.primary._get_pipeline_settings()
+            root_workers = self._get_concurrency()
+            self.stage(f"Syncing {len(self.roots)} portfolios to {self.primary._get_database_type()} database")
+            self.info(f"📚 {root_workers} roots at a time, {parse_workers} shared parser threads")
+
+            progress, overall_task = self.progress(len(self.roots), "Portfolios")
+            with ThreadPoolExecutor(max_workers=parse_workers, thread_name_prefix="silan-parse") as parser_pool, \
+                    ThreadPoolExecutor(max_workers=root_workers, thread_name_prefix="silan-root") as root_pool:
+                shared = SharedSyncResources(
+                    engine=self.primary.engine,
+                    session_factory=self.primary.session_factory,
+                    parser_pool=parser_pool,
+                    progress=progress
+                )
+                progress.start()
+                try:
+                    futures = {root_pool.submit(self._sync_root, root, shared): root for root in self.roots}
+                    for future in as_completed(futures):
+                        self.results.append(future.result())
+                        progress.advance(overall_task)
+                finally:
+                    progress.stop()
+
+            self.results.sort(key=lambda result: self.roots.index(result['root']))
+            self._display_results()
+            return all(result['success'] for result in self.results)
+
+        except Exception as e:
+            self.error(f"Multi-root sync failed: {e}")
+            return False
+        finally:
+            self.primary._cleanup_database()
+
+    def _sync_root(self, root: Path, shared: SharedSyncResources) -> Dict[str, Any]:
+        """Sync one root with the shared resources; never raises"""
+        started = time.perf_counter()
+        sync_logic: Optional[DatabaseSyncLogic] = None
+        try:
+            sync_logic = DatabaseSyncLogic(
+                self.database_config, self.dry_run, project_dir=root, shared=shared, **self.sync_options
+            )
+            # Shard settings are parsed during validation
+            success = sync_logic.validate_configuration() and sync_logic.execute_sync()
+        except Exception as e:
+            self.error(f"Sync of {root} failed: {e}")
+            success = False
+
+        stats = sync_logic.sync_stats if sync_logic else {}
+        return {
+            'root': root,
+            'success': bool(success),
+            'stats': stats,
+            'seconds': time.perf_counter() - started,
+        }
+
+    def _display_results(self) -> None:
+        """Display one row per root and the totals"""
+        rows = []
+        for result in self.results:
+            stats = result['stats']
+            rows.append([
+                result['root'].name,
+                self.owners.get(result['root'], ''),
+                str(stats.get('total_items', 0)),
+                str(stats.get('success_count', 0)),
+                str(stats.get('resumed_count', 0)),
+                str(stats.get('error_count', 0)),
+                f"{result['seconds']:.1f}s",
+                "✅" if result['success'] else "❌",
+            ])
+        self.cli.display_table(
+            "Portfolio Sync Results",
+            ["Root", "Owner", "Items", "Synced", "Resumed", "Errors", "Time", "Status"],
+            rows
+        )
+
+        failed = [result['root'].name for result in self.results if not result['success']]
+        totals = {
+            "Portfolios": len(self.results),
+            "Items Synced": sum(result['stats'].get('success_count', 0) for result in self.results),
+            "Errors": sum(result['stats'].get('error_count', 0) for result in self.results),
+        }
+        totals.update(self.primary._sql_stats_data())
+        if failed:
+            self.cli.display_error_panel("Multi-Portfolio Sync Incomplete", f"Failed: {', '.join(failed)}", totals)
+        else:
+            self.cli.display_success_panel("Sync Completed Successfully", "All portfolios synchronized", totals)
+
+    def cleanup(self) -> None:
+        """Clean up all resources"""
+        self.primary.cleanup()
@@ -19,6 +19,7 @@ class StatusLogic(ModernLogger):
         # Initialize services
         self.config_manager = ConfigManager(self.project_dir)
         self.content_logic = ContentLogic()
+        self._content_languages: Dict[str, int] = {}
     
     def show_project_status(self) -> None:
         """Show project overview and configuration"""
@@ -182,11 +183,13 @@ class StatusLogic(ModernLogger):
                 total_md_files = 0
                 for dir_name in found_dirs:
                     dir_path = self.project_dir / dir_name
-                    md_files = list(dir_path.rglob('*.md'))
+                    # Shares the persisted listing index with content discovery
+                    md_files = self.content_logic.dir_index.walk_files(dir_path, '.md')
                     total_md_files += len(md_files)
                     self.info(f"  {dir_name}/: {len(md_files)} markdown files")
                 
                 self.info(f"📄 Total Markdown Files: {total_md_files}")
+                self.content_logic.dir_index.save()
                 
                 # Analyze content by parser type
                 if total_md_files > 0:
@@ -195,6 +198,10 @@ class StatusLogic(ModernLogger):
                     
                     for content_type, count in content_stats.items():
                         self.info(f"  {content_type.title()}: {count} files")
+                    
+                    if self._content_languages:
+                        languages = ', '.join(f"{lang}: {count}" for lang, count in sorted(self._content_languages.items()))
+                        self.info(f"🌐 Languages: {languages}")
                         
             else:
                 self.warning("📁 No content directories found")
@@ -205,21 +212,15 @@ class StatusLogic(ModernLogger):
             
     def _analyze_content_files(self, content_dirs: list) -> Dict[str, int]:
         """Analyze content files by type"""
-        stats = {}
-        
         try:
-            for dir_name in content_dirs:
-                dir_path = self.project_dir / dir_name
-                
-                # Use content logic to analyze files
-                content_summary = self.content_logic.get_content_summary()
-                return content_summary.get('content_types', {})
+            # Use content logic to analyze files (frontmatter headers only)
+            content_summary = self.content_logic.get_content_summary()
+            self._content_languages = content_summary.get('languages', {})
+            return content_summary.get('content_types', {})
                     
         except Exception as e:
             self.error(f"Error analyzing content files: {e}")
             return {"unknown": 0}
-        
-        return stats
     
     def show_quick_actions(self) -> None:
         """Show suggested next actions"""
@@ -1,6 +1,6 @@
 """Blog-related models"""
 
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Enum
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Enum, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
@@ -77,6 +77,9 @@ class BlogPost(Base, TimestampMixin):
     comment_count: Mapped[int] = mapped_column(Integer, default=0)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     series_order: Mapped[Optional[int]] = mapped_column(Integer)
+    # Rendered at sync time
+    content_html: Mapped[Optional[str]] = mapped_column(Text)
+    toc: Mapped[Optional[List[dict]]] = mapped_column(JSON)
     
     # Relationships - matching Go schema edges
     user: Mapped["User"] = relationship(back_populates="blog_posts")
@@ -97,6 +100,9 @@ class BlogPostTranslation(Base):
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     excerpt: Mapped[Optional[str]] = mapped_column(Text)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Rendered at sync time
+    content_html: Mapped[Optional[str]] = mapped_column(Text)
+    toc: Mapped[Optional[List[dict]]] = mapped_column(JSON)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
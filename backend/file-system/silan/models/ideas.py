@@ -1,6 +1,6 @@
 """Ideas-related models"""
 
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Enum, Numeric
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Enum, Numeric, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
@@ -52,6 +52,9 @@ class Idea(Base, TimestampMixin):
     is_public: Mapped[bool] = mapped_column(Boolean, default=False)
     view_count: Mapped[int] = mapped_column(Integer, default=0)
     like_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Rendered at sync time
+    content_html: Mapped[Optional[str]] = mapped_column(Text)
+    toc: Mapped[Optional[List[dict]]] = mapped_column(JSON)
     
     # Relationships - matching Go schema edges
     user: Mapped["User"] = relationship(back_populates="ideas")
@@ -1,6 +1,6 @@
 """Project-related models"""
 
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Date, Enum
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer, Date, Enum, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, date
@@ -95,6 +95,9 @@ class ProjectDetail(Base, TimestampMixin):
     future_enhancements: Mapped[Optional[str]] = mapped_column(Text)
     license: Mapped[Optional[str]] = mapped_column(String(50))
     version: Mapped[Optional[str]] = mapped_column(String(20))
+    # Rendered at sync time
+    content_html: Mapped[Optional[str]] = mapped_column(Text)
+    toc: Mapped[Optional[List[dict]]] = mapped_column(JSON)
     
     # Relationships - matching Go schema edges
     project: Mapped["Project"] = relationship(back_populates="details")
@@ -131,6 +134,13 @@ class ProjectImage(Base, TimestampMixin):
     image_type: Mapped[Optional[str]] = mapped_column(String(50))
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
     
+    # Derivative metadata filled by the optional image stage of db-sync
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    width: Mapped[Optional[int]] = mapped_column(Integer)
+    height: Mapped[Optional[int]] = mapped_column(Integer)
+    blurhash: Mapped[Optional[str]] = mapped_column(String(100))
+    derivatives: Mapped[Optional[List[dict]]] = mapped_column(JSON)
+    
     # Relationships - matching Go schema edges
     project: Mapped["Project"] = relationship(back_populates="images")
     translations: Mapped[List["ProjectImageTranslation"]] = relationship(back_populates="project_image", cascade="all, delete-orphan")
@@ -34,14 +34,22 @@ Usage:
     result = parser.parse_file(file_path)
 """
 
-from .base_parser import BaseParser, ExtractedContent
-from .resume_parser import ResumeParser
-from .project_parser import ProjectParser
-from .blog_parser import BlogParser
-from .idea_parser import IdeaParser
-from .update_parser import UpdateParser
 from .parser_factory import ParserFactory, ParsedContentCollection
 
+# Parser modules import frontmatter and yaml, so they are loaded on first
+# access. ParserFactory keeps its own registry of content type aliases and
+# imports the matching parser when it is first requested.
+_LAZY_EXPORTS = {
+    'BaseParser': '.base_parser',
+    'ExtractedContent': '.base_parser',
+    'ResumeParser': '.resume_parser',
+    'ProjectParser': '.project_parser',
+    'BlogParser': '.blog_parser',
+    'IdeaParser': '.idea_parser',
+    'UpdateParser': '.update_parser',
+    'read_frontmatter': '.frontmatter_reader',
+}
+
 __all__ = [
     # Core classes
     'BaseParser',
@@ -56,7 +64,8 @@ __all__ = [
     
     # Factory and utilities
     'ParserFactory',
-    'ParsedContentCollection'
+    'ParsedContentCollection',
+    'read_frontmatter'
 ]
 
 # Version information
@@ -64,21 +73,17 @@ __version__ = '1.0.0'
 __author__ = 'Silan AI Portfolio System'
 __description__ = 'Comprehensive content parsing system with specialized extractors'
 
-# Register all parsers with the factory
-ParserFactory.register_parser('resume', ResumeParser)
-ParserFactory.register_parser('cv', ResumeParser) 
-ParserFactory.register_parser('project', ProjectParser)
-ParserFactory.register_parser('projects', ProjectParser)
-ParserFactory.register_parser('blog', BlogParser)
-ParserFactory.register_parser('blog_post', BlogParser)
-ParserFactory.register_parser('article', BlogParser)
-ParserFactory.register_parser('vlog', BlogParser)  # Add vlog mapping
-ParserFactory.register_parser('video', BlogParser)  # Add video mapping
-ParserFactory.register_parser('podcast', BlogParser)  # Add podcast mapping
-ParserFactory.register_parser('tutorial', BlogParser)  # Add tutorial mapping
-ParserFactory.register_parser('idea', IdeaParser)
-ParserFactory.register_parser('ideas', IdeaParser)
-ParserFactory.register_parser('concept', IdeaParser)
-ParserFactory.register_parser('update', UpdateParser)
-ParserFactory.register_parser('updates', UpdateParser)
-ParserFactory.register_parser('recent_update', UpdateParser)
\ No newline at end of file
+
+def __getattr__(name):
+    """Import parser classes and helpers on first access"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,7 +6,6 @@ providing shared functionality for content extraction, validation, and data stru
 """
 
 import frontmatter
-import markdown2
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -16,6 +15,9 @@ from dataclasses import dataclass, field
 import json
 import hashlib
 from ..utils.logger import ModernLogger
+from ..utils.date_parser import parse_date, parse_date_range, parse_datetime
+from ..utils.sync_profiler import NULL_PROFILER, SyncProfiler
+from .markdown_renderer import MarkdownRenderer
 
 @dataclass
 class ExtractedContent:
@@ -36,6 +38,11 @@ class ExtractedContent:
     
     # Content metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
+    dates: Dict[str, datetime] = field(default_factory=dict)
+    
+    # Rendered body, filled when the parser has a renderer
+    content_html: str = ""
+    toc: List[Dict[str, Any]] = field(default_factory=list)
     content_hash: str = ""
     parsed_at: datetime = field(default_factory=datetime.now)
     
@@ -53,15 +60,17 @@ class BaseParser(ABC, ModernLogger):
     Inherits from ModernLogger for direct logging capabilities.
     """
     
+    # Frontmatter fields parsed into ExtractedContent.dates
+    DATE_FIELDS = ('date', 'published_at', 'publish_date', 'created_at', 'updated_at',
+                   'start_date', 'end_date')
+    
     def __init__(self, content_dir: Path, logger_name: str = "base_parser"):
-        ModernLogger.__init__(self, name=logger_name)
+        ModernLogger.__init__(self, name=logger_name, level="info")
         self.content_dir = content_dir
-        self.markdown = markdown2.Markdown(extras=[
-            'fenced-code-blocks', 'tables', 'footnotes', 'task_list',
-            'strike', 'target-blank-links', 'code-friendly', 'cuddled-lists',
-            'metadata', 'header-ids', 'toc', 'wiki-tables', 'smarty-pants',
-            'break-on-newline', 'nofollow'
-        ])
+        # Set by the caller to render bodies to HTML while parsing
+        self.renderer: Optional[MarkdownRenderer] = None
+        # Set by the caller to time parsing stages
+        self.profiler: SyncProfiler = NULL_PROFILER
         
         # Technology categorization mapping
         self.tech_categories = {
@@ -145,7 +154,7 @@ class BaseParser(ABC, ModernLogger):
         """
         try:
             # Read file with frontmatter
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with self.profiler.stage('frontmatter'), open(file_path, 'r', encoding='utf-8') as f:
                 post = frontmatter.load(f)
             
             # Calculate content hash for change detection
@@ -170,11 +179,23 @@ class BaseParser(ABC, ModernLogger):
                 categories=post_metadata.get('categories', [])
             )
             
+            # Parse frontmatter dates once so the sync can reuse them
+            extracted.dates = self._extract_dates(post_metadata)
+            
             # Parse content using specialized parser
-            self._parse_content(post, extracted)
+            with self.profiler.stage(f"parse.{extracted.content_type}._parse_content"):
+                self._parse_content(post, extracted)
+            
+            # Render the body once; the renderer caches by content hash
+            if self.renderer is not None:
+                with self.profiler.stage('render'):
+                    rendered = self.renderer.render(content)
+                extracted.content_html = rendered.html
+                extracted.toc = rendered.toc
             
             # Validate extracted content
-            self._validate_content(extracted)
+            with self.profiler.stage('validation'):
+                self._validate_content(extracted)
             
             # Calculate extraction quality
             extracted.extraction_quality = self._calculate_quality(extracted)
@@ -185,6 +206,15 @@ class BaseParser(ABC, ModernLogger):
             self.error(f"Error parsing {file_path}: {e}")
             return None
     
+    def _extract_dates(self, metadata: Dict[str, Any]) -> Dict[str, datetime]:
+        """Parse the well-known frontmatter date fields, keeping any time of day"""
+        dates = {}
+        for key in self.DATE_FIELDS:
+            parsed = parse_datetime(metadata.get(key))
+            if parsed:
+                dates[key] = parsed
+        return dates
+    
     @abstractmethod
     def _get_content_type(self) -> str:
         """Return the content type handled by this parser"""
@@ -202,7 +232,8 @@ class BaseParser(ABC, ModernLogger):
     
     def _calculate_content_hash(self, post: frontmatter.Post) -> str:
         """Calculate hash of content for change detection"""
-        content_str = json.dumps(post.metadata, sort_keys=True) + post.content
+        # Unquoted YAML dates load as date/datetime objects
+        content_str = json.dumps(post.metadata, sort_keys=True, default=str) + post.content
         return hashlib.md5(content_str.encode()).hexdigest()
     
     def _calculate_quality(self, extracted: ExtractedContent) -> float:
@@ -262,65 +293,15 @@ class BaseParser(ABC, ModernLogger):
             return 'advanced'
         return 'intermediate'
     
-    def _parse_date(self, date_str: Union[str, None]) -> Optional[date]:
+    def _parse_date(self, date_str: Union[str, date, None]) -> Optional[date]:
         """Parse various date formats into date object"""
-        if not date_str:
-            return None
-        
-        date_str = str(date_str).strip()
-        
-        # Try different date formats
-        formats = [
-            '%Y-%m-%d', '%Y-%m', '%Y',
-            '%m/%d/%Y', '%m/%d/%y',
-            '%b %d, %Y', '%B %d, %Y',
-            '%b %Y', '%B %Y',
-            '%d %b %Y', '%d %B %Y'
-        ]
-        
-        for fmt in formats:
-            try:
-                parsed = datetime.strptime(date_str, fmt)
-                return parsed.date()
-            except ValueError:
-                continue
-        
-        return None
+        return parse_date(date_str)
     
     def _parse_date_range(self, date_range: str) -> Tuple[Optional[date], Optional[date]]:
         """Parse date range like 'Jan 2020 - Dec 2021'"""
         if not date_range:
             return None, None
-        
-        # Handle special cases
-        if date_range.lower() in ['now', 'current', 'present', 'ongoing']:
-            return None, None
-        
-        # Split by common separators
-        separators = [' - ', ' – ', ' — ', ' to ', '-', '–', '—']
-        parts = None
-        
-        for sep in separators:
-            if sep in date_range:
-                parts = date_range.split(sep, 1)
-                break
-        
-        if not parts:
-            # Single date
-            return self._parse_date(date_range), None
-        
-        if len(parts) == 2:
-            start_date = self._parse_date(parts[0].strip())
-            end_str = parts[1].strip()
-            
-            # Check for ongoing indicators
-            if end_str.lower() in ['now', 'current', 'present', 'ongoing']:
-                return start_date, None
-            
-            end_date = self._parse_date(end_str)
-            return start_date, end_date
-        
-        return None, None
+        return parse_date_range(str(date_range))
     
     def _extract_section(self, content: str, section_name: str) -> str:
         """Extract a specific section from markdown content"""
@@ -0,0 +1,78 @@
+"""
+Header-only frontmatter reader.
+
+Reads a markdown file only up to the closing ``---`` fence and parses the YAML
+header, so type detection, language grouping and status never load post bodies.
+Parsed headers are memoized on their raw bytes, so unchanged headers are parsed once.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Union
+
+import yaml
+
+# Prefer the libyaml C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Frontmatter larger than this is treated as missing rather than read in full
+MAX_HEADER_BYTES = 64 * 1024
+
+_FENCE = b'---'
+
+
+def read_frontmatter(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read and parse only the frontmatter block of a markdown file.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Frontmatter metadata, or an empty dict when there is none
+    """
+    header = read_frontmatter_bytes(file_path)
+    if not header:
+        return {}
+
+    metadata = _parse_header(header)
+    # Callers are free to mutate what they get back
+    return copy.deepcopy(metadata)
+
+
+def read_frontmatter_bytes(file_path: Union[str, Path]) -> bytes:
+    """Read the raw YAML between the opening and closing fences, bounded by MAX_HEADER_BYTES"""
+    try:
+        with open(file_path, 'rb') as f:
+            first_line = f.readline(MAX_HEADER_BYTES)
+            if first_line.lstrip(b'\xef\xbb\xbf').rstrip() != _FENCE:
+                return b''
+
+            lines = []
+            size = 0
+            while True:
+                line = f.readline(MAX_HEADER_BYTES)
+                if not line:
+                    # No closing fence
+                    return b''
+                if line.rstrip() in (_FENCE, b'...'):
+                    return b''.join(lines)
+
+                size += len(line)
+                if size > MAX_HEADER_BYTES:
+                    return b''
+                lines.append(line)
+    except OSError:
+        return b''
+
+
+@lru_cache(maxsize=4096)
+def _parse_header(header: bytes) -> Dict[str, Any]:
+    """Parse a frontmatter header, memoized on its content"""
+    try:
+        metadata = yaml.load(header.decode('utf-8'), Loader=_YamlLoader)
+    except (yaml.YAMLError, UnicodeDecodeError):
+        return {}
+
+    return metadata if isinstance(metadata, dict) else {}
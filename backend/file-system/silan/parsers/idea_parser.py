@@ -12,6 +12,9 @@ from datetime import datetime, date
 from pathlib import Path
 import yaml
 from .base_parser import BaseParser, ExtractedContent
+from ..utils.folder_manifest import (
+    FolderManifest, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, DOCUMENT_EXTENSIONS
+)
 
 
 class IdeaParser(BaseParser):
@@ -45,19 +48,24 @@ class IdeaParser(BaseParser):
         except Exception as e:
             return f"Error: {e}"
 
-    def parse_folder(self, folder_path: Path) -> Optional[ExtractedContent]:
+    def parse_folder(self, folder_path: Path,
+                     manifest: Optional[FolderManifest] = None) -> Optional[ExtractedContent]:
         """
         Parse an idea folder structure with enhanced debugging.
+        
+        The folder is walked once into a FolderManifest shared by all scanners.
         """
         try:
+            if manifest is None:
+                manifest = FolderManifest.build(folder_path)
+            
             # Look for main content file
             main_files = ['README.md', 'index.md', 'idea.md']
             main_file = None
             
             for filename in main_files:
-                file_path = folder_path / filename
-                if file_path.exists():
-                    main_file = file_path
+                if manifest.has_file(filename):
+                    main_file = folder_path / filename
                     break
             
             if not main_file:
@@ -79,7 +87,7 @@ class IdeaParser(BaseParser):
             # Load idea configuration if exists
             config_file = folder_path / 'config.yaml'
             config_data = {}
-            if config_file.exists():
+            if manifest.has_file('config.yaml'):
                 try:
                     with open(config_file, 'r', encoding='utf-8') as f:
                         config_data = yaml.safe_load(f) or {}
@@ -87,7 +95,7 @@ class IdeaParser(BaseParser):
                     self.warning(f"Error reading config.yaml: {e}")
             
             # Enhance extracted data with folder structure
-            self._enhance_with_folder_data(extracted, folder_path, config_data)
+            self._enhance_with_folder_data(extracted, folder_path, config_data, manifest)
             
             # Final check - if motivation is still empty, force set it
             if not extracted.main_entity.get('motivation') and debug_motivation:
@@ -99,7 +107,8 @@ class IdeaParser(BaseParser):
             self.error(f"Error parsing idea folder {folder_path}: {e}")
             return None
     
-    def _enhance_with_folder_data(self, extracted: ExtractedContent, folder_path: Path, config_data: Dict):
+    def _enhance_with_folder_data(self, extracted: ExtractedContent, folder_path: Path, config_data: Dict,
+                                  manifest: FolderManifest):
         """Enhance extracted data with folder structure information"""
         
         # Update idea data with config
@@ -125,32 +134,32 @@ class IdeaParser(BaseParser):
             extracted.metadata['config_data'] = config_data
         
         # Scan research folder
-        research_data = self._scan_research_folder(folder_path / 'research')
+        research_data = self._scan_research_folder(manifest)
         extracted.metadata['research_materials'] = research_data
         
         # Scan notes folder
-        notes_data = self._scan_notes_folder(folder_path / 'notes')
+        notes_data = self._scan_notes_folder(manifest)
         extracted.metadata['development_notes'] = notes_data
         
         # Scan experiments folder
-        experiments_data = self._scan_experiments_folder(folder_path / 'experiments')
+        experiments_data = self._scan_experiments_folder(manifest)
         extracted.metadata['experiments'] = experiments_data
         
         # Scan references folder
-        references_data = self._scan_references_folder(folder_path / 'references')
+        references_data = self._scan_references_folder(manifest)
         extracted.metadata['references'] = references_data
         
         # Scan prototypes folder
-        prototypes_data = self._scan_prototypes_folder(folder_path / 'prototypes')
+        prototypes_data = self._scan_prototypes_folder(manifest)
         extracted.metadata['prototypes'] = prototypes_data
         
         # Scan assets folder
-        assets_data = self._scan_assets_folder(folder_path / 'assets')
+        assets_data = self._scan_assets_folder(manifest)
         extracted.metadata['assets'] = assets_data
         if assets_data.get('images'):
             extracted.images.extend(assets_data['images'])
     
-    def _scan_research_folder(self, research_folder: Path) -> Dict[str, Any]:
+    def _scan_research_folder(self, manifest: FolderManifest) -> Dict[str, Any]:
         """Scan research folder for research materials"""
         research_data = {
             'papers': [],
@@ -159,149 +168,131 @@ class IdeaParser(BaseParser):
             'technical_research': []
         }
         
-        if not research_folder.exists():
-            return research_data
-        
-        for research_file in research_folder.rglob('*'):
-            if research_file.is_file() and research_file.suffix.lower() in {'.md', '.txt', '.pdf', '.doc', '.docx'}:
-                filename_lower = research_file.name.lower()
-                
-                file_data = {
-                    'filename': research_file.name,
-                    'path': str(research_file.relative_to(research_folder)),
-                    'size': research_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(research_file.stat().st_mtime)
-                }
-                
-                # Categorize research file
-                if any(keyword in filename_lower for keyword in ['paper', 'article', 'journal']):
-                    research_data['papers'].append(file_data)
-                elif any(keyword in filename_lower for keyword in ['market', 'user', 'survey']):
-                    research_data['market_analysis'].append(file_data)
-                elif any(keyword in filename_lower for keyword in ['competitor', 'competitive', 'analysis']):
-                    research_data['competitive_analysis'].append(file_data)
-                else:
-                    research_data['technical_research'].append(file_data)
+        for research_file in manifest.files('research', {'.md', '.txt', '.pdf', '.doc', '.docx'}):
+            filename_lower = research_file.name.lower()
+            
+            file_data = {
+                'filename': research_file.name,
+                'path': research_file.relative_to('research'),
+                'size': research_file.size,
+                'modified': research_file.modified
+            }
+            
+            # Categorize research file
+            if any(keyword in filename_lower for keyword in ['paper', 'article', 'journal']):
+                research_data['papers'].append(file_data)
+            elif any(keyword in filename_lower for keyword in ['market', 'user', 'survey']):
+                research_data['market_analysis'].append(file_data)
+            elif any(keyword in filename_lower for keyword in ['competitor', 'competitive', 'analysis']):
+                research_data['competitive_analysis'].append(file_data)
+            else:
+                research_data['technical_research'].append(file_data)
         
         return research_data
     
-    def _scan_notes_folder(self, notes_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_notes_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan notes folder for development notes"""
         notes = []
         
-        if not notes_folder.exists():
-            return notes
-        
-        for note_file in notes_folder.rglob('*.md'):
-            if note_file.is_file():
-                try:
-                    # Read content for analysis
-                    with open(note_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        summary = content[:200] + ('...' if len(content) > 200 else '')
-                    
-                    # Categorize note type
-                    note_type = self._categorize_note_type(note_file.name, content)
-                    
-                    notes.append({
-                        'filename': note_file.name,
-                        'path': str(note_file.relative_to(notes_folder)),
-                        'type': note_type,
-                        'summary': summary,
-                        'size': note_file.stat().st_size,
-                        'modified': datetime.fromtimestamp(note_file.stat().st_mtime)
-                    })
-                except Exception:
-                    continue
+        for note_file in manifest.files('notes'):
+            if note_file.suffix != '.md':
+                continue
+            try:
+                # Read content for analysis
+                with open(note_file.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    summary = content[:200] + ('...' if len(content) > 200 else '')
+                
+                # Categorize note type
+                note_type = self._categorize_note_type(note_file.name, content)
+                
+                notes.append({
+                    'filename': note_file.name,
+                    'path': note_file.relative_to('notes'),
+                    'type': note_type,
+                    'summary': summary,
+                    'size': note_file.size,
+                    'modified': note_file.modified
+                })
+            except Exception:
+                continue
         
         return notes
     
-    def _scan_experiments_folder(self, experiments_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_experiments_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan experiments folder for experiment records"""
         experiments = []
         
-        if not experiments_folder.exists():
-            return experiments
-        
-        for exp_file in experiments_folder.rglob('*'):
-            if exp_file.is_file():
-                experiment_data = {
-                    'filename': exp_file.name,
-                    'path': str(exp_file.relative_to(experiments_folder)),
-                    'type': self._classify_experiment_type(exp_file.name),
-                    'size': exp_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(exp_file.stat().st_mtime)
-                }
-                
-                # Try to extract experiment metadata from markdown files
-                if exp_file.suffix.lower() == '.md':
-                    try:
-                        with open(exp_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            experiment_data['summary'] = content[:200] + ('...' if len(content) > 200 else '')
-                    except Exception:
-                        pass
-                
-                experiments.append(experiment_data)
+        for exp_file in manifest.files('experiments'):
+            experiment_data = {
+                'filename': exp_file.name,
+                'path': exp_file.relative_to('experiments'),
+                'type': self._classify_experiment_type(exp_file.name),
+                'size': exp_file.size,
+                'modified': exp_file.modified
+            }
+            
+            # Try to extract experiment metadata from markdown files
+            if exp_file.extension == '.md':
+                try:
+                    with open(exp_file.path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                        experiment_data['summary'] = content[:200] + ('...' if len(content) > 200 else '')
+                except Exception:
+                    pass
+            
+            experiments.append(experiment_data)
         
         return experiments
     
-    def _scan_references_folder(self, references_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_references_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan references folder for reference materials"""
         references = []
         
-        if not references_folder.exists():
-            return references
-        
         reference_exts = {'.md', '.txt', '.pdf', '.url', '.webloc'}
         
-        for ref_file in references_folder.rglob('*'):
-            if ref_file.is_file() and ref_file.suffix.lower() in reference_exts:
-                ref_data = {
-                    'filename': ref_file.name,
-                    'path': str(ref_file.relative_to(references_folder)),
-                    'type': self._classify_reference_type(ref_file.name),
-                    'size': ref_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(ref_file.stat().st_mtime)
-                }
-                
-                # Extract URL from .url files
-                if ref_file.suffix.lower() == '.url':
-                    try:
-                        with open(ref_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            url_match = re.search(r'URL=(.+)', content)
-                            if url_match:
-                                ref_data['url'] = url_match.group(1).strip()
-                    except Exception:
-                        pass
-                
-                references.append(ref_data)
+        for ref_file in manifest.files('references', reference_exts):
+            ref_data = {
+                'filename': ref_file.name,
+                'path': ref_file.relative_to('references'),
+                'type': self._classify_reference_type(ref_file.name),
+                'size': ref_file.size,
+                'modified': ref_file.modified
+            }
+            
+            # Extract URL from .url files
+            if ref_file.extension == '.url':
+                try:
+                    with open(ref_file.path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                        url_match = re.search(r'URL=(.+)', content)
+                        if url_match:
+                            ref_data['url'] = url_match.group(1).strip()
+                except Exception:
+                    pass
+            
+            references.append(ref_data)
         
         return references
     
-    def _scan_prototypes_folder(self, prototypes_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_prototypes_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan prototypes folder for prototype files"""
         prototypes = []
         
-        if not prototypes_folder.exists():
-            return prototypes
-        
-        for proto_file in prototypes_folder.rglob('*'):
-            if proto_file.is_file():
-                prototype_data = {
-                    'filename': proto_file.name,
-                    'path': str(proto_file.relative_to(prototypes_folder)),
-                    'type': self._classify_prototype_type(proto_file.name),
-                    'size': proto_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(proto_file.stat().st_mtime)
-                }
-                
-                prototypes.append(prototype_data)
+        for proto_file in manifest.files('prototypes'):
+            prototype_data = {
+                'filename': proto_file.name,
+                'path': proto_file.relative_to('prototypes'),
+                'type': self._classify_prototype_type(proto_file.name),
+                'size': proto_file.size,
+                'modified': proto_file.modified
+            }
+            
+            prototypes.append(prototype_data)
         
         return prototypes
     
-    def _scan_assets_folder(self, assets_folder: Path) -> Dict[str, Any]:
+    def _scan_assets_folder(self, manifest: FolderManifest) -> Dict[str, Any]:
         """Scan assets folder for images and media"""
         assets_data = {
             'images': [],
@@ -309,42 +300,31 @@ class IdeaParser(BaseParser):
             'documents': []
         }
         
-        if not assets_folder.exists():
-            return assets_data
-        
-        # Image extensions
-        image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp'}
-        video_exts = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
-        doc_exts = {'.pdf', '.doc', '.docx', '.ppt', '.pptx'}
-        
-        for asset_file in assets_folder.rglob('*'):
-            if not asset_file.is_file():
-                continue
-            
-            ext = asset_file.suffix.lower()
+        for asset_file in manifest.files('assets'):
+            ext = asset_file.extension
             
-            if ext in image_exts:
+            if ext in IMAGE_EXTENSIONS:
                 assets_data['images'].append({
-                    'image_url': str(asset_file.relative_to(assets_folder)),
+                    'image_url': asset_file.relative_to('assets'),
                     'alt_text': asset_file.stem.replace('-', ' ').replace('_', ' ').title(),
                     'caption': asset_file.stem.replace('-', ' ').replace('_', ' ').title(),
                     'image_type': self._classify_idea_image_type(asset_file.name),
                     'sort_order': len(assets_data['images']),
-                    'file_size': asset_file.stat().st_size
+                    'file_size': asset_file.size
                 })
-            elif ext in video_exts:
+            elif ext in VIDEO_EXTENSIONS:
                 assets_data['videos'].append({
                     'filename': asset_file.name,
-                    'path': str(asset_file.relative_to(assets_folder)),
-                    'size': asset_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(asset_file.stat().st_mtime)
+                    'path': asset_file.relative_to('assets'),
+                    'size': asset_file.size,
+                    'modified': asset_file.modified
                 })
-            elif ext in doc_exts:
+            elif ext in DOCUMENT_EXTENSIONS:
                 assets_data['documents'].append({
                     'filename': asset_file.name,
-                    'path': str(asset_file.relative_to(assets_folder)),
-                    'size': asset_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(asset_file.stat().st_mtime)
+                    'path': asset_file.relative_to('assets'),
+                    'size': asset_file.size,
+                    'modified': asset_file.modified
                 })
         
         return assets_data
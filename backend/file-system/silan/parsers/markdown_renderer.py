@@ -0,0 +1,320 @@
+"""
+Markdown to HTML rendering with a content-addressed render cache.
+
+Sync renders each content body once at write time and stores the HTML and a
+table of contents next to the raw markdown. Renders are keyed by a hash of the
+markdown text and the renderer settings, kept in memory for the run and on disk
+under ``.silan/cache/render`` so unchanged content is never rendered again.
+
+The converter itself is pluggable (``sync.markdown_renderer`` in silan.yaml).
+Every backend is configured for the features the content relies on (fenced
+code, tables, footnotes, task lists, strikethrough, hard line breaks) and its
+output is normalized afterwards, so header ids and the TOC built from them are
+the same whichever library produced the HTML.
+"""
+
+import hashlib
+import html
+import importlib.util
+import json
+import os
+import re
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from ..core.exceptions import ConfigurationError
+
+# Extras the content relies on: fenced code, tables, footnotes, task lists, header ids, toc.
+# 'metadata' is left out: frontmatter is stripped before rendering, and the extra
+# would swallow a leading heading such as '# Title: subtitle' as a metadata line.
+MARKDOWN2_EXTRAS = [
+    'fenced-code-blocks', 'tables', 'footnotes', 'task_list',
+    'strike', 'target-blank-links', 'code-friendly', 'cuddled-lists',
+    'header-ids', 'toc', 'wiki-tables', 'smarty-pants',
+    'break-on-newline', 'nofollow'
+]
+
+DEFAULT_BACKEND = 'markdown2'
+
+RENDER_CACHE_VERSION = 1
+
+_HEADING = re.compile(r'<h([1-6])\s+id="([^"]+)"[^>]*>(.*?)</h\1>', re.DOTALL | re.IGNORECASE)
+_HEADING_WITHOUT_ID = re.compile(r'<h([1-6])((?:\s+(?!id=)[^>]*)?)>(.*?)</h\1>', re.DOTALL | re.IGNORECASE)
+_TASK_ITEM = re.compile(r'<li>(\s*(?:<p>)?)\[([ xX])\]\s')
+_TAG = re.compile(r'<[^>]+>')
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_HYPHENATE = re.compile(r'[-\s]+')
+
+
+@dataclass
+class RenderedMarkdown:
+    """Rendered HTML and its table of contents"""
+    html: str = ''
+    toc: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def build_toc(rendered_html: str) -> List[Dict[str, Any]]:
+    """Build a flat table of contents from headings that carry an id"""
+    toc = []
+    for match in _HEADING.finditer(rendered_html):
+        title = html.unescape(_TAG.sub('', match.group(3))).strip()
+        if title:
+            toc.append({'level': int(match.group(1)), 'id': match.group(2), 'title': title})
+    return toc
+
+
+def slugify(text: str) -> str:
+    """Header id slug, identical to markdown2's header-ids extra"""
+    text = unicodedata.normalize('NFKD', text).encode('utf-8', 'ignore').decode()
+    text = _SLUG_STRIP.sub('', text).strip().lower()
+    return _SLUG_HYPHENATE.sub('-', text)
+
+
+def add_header_ids(rendered_html: str) -> str:
+    """Give headings without an id a slug id, numbering repeats like markdown2 does"""
+    seen: Dict[str, int] = {}
+
+    def replace(match: 're.Match[str]') -> str:
+        title = html.unescape(_TAG.sub('', match.group(3))).strip()
+        header_id = slugify(title)
+        if not header_id:
+            return match.group(0)
+        if header_id in seen:
+            seen[header_id] += 1
+            header_id = f"{header_id}-{seen[header_id]}"
+        else:
+            seen[header_id] = 1
+        level = match.group(1)
+        return f'<h{level} id="{header_id}"{match.group(2)}>{match.group(3)}</h{level}>'
+
+    return _HEADING_WITHOUT_ID.sub(replace, rendered_html)
+
+
+def _task_item(match: 're.Match[str]') -> str:
+    checked = ' checked' if match.group(2) in 'xX' else ''
+    return (f'<li class="task-list-item">{match.group(1)}'
+            f'<input type="checkbox" class="task-list-item-checkbox"{checked} disabled> ')
+
+
+class MarkdownBackend(ABC):
+    """One markdown library behind a common ``convert`` call.
+
+    Converters are built per thread, since some libraries keep state between
+    calls. Subclasses set ``name`` and ``module`` and build the converter.
+    """
+
+    name = ''
+    module = ''
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the backing library is installed"""
+        return importlib.util.find_spec(cls.module) is not None
+
+    @property
+    def signature(self) -> str:
+        """Settings that affect the output, part of the render cache key"""
+        return ''
+
+    def convert(self, text: str) -> str:
+        """Convert markdown to normalized HTML"""
+        converter = getattr(self._local, 'converter', None)
+        if converter is None:
+            converter = self._create()
+            self._local.converter = converter
+        rendered_html = str(converter(text))
+        # Task lists written as '[ ]' items when the library has no task list support
+        rendered_html = _TASK_ITEM.sub(_task_item, rendered_html)
+        return add_header_ids(rendered_html)
+
+    @abstractmethod
+    def _create(self) -> Callable[[str], str]:
+        """Build this thread's converter"""
+
+
+class Markdown2Backend(MarkdownBackend):
+    """markdown2 with the extras the content was written against"""
+
+    name = 'markdown2'
+    module = 'markdown2'
+
+    @property
+    def signature(self) -> str:
+        return ','.join(MARKDOWN2_EXTRAS)
+
+    def _create(self) -> Callable[[str], str]:
+        import markdown2
+        return markdown2.Markdown(extras=MARKDOWN2_EXTRAS).convert
+
+
+class MarkdownItBackend(MarkdownBackend):
+    """markdown-it-py in CommonMark mode plus tables and strikethrough.
+
+    Footnotes and task lists come from mdit-py-plugins when it is installed.
+    """
+
+    name = 'markdown-it-py'
+    module = 'markdown_it'
+
+    @property
+    def signature(self) -> str:
+        plugins = importlib.util.find_spec('mdit_py_plugins') is not None
+        return 'commonmark,breaks,html,table,strikethrough' + (',footnote,tasklists' if plugins else '')
+
+    def _create(self) -> Callable[[str], str]:
+        from markdown_it import MarkdownIt
+        md = MarkdownIt('commonmark', {'breaks': True, 'html': True}).enable(['table', 'strikethrough'])
+        try:
+            from mdit_py_plugins.footnote import footnote_plugin
+            from mdit_py_plugins.tasklists import tasklists_plugin
+        except ImportError:
+            return md.render
+        return md.use(footnote_plugin).use(tasklists_plugin).render
+
+
+class MistuneBackend(MarkdownBackend):
+    """mistune with its table, footnote, task list and strikethrough plugins"""
+
+    name = 'mistune'
+    module = 'mistune'
+    plugins = ('strikethrough', 'footnotes', 'table', 'task_lists')
+
+    @property
+    def signature(self) -> str:
+        return 'hard_wrap,raw_html,' + ','.join(self.plugins)
+
+    def _create(self) -> Callable[[str], str]:
+        import mistune
+        return mistune.create_markdown(escape=False, hard_wrap=True, plugins=list(self.plugins))
+
+
+RENDERER_BACKENDS: Dict[str, Type[MarkdownBackend]] = {
+    'markdown2': Markdown2Backend,
+    'markdown-it-py': MarkdownItBackend,
+    'markdown-it': MarkdownItBackend,
+    'mistune': MistuneBackend,
+}
+
+
+def create_backend(name: str = DEFAULT_BACKEND) -> MarkdownBackend:
+    """
+    Create a markdown backend by its silan.yaml name.
+
+    Args:
+        name: One of RENDERER_BACKENDS
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ConfigurationError: If the name is unknown or the library is not installed
+    """
+    backend_class = RENDERER_BACKENDS.get(str(name).strip().lower())
+    if backend_class is None:
+        raise ConfigurationError(
+            f"Unknown markdown renderer '{name}'; choose one of: {', '.join(sorted(RENDERER_BACKENDS))}"
+        )
+    if not backend_class.available():
+        raise ConfigurationError(
+            f"Markdown renderer '{name}' needs the '{backend_class.module}' package to be installed"
+        )
+    return backend_class()
+
+
+class MarkdownRenderer:
+    """Render markdown with a backend, memoized in memory and on disk by content hash"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, memory_size: int = 256,
+                 backend: Optional[MarkdownBackend] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_size = memory_size
+        self.backend = backend or Markdown2Backend()
+
+        self._memory: 'OrderedDict[str, RenderedMarkdown]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.rendered_count = 0
+        self.cached_count = 0
+
+    @property
+    def cache_key_prefix(self) -> str:
+        """Identifies the renderer settings a cached render was produced with"""
+        return f"{self.backend.name}:{self.backend.signature}:v{RENDER_CACHE_VERSION}"
+
+    def render(self, text: str) -> RenderedMarkdown:
+        """
+        Render markdown text, reusing a cached render for identical input.
+
+        Args:
+            text: Markdown body without frontmatter
+
+        Returns:
+            RenderedMarkdown with HTML and table of contents
+        """
+        if not text or not text.strip():
+            return RenderedMarkdown()
+
+        key = hashlib.sha256(f"{self.cache_key_prefix}\n{text}".encode('utf-8')).hexdigest()
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.cached_count += 1
+                return cached
+
+        rendered = self._load(key)
+        if rendered is not None:
+            with self._lock:
+                self.cached_count += 1
+        else:
+            rendered_html = self.backend.convert(text)
+            rendered = RenderedMarkdown(html=rendered_html, toc=build_toc(rendered_html))
+            self._store(key, rendered)
+            with self._lock:
+                self.rendered_count += 1
+
+        with self._lock:
+            self._memory[key] = rendered
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return rendered
+
+    def _cache_file(self, key: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[RenderedMarkdown]:
+        """Load a render from the disk cache"""
+        cache_file = self._cache_file(key)
+        if not cache_file:
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return RenderedMarkdown(html=data['html'], toc=data.get('toc', []))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store(self, key: str, rendered: RenderedMarkdown) -> None:
+        """Write a render to the disk cache; failures only cost a re-render later"""
+        cache_file = self._cache_file(key)
+        if not cache_file:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'html': rendered.html, 'toc': rendered.toc}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
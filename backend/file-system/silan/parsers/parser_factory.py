@@ -5,13 +5,12 @@ This module provides a factory pattern for instantiating the appropriate
 parser based on file path, content type, or metadata analysis.
 """
 
+import importlib
 from pathlib import Path
-from typing import Dict, Any, Optional, Type, Union, List
-from .base_parser import BaseParser, ExtractedContent
-from .resume_parser import ResumeParser
-from .project_parser import ProjectParser
-from .blog_parser import BlogParser
-from .idea_parser import IdeaParser
+from typing import Dict, Any, Optional, Type, Union, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_parser import BaseParser, ExtractedContent
 
 
 class ParserFactory:
@@ -22,22 +21,47 @@ class ParserFactory:
     for extracting structured data from markdown files.
     """
     
-    # Registry of available parsers
-    _parsers: Dict[str, Type[BaseParser]] = {
-        'resume': ResumeParser,
-        'project': ProjectParser,
-        'projects': ProjectParser,  # Handle plural
-        'blog': BlogParser,
-        'blog_post': BlogParser,
-        'idea': IdeaParser,
-        'ideas': IdeaParser,  # Handle plural
+    # Registry of available parsers. Entries may be "module:Class" paths that are
+    # imported on first use, so loading the factory does not pull in frontmatter.
+    _parsers: Dict[str, Union[str, Type['BaseParser']]] = {
+        'resume': 'resume_parser:ResumeParser',
+        'cv': 'resume_parser:ResumeParser',
+        'project': 'project_parser:ProjectParser',
+        'projects': 'project_parser:ProjectParser',  # Handle plural
+        'blog': 'blog_parser:BlogParser',
+        'blog_post': 'blog_parser:BlogParser',
+        'article': 'blog_parser:BlogParser',
+        'vlog': 'blog_parser:BlogParser',
+        'video': 'blog_parser:BlogParser',
+        'podcast': 'blog_parser:BlogParser',
+        'tutorial': 'blog_parser:BlogParser',
+        'idea': 'idea_parser:IdeaParser',
+        'ideas': 'idea_parser:IdeaParser',  # Handle plural
+        'concept': 'idea_parser:IdeaParser',
+        'update': 'update_parser:UpdateParser',
+        'updates': 'update_parser:UpdateParser',
+        'recent_update': 'update_parser:UpdateParser',
     }
     
     # Default parser for unknown content types
-    _default_parser = ProjectParser  # Use project parser as fallback
+    _default_parser = 'project'  # Use project parser as fallback
+    
+    @classmethod
+    def _resolve(cls, content_type: str) -> Optional[Type['BaseParser']]:
+        """Resolve a registry entry to a parser class, importing it if needed"""
+        key = content_type.lower()
+        parser_class = cls._parsers.get(key)
+        
+        if isinstance(parser_class, str):
+            module_name, class_name = parser_class.split(':')
+            module = importlib.import_module(f".{module_name}", __package__)
+            parser_class = getattr(module, class_name)
+            cls._parsers[key] = parser_class
+        
+        return parser_class
     
     @classmethod
-    def get_parser(cls, content_type: str) -> Optional[Type[BaseParser]]:
+    def get_parser(cls, content_type: str) -> Optional[Type['BaseParser']]:
         """
         Get parser class for a specific content type.
         
@@ -47,7 +71,7 @@ class ParserFactory:
         Returns:
             Parser class or None if not found
         """
-        return cls._parsers.get(content_type.lower())
+        return cls._resolve(content_type)
     
     @classmethod
     def create_parser(
@@ -56,7 +80,7 @@ class ParserFactory:
         content_type: Optional[str] = None,
         file_path: Optional[Path] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> BaseParser:
+    ) -> 'BaseParser':
         """
         Create appropriate parser based on content type detection.
         
@@ -71,21 +95,21 @@ class ParserFactory:
         """
         # Determine content type if not provided
         if not content_type:
-            content_type = self._detect_content_type(file_path, metadata)
+            content_type = cls._detect_content_type(file_path, metadata)
         
         # Get parser class
-        parser_class = self._parsers.get(content_type.lower(), self._default_parser)
+        parser_class = cls._resolve(content_type) or cls._resolve(cls._default_parser)
         
         # Create and return parser instance
         return parser_class(content_dir)
     
     @classmethod
-    def get_available_parsers(cls) -> Dict[str, Type[BaseParser]]:
+    def get_available_parsers(cls) -> Dict[str, Type['BaseParser']]:
         """Get dictionary of available parsers"""
-        return cls._parsers.copy()
+        return {content_type: cls._resolve(content_type) for content_type in list(cls._parsers)}
     
     @classmethod
-    def register_parser(cls, content_type: str, parser_class: Type[BaseParser]):
+    def register_parser(cls, content_type: str, parser_class: Union[str, Type['BaseParser']]):
         """Register a new parser for a content type"""
         cls._parsers[content_type.lower()] = parser_class
     
@@ -197,7 +221,7 @@ class ParserFactory:
         cls, 
         file_path: Path, 
         content_dir: Optional[Path] = None
-    ) -> Optional[ExtractedContent]:
+    ) -> Optional['ExtractedContent']:
         """
         Parse a file with automatic parser detection.
         
@@ -212,20 +236,19 @@ class ParserFactory:
             content_dir = file_path.parent
         
         try:
-            # Read file metadata first for type detection
-            import frontmatter
-            with open(file_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
+            # Read only the frontmatter header for type detection
+            from .frontmatter_reader import read_frontmatter
+            metadata = read_frontmatter(file_path)
             
             # Detect content type
-            content_type = cls._detect_content_type(file_path, post.metadata)
+            content_type = cls._detect_content_type(file_path, metadata)
             
             # Create appropriate parser
             parser = cls.create_parser(
                 content_dir=content_dir,
                 content_type=content_type,
                 file_path=file_path,
-                metadata=post.metadata
+                metadata=metadata
             )
             
             # Parse file
@@ -240,7 +263,7 @@ class ParserFactory:
         cls, 
         content_dir: Path, 
         pattern: str = "**/*.md"
-    ) -> Dict[str, List[ExtractedContent]]:
+    ) -> Dict[str, List['ExtractedContent']]:
         """
         Parse all files in a directory with automatic type detection.
         
@@ -273,9 +296,9 @@ class ParserFactory:
         return results
     
     @classmethod
-    def get_parser_for_type(cls, content_type: str) -> Optional[Type[BaseParser]]:
+    def get_parser_for_type(cls, content_type: str) -> Optional[Type['BaseParser']]:
         """Get parser class for a specific content type"""
-        return cls._parsers.get(content_type.lower())
+        return cls._resolve(content_type)
     
     @classmethod
     def supports_content_type(cls, content_type: str) -> bool:
@@ -295,14 +318,14 @@ class ParsedContentCollection:
     Provides utilities for filtering, sorting, and analyzing parsed content.
     """
     
-    def __init__(self, content_data: Dict[str, List[ExtractedContent]]):
+    def __init__(self, content_data: Dict[str, List['ExtractedContent']]):
         self.content_data = content_data
     
-    def get_by_type(self, content_type: str) -> List[ExtractedContent]:
+    def get_by_type(self, content_type: str) -> List['ExtractedContent']:
         """Get all content of a specific type"""
         return self.content_data.get(content_type, [])
     
-    def get_all_content(self) -> List[ExtractedContent]:
+    def get_all_content(self) -> List['ExtractedContent']:
         """Get all parsed content regardless of type"""
         all_content = []
         for content_list in self.content_data.values():
@@ -12,6 +12,9 @@ from datetime import datetime, date
 from pathlib import Path
 import yaml
 from .base_parser import BaseParser, ExtractedContent
+from ..utils.folder_manifest import (
+    FolderManifest, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, TEXT_EXTENSIONS
+)
 
 
 class ProjectParser(BaseParser):
@@ -28,10 +31,14 @@ class ProjectParser(BaseParser):
     def _get_content_type(self) -> str:
         return 'project'
     
-    def parse_folder(self, folder_path: Path) -> Optional[ExtractedContent]:
+    def parse_folder(self, folder_path: Path,
+                     manifest: Optional[FolderManifest] = None) -> Optional[ExtractedContent]:
         """
         Parse a project folder structure.
         
+        The folder is walked once into a FolderManifest shared by all scanners;
+        pass one in to reuse a walk that was already done.
+        
         Expected structure:
         project-name/
         ├── README.md (main content)
@@ -44,14 +51,16 @@ class ProjectParser(BaseParser):
         └── research/
         """
         try:
+            if manifest is None:
+                manifest = FolderManifest.build(folder_path)
+            
             # Look for main content file
             main_files = ['README.md', 'index.md', 'project.md']
             main_file = None
             
             for filename in main_files:
-                file_path = folder_path / filename
-                if file_path.exists():
-                    main_file = file_path
+                if manifest.has_file(filename):
+                    main_file = folder_path / filename
                     break
             
             if not main_file:
@@ -66,7 +75,7 @@ class ProjectParser(BaseParser):
             # Load project configuration if exists
             config_file = folder_path / 'config.yaml'
             config_data = {}
-            if config_file.exists():
+            if manifest.has_file('config.yaml'):
                 try:
                     with open(config_file, 'r', encoding='utf-8') as f:
                         config_data = yaml.safe_load(f) or {}
@@ -74,7 +83,7 @@ class ProjectParser(BaseParser):
                     self.warning(f"Error reading config.yaml: {e}")
             
             # Enhance extracted data with folder structure
-            self._enhance_with_folder_data(extracted, folder_path, config_data)
+            self._enhance_with_folder_data(extracted, folder_path, config_data, manifest)
             
             return extracted
             
@@ -82,7 +91,8 @@ class ProjectParser(BaseParser):
             self.error(f"Error parsing project folder {folder_path}: {e}")
             return None
     
-    def _enhance_with_folder_data(self, extracted: ExtractedContent, folder_path: Path, config_data: Dict):
+    def _enhance_with_folder_data(self, extracted: ExtractedContent, folder_path: Path, config_data: Dict,
+                                  manifest: FolderManifest):
         """Enhance extracted data with folder structure information"""
         
         # Update project data with config
@@ -96,174 +106,162 @@ class ProjectParser(BaseParser):
                 config_project_data = config_data
             
             # Debug logging
-            self.debug(f"Enhancing project {project_data.get('title', 'Unknown')} with config data")
-            self.debug(f"Config description: {config_project_data.get('description', 'Missing')}")
-            self.debug(f"Before - project description: {project_data.get('description', 'Missing')}")
+            self.debug("Enhancing project %s with config data", project_data.get('title', 'Unknown'))
+            self.debug("Config description: %s", config_project_data.get('description', 'Missing'))
+            self.debug("Before - project description: %s", project_data.get('description', 'Missing'))
             
             # Override with config data if available
             for key, value in config_project_data.items():
                 if key in project_data and value is not None:
                     old_value = project_data[key]
                     project_data[key] = value
-                    self.debug(f"Updated {key}: '{old_value}' -> '{value}'")
+                    self.debug("Updated %s: '%s' -> '%s'", key, old_value, value)
                 # Also add any new fields that don't exist yet
                 elif key not in project_data and value is not None:
                     project_data[key] = value
-                    self.debug(f"Added new {key}: '{value}'")
+                    self.debug("Added new %s: '%s'", key, value)
             
             # Handle nested config structure - extract links
             if 'links' in config_project_data:
                 links = config_project_data['links']
-                self.debug(f"Processing links: {links}")
+                self.debug("Processing links: %s", links)
                 if 'github' in links:
                     project_data['github_url'] = links['github']
-                    self.debug(f"Set github_url: {links['github']}")
+                    self.debug("Set github_url: %s", links['github'])
                 if 'demo' in links:
                     project_data['demo_url'] = links['demo']
-                    self.debug(f"Set demo_url: {links['demo']}")
+                    self.debug("Set demo_url: %s", links['demo'])
                 if 'documentation' in links:
                     project_data['documentation_url'] = links['documentation']
-                    self.debug(f"Set documentation_url: {links['documentation']}")
+                    self.debug("Set documentation_url: %s", links['documentation'])
             
             # Handle nested metadata - extract featured flag
             if 'metadata' in config_project_data:
                 metadata = config_project_data['metadata']
                 if 'featured' in metadata:
                     project_data['is_featured'] = metadata['featured']
-                    self.debug(f"Set is_featured: {metadata['featured']}")
+                    self.debug("Set is_featured: %s", metadata['featured'])
             
-            self.debug(f"After - project description: {project_data.get('description', 'Missing')}")
-            self.debug(f"After - github_url: {project_data.get('github_url', 'Missing')}")
-            self.debug(f"After - is_featured: {project_data.get('is_featured', 'Missing')}")
+            self.debug("After - project description: %s", project_data.get('description', 'Missing'))
+            self.debug("After - github_url: %s", project_data.get('github_url', 'Missing'))
+            self.debug("After - is_featured: %s", project_data.get('is_featured', 'Missing'))
             
             # Add folder-specific data to metadata (not main entity)
             extracted.metadata['folder_path'] = str(folder_path)
             extracted.metadata['config_data'] = config_data
         
         # Scan assets folder for images and media
-        assets_folder = folder_path / 'assets'
-        if assets_folder.exists():
-            folder_images = self._scan_assets_folder(assets_folder)
+        if manifest.has_dir('assets'):
+            folder_images = self._scan_assets_folder(manifest)
             extracted.images.extend(folder_images)
         
         # Scan for additional documentation
-        docs = self._scan_documentation_files(folder_path)
+        docs = self._scan_documentation_files(manifest)
         extracted.metadata['documentation_files'] = docs
         
         # Scan notes folder
-        notes = self._scan_notes_folder(folder_path / 'notes')
+        notes = self._scan_notes_folder(manifest)
         extracted.metadata['notes'] = notes
         
         # Scan research folder
-        research = self._scan_research_folder(folder_path / 'research')
+        research = self._scan_research_folder(manifest)
         extracted.metadata['research'] = research
     
-    def _scan_assets_folder(self, assets_folder: Path) -> List[Dict[str, Any]]:
+    def collect_asset_images(self, folder_path: Path,
+                             manifest: Optional[FolderManifest] = None) -> List[Dict[str, Any]]:
+        """Collect gallery images and videos from a project folder's assets"""
+        if manifest is None:
+            manifest = FolderManifest.build(folder_path)
+        if not manifest.has_dir('assets'):
+            return []
+        return self._scan_assets_folder(manifest)
+    
+    def _scan_assets_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan assets folder for images and media"""
         images = []
         
-        # Image extensions
-        image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp'}
-        
         # Scan images subfolder
-        images_folder = assets_folder / 'images'
-        if images_folder.exists():
-            for img_file in images_folder.rglob('*'):
-                if img_file.is_file() and img_file.suffix.lower() in image_exts:
-                    images.append({
-                        'image_url': str(img_file.relative_to(assets_folder)),
-                        'alt_text': img_file.stem.replace('-', ' ').replace('_', ' ').title(),
-                        'caption': img_file.stem.replace('-', ' ').replace('_', ' ').title(),
-                        'image_type': self._classify_project_image(str(img_file), img_file.stem),
-                        'sort_order': len(images),
-                        'file_size': img_file.stat().st_size if img_file.exists() else 0
-                    })
+        for img_file in manifest.files('assets/images', IMAGE_EXTENSIONS):
+            images.append({
+                'image_url': img_file.relative_to('assets'),
+                'alt_text': img_file.stem.replace('-', ' ').replace('_', ' ').title(),
+                'caption': img_file.stem.replace('-', ' ').replace('_', ' ').title(),
+                'image_type': self._classify_project_image(str(img_file.path), img_file.stem),
+                'sort_order': len(images),
+                'file_size': img_file.size,
+                'source_path': str(img_file.path)
+            })
         
         # Scan videos subfolder
-        videos_folder = assets_folder / 'videos'
-        if videos_folder.exists():
-            video_exts = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
-            for video_file in videos_folder.rglob('*'):
-                if video_file.is_file() and video_file.suffix.lower() in video_exts:
-                    images.append({
-                        'image_url': str(video_file.relative_to(assets_folder)),
-                        'alt_text': video_file.stem.replace('-', ' ').replace('_', ' ').title(),
-                        'caption': video_file.stem.replace('-', ' ').replace('_', ' ').title(),
-                        'image_type': 'video',
-                        'sort_order': len(images),
-                        'file_size': video_file.stat().st_size if video_file.exists() else 0
-                    })
+        for video_file in manifest.files('assets/videos', VIDEO_EXTENSIONS):
+            images.append({
+                'image_url': video_file.relative_to('assets'),
+                'alt_text': video_file.stem.replace('-', ' ').replace('_', ' ').title(),
+                'caption': video_file.stem.replace('-', ' ').replace('_', ' ').title(),
+                'image_type': 'video',
+                'sort_order': len(images),
+                'file_size': video_file.size,
+                'source_path': str(video_file.path)
+            })
         
         return images
     
-    def _scan_documentation_files(self, folder_path: Path) -> List[Dict[str, Any]]:
+    def _scan_documentation_files(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan for additional documentation files"""
         docs = []
         
-        # Documentation extensions
-        doc_exts = {'.md', '.txt', '.rst', '.adoc'}
-        
         # Scan docs subfolder
-        docs_folder = folder_path / 'assets' / 'docs'
-        if docs_folder.exists():
-            for doc_file in docs_folder.rglob('*'):
-                if doc_file.is_file() and doc_file.suffix.lower() in doc_exts:
-                    docs.append({
-                        'filename': doc_file.name,
-                        'path': str(doc_file.relative_to(folder_path)),
-                        'type': self._classify_documentation_type(doc_file.name),
-                        'size': doc_file.stat().st_size,
-                        'modified': datetime.fromtimestamp(doc_file.stat().st_mtime)
-                    })
+        for doc_file in manifest.files('assets/docs', TEXT_EXTENSIONS):
+            docs.append({
+                'filename': doc_file.name,
+                'path': doc_file.relative_to(),
+                'type': self._classify_documentation_type(doc_file.name),
+                'size': doc_file.size,
+                'modified': doc_file.modified
+            })
         
         return docs
     
-    def _scan_notes_folder(self, notes_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_notes_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan notes folder for development notes"""
         notes = []
         
-        if not notes_folder.exists():
-            return notes
-        
-        for note_file in notes_folder.rglob('*.md'):
-            if note_file.is_file():
-                try:
-                    # Read first few lines for summary
-                    with open(note_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        summary = content[:200] + ('...' if len(content) > 200 else '')
-                    
-                    notes.append({
-                        'filename': note_file.name,
-                        'path': str(note_file.relative_to(notes_folder)),
-                        'summary': summary,
-                        'size': note_file.stat().st_size,
-                        'modified': datetime.fromtimestamp(note_file.stat().st_mtime)
-                    })
-                except Exception:
-                    continue
+        for note_file in manifest.files('notes'):
+            if note_file.suffix != '.md':
+                continue
+            try:
+                # Read first few lines for summary
+                with open(note_file.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    summary = content[:200] + ('...' if len(content) > 200 else '')
+                
+                notes.append({
+                    'filename': note_file.name,
+                    'path': note_file.relative_to('notes'),
+                    'summary': summary,
+                    'size': note_file.size,
+                    'modified': note_file.modified
+                })
+            except Exception:
+                continue
         
         return notes
     
-    def _scan_research_folder(self, research_folder: Path) -> List[Dict[str, Any]]:
+    def _scan_research_folder(self, manifest: FolderManifest) -> List[Dict[str, Any]]:
         """Scan research folder for research materials"""
         research = []
         
-        if not research_folder.exists():
-            return research
-        
         # Research file extensions
         research_exts = {'.md', '.txt', '.pdf', '.doc', '.docx', '.xlsx', '.csv'}
         
-        for research_file in research_folder.rglob('*'):
-            if research_file.is_file() and research_file.suffix.lower() in research_exts:
-                research.append({
-                    'filename': research_file.name,
-                    'path': str(research_file.relative_to(research_folder)),
-                    'type': self._classify_research_type(research_file.name),
-                    'size': research_file.stat().st_size,
-                    'modified': datetime.fromtimestamp(research_file.stat().st_mtime)
-                })
+        for research_file in manifest.files('research', research_exts):
+            research.append({
+                'filename': research_file.name,
+                'path': research_file.relative_to('research'),
+                'type': self._classify_research_type(research_file.name),
+                'size': research_file.size,
+                'modified': research_file.modified
+            })
         
         return research
     
@@ -317,6 +315,7 @@ class ProjectParser(BaseParser):
         
         # Extract images and media
         images = self._extract_project_images(content, metadata)
+        self._resolve_local_images(images, Path(extracted.file_path).parent)
         extracted.images = images
         
         # Extract project relationships
@@ -394,7 +393,7 @@ class ProjectParser(BaseParser):
         technologies = []
         
         # Get technologies from metadata
-        tech_stack = metadata.get('tech_stack', [])
+        tech_stack = list(metadata.get('tech_stack', []))
         
         # Also try to get from nested technologies structure
         if 'technologies' in metadata:
@@ -410,8 +409,8 @@ class ProjectParser(BaseParser):
         # Also extract from content sections
         tech_from_content = self._extract_tech_from_content(content)
         
-        # Combine and deduplicate
-        all_techs = list(set(tech_stack + tech_from_content))
+        # Combine and deduplicate, keeping first-seen order so sort_order is stable across syncs
+        all_techs = list(dict.fromkeys(tech_stack + tech_from_content))
         
         for i, tech in enumerate(all_techs):
             if not tech or not tech.strip():
@@ -457,7 +456,7 @@ class ProjectParser(BaseParser):
             matches = re.findall(pattern, tech_section, re.IGNORECASE)
             technologies.extend([match for match in matches if match])
         
-        return list(set(technologies))
+        return list(dict.fromkeys(technologies))
     
     def _estimate_tech_proficiency(self, tech: str, content: str) -> str:
         """Estimate proficiency level based on context"""
@@ -598,6 +597,17 @@ class ProjectParser(BaseParser):
         
         return images
     
+    def _resolve_local_images(self, images: List[Dict[str, Any]], base_dir: Path):
+        """Record the local file behind relative image URLs so derivatives can be generated"""
+        for image in images:
+            url = image.get('image_url', '')
+            if not url or re.match(r'^([a-z][a-z0-9+.-]*:|//|/)', url, re.IGNORECASE):
+                continue
+            
+            candidate = base_dir / url.split('?', 1)[0].split('#', 1)[0]
+            if candidate.is_file():
+                image['source_path'] = str(candidate)
+    
     def _classify_project_image(self, url: str, alt_text: str) -> str:
         """Classify project image type"""
         url_lower = url.lower()
@@ -0,0 +1,226 @@
+"""
+Compare markdown renderer backends on real and synthetic content.
+
+Each installed backend is first checked against small samples of the features
+the content relies on, then timed over the markdown bodies of a content folder
+(by default the bundled ``api-test-portfolio``) and over generated long posts.
+The fastest backend that passes every check is the one to put in silan.yaml::
+
+    python -m silan.parsers.render_benchmark api-test-portfolio/content --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import frontmatter
+from rich.console import Console
+from rich.table import Table
+
+from .markdown_renderer import RENDERER_BACKENDS, MarkdownBackend, build_toc
+
+# The sample portfolio shipped next to the package in a source checkout
+BUNDLED_CONTENT = Path(__file__).resolve().parents[4] / 'api-test-portfolio' / 'content'
+
+# Feature samples and what the rendered HTML must contain for each
+FEATURE_CHECKS: Dict[str, Tuple[str, Callable[[str], bool]]] = {
+    'fenced_code': ("```python\nprint('x')\n```\n", lambda out: '<pre' in out and '<code' in out),
+    'tables': ("| a | b |\n|---|---|\n| 1 | 2 |\n", lambda out: '<table' in out and '<td' in out),
+    'footnotes': ("Claim[^1].\n\n[^1]: Source.\n", lambda out: 'fn' in out and '<sup' in out),
+    'task_lists': ("- [ ] open\n- [x] done\n", lambda out: out.count('type="checkbox"') == 2 and 'checked' in out),
+    'strikethrough': ("~~gone~~\n", lambda out: '<s>gone</s>' in out or '<del>gone</del>' in out),
+    'header_ids': ("## Getting Started\n\n## Getting Started\n",
+                   lambda out: 'id="getting-started"' in out and 'id="getting-started-2"' in out),
+    'toc': ("# Title: subtitle\n\n## Part *one*\n",
+            lambda out: [entry['title'] for entry in build_toc(out)] == ['Title: subtitle', 'Part one']),
+}
+
+
+@dataclass
+class BackendResult:
+    """Timings and compliance for one backend"""
+    name: str
+    available: bool
+    missing_features: List[str] = field(default_factory=list)
+    content_seconds: Optional[float] = None
+    synthetic_seconds: Optional[float] = None
+    throughput_mb_s: Optional[float] = None
+
+    @property
+    def compliant(self) -> bool:
+        return self.available and not self.missing_features
+
+
+def check_compliance(backend: MarkdownBackend) -> List[str]:
+    """Names of the required features a backend fails to render"""
+    missing = []
+    for feature, (sample, check) in FEATURE_CHECKS.items():
+        try:
+            if not check(backend.convert(sample)):
+                missing.append(feature)
+        except Exception:
+            missing.append(feature)
+    return missing
+
+
+def load_documents(paths: Sequence[Path]) -> List[str]:
+    """Markdown bodies (frontmatter removed) of every .md file under the given paths"""
+    documents = []
+    for path in paths:
+        files = [path] if path.is_file() else sorted(path.rglob('*.md'))
+        for file_path in files:
+            try:
+                documents.append(frontmatter.loads(file_path.read_text(encoding='utf-8')).content)
+            except Exception:
+                continue
+    return documents
+
+
+def synthetic_post(sections: int = 150, seed: int = 0) -> str:
+    """A long post exercising every required feature, deterministic for a given seed"""
+    parts = [f"# Synthetic post {seed}\n"]
+    for index in range(sections):
+        n = seed * sections + index
+        parts.append(f"## Section {index}: notes on topic {n % 17}\n")
+        parts.append(
+            f"Paragraph {n} with **bold**, *emphasis*, `inline code`, ~~old text~~ and a "
+            f"[link](https://example.com/{n}). A reference to the source[^{n}].\n"
+            "Second line of the same paragraph.\n"
+        )
+        parts.append(f"### Checklist {index}\n\n- [x] measured\n- [ ] compared\n- item {n}\n")
+        if index % 3 == 0:
+            parts.append(f"| metric | value |\n|---|---|\n| p50 | {n % 97} ms |\n| p95 | {n % 389} ms |\n")
+        if index % 4 == 0:
+            parts.append(f"```python\ndef handler_{n}(request):\n    return {{'id': {n}}}\n```\n")
+        parts.append(f"> Quote {n}: rendering once at sync time keeps requests fast.\n")
+        parts.append(f"[^{n}]: Footnote {n}.\n")
+    return '\n'.join(parts)
+
+
+def time_backend(backend: MarkdownBackend, documents: Sequence[str], repeat: int) -> float:
+    """Median seconds to render all documents once, after a warm-up pass"""
+    for document in documents:
+        backend.convert(document)
+
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        for document in documents:
+            backend.convert(document)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def run_benchmark(documents: Sequence[str], synthetic: Sequence[str], repeat: int = 5,
+                  backends: Optional[Sequence[str]] = None) -> List[BackendResult]:
+    """
+    Check and time each backend.
+
+    Args:
+        documents: Real markdown bodies
+        synthetic: Generated long posts
+        repeat: Timed passes per corpus; the median is reported
+        backends: Backend names to include; defaults to every registered backend
+
+    Returns:
+        One result per backend, fastest compliant first
+    """
+    names = backends or sorted({backend_class.name for backend_class in RENDERER_BACKENDS.values()})
+    total_bytes = sum(len(text.encode('utf-8')) for text in list(documents) + list(synthetic))
+
+    results = []
+    for name in names:
+        backend_class = RENDERER_BACKENDS[name]
+        if not backend_class.available():
+            results.append(BackendResult(name=name, available=False))
+            continue
+
+        backend = backend_class()
+        result = BackendResult(name=name, available=True, missing_features=check_compliance(backend))
+        result.content_seconds = time_backend(backend, documents, repeat) if documents else 0.0
+        result.synthetic_seconds = time_backend(backend, synthetic, repeat) if synthetic else 0.0
+        elapsed = result.content_seconds + result.synthetic_seconds
+        if elapsed > 0:
+            result.throughput_mb_s = total_bytes / elapsed / 1_000_000
+        results.append(result)
+
+    results.sort(key=lambda r: (
+        not r.compliant, not r.available, (r.content_seconds or 0) + (r.synthetic_seconds or 0)
+    ))
+    return results
+
+
+def display_results(results: Sequence[BackendResult], console: Console) -> None:
+    """Print the comparison table and the recommended backend"""
+    table = Table(title="Markdown renderer benchmark")
+    table.add_column("Backend", style="cyan")
+    table.add_column("Content (ms)", justify="right")
+    table.add_column("Synthetic (ms)", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("Missing features")
+
+    for result in results:
+        if not result.available:
+            table.add_row(result.name, "-", "-", "-", "[dim]not installed[/dim]")
+            continue
+        table.add_row(
+            result.name,
+            f"{(result.content_seconds or 0) * 1000:.1f}",
+            f"{(result.synthetic_seconds or 0) * 1000:.1f}",
+            f"{result.throughput_mb_s or 0:.2f}",
+            ', '.join(result.missing_features) or "[green]none[/green]"
+        )
+    console.print(table)
+
+    best = next((result for result in results if result.compliant), None)
+    if best:
+        console.print(f"Fastest compliant backend: [bold]{best.name}[/bold]")
+        console.print(f"  silan.yaml -> sync:\n    markdown_renderer: {best.name}")
+    else:
+        console.print("[yellow]No installed backend renders every required feature[/yellow]")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare markdown renderer backends")
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help="Content folders or files (default: the bundled api-test-portfolio, "
+                             "else ./content)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed passes per corpus")
+    parser.add_argument('--synthetic', type=int, default=5, help="Number of synthetic long posts")
+    parser.add_argument('--sections', type=int, default=150, help="Sections per synthetic post")
+    parser.add_argument('--backend', action='append', choices=sorted(RENDERER_BACKENDS),
+                        help="Only benchmark these backends")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [BUNDLED_CONTENT if BUNDLED_CONTENT.exists() else Path('content')]
+    documents = load_documents([path for path in paths if path.exists()])
+    if not documents:
+        # Timings from the synthetic posts alone say little about real content
+        Console(stderr=True).print(
+            f"[yellow]No markdown documents found in {', '.join(str(path) for path in paths)}; "
+            f"timing synthetic posts only[/yellow]"
+        )
+    synthetic = [synthetic_post(args.sections, seed) for seed in range(args.synthetic)]
+    backends = None
+    if args.backend:
+        backends = list(dict.fromkeys(RENDERER_BACKENDS[name].name for name in args.backend))
+
+    results = run_benchmark(documents, synthetic, args.repeat, backends)
+
+    if args.json:
+        print(json.dumps([dict(asdict(result), compliant=result.compliant) for result in results], indent=2))
+    else:
+        console = Console()
+        console.print(f"{len(documents)} content documents, {len(synthetic)} synthetic posts, "
+                      f"median of {args.repeat} passes")
+        display_results(results, console)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -643,13 +643,7 @@ class ResumeParser(BaseParser):
         award_date = None
         
         if date_match:
-            try:
-                award_date = datetime.strptime(date_match.group(1), '%b %Y').date()
-            except ValueError:
-                try:
-                    award_date = datetime.strptime(date_match.group(1), '%B %Y').date()
-                except ValueError:
-                    pass
+            award_date = self._parse_date(date_match.group(1))
         
         # Extract title (remove date)
         title = re.sub(r'^\w+\s+\d{4}\s+', '', award_text).strip()
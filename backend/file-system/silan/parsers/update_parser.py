@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, date
 from pathlib import Path
 from .base_parser import BaseParser, ExtractedContent
+from ..utils.date_parser import date_from_path
 
 
 class UpdateParser(BaseParser):
@@ -106,52 +107,7 @@ class UpdateParser(BaseParser):
     
     def _extract_date_from_filename(self, file_path: str) -> Optional[date]:
         """Extract date from filename like '2024-01-15-project-milestone.md'"""
-        file_path = Path(file_path)
-        filename = file_path.stem
-        
-        # Try different date patterns
-        date_patterns = [
-            r'^(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD at start
-            r'(\d{4})(\d{2})(\d{2})',     # YYYYMMDD
-            r'(\d{2})-(\d{2})-(\d{4})',   # MM-DD-YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, filename)
-            if match:
-                try:
-                    if pattern.startswith('^(\d{4})'):  # YYYY-MM-DD
-                        year, month, day = match.groups()
-                        return date(int(year), int(month), int(day))
-                    elif pattern == r'(\d{4})(\d{2})(\d{2})':  # YYYYMMDD
-                        year, month, day = match.groups()
-                        return date(int(year), int(month), int(day))
-                    else:  # MM-DD-YYYY
-                        month, day, year = match.groups()
-                        return date(int(year), int(month), int(day))
-                except ValueError:
-                    continue
-        
-        # Try to extract from path structure (year/month folders)
-        path_parts = file_path.parts
-        if len(path_parts) >= 2:
-            try:
-                # Look for year in path
-                year = None
-                month = None
-                
-                for part in path_parts:
-                    if re.match(r'^\d{4}$', part):  # Year folder
-                        year = int(part)
-                    elif re.match(r'^\d{2}-\w+$', part):  # Month folder like "01-january"
-                        month = int(part.split('-')[0])
-                
-                if year and month:
-                    return date(year, month, 1)  # First day of month
-            except ValueError:
-                pass
-        
-        return None
+        return date_from_path(str(file_path))
     
     def _extract_slug_from_filename(self, file_path: str) -> str:
         """Extract slug from filename"""
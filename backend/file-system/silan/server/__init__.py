@@ -1,7 +1,9 @@
 """Manager classes for resource and operation management"""
 
 from .backend_manager import BackendManager
+from .backend_supervisor import BackendSupervisor
 
 __all__ = [
-    'BackendManager'
+    'BackendManager',
+    'BackendSupervisor'
 ]
\ No newline at end of file
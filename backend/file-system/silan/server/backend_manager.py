@@ -9,6 +9,8 @@ from typing import Dict, Any, Optional
 
 from ..core.interfaces import IManager
 from ..utils import ModernLogger, FileOperations
+from ..utils.log_tail import LogFilter, tail_lines, follow as follow_log
+from ..utils.readiness import DEFAULT_HEALTH_PATH, DEFAULT_READY_TIMEOUT, wait_until_ready, wait_until_released
 
 
 class BackendManager(IManager,ModernLogger):
@@ -93,13 +95,25 @@ class BackendManager(IManager,ModernLogger):
             # Save PID
             self._save_pid(process.pid)
             
-            # Wait a moment and check if process is still running
-            time.sleep(2)
-            if process.poll() is not None:
-                self.error("Backend process exited immediately")
+            # Wait until the server accepts requests
+            server_config = config.get('server', {})
+            readiness_config = config.get('readiness') or {}
+            readiness = wait_until_ready(
+                server_config.get('host', '0.0.0.0'),
+                server_config.get('port', 8888),
+                health_path=readiness_config.get('health_path') or DEFAULT_HEALTH_PATH,
+                timeout=float(readiness_config.get('timeout') or DEFAULT_READY_TIMEOUT),
+                is_alive=lambda: process.poll() is None
+            )
+            if not readiness.ready:
+                if readiness.stage == 'exited':
+                    self.error("Backend process exited before it was ready")
+                else:
+                    self.error(f"Backend not ready after {readiness.elapsed:.1f}s "
+                               f"({readiness.stage} check: {readiness.error})")
                 return False
             
-            self.info(f"✅ Backend server started (PID: {process.pid})")
+            self.info(f"✅ Backend server started (PID: {process.pid}), ready in {readiness.elapsed_ms} ms")
             return True
             
         except Exception as e:
@@ -157,8 +171,11 @@ class BackendManager(IManager,ModernLogger):
             if not self.stop():
                 self.warning("Failed to stop cleanly, continuing with start")
             
-            # Wait a moment
-            time.sleep(2)
+            # Wait until the old instance has released its port
+            server_config = config.get('server', {})
+            port = server_config.get('port', 8888)
+            if not wait_until_released(server_config.get('host', '0.0.0.0'), port):
+                self.warning(f"Port {port} is still in use, starting anyway")
             
             # Start with previous config
             return self.start(config)
@@ -215,45 +232,29 @@ class BackendManager(IManager,ModernLogger):
             self.error(f"Failed to get status: {e}")
             return {'running': False, 'error': str(e)}
     
-    def show_logs(self, follow: bool = False, lines: int = 50) -> bool:
+    def show_logs(self, follow: bool = False, lines: int = 50,
+                  level: Optional[str] = None, pattern: Optional[str] = None) -> bool:
         """Show backend server logs"""
         try:
             if not self.log_file.exists():
                 self.warning("No log file found")
                 return True
             
+            line_filter = LogFilter(level, pattern)
+            if not line_filter.active:
+                line_filter = None
+            
+            # Show last N lines
+            for line in tail_lines(str(self.log_file), lines, line_filter):
+                print(line)
+            
             if follow:
                 # Follow logs in real-time
                 try:
-                    process = subprocess.Popen(
-                        ['tail', '-f', '-n', str(lines), str(self.log_file)],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    
-                    for line in process.stdout or []:
-                        print(line.rstrip())
-                        
+                    for line in follow_log(str(self.log_file), line_filter):
+                        print(line, flush=True)
                 except KeyboardInterrupt:
-                    process.terminate()
                     return True
-            else:
-                # Show last N lines
-                try:
-                    result = subprocess.run(
-                        ['tail', '-n', str(lines), str(self.log_file)],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    print(result.stdout)
-                except subprocess.CalledProcessError:
-                    # Fallback to Python implementation
-                    with open(self.log_file, 'r') as f:
-                        all_lines = f.readlines()
-                        for line in all_lines[-lines:]:
-                            print(line.rstrip())
             
             return True
             
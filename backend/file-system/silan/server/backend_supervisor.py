@@ -0,0 +1,277 @@
+"""Supervisor for multiple Go backend instances"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import ModernLogger
+from ..utils.readiness import DEFAULT_HEALTH_PATH, DEFAULT_READY_TIMEOUT, wait_until_ready
+
+# Restart delay after a crash: 1 s doubling up to 60 s
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+# An instance that ran this long before crashing starts over at the initial delay
+STABLE_SECONDS = 30.0
+
+POLL_INTERVAL = 0.5
+STOP_TIMEOUT = 10.0
+
+SPEC_FILE = 'backend_supervisor.json'
+STATE_FILE = 'backend_instances.json'
+ROLLING_RESTART_REQUEST = 'backend_rolling_restart.request'
+
+
+@dataclass
+class BackendInstance:
+    """One supervised backend process"""
+    index: int
+    port: int
+    command: List[str]
+    process: Optional[subprocess.Popen] = None
+    status: str = 'pending'
+    restarts: int = 0
+    started_at: Optional[float] = None
+    last_exit_code: Optional[int] = None
+    backoff: float = INITIAL_BACKOFF
+    next_start_at: float = 0.0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'port': self.port,
+            'pid': self.pid if self.alive else None,
+            'status': self.status,
+            'restarts': self.restarts,
+            'started_at': self.started_at,
+            'last_exit_code': self.last_exit_code,
+            'next_start_at': self.next_start_at if self.status == 'backoff' else None,
+        }
+
+
+class BackendSupervisor(ModernLogger):
+    """Keeps N backend instances running, restarting crashed ones with exponential backoff.
+
+    Started by ``silan backend start --instances N`` as its own process. The
+    spec file lists each instance's port and command; the state file is
+    rewritten whenever an instance changes so the CLI can report PIDs. A
+    rolling restart is requested by creating the request file, and restarts
+    one instance at a time, waiting for it to be ready before the next.
+    """
+
+    def __init__(self, silan_dir: Path):
+        super().__init__(name="backend_supervisor", level="info")
+        self.silan_dir = Path(silan_dir)
+        self.spec_file = self.silan_dir / SPEC_FILE
+        self.state_file = self.silan_dir / STATE_FILE
+        self.request_file = self.silan_dir / ROLLING_RESTART_REQUEST
+
+        with open(self.spec_file, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+
+        self.host = spec.get('host', '0.0.0.0')
+        self.health_path = spec.get('health_path') or DEFAULT_HEALTH_PATH
+        self.ready_timeout = float(spec.get('ready_timeout') or DEFAULT_READY_TIMEOUT)
+        self.cwd = spec.get('cwd') or None
+        self.log_file = spec.get('log_file')
+        self.instances = [
+            BackendInstance(index=item['index'], port=item['port'], command=item['command'])
+            for item in spec['instances']
+        ]
+
+        # Completed rollouts, and every rollout that ended, failed or not
+        self.rolling_restarts = 0
+        self.rollouts_finished = 0
+        self.last_rollout_error: Optional[str] = None
+        self._stopping = False
+
+    def run(self) -> int:
+        """Supervise until SIGTERM/SIGINT, then stop every instance"""
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.info(f"Supervising {len(self.instances)} backend instances "
+                  f"on ports {self.instances[0].port}-{self.instances[-1].port}")
+        for instance in self.instances:
+            self._start_instance(instance)
+        self._write_state()
+
+        try:
+            while not self._stopping:
+                if self.request_file.exists():
+                    self._remove(self.request_file)
+                    self._rolling_restart()
+
+                changed = False
+                now = time.monotonic()
+                for instance in self.instances:
+                    if instance.status == 'running' and not instance.alive:
+                        self._handle_exit(instance, now)
+                        changed = True
+                    elif instance.status == 'backoff' and now >= instance.next_start_at:
+                        instance.restarts += 1
+                        self._start_instance(instance)
+                        changed = True
+                if changed:
+                    self._write_state()
+
+                time.sleep(POLL_INTERVAL)
+        finally:
+            self._stop_all()
+            self._remove(self.state_file)
+            self._remove(self.request_file)
+        return 0
+
+    def _request_stop(self, signum: int, frame: Any) -> None:
+        self._stopping = True
+
+    def _start_instance(self, instance: BackendInstance) -> None:
+        """Spawn an instance; a failure to spawn is treated like a crash"""
+        try:
+            log = open(self.log_file, 'a') if self.log_file else None
+            try:
+                instance.process = subprocess.Popen(
+                    instance.command,
+                    stdout=log or subprocess.DEVNULL,
+                    stderr=subprocess.STDOUT,
+                    cwd=self.cwd
+                )
+            finally:
+                # The child keeps its own handle
+                if log:
+                    log.close()
+            instance.status = 'running'
+            instance.started_at = time.time()
+            self.info(f"Instance {instance.index} started on port {instance.port} (PID: {instance.pid})")
+        except OSError as e:
+            self.error(f"Instance {instance.index} failed to start: {e}")
+            instance.process = None
+            self._schedule_restart(instance, time.monotonic(), ran_for=0.0)
+
+    def _handle_exit(self, instance: BackendInstance, now: float) -> None:
+        """Record a crash and schedule the restart"""
+        instance.last_exit_code = instance.process.returncode if instance.process else None
+        ran_for = time.time() - (instance.started_at or time.time())
+        self.warning(f"Instance {instance.index} (port {instance.port}) exited with code "
+                     f"{instance.last_exit_code} after {ran_for:.1f}s")
+        self._schedule_restart(instance, now, ran_for)
+
+    def _schedule_restart(self, instance: BackendInstance, now: float, ran_for: float) -> None:
+        if ran_for >= STABLE_SECONDS:
+            instance.backoff = INITIAL_BACKOFF
+        instance.status = 'backoff'
+        instance.next_start_at = now + instance.backoff
+        self.info(f"Restarting instance {instance.index} in {instance.backoff:.0f}s")
+        instance.backoff = min(instance.backoff * 2, MAX_BACKOFF)
+
+    def _rolling_restart(self) -> None:
+        """Restart instances one at a time so the others keep serving"""
+        self.info("Rolling restart requested")
+        self.last_rollout_error = None
+        for instance in self.instances:
+            if self._stopping:
+                return
+            self._stop_instance(instance)
+            self._start_instance(instance)
+            self._write_state()
+            if instance.status != 'running':
+                self.last_rollout_error = f"instance {instance.index} failed to start"
+                break
+
+            process = instance.process
+            readiness = wait_until_ready(
+                self.host, instance.port,
+                health_path=self.health_path,
+                timeout=self.ready_timeout,
+                is_alive=lambda: process is not None and process.poll() is None
+            )
+            if not readiness.ready:
+                # Leave the remaining instances on the old process rather than lose capacity
+                self.last_rollout_error = (f"instance {instance.index} not ready "
+                                           f"({readiness.stage}: {readiness.error})")
+                self.error(f"Rolling restart stopped: {self.last_rollout_error}")
+                break
+            instance.backoff = INITIAL_BACKOFF
+            self.info(f"Instance {instance.index} ready in {readiness.elapsed_ms} ms")
+        else:
+            # Only a rollout that brought every instance back counts; failures are in last_rollout_error
+            self.rolling_restarts += 1
+
+        # The CLI waits for this to change, whatever the outcome
+        self.rollouts_finished += 1
+        self._write_state()
+
+    def _stop_instance(self, instance: BackendInstance) -> None:
+        process = instance.process
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait(timeout=5)
+        instance.status = 'stopped'
+
+    def _stop_all(self) -> None:
+        """Terminate every instance together, then wait for them"""
+        running = [instance for instance in self.instances if instance.alive]
+        for instance in running:
+            instance.process.terminate()
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for instance in running:
+            try:
+                instance.process.wait(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                instance.process.kill()
+                instance.process.wait(timeout=5)
+            instance.status = 'stopped'
+        self.info(f"Stopped {len(running)} backend instances")
+
+    def _write_state(self) -> None:
+        """Atomically rewrite the state file read by the CLI"""
+        state = {
+            'supervisor_pid': os.getpid(),
+            'updated_at': time.time(),
+            'rolling_restarts': self.rolling_restarts,
+            'rollouts_finished': self.rollouts_finished,
+            'last_rollout_error': self.last_rollout_error,
+            'instances': [instance.to_dict() for instance in self.instances],
+        }
+        tmp_file = self.state_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python -m silan.server.backend_supervisor <silan-dir>", file=sys.stderr)
+        return 2
+    return BackendSupervisor(Path(args[0])).run()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
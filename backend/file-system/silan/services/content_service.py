@@ -14,7 +14,7 @@ class ContentService(IService):
     """Service for content file operations and parsing"""
     
     def __init__(self, content_directory: Path, logger: Optional[ModernLogger] = None):
-        self.logger = logger or ModernLogger(name="content_service")
+        self.logger = logger or ModernLogger(name="content_service", level="info")
         self.content_dir = Path(content_directory)
         self.file_ops = FileOperations(self.logger)
         self.parser_factory = ParserFactory()
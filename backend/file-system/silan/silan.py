@@ -7,7 +7,7 @@ Pure class-based architecture using inherited logger.
 """
 
 import click
-from typing import Optional
+from typing import Optional, Tuple
 
 from .logic.cli_logic import CLILogic
 
@@ -23,10 +23,14 @@ class SilanCLI:
         @click.group()
         @click.version_option(version='1.0.0')
         @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+        @click.option('--quiet', '-q', is_flag=True,
+                      help='Machine mode: no banner or progress bars (default when output is not a terminal)')
+        @click.option('--log-json', type=click.Path(dir_okay=False),
+                      help='Also write log records as JSON lines to this file')
         @click.pass_context
-        def cli(ctx, verbose):
+        def cli(ctx, verbose, quiet, log_json):
             """Silan Database Tools - Sync markdown content to databases with ease"""
-            self.cli_logic.run_application(ctx, verbose)
+            self.cli_logic.run_application(ctx, verbose, quiet, log_json)
         
         # Add commands to the group
         cli.add_command(self._create_init_command())
@@ -71,12 +75,30 @@ class SilanCLI:
         @click.option('--database', help='Database name (MySQL/PostgreSQL only)')
         @click.option('--db-path', default='portfolio.db', help='Database file path (SQLite only)')
         @click.option('--dry-run', is_flag=True, help='Show what would be synced without actually syncing')
-        @click.option('--create-tables', is_flag=True, help='Create database tables if they don\'t exist')
+        @click.option('--create-tables', is_flag=True, help='Create missing database tables and add new columns to existing ones')
         @click.option('--start-backend', is_flag=True, help='Start backend server after sync')
         @click.option('--use-cache', is_flag=True, default=True, help='Use cached database configuration')
+        @click.option('--image-derivatives/--no-image-derivatives', default=None,
+                      help='Generate resized WebP images and blurhash for project galleries (needs Pillow)')
+        @click.option('--profile', is_flag=True, help='Report wall/CPU time per sync stage')
+        @click.option('--profile-output', type=click.Path(dir_okay=False),
+                      help='Also write cProfile stats to this file (implies --profile, parses inline)')
+        @click.option('--since-commit', is_flag=False, flag_value='last', default=None, metavar='[SHA]',
+                      help='Only sync content changed since this commit (default: the last synced commit)')
+        @click.option('--shard', metavar='I/N',
+                      help='Only sync the I-th of N hash partitions of the content, for parallel runners')
+        @click.option('--finalize', is_flag=True,
+                      help='Recompute aggregate counters once after all --shard runs have finished')
+        @click.option('--resume', is_flag=True,
+                      help='Continue an interrupted sync, skipping items it wrote whose content is unchanged')
+        @click.option('--roots', 'roots', multiple=True, type=click.Path(exists=True, file_okay=False),
+                      help='Sync this portfolio directory with its own owner; repeat to sync several concurrently')
         def db_sync(db_type: Optional[str], host: str, port: Optional[int], user: Optional[str], 
                    password: Optional[str], database: Optional[str], db_path: str, dry_run: bool, 
-                   create_tables: bool, start_backend: bool, use_cache: bool):
+                   create_tables: bool, start_backend: bool, use_cache: bool,
+                   image_derivatives: Optional[bool], profile: bool, profile_output: Optional[str],
+                   since_commit: Optional[str], shard: Optional[str], finalize: bool, resume: bool,
+                   roots: Tuple[str, ...]):
             """Sync content files to database (MySQL/PostgreSQL/SQLite)"""
             success = self.cli_logic.execute_command(
                 'db-sync',
@@ -90,7 +112,15 @@ class SilanCLI:
                 dry_run=dry_run,
                 create_tables=create_tables,
                 start_backend=start_backend,
-                use_cache=use_cache
+                use_cache=use_cache,
+                image_derivatives=image_derivatives,
+                profile=profile,
+                profile_output=profile_output,
+                since_commit=since_commit,
+                shard=shard,
+                finalize=finalize,
+                resume=resume,
+                roots=list(roots)
             )
             if not success:
                 raise click.ClickException("Database sync failed")
@@ -144,6 +174,7 @@ class SilanCLI:
         backend.add_command(self._create_backend_restart_command())
         backend.add_command(self._create_backend_status_command())
         backend.add_command(self._create_backend_logs_command())
+        backend.add_command(self._create_backend_top_command())
         backend.add_command(self._create_backend_install_command())
         
         return backend
@@ -163,9 +194,15 @@ class SilanCLI:
         @click.option('--server-port', default=8888, help='Backend server port')
         @click.option('--daemon', '-d', is_flag=True, help='Run backend as daemon')
         @click.option('--config-file', help='Custom backend configuration file')
+        @click.option('--ready-timeout', default=30, type=click.IntRange(1, 600),
+                      help='Seconds to wait for the server to accept requests')
+        @click.option('--health-path', default='/', help='HTTP path probed to confirm the server is ready')
+        @click.option('--instances', default=1, type=click.IntRange(1, 64),
+                      help='Run N supervised instances on consecutive ports from --server-port')
         def start(db_type: str, host: str, port: Optional[int], user: Optional[str], password: Optional[str], 
                  database: Optional[str], db_path: str, server_host: str, server_port: int,
-                 daemon: bool, config_file: Optional[str]):
+                 daemon: bool, config_file: Optional[str], ready_timeout: int, health_path: str,
+                 instances: int):
             """Start the Go backend server"""
             # Build database configuration
             if db_type in ['mysql', 'postgresql']:
@@ -193,7 +230,12 @@ class SilanCLI:
                     'port': server_port
                 },
                 'daemon': daemon,
-                'config_file': config_file
+                'config_file': config_file,
+                'instances': instances,
+                'readiness': {
+                    'timeout': ready_timeout,
+                    'health_path': health_path
+                }
             }
             
             success = self.cli_logic.execute_command('backend', action='start', **backend_config)
@@ -238,14 +280,44 @@ class SilanCLI:
         @click.command('logs')
         @click.option('--follow', '-f', is_flag=True, help='Follow log output')
         @click.option('--lines', '-n', default=50, help='Number of lines to show')
-        def logs(follow: bool, lines: int):
+        @click.option('--level', '-l', help='Only show lines at or above this level (info, warn, error, ...)')
+        @click.option('--grep', '-g', 'pattern', help='Only show lines matching this regular expression')
+        def logs(follow: bool, lines: int, level: Optional[str], pattern: Optional[str]):
             """Show backend server logs"""
-            success = self.cli_logic.execute_command('backend', action='logs', follow=follow, lines=lines)
+            success = self.cli_logic.execute_command('backend', action='logs', follow=follow, lines=lines,
+                                                     level=level, pattern=pattern)
             if not success:
                 raise click.ClickException("Failed to show backend logs")
         
         return logs
     
+    def _create_backend_top_command(self):
+        """Create backend top command"""
+        @click.command('top')
+        @click.option('--interval', '-i', default=1.0, type=click.FloatRange(0.1), help='Seconds between samples')
+        @click.option('--count', '-c', type=click.IntRange(1), help='Stop after this many samples')
+        @click.option('--json', 'json_output', is_flag=True,
+                      help='Print samples as JSON lines, then a summary line')
+        @click.option('--history', default=300, type=click.IntRange(1, 100000),
+                      help='Samples kept for percentiles')
+        @click.option('--health-path', help="HTTP path timed on every sample ('' to disable)")
+        @click.option('--instance', type=click.IntRange(0),
+                      help='Only this instance of a backend started with --instances')
+        def top(interval: float, count: Optional[int], json_output: bool, history: int,
+                health_path: Optional[str], instance: Optional[int]):
+            """Monitor backend CPU, memory, threads, FDs, connections and latency"""
+            if json_output:
+                self.cli_logic.use_stderr()
+            success = self.cli_logic.execute_command(
+                'backend', action='top', interval=interval, count=count,
+                json_output=json_output, history=history, health_path=health_path,
+                instance=instance
+            )
+            if not success:
+                raise click.ClickException("Failed to monitor backend server")
+        
+        return top
+    
     def _create_backend_install_command(self):
         """Create backend install command"""
         @click.command('install')
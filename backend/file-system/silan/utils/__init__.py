@@ -5,6 +5,11 @@ from .config import ConfigManager
 from .file_operations import FileOperations
 from .cli_interface import CLIInterface
 from .validation import DataValidator, ContentValidator
+from .directory_index import DirectoryIndex
+from .collection_diff import CollectionDiff, diff_ordered_collection
+from .folder_manifest import FolderManifest, ManifestEntry
+from .date_parser import parse_date, parse_datetime, parse_date_range, date_from_path
+from .sync_profiler import SyncProfiler
 
 __all__ = [
     'ModernLogger',
@@ -12,5 +17,15 @@ __all__ = [
     'FileOperations',
     'CLIInterface',
     'DataValidator',
-    'ContentValidator'
+    'ContentValidator',
+    'DirectoryIndex',
+    'CollectionDiff',
+    'diff_ordered_collection',
+    'FolderManifest',
+    'ManifestEntry',
+    'parse_date',
+    'parse_datetime',
+    'parse_date_range',
+    'date_from_path',
+    'SyncProfiler'
 ]
\ No newline at end of file
@@ -14,7 +14,8 @@ class CLIInterface:
     
     def __init__(self, logger: ModernLogger):
         self.logger = logger
-        self.console = Console()
+        # Reuse the logger's process-wide console instead of building a new one
+        self.console = getattr(logger, 'console', None) or Console()
     
     def display_info_panel(self, title: str, info: Dict[str, Any]) -> None:
         """Display information in a panel"""
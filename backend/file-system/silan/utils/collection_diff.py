@@ -0,0 +1,93 @@
+"""Ordered list diffing for child collections"""
+
+import uuid
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Mapping, Sequence, Tuple
+
+
+@dataclass
+class CollectionDiff:
+    """Minimal set of operations turning the stored children into the desired ones"""
+    inserts: List[Dict[str, Any]] = field(default_factory=list)
+    updates: List[Tuple[Mapping[str, Any], Dict[str, Any]]] = field(default_factory=list)
+    deletes: List[Mapping[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the stored collection already matches"""
+        return not (self.inserts or self.updates or self.deletes)
+
+
+def diff_ordered_collection(
+    existing: Sequence[Mapping[str, Any]],
+    desired: Sequence[Mapping[str, Any]],
+    key_fields: Sequence[str],
+    compare_fields: Sequence[str] = ()
+) -> CollectionDiff:
+    """
+    Diff stored child rows against the desired ordered list.
+
+    Rows are matched on ``key_fields``; duplicate keys are paired in order. A matched
+    row becomes an update only when one of ``compare_fields`` (typically including the
+    sort order, so reorders are cheap updates) differs. Unmatched desired rows are
+    inserts and unmatched stored rows are deletes.
+
+    Args:
+        existing: Stored rows in their current order
+        desired: Desired rows in their target order
+        key_fields: Fields identifying the same child across syncs
+        compare_fields: Fields whose changes require an update
+
+    Returns:
+        CollectionDiff with the operations to apply
+    """
+    diff = CollectionDiff()
+
+    available: Dict[Tuple[Any, ...], Deque[Mapping[str, Any]]] = defaultdict(deque)
+    for row in existing:
+        available[_row_key(row, key_fields)].append(row)
+
+    for row in desired:
+        candidates = available.get(_row_key(row, key_fields))
+        if not candidates:
+            diff.inserts.append(dict(row))
+            continue
+
+        stored = candidates.popleft()
+        changes = {
+            name: row.get(name)
+            for name in compare_fields
+            if not _values_equal(stored.get(name), row.get(name))
+        }
+        if changes:
+            diff.updates.append((stored, changes))
+        else:
+            diff.unchanged += 1
+
+    for remaining in available.values():
+        diff.deletes.extend(remaining)
+
+    return diff
+
+
+def _row_key(row: Mapping[str, Any], key_fields: Sequence[str]) -> Tuple[Any, ...]:
+    """Build the matching key for a row"""
+    return tuple(_normalize(row.get(name)) for name in key_fields)
+
+
+def _values_equal(stored: Any, desired: Any) -> bool:
+    """Compare a stored and a desired value, treating empty values as equal"""
+    return _normalize(stored) == _normalize(desired)
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize values so database round-trips do not look like changes"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, str):
+        return value.strip()
+    return value
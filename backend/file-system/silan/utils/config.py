@@ -1,5 +1,6 @@
 """Configuration management utilities"""
 
+import os
 import yaml
 import json
 from pathlib import Path
@@ -165,6 +166,7 @@ class ConfigManager(ModernLogger):
                 "auto_migrate": True,
                 "process_markdown": True,
                 "generate_html": True,
+                "markdown_renderer": "markdown2",
                 "extract_metadata": True,
                 "validate_frontmatter": True,
                 "watch_files": False,
@@ -173,6 +175,21 @@ class ConfigManager(ModernLogger):
                 "log_file": "sync.log"
             },
             
+            "performance": {
+                "batch_size": 100,
+                "parse_workers": 4,
+                "lookahead": 32
+            },
+            
+            "images": {
+                "derivatives": False,
+                "widths": [480, 960, 1600],
+                "quality": 80,
+                "workers": 0,
+                "output_dir": ".silan/derivatives",
+                "url_prefix": "/derivatives"
+            },
+            
             "languages": {
                 "default": "en",
                 "supported": [
@@ -329,8 +346,11 @@ class ConfigManager(ModernLogger):
                 'version': '1.0'
             }
             
-            with open(self.last_sync_cache_file, 'w', encoding='utf-8') as f:
+            # Written atomically: concurrent shard runs read and write this file together
+            tmp_file = self.last_sync_cache_file.with_name(f"{self.last_sync_cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.last_sync_cache_file)
             
             self._last_sync_cache = cache_data
             self.success("Last sync configuration saved")
@@ -0,0 +1,216 @@
+"""
+Shared date parsing for parsers and database sync.
+
+Strings are sniffed with precompiled patterns so each value is tried against the
+one or two formats it can possibly match, instead of every format in turn. Results
+are memoized on the raw string, so repeated values (resume ranges, frontmatter dates
+seen again by the sync) are parsed once per process.
+"""
+
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# ISO dates and datetimes are built directly instead of going through strptime
+_ISO_DATE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+_ISO_DATETIME = re.compile(r'^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}')
+_YEAR_MONTH = re.compile(r'^(\d{4})-(\d{1,2})$')
+_YEAR = re.compile(r'^(\d{4})$')
+
+# Remaining shapes dispatch to the strptime formats they can match
+_FORMAT_DISPATCH = (
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), ('%m/%d/%Y',)),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{2}$'), ('%m/%d/%y',)),
+    (re.compile(r'^[A-Za-z]+ \d{1,2}, \d{4}$'), ('%b %d, %Y', '%B %d, %Y')),
+    (re.compile(r'^[A-Za-z]+ \d{4}$'), ('%b %Y', '%B %Y')),
+    (re.compile(r'^\d{1,2} [A-Za-z]+ \d{4}$'), ('%d %b %Y', '%d %B %Y')),
+)
+
+# Filename prefixes such as '2024-01-15-milestone', with (year, month, day) group order
+_FILENAME_PATTERNS = (
+    (re.compile(r'^(\d{4})-(\d{2})-(\d{2})'), (0, 1, 2)),  # YYYY-MM-DD at start
+    (re.compile(r'(\d{4})(\d{2})(\d{2})'), (0, 1, 2)),     # YYYYMMDD
+    (re.compile(r'(\d{2})-(\d{2})-(\d{4})'), (2, 0, 1)),   # MM-DD-YYYY
+)
+_YEAR_FOLDER = re.compile(r'^\d{4}$')
+_MONTH_FOLDER = re.compile(r'^\d{2}-\w+$')  # e.g. "01-january"
+
+_RANGE_SEPARATORS = (' - ', ' – ', ' — ', ' to ', '-', '–', '—')
+ONGOING_MARKERS = frozenset(['now', 'current', 'present', 'ongoing'])
+
+DateLike = Union[str, date, datetime, None]
+
+
+def parse_date(value: DateLike) -> Optional[date]:
+    """
+    Parse a date from a string, date or datetime.
+
+    Args:
+        value: Raw value, typically from frontmatter
+
+    Returns:
+        Parsed date or None when the value is empty or unrecognized
+    """
+    if not value:
+        return None
+    # datetime is a subclass of date, so check it first
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    parsed = _parse_string(str(value).strip())
+    return parsed.date() if parsed else None
+
+
+def parse_datetime(value: DateLike) -> Optional[datetime]:
+    """
+    Parse a datetime from a string, date or datetime.
+
+    Args:
+        value: Raw value, typically from frontmatter
+
+    Returns:
+        Naive datetime (midnight for plain dates, UTC when an offset was given)
+        or None when unrecognized
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return _naive_utc(value)
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+
+    return _parse_string(str(value).strip())
+
+
+@lru_cache(maxsize=4096)
+def parse_date_range(date_range: str) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Parse a date range like 'Jan 2020 - Dec 2021' or '2019 – present'.
+
+    Args:
+        date_range: Raw range text
+
+    Returns:
+        (start, end) tuple; end is None for ongoing ranges
+    """
+    if not date_range:
+        return None, None
+
+    date_range = str(date_range).strip()
+    if date_range.lower() in ONGOING_MARKERS:
+        return None, None
+
+    # A complete date such as '2020-01-15' is not a range
+    single = parse_date(date_range)
+    if single:
+        return single, None
+
+    for sep in _RANGE_SEPARATORS:
+        if sep in date_range:
+            start_str, end_str = date_range.split(sep, 1)
+            start = parse_date(start_str.strip())
+            end_str = end_str.strip()
+            if end_str.lower() in ONGOING_MARKERS:
+                return start, None
+            return start, parse_date(end_str)
+
+    return None, None
+
+
+@lru_cache(maxsize=4096)
+def date_from_path(file_path: str) -> Optional[date]:
+    """
+    Extract a date from a filename prefix or from year/month folders.
+
+    Args:
+        file_path: Path such as 'updates/2024/01-january/2024-01-15-milestone.md'
+
+    Returns:
+        Extracted date or None
+    """
+    path = Path(file_path)
+    stem = path.stem
+
+    for pattern, order in _FILENAME_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            groups = match.groups()
+            try:
+                return date(int(groups[order[0]]), int(groups[order[1]]), int(groups[order[2]]))
+            except ValueError:
+                continue
+
+    # Fall back to year/month folder structure
+    year = None
+    month = None
+    for part in path.parts:
+        if _YEAR_FOLDER.match(part):
+            year = int(part)
+        elif _MONTH_FOLDER.match(part):
+            month = int(part.split('-')[0])
+
+    if year and month:
+        try:
+            return date(year, month, 1)
+        except ValueError:
+            return None
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_string(text: str) -> Optional[datetime]:
+    """Sniff the shape of a date string and parse it, memoized on the raw text"""
+    if not text:
+        return None
+
+    try:
+        match = _ISO_DATE.match(text)
+        if match:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+        if _ISO_DATETIME.match(text):
+            return _parse_iso_datetime(text)
+
+        match = _YEAR_MONTH.match(text)
+        if match:
+            return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+        match = _YEAR.match(text)
+        if match:
+            return datetime(int(match.group(1)), 1, 1)
+    except ValueError:
+        return None
+
+    for pattern, formats in _FORMAT_DISPATCH:
+        if pattern.match(text):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(text, fmt)
+                except ValueError:
+                    continue
+            return None
+
+    return None
+
+
+def _parse_iso_datetime(text: str) -> Optional[datetime]:
+    """Parse an ISO 8601 datetime, converting any offset to UTC"""
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return _naive_utc(parsed)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Stored columns are naive UTC; local times without an offset are kept as written"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
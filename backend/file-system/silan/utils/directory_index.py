@@ -0,0 +1,165 @@
+"""Persisted directory listing index for content discovery"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .logger import ModernLogger
+
+
+class DirectoryIndex:
+    """Cache directory listings per run and across runs, keyed by directory mtime.
+
+    Each directory is listed with ``os.scandir`` at most once per invocation. On
+    the next run a directory whose mtime is unchanged reuses its persisted listing,
+    so only a single ``stat`` is paid for it instead of a full re-walk.
+
+    Like git's racy-index rule, a listing is only trusted if the directory's
+    mtime is older than the scan by more than the filesystem's timestamp
+    granularity; otherwise a change in the same tick could go unnoticed, so
+    the directory is rescanned on the next run.
+    """
+
+    INDEX_VERSION = 2
+    # Coarsest mtime resolution to allow for (FAT, some network filesystems)
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, root: Path, index_file: Optional[Path] = None,
+                 logger: Optional[ModernLogger] = None):
+        self.root = Path(root)
+        self.index_file = index_file
+        self.logger = logger
+
+        # Persisted listings: relative dir -> {'mtime_ns', 'scanned_at_ns', 'dirs', 'files'}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Directories already validated or listed during this run
+        self._fresh: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._dirty = False
+        self._loaded = False
+
+    def listdir(self, directory: Union[str, Path]) -> Tuple[List[str], List[str]]:
+        """Return sorted (subdirectory names, file names) for a directory"""
+        self._load()
+
+        directory = Path(directory)
+        key = self._key(directory)
+        if key in self._fresh:
+            return self._fresh[key]
+
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._fresh[key] = ([], [])
+            return self._fresh[key]
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.get('mtime_ns') == mtime_ns and not self._is_racy(entry):
+            listing = (entry['dirs'], entry['files'])
+        else:
+            scanned_at_ns = time.time_ns()
+            listing = self._scan(directory)
+            self._entries[key] = {
+                'mtime_ns': mtime_ns,
+                'scanned_at_ns': scanned_at_ns,
+                'dirs': listing[0],
+                'files': listing[1],
+            }
+            self._dirty = True
+
+        self._fresh[key] = listing
+        return listing
+
+    def walk_files(self, directory: Union[str, Path], suffix: Optional[str] = None) -> List[Path]:
+        """Recursively list files under a directory, optionally filtered by suffix"""
+        directory = Path(directory)
+        found: List[Path] = []
+
+        dirs, files = self.listdir(directory)
+        for name in files:
+            if suffix is None or name.endswith(suffix):
+                found.append(directory / name)
+        for name in dirs:
+            found.extend(self.walk_files(directory / name, suffix))
+
+        return found
+
+    def invalidate(self) -> None:
+        """Forget listings validated during this run"""
+        self._fresh.clear()
+
+    def save(self) -> None:
+        """Persist the index if any listing changed"""
+        if not self._dirty or not self.index_file:
+            return
+
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            # Drop listings for directories that no longer exist
+            entries = {key: value for key, value in self._entries.items()
+                       if (self.root / key).is_dir()}
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.INDEX_VERSION, 'entries': entries}, f)
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Could not save directory index: {e}")
+
+    def _load(self) -> None:
+        """Load the persisted index once"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.index_file or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.INDEX_VERSION:
+                self._entries = data.get('entries', {})
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Ignoring unreadable directory index: {e}")
+            self._entries = {}
+
+    def _is_racy(self, entry: Dict[str, Any]) -> bool:
+        """Whether the directory may have changed within the same mtime tick as its scan"""
+        scanned_at_ns = entry.get('scanned_at_ns')
+        if scanned_at_ns is None:
+            return True
+        return entry['mtime_ns'] >= scanned_at_ns - self.RACY_WINDOW_NS
+
+    def _scan(self, directory: Path) -> Tuple[List[str], List[str]]:
+        """List a directory with os.scandir, using cached d_type information"""
+        dirs: List[str] = []
+        files: List[str] = []
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            if self.logger:
+                self.logger.debug(f"Cannot list {directory}: {e}")
+
+        dirs.sort()
+        files.sort()
+        return dirs, files
+
+    def _key(self, directory: Path) -> str:
+        """Get the index key for a directory"""
+        try:
+            return directory.relative_to(self.root).as_posix()
+        except ValueError:
+            return directory.as_posix()
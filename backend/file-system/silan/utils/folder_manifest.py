@@ -0,0 +1,169 @@
+"""Single-walk file manifest for folder-based content items"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Extension buckets shared by the folder scanners
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.doc', '.docx', '.ppt', '.pptx'})
+TEXT_EXTENSIONS = frozenset({'.md', '.txt', '.rst', '.adoc'})
+
+# Files that contribute to a folder's change-detection hash
+HASHED_SUFFIXES = ('.md', '.yaml', '.yml')
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A file in a folder manifest with its stat results captured once"""
+    path: Path
+    relative_path: str
+    parts: Tuple[str, ...]
+    size: int
+    mtime: float
+
+    @property
+    def name(self) -> str:
+        return self.parts[-1]
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix
+
+    @property
+    def extension(self) -> str:
+        """Lower-cased suffix used for bucketing"""
+        return self.path.suffix.lower()
+
+    @property
+    def modified(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime)
+
+    def relative_to(self, subfolder: str = '') -> str:
+        """Path relative to a subfolder of the manifest root"""
+        depth = len(Path(subfolder).parts)
+        return str(Path(*self.parts[depth:]))
+
+
+class FolderManifest:
+    """Every file below a content folder, listed with one os.scandir walk.
+
+    Scanners ask for files under a subfolder (optionally filtered by extension)
+    instead of running their own ``rglob`` and ``stat`` calls, and the folder
+    content hash is computed from the same listing.
+    """
+
+    def __init__(self, root: Union[str, Path], entries: List[ManifestEntry], directories: Iterable[str]):
+        self.root = Path(root)
+        self.entries = entries
+        self.directories = frozenset(directories)
+        self._file_paths = frozenset(entry.relative_path for entry in entries)
+
+        # Files grouped by their top-level directory ('' for files in the root)
+        self._by_top: Dict[str, List[ManifestEntry]] = {}
+        # Files grouped by lower-cased extension
+        self._by_extension: Dict[str, List[ManifestEntry]] = {}
+        for entry in entries:
+            top = entry.parts[0] if len(entry.parts) > 1 else ''
+            self._by_top.setdefault(top, []).append(entry)
+            self._by_extension.setdefault(entry.extension, []).append(entry)
+
+    @classmethod
+    def build(cls, root: Union[str, Path]) -> 'FolderManifest':
+        """Walk a folder once, capturing size and mtime from the scandir entries"""
+        root = Path(root)
+        entries: List[ManifestEntry] = []
+        directories: List[str] = []
+
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(str(root), ())]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for dir_entry in it:
+                        parts = prefix + (dir_entry.name,)
+                        try:
+                            if dir_entry.is_dir(follow_symlinks=False):
+                                directories.append('/'.join(parts))
+                                stack.append((dir_entry.path, parts))
+                            elif dir_entry.is_file(follow_symlinks=False):
+                                stat = dir_entry.stat()
+                                entries.append(ManifestEntry(
+                                    path=Path(dir_entry.path),
+                                    relative_path='/'.join(parts),
+                                    parts=parts,
+                                    size=stat.st_size,
+                                    mtime=stat.st_mtime
+                                ))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        # Same order as sorting the paths, so hashes stay stable across walks
+        entries.sort(key=lambda entry: entry.parts)
+        return cls(root, entries, directories)
+
+    def has_dir(self, subfolder: str) -> bool:
+        """Whether a subfolder (relative, '/'-separated) exists"""
+        return subfolder.strip('/') in self.directories
+
+    def has_file(self, relative_path: str) -> bool:
+        """Whether a file exists at a relative, '/'-separated path"""
+        return relative_path in self._file_paths
+
+    def files(self, under: Optional[str] = None,
+              extensions: Optional[Iterable[str]] = None) -> List[ManifestEntry]:
+        """
+        List files, optionally restricted to a subfolder and a set of extensions.
+
+        Args:
+            under: Relative subfolder such as 'assets/images'; None for the whole folder
+            extensions: Lower-cased extensions to keep, e.g. IMAGE_EXTENSIONS
+
+        Returns:
+            Matching entries in path order
+        """
+        under_parts = tuple(part for part in (under or '').split('/') if part)
+        if not under_parts:
+            candidates = self.entries
+        else:
+            candidates = [
+                entry for entry in self._by_top.get(under_parts[0], [])
+                if len(entry.parts) > len(under_parts) and entry.parts[:len(under_parts)] == under_parts
+            ]
+
+        if extensions is None:
+            return list(candidates)
+
+        wanted = frozenset(extensions)
+        return [entry for entry in candidates if entry.extension in wanted]
+
+    def bucket(self, extensions: Iterable[str]) -> List[ManifestEntry]:
+        """All files whose extension is in the given bucket, in path order"""
+        found: List[ManifestEntry] = []
+        for extension in extensions:
+            found.extend(self._by_extension.get(extension, []))
+        found.sort(key=lambda entry: entry.parts)
+        return found
+
+    def content_hash(self, read_text: Callable[[Path], str],
+                     suffixes: Tuple[str, ...] = HASHED_SUFFIXES) -> str:
+        """MD5 over the text of every file with a hashed suffix, in path order"""
+        hash_md5 = hashlib.md5()
+        # Suffix matching stays case-sensitive, as it always was for the hash
+        for entry in self.bucket(suffixes):
+            if entry.suffix in suffixes:
+                try:
+                    hash_md5.update(read_text(entry.path).encode('utf-8'))
+                except Exception:
+                    continue
+        return hash_md5.hexdigest()
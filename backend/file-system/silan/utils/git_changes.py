@@ -0,0 +1,113 @@
+"""
+Changed content paths from local git history.
+
+CI checkouts give every file a fresh mtime, so stat-based change detection
+sees everything as modified. Git knows better: the working tree is compared
+with a base commit (``git diff --name-status -M``) and untracked files are
+added, giving the paths under ``content/`` that were added, modified, renamed
+or deleted since that commit, including uncommitted edits. Every function
+returns None when git or the base commit is unavailable (no repository, a
+shallow clone missing the commit), so callers can fall back to a full sync.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+GIT_TIMEOUT = 30
+
+
+@dataclass
+class GitChangeSet:
+    """Paths changed between a base commit and the working tree, relative to the project"""
+    base: str
+    head: Optional[str]
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    renamed: List[List[str]] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.changed or self.deleted)
+
+
+def _git(project_dir: Path, *args: str) -> Optional[str]:
+    """Run a git command in the project directory; None if it fails"""
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(project_dir), *args],
+            capture_output=True, text=True, timeout=GIT_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def head_commit(project_dir: Path) -> Optional[str]:
+    """Full SHA of HEAD, or None outside a repository"""
+    output = _git(project_dir, 'rev-parse', '--verify', '--quiet', 'HEAD')
+    return output.strip() if output else None
+
+
+def resolve_commit(project_dir: Path, ref: str) -> Optional[str]:
+    """Full SHA of a commit-ish, or None if it is not in the local history"""
+    output = _git(project_dir, 'rev-parse', '--verify', '--quiet', f"{ref}^{{commit}}")
+    return output.strip() if output else None
+
+
+def dirty_paths(project_dir: Path, pathspecs: Sequence[str]) -> Optional[List[str]]:
+    """Paths with uncommitted changes (including untracked files), relative to the project"""
+    diff = _git(project_dir, 'diff', '--name-only', '--relative', '-z', 'HEAD', '--', *pathspecs)
+    untracked = _git(project_dir, 'ls-files', '--others', '--exclude-standard', '-z', '--', *pathspecs)
+    if diff is None or untracked is None:
+        return None
+    return sorted(path for path in set(diff.split('\0')) | set(untracked.split('\0')) if path)
+
+
+def changed_since(project_dir: Path, base_ref: str, pathspecs: Sequence[str]) -> Optional[GitChangeSet]:
+    """
+    Paths under the pathspecs that differ between a commit and the working tree.
+
+    Args:
+        project_dir: Directory inside the repository; paths are reported relative to it
+        base_ref: Commit-ish the database was last synced from
+        pathspecs: Limits the diff, e.g. ['content', 'silan.yaml']
+
+    Returns:
+        GitChangeSet, or None if git or the base commit is unavailable
+    """
+    base = resolve_commit(project_dir, base_ref)
+    if base is None:
+        return None
+
+    # Working tree against the base, so uncommitted edits count as changes too
+    output = _git(project_dir, 'diff', '--name-status', '-M', '--relative', '-z', base, '--', *pathspecs)
+    untracked = _git(project_dir, 'ls-files', '--others', '--exclude-standard', '-z', '--', *pathspecs)
+    if output is None or untracked is None:
+        return None
+
+    changes = GitChangeSet(base=base, head=head_commit(project_dir))
+    fields = output.split('\0')
+    index = 0
+    while index < len(fields) and fields[index]:
+        status = fields[index]
+        if status[0] in 'RC':
+            old_path, new_path = fields[index + 1], fields[index + 2]
+            index += 3
+            if status[0] == 'R':
+                changes.deleted.append(old_path)
+                changes.renamed.append([old_path, new_path])
+            changes.changed.append(new_path)
+            continue
+        path = fields[index + 1]
+        index += 2
+        if status[0] == 'D':
+            changes.deleted.append(path)
+        else:
+            changes.changed.append(path)
+
+    changes.changed.extend(path for path in untracked.split('\0') if path)
+    changes.changed = sorted(set(changes.changed))
+    changes.deleted = sorted(set(changes.deleted) - set(changes.changed))
+    return changes
@@ -0,0 +1,318 @@
+"""
+Image derivative generation for project galleries.
+
+Raster images are resized to a few widths, encoded as WebP and described with
+their dimensions and a blurhash placeholder. Results are keyed by the source
+file's content hash and kept on disk next to the derivatives, so an image that
+has not changed is never decoded again. Pillow is optional: without it the stage
+reports itself unavailable and images are synced as before.
+"""
+
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is an optional dependency
+    Image = None
+    ImageOps = None
+
+from .logger import ModernLogger
+
+PIL_AVAILABLE = Image is not None
+
+# Formats Pillow can decode; vector images are left untouched
+RASTER_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'})
+
+DEFAULT_WIDTHS = (480, 960, 1600)
+
+_BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def file_content_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def render_derivatives(source_path: str, content_hash: str, output_dir: str,
+                       widths: Sequence[int], quality: int) -> Dict[str, Any]:
+    """
+    Decode one image and write its WebP derivatives and metadata file.
+
+    Runs inside a worker process, so it only takes and returns plain data.
+
+    Args:
+        source_path: Original image file
+        content_hash: Content hash of the original, used to name the outputs
+        output_dir: Root directory for derivatives
+        widths: Target widths; widths at or above the original are skipped
+        quality: WebP quality (0-100)
+
+    Returns:
+        Metadata with original width/height, blurhash and variant list
+    """
+    target_dir = Path(output_dir) / content_hash[:2]
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    width, height = image.size
+
+    # Always emit a full-size WebP so the original never has to be served
+    variant_widths = sorted({w for w in widths if 0 < w < width} | {width})
+    variants = []
+    for variant_width in variant_widths:
+        variant_height = max(1, round(height * variant_width / width))
+        name = f"{content_hash}-{variant_width}.webp"
+        target = target_dir / name
+        if not target.exists():
+            resized = image if variant_width == width else image.resize(
+                (variant_width, variant_height), Image.LANCZOS
+            )
+            tmp_target = target.with_suffix('.tmp')
+            resized.save(tmp_target, 'WEBP', quality=quality, method=4)
+            os.replace(tmp_target, target)
+        variants.append({
+            'path': f"{content_hash[:2]}/{name}",
+            'width': variant_width,
+            'height': variant_height,
+            'format': 'webp'
+        })
+
+    thumbnail = image.convert('RGB')
+    thumbnail.thumbnail((32, 32))
+    metadata = {
+        'content_hash': content_hash,
+        'width': width,
+        'height': height,
+        'blurhash': encode_blurhash(list(thumbnail.getdata()), *thumbnail.size),
+        'variants': variants,
+        # Settings the variants were produced with; changing them re-renders
+        'settings': {'widths': list(widths), 'quality': quality}
+    }
+
+    meta_file = target_dir / f"{content_hash}.json"
+    tmp_meta = meta_file.with_suffix('.tmp')
+    with open(tmp_meta, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f)
+    os.replace(tmp_meta, meta_file)
+
+    return metadata
+
+
+def encode_blurhash(pixels: List[Tuple[int, int, int]], width: int, height: int,
+                    components_x: int = 4, components_y: int = 3) -> str:
+    """Encode RGB pixels (row-major) as a blurhash string"""
+    linear = [(_srgb_to_linear(r), _srgb_to_linear(g), _srgb_to_linear(b)) for r, g, b in pixels]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(components_x)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(components_y)]
+
+    factors = []
+    for j in range(components_y):
+        for i in range(components_x):
+            normalisation = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                row = y * width
+                weight_y = cos_y[j][y]
+                for x in range(width):
+                    basis = cos_x[i][x] * weight_y
+                    pr, pg, pb = linear[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = normalisation / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _encode83((components_x - 1) + (components_y - 1) * 9, 1)
+
+    if ac:
+        actual_max = max(abs(value) for factor in ac for value in factor)
+        quantised_max = max(0, min(82, int(math.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _encode83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += _encode83(0, 1)
+
+    dc_value = (_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2])
+    result += _encode83(dc_value, 4)
+
+    for factor in ac:
+        quantised = [
+            max(0, min(18, int(math.floor(_sign_pow(value / max_value, 0.5) * 9 + 9.5))))
+            for value in factor
+        ]
+        result += _encode83(quantised[0] * 19 * 19 + quantised[1] * 19 + quantised[2], 2)
+
+    return result
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exponent: float) -> float:
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def _encode83(value: int, length: int) -> str:
+    return ''.join(_BASE83[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1))
+
+
+class ImageDerivativeStage:
+    """Annotate synced image rows with derivative URLs, dimensions and blurhash.
+
+    Images whose content hash already has metadata on disk are annotated from
+    that file; the rest are rendered in a process pool that lives for the run.
+    """
+
+    def __init__(self, output_dir: Path, url_prefix: str = '/derivatives',
+                 widths: Sequence[int] = DEFAULT_WIDTHS, quality: int = 80,
+                 workers: int = 0, logger: Optional[ModernLogger] = None):
+        self.output_dir = Path(output_dir)
+        self.url_prefix = url_prefix.rstrip('/')
+        self.widths = tuple(int(w) for w in widths)
+        self.quality = int(quality)
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self.logger = logger
+
+        self.rendered_count = 0
+        self.reused_count = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def available(self) -> bool:
+        return PIL_AVAILABLE
+
+    def process(self, images: List[Dict[str, Any]]) -> None:
+        """Annotate image dicts in place; images without a local raster source are skipped"""
+        pending: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+
+        for image in images:
+            source = image.get('source_path')
+            if not source or Path(source).suffix.lower() not in RASTER_EXTENSIONS:
+                continue
+
+            try:
+                content_hash = file_content_hash(Path(source))
+            except OSError as e:
+                self._warn(f"Cannot read image {source}: {e}")
+                continue
+
+            image['content_hash'] = content_hash
+            metadata = self._load_metadata(content_hash)
+            if metadata:
+                self._apply(image, metadata)
+                self.reused_count += 1
+            else:
+                pending.setdefault(content_hash, (source, []))[1].append(image)
+
+        if not pending:
+            return
+
+        if len(pending) == 1 or self.workers == 1:
+            results = {
+                content_hash: self._render_inline(source, content_hash)
+                for content_hash, (source, _) in pending.items()
+            }
+        else:
+            executor = self._get_executor()
+            futures: Dict[str, Future] = {
+                content_hash: executor.submit(
+                    render_derivatives, source, content_hash, str(self.output_dir),
+                    self.widths, self.quality
+                )
+                for content_hash, (source, _) in pending.items()
+            }
+            results = {}
+            for content_hash, future in futures.items():
+                try:
+                    results[content_hash] = future.result()
+                except Exception as e:
+                    self._warn(f"Derivative generation failed for {pending[content_hash][0]}: {e}")
+                    results[content_hash] = None
+
+        for content_hash, metadata in results.items():
+            if not metadata:
+                continue
+            self.rendered_count += 1
+            for image in pending[content_hash][1]:
+                self._apply(image, metadata)
+
+    def close(self) -> None:
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _render_inline(self, source: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Render in this process when a pool would not pay for itself"""
+        try:
+            return render_derivatives(source, content_hash, str(self.output_dir), self.widths, self.quality)
+        except Exception as e:
+            self._warn(f"Derivative generation failed for {source}: {e}")
+            return None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # The sync's parser threads are running; a forked child could inherit a held lock
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def _load_metadata(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Load metadata for an already processed image, if its derivatives still exist"""
+        meta_file = self.output_dir / content_hash[:2] / f"{content_hash}.json"
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get('settings') != {'widths': list(self.widths), 'quality': self.quality}:
+            return None
+        if not all((self.output_dir / variant['path']).exists() for variant in metadata.get('variants', [])):
+            return None
+        return metadata
+
+    def _apply(self, image: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        """Copy derivative metadata onto an image row"""
+        image['width'] = metadata.get('width')
+        image['height'] = metadata.get('height')
+        image['blurhash'] = metadata.get('blurhash')
+        image['derivatives'] = [
+            {
+                'url': f"{self.url_prefix}/{variant['path']}",
+                'width': variant['width'],
+                'height': variant['height'],
+                'format': variant['format']
+            }
+            for variant in metadata.get('variants', [])
+        ]
+
+    def _warn(self, message: str) -> None:
+        if self.logger:
+            self.logger.warning(message)
@@ -0,0 +1,223 @@
+"""
+Tail and follow the backend log without external tools.
+
+The last lines are found by reading fixed-size blocks backwards from the end
+of the file, so showing 50 lines of a multi-gigabyte ``backend.log`` reads a
+few kilobytes. Following polls the open file for appended data and notices
+rotation (the path now names a different file) and truncation (the file got
+shorter), reopening or rewinding as needed. Lines can be filtered in-process
+by minimum level and by regular expression.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Callable, Iterator, List, Optional, Pattern
+
+from ..core.exceptions import ValidationError
+
+BLOCK_SIZE = 64 * 1024
+
+# Idle wait between polls while following
+FOLLOW_INTERVAL = 0.25
+
+# go-zero levels plus the usual names, mapped to comparable ranks
+LEVEL_RANKS = {
+    'debug': 10,
+    'info': 20,
+    'stat': 20,
+    'slow': 30,
+    'warn': 30,
+    'warning': 30,
+    'error': 40,
+    'severe': 50,
+    'fatal': 50,
+    'panic': 50,
+}
+
+_PLAIN_LEVEL = re.compile(r'\b(DEBUG|INFO|WARN(?:ING)?|ERROR|SEVERE|FATAL|PANIC)\b', re.IGNORECASE)
+_JSON_LEVEL = re.compile(r'"level"\s*:\s*"(\w+)"')
+
+
+def line_level(line: str) -> Optional[str]:
+    """Level of a log line: the go-zero JSON 'level' field, or a level word in plain text"""
+    if line.startswith('{'):
+        match = _JSON_LEVEL.search(line)
+        if match:
+            return match.group(1).lower()
+        try:
+            level = json.loads(line).get('level')
+            return str(level).lower() if level else None
+        except (ValueError, AttributeError):
+            pass
+    match = _PLAIN_LEVEL.search(line)
+    return match.group(1).lower() if match else None
+
+
+class LogFilter:
+    """Keeps lines at or above a level and/or matching a regular expression.
+
+    Under a level filter, lines without a recognizable level are dropped.
+    """
+
+    def __init__(self, level: Optional[str] = None, pattern: Optional[str] = None):
+        self.min_rank: Optional[int] = None
+        self.pattern: Optional[Pattern[str]] = None
+
+        if level:
+            rank = LEVEL_RANKS.get(level.lower())
+            if rank is None:
+                raise ValidationError(
+                    f"Unknown log level '{level}'; choose one of: {', '.join(sorted(LEVEL_RANKS))}", 'level'
+                )
+            self.min_rank = rank
+
+        if pattern:
+            try:
+                self.pattern = re.compile(pattern)
+            except re.error as e:
+                raise ValidationError(f"Invalid log filter pattern '{pattern}': {e}", 'grep')
+
+    @property
+    def active(self) -> bool:
+        return self.min_rank is not None or self.pattern is not None
+
+    def __call__(self, line: str) -> bool:
+        if self.min_rank is not None:
+            level = line_level(line)
+            if level is None or LEVEL_RANKS.get(level, 0) < self.min_rank:
+                return False
+        if self.pattern is not None and not self.pattern.search(line):
+            return False
+        return True
+
+
+def tail_lines(path: str, count: int, line_filter: Optional[Callable[[str], bool]] = None,
+               block_size: int = BLOCK_SIZE) -> List[str]:
+    """
+    Read the last lines of a file by seeking backwards from the end.
+
+    Args:
+        path: Log file path
+        count: Number of (matching) lines to return
+        line_filter: Keeps a line when it returns True
+        block_size: Bytes read per backwards step
+
+    Returns:
+        Up to count lines in file order, without line endings
+    """
+    if count <= 0:
+        return []
+
+    collected: List[str] = []
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder: Optional[bytes] = None
+        skip_trailing_newline = True
+
+        while position > 0 and len(collected) < count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + (remainder or b'')
+
+            if skip_trailing_newline:
+                # A final newline terminates the last line rather than starting an empty one
+                if chunk.endswith(b'\n'):
+                    chunk = chunk[:-1]
+                skip_trailing_newline = False
+
+            pieces = chunk.split(b'\n')
+            # The first piece may continue in the previous block
+            remainder = pieces[0]
+            for raw in reversed(pieces[1:]):
+                if _collect(raw, collected, line_filter) and len(collected) >= count:
+                    break
+
+        # What is left at the start of the file is the first line
+        if position == 0 and len(collected) < count and remainder is not None:
+            _collect(remainder, collected, line_filter)
+
+    collected.reverse()
+    return collected
+
+
+def _collect(raw: bytes, collected: List[str], line_filter: Optional[Callable[[str], bool]]) -> bool:
+    line = raw.decode('utf-8', errors='replace').rstrip('\r')
+    if line_filter is None or line_filter(line):
+        collected.append(line)
+        return True
+    return False
+
+
+def follow(path: str, line_filter: Optional[Callable[[str], bool]] = None,
+           interval: float = FOLLOW_INTERVAL) -> Iterator[str]:
+    """
+    Yield lines appended to a file from its current end, until interrupted.
+
+    Rotation (the path now refers to another file) finishes the old file and
+    reads the new one from its start; truncation rewinds to the start. A
+    missing file is waited for.
+
+    Args:
+        path: Log file path
+        line_filter: Keeps a line when it returns True
+        interval: Seconds to wait between polls when no new data arrived
+    """
+    f = None
+    identity = None
+    pending = b''
+    from_start = False
+    try:
+        while True:
+            if f is None:
+                try:
+                    f = open(path, 'rb')
+                except FileNotFoundError:
+                    from_start = True
+                    time.sleep(interval)
+                    continue
+                stat = os.fstat(f.fileno())
+                identity = (stat.st_dev, stat.st_ino)
+                if not from_start:
+                    f.seek(0, os.SEEK_END)
+
+            data = f.read(BLOCK_SIZE)
+            if data:
+                *lines, pending = (pending + data).split(b'\n')
+                for raw in lines:
+                    yield from _emit(raw, line_filter)
+                continue
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stat = None
+
+            if stat is None or (stat.st_dev, stat.st_ino) != identity:
+                # Rotated: the old file is fully read, switch to the new one from its start
+                if pending:
+                    yield from _emit(pending, line_filter)
+                    pending = b''
+                f.close()
+                f = None
+                from_start = True
+                continue
+
+            if stat.st_size < f.tell():
+                # Truncated in place
+                f.seek(0)
+                pending = b''
+                continue
+
+            time.sleep(interval)
+    finally:
+        if f is not None:
+            f.close()
+
+
+def _emit(raw: bytes, line_filter: Optional[Callable[[str], bool]]) -> Iterator[str]:
+    line = raw.decode('utf-8', errors='replace').rstrip('\r')
+    if line_filter is None or line_filter(line):
+        yield line
@@ -1,7 +1,6 @@
 from pathlib import Path
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.traceback import install as install_rich_traceback
 from rich.progress import (
     Progress,
     SpinnerColumn,
@@ -16,10 +15,74 @@ from rich.text import Text
 from rich.table import Table
 from rich.box import ROUNDED
 from rich.theme import Theme
+import json
 import logging
 import os
-from typing import Any, Optional, Tuple
-from pyfiglet import Figlet
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+# Every ModernLogger logs through a child of this logger, which owns the shared handlers
+ROOT_LOGGER_NAME = "silan"
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({})).keys()) | {'message', 'asctime', 'icon'}
+
+
+class IconFormatter(logging.Formatter):
+    """Prefix console messages with the level icon carried on the record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        icon = getattr(record, 'icon', '')
+        return f"{icon} {message}" if icon else message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message and any `extra` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class ThrottledProgress:
+    """Batch progress-bar advances so hot loops update the bar at most every `interval` seconds"""
+
+    def __init__(self, progress: Progress, task_id: Any, interval: float = 0.1):
+        self.progress = progress
+        self.task_id = task_id
+        self.interval = interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def advance(self, count: int = 1) -> None:
+        self._pending += count
+        now = time.monotonic()
+        if now - self._last_flush >= self.interval:
+            self._flush(now)
+
+    def flush(self) -> None:
+        """Push any pending advance to the bar"""
+        self._flush(time.monotonic())
+
+    def _flush(self, now: float) -> None:
+        if self._pending:
+            self.progress.update(self.task_id, advance=self._pending)
+            self._pending = 0
+        self._last_flush = now
+
 
 class ModernLogger:
     """
@@ -57,6 +120,14 @@ class ModernLogger:
         "logging.level.critical": "bold white on red",
     }
 
+    # Process-wide state shared by every logger instance
+    _shared_console: Optional[Console] = None
+    _shared_handlers: Dict[bool, RichHandler] = {}
+    _json_handler: Optional[logging.Handler] = None
+    _quiet: Optional[bool] = None
+    _console_stderr = False
+    _tracebacks_installed = False
+
     def __init__(
         self,
         name: str = "app",
@@ -77,9 +148,7 @@ class ModernLogger:
     
     def _initialize_logger(self) -> None:
         """Initialize the logger - can be overridden in subclasses"""
-        # Enable rich tracebacks
-        if self.rich_tracebacks:
-            install_rich_traceback(show_locals=True)
+        # Rich tracebacks are installed once per process by install_tracebacks()
 
         # Map text levels to logging levels
         levels = {
@@ -91,29 +160,101 @@ class ModernLogger:
         }
         log_level = levels.get(self.level.lower(), logging.INFO)
 
-        # Get custom theme (can be overridden in subclasses)
-        custom_theme = self._get_custom_theme()
-
-        # Set up console and handler
-        self.console = Console(theme=custom_theme, highlight=True)
-        rich_handler = RichHandler(
-            console=self.console,
-            show_time=True,
-            show_level=True,
-            show_path=self.show_path,
-            markup=True,
-            rich_tracebacks=self.rich_tracebacks,
-            log_time_format="%H:%M:%S"
-        )
-
-        self.logger = logging.getLogger(self.name)
-        self.logger.setLevel(log_level)
-        self.logger.handlers.clear()
-        self.logger.addHandler(rich_handler)
+        # Console and handlers are shared: they live on the root 'silan' logger and
+        # every instance logs through a child of it, so creating a logger is cheap
+        self.console = self._get_shared_console()
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        if not root.handlers:
+            root.addHandler(self._get_shared_handler(False))
+            root.propagate = False
+        if root.level == logging.NOTSET:
+            root.setLevel(logging.INFO)
+
+        self.logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{self.name}")
+        # Info loggers follow the root level, which set_verbose() lowers to debug
+        self.logger.setLevel(logging.NOTSET if log_level == logging.INFO else log_level)
+        if self.show_path:
+            self.logger.handlers = [self._get_shared_handler(True)]
+            self.logger.propagate = False
 
         if self.log_file:
             self._setup_file_handler(self.log_file)
-    
+
+    def _get_shared_console(self) -> Console:
+        """Get the process-wide console, creating it on first use"""
+        if ModernLogger._shared_console is None:
+            ModernLogger._shared_console = Console(
+                theme=self._get_custom_theme(), highlight=True, stderr=ModernLogger._console_stderr
+            )
+        return ModernLogger._shared_console
+
+    def _get_shared_handler(self, show_path: bool) -> RichHandler:
+        """Get the process-wide rich handler for a path setting"""
+        handler = ModernLogger._shared_handlers.get(show_path)
+        if handler is None:
+            handler = RichHandler(
+                console=self._get_shared_console(),
+                show_time=True,
+                show_level=True,
+                show_path=show_path,
+                markup=True,
+                rich_tracebacks=self.rich_tracebacks,
+                log_time_format="%H:%M:%S"
+            )
+            handler.setFormatter(IconFormatter())
+            ModernLogger._shared_handlers[show_path] = handler
+        return handler
+
+    @classmethod
+    def enable_json_log(cls, log_file: str) -> None:
+        """Also write every record as a JSON line to a file, through one shared handler"""
+        if cls._json_handler is not None:
+            return
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        handler = logging.FileHandler(log_file, encoding='utf-8')
+        handler.setFormatter(JsonLinesFormatter())
+        logging.getLogger(ROOT_LOGGER_NAME).addHandler(handler)
+        cls._json_handler = handler
+
+    @classmethod
+    def use_stderr(cls) -> None:
+        """Send all console output to stderr, keeping stdout for machine-readable data"""
+        ModernLogger._console_stderr = True
+        if ModernLogger._shared_console is not None:
+            ModernLogger._shared_console.stderr = True
+
+    @classmethod
+    def set_verbose(cls, verbose: bool) -> None:
+        """Show debug messages from every info-level logger in the process"""
+        logging.getLogger(ROOT_LOGGER_NAME).setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    @classmethod
+    def set_quiet(cls, quiet: bool) -> None:
+        """Force quiet (machine) mode on or off for the whole process"""
+        cls._quiet = quiet
+
+    @classmethod
+    def is_quiet(cls) -> bool:
+        """Check quiet mode, defaulting to on when stdout is not a terminal"""
+        if cls._quiet is None:
+            try:
+                return not sys.stdout.isatty()
+            except (AttributeError, ValueError):
+                return True
+        return cls._quiet
+
+    @classmethod
+    def install_tracebacks(cls) -> None:
+        """Install rich tracebacks once, skipped in quiet mode"""
+        if cls._tracebacks_installed or cls.is_quiet():
+            return
+        # rich.traceback pulls in pygments, so it is only imported when installed
+        from rich.traceback import install as install_rich_traceback
+        install_rich_traceback(show_locals=True)
+        cls._tracebacks_installed = True
+
     def _get_custom_theme(self) -> Theme:
         """Get custom theme - can be overridden in subclasses"""
         theme_dict = self.DEFAULT_THEME.copy()
@@ -124,6 +265,10 @@ class ModernLogger:
         log_dir = os.path.dirname(log_file)
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir)
+        # Loggers are shared by name, so later instances must not add the file twice
+        target = os.path.abspath(log_file)
+        if any(getattr(h, 'baseFilename', None) == target for h in self.logger.handlers):
+            return
         fh = logging.FileHandler(log_file)
         fh.setFormatter(logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -153,35 +298,46 @@ class ModernLogger:
         return grad_text
 
     # —— Logging Level Methods (can be overridden in subclasses) —— #
+    #
+    # Messages take %-style arguments that are only formatted when the record is
+    # emitted, and disabled levels return before any record is built:
+    #     self.debug("Syncing %s (%d/%d)", name, current, total)
+    # Keyword `extra` fields are kept as structured fields in the JSON log.
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("DEBUG", message)
-        self.logger.debug(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, "DEBUG", message, args, kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("INFO", message)
-        self.logger.info(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, "INFO", message, args, kwargs)
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("WARNING", message)
-        self.logger.warning(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, "WARNING", message, args, kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("ERROR", message)
-        self.logger.error(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, "ERROR", message, args, kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("CRITICAL", message)
-        self.logger.critical(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, "CRITICAL", message, args, kwargs)
 
     def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
-        formatted_message = self._format_log_message("ERROR", message)
-        self.logger.exception(formatted_message, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            kwargs.setdefault('exc_info', True)
+            self._log(logging.ERROR, "ERROR", message, args, kwargs)
     
-    def _format_log_message(self, level: str, message: str) -> str:
-        """Format log message with icon - can be overridden in subclasses"""
-        icon = self.LEVEL_ICONS.get(level, "")
-        return f"{icon} {message}" if icon else message
+    def _log(self, level: int, level_name: str, message: str, args: Tuple[Any, ...],
+             kwargs: Dict[str, Any]) -> None:
+        """Emit a record carrying the level icon for the console formatter"""
+        extra = kwargs.get('extra')
+        icon = self.LEVEL_ICONS.get(level_name, "")
+        kwargs['extra'] = dict(extra, icon=icon) if extra else {'icon': icon}
+        # Attribute the record to the caller of debug()/info()/..., not to this module
+        kwargs.setdefault('stacklevel', 3)
+        self.logger.log(level, message, *args, **kwargs)
 
     # —— Rich Print Methods —— #
 
@@ -202,7 +358,8 @@ class ModernLogger:
             TimeElapsedColumn(),
             TimeRemainingColumn(),
             console=self.console,
-            expand=True
+            expand=True,
+            disable=self.is_quiet()
         )
         task_id = progress.add_task(description, total=total)
         return progress, task_id
@@ -308,7 +465,13 @@ class ModernLogger:
         """
         Print an ASCII Art Banner at program startup with gradient styling,
         and a project description panel using the theme colors.
+        Skipped in quiet mode.
         """
+        if self.is_quiet():
+            return
+
+        # Imported here so startup only pays for pyfiglet when a banner is drawn
+        from pyfiglet import Figlet
         fig = Figlet(font=font)
         art = fig.renderText(project_name)
 
@@ -0,0 +1,169 @@
+"""
+Resource sampling for the managed backend process.
+
+A sample records CPU%, resident memory, threads, open file descriptors, TCP
+connections by state and the latency of one HTTP request to the health URL.
+Samples are kept in a fixed-size ring buffer, so a monitor can run for hours
+and still summarize the most recent window with percentiles and the growth of
+memory, descriptors and connections between its first and last sample, which
+is what a leak looks like.
+"""
+
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import psutil
+
+from .readiness import DEFAULT_HEALTH_PATH, check_http
+from .sql_stats import percentile
+
+# Metrics summarized with percentiles, in display order
+SUMMARY_METRICS = [
+    'cpu_percent', 'rss_mb', 'threads', 'fds', 'tcp_total', 'tcp_established', 'tcp_close_wait', 'latency_ms'
+]
+
+# Metrics whose first-to-last change is reported as growth
+GROWTH_METRICS = ['rss_mb', 'threads', 'fds', 'tcp_total', 'tcp_close_wait']
+
+
+@dataclass
+class ResourceSample:
+    """One observation of the backend process"""
+    timestamp: float
+    cpu_percent: float
+    rss_mb: float
+    threads: int
+    fds: Optional[int]
+    tcp_total: int
+    tcp_established: int
+    tcp_close_wait: int
+    tcp_states: Dict[str, int] = field(default_factory=dict)
+    latency_ms: Optional[float] = None
+    status_code: Optional[int] = None
+    health_error: Optional[str] = None
+
+
+class ProcessMonitor:
+    """Samples a process and its health URL into a ring buffer"""
+
+    def __init__(self, pid: int, host: str = '127.0.0.1', port: Optional[int] = None,
+                 health_path: Optional[str] = DEFAULT_HEALTH_PATH, history: int = 300,
+                 health_timeout: float = 2.0):
+        self.process = psutil.Process(pid)
+        self.host = host
+        self.port = port
+        self.health_path = health_path
+        self.health_timeout = health_timeout
+        self.samples: Deque[ResourceSample] = deque(maxlen=max(1, history))
+        self.health_failures = 0
+
+        # The first cpu_percent() call only sets the baseline
+        self.process.cpu_percent(None)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def sample(self) -> ResourceSample:
+        """
+        Take one sample and append it to the ring buffer.
+
+        Raises:
+            psutil.NoSuchProcess: If the process has exited
+        """
+        process = self.process
+        with process.oneshot():
+            cpu = process.cpu_percent(None)
+            rss = process.memory_info().rss
+            threads = process.num_threads()
+            fds = self._open_fds()
+
+        states = self._tcp_states()
+        latency_ms, status_code, health_error = self._probe_health()
+        if health_error:
+            self.health_failures += 1
+
+        sample = ResourceSample(
+            timestamp=time.time(),
+            cpu_percent=round(cpu, 1),
+            rss_mb=round(rss / (1024 * 1024), 2),
+            threads=threads,
+            fds=fds,
+            tcp_total=sum(states.values()),
+            tcp_established=states.get('ESTABLISHED', 0),
+            tcp_close_wait=states.get('CLOSE_WAIT', 0),
+            tcp_states=states,
+            latency_ms=latency_ms,
+            status_code=status_code,
+            health_error=health_error,
+        )
+        self.samples.append(sample)
+        return sample
+
+    def _open_fds(self) -> Optional[int]:
+        try:
+            if hasattr(self.process, 'num_fds'):
+                return self.process.num_fds()
+            return self.process.num_handles()
+        except (psutil.AccessDenied, AttributeError):
+            return None
+
+    def _tcp_states(self) -> Dict[str, int]:
+        # net_connections() replaced connections() in psutil 6
+        connections = getattr(self.process, 'net_connections', None) or self.process.connections
+        try:
+            states: Dict[str, int] = {}
+            for connection in connections(kind='tcp'):
+                states[connection.status] = states.get(connection.status, 0) + 1
+            return states
+        except psutil.AccessDenied:
+            return {}
+
+    def _probe_health(self) -> Tuple[Optional[float], Optional[int], Optional[str]]:
+        if not self.port or self.health_path is None:
+            return None, None, None
+        started = time.perf_counter()
+        status_code, error = check_http(self.host, self.port, self.health_path, self.health_timeout)
+        latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        if status_code is not None and status_code >= 500:
+            error = f"HTTP {status_code}"
+        return (latency_ms if status_code is not None else None), status_code, error
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentiles and growth over the samples in the ring buffer"""
+        samples = list(self.samples)
+        metrics: Dict[str, Dict[str, Any]] = {}
+        for name in SUMMARY_METRICS:
+            values = sorted(v for v in (getattr(s, name) for s in samples) if v is not None)
+            if not values:
+                continue
+            metrics[name] = {
+                'min': values[0],
+                'p50': percentile(values, 0.50),
+                'p95': percentile(values, 0.95),
+                'p99': percentile(values, 0.99),
+                'max': values[-1],
+                'last': getattr(samples[-1], name),
+            }
+
+        growth = {}
+        if len(samples) >= 2:
+            for name in GROWTH_METRICS:
+                first, last = getattr(samples[0], name), getattr(samples[-1], name)
+                if first is not None and last is not None:
+                    growth[name] = round(last - first, 2)
+
+        return {
+            'pid': self.pid,
+            'samples': len(samples),
+            'window_seconds': round(samples[-1].timestamp - samples[0].timestamp, 1) if samples else 0.0,
+            'health_failures': self.health_failures,
+            'metrics': metrics,
+            'growth': growth,
+        }
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Samples in the ring buffer as plain dicts"""
+        return [asdict(sample) for sample in self.samples]
@@ -0,0 +1,161 @@
+"""
+Readiness probing for the backend server.
+
+After the backend process is spawned, the probe polls the configured address
+with exponential backoff: first until a TCP connection is accepted, then until
+an HTTP request to the health path gets an answer that is not a server error.
+The go-zero server has no dedicated health route, so the default path is ``/``;
+a 404 from the router still proves requests are being served. Polling stops as
+soon as the server is ready, when the process exits, or at the timeout.
+
+An answer only counts while the process is still running: a stale server left
+on the port answers too, while the new process exits failing to bind.
+"""
+
+import http.client
+import socket
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+DEFAULT_HEALTH_PATH = '/'
+DEFAULT_READY_TIMEOUT = 30.0
+
+# Backoff between probes: 50 ms doubling up to 250 ms
+INITIAL_DELAY = 0.05
+MAX_DELAY = 0.25
+
+# Wildcard bind addresses are probed through loopback
+_WILDCARD_HOSTS = {'': '127.0.0.1', '0.0.0.0': '127.0.0.1', '::': '::1', '[::]': '::1'}
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for a server"""
+    ready: bool
+    elapsed: float
+    attempts: int
+    stage: str
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def elapsed_ms(self) -> float:
+        return round(self.elapsed * 1000, 1)
+
+
+def probe_host(host: str) -> str:
+    """Address to connect to for a server bound to host"""
+    return _WILDCARD_HOSTS.get(host.strip(), host.strip().strip('[]'))
+
+
+def check_tcp(host: str, port: int, timeout: float = 1.0) -> Optional[str]:
+    """Try one TCP connection; returns None on success or the error text"""
+    try:
+        with socket.create_connection((probe_host(host), port), timeout=timeout):
+            return None
+    except OSError as e:
+        return str(e) or e.__class__.__name__
+
+
+def check_http(host: str, port: int, path: str = DEFAULT_HEALTH_PATH,
+               timeout: float = 1.0) -> Tuple[Optional[int], Optional[str]]:
+    """Send one GET to the health path; returns (status code, error text)"""
+    connection = http.client.HTTPConnection(probe_host(host), port, timeout=timeout)
+    try:
+        connection.request('GET', path or DEFAULT_HEALTH_PATH, headers={'User-Agent': 'silan-readiness'})
+        response = connection.getresponse()
+        response.read()
+        return response.status, None
+    except (OSError, http.client.HTTPException) as e:
+        return None, str(e) or e.__class__.__name__
+    finally:
+        connection.close()
+
+
+def port_in_use(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Whether something already accepts connections on the port"""
+    return check_tcp(host, port, timeout) is None
+
+
+def _confirm_alive(result: ReadinessResult, is_alive: Optional[Callable[[], bool]]) -> ReadinessResult:
+    """Turn a ready result into 'exited' when the process is gone: another server answered"""
+    if is_alive is None or is_alive():
+        return result
+    return ReadinessResult(False, result.elapsed, result.attempts, 'exited', result.status_code,
+                           'process exited; another server is answering on the port')
+
+
+def wait_until_ready(host: str, port: int, health_path: Optional[str] = DEFAULT_HEALTH_PATH,
+                     timeout: float = DEFAULT_READY_TIMEOUT,
+                     is_alive: Optional[Callable[[], bool]] = None) -> ReadinessResult:
+    """
+    Poll a server until it accepts connections and answers HTTP requests.
+
+    Args:
+        host: Host the server was told to bind to; wildcard addresses use loopback
+        port: Server port
+        health_path: Path requested once the port accepts connections; None skips the HTTP check
+        timeout: Seconds to wait before giving up
+        is_alive: Returns False once the server process has exited, ending the wait early
+
+    Returns:
+        ReadinessResult with time-to-ready, or the stage that did not succeed
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    delay = INITIAL_DELAY
+    attempts = 0
+    stage = 'tcp'
+    status_code = None
+    error = None
+
+    while True:
+        if is_alive is not None and not is_alive():
+            return ReadinessResult(False, time.monotonic() - started, attempts, 'exited',
+                                   status_code, 'process exited before becoming ready')
+
+        attempts += 1
+        probe_timeout = max(0.05, min(1.0, deadline - time.monotonic()))
+        if stage == 'tcp':
+            error = check_tcp(host, port, probe_timeout)
+            if error is None:
+                if health_path is None:
+                    return _confirm_alive(ReadinessResult(True, time.monotonic() - started, attempts, stage),
+                                          is_alive)
+                stage = 'http'
+                # The port is open; ask for the health path right away
+                continue
+        else:
+            status_code, error = check_http(host, port, health_path, probe_timeout)
+            if status_code is not None and status_code < 500:
+                return _confirm_alive(
+                    ReadinessResult(True, time.monotonic() - started, attempts, stage, status_code), is_alive
+                )
+            if status_code is not None:
+                error = f"HTTP {status_code}"
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ReadinessResult(False, time.monotonic() - started, attempts, stage, status_code, error)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, MAX_DELAY)
+
+
+def wait_until_released(host: str, port: int, timeout: float = 10.0) -> bool:
+    """
+    Poll until nothing accepts connections on a port, e.g. after stopping the server.
+
+    Returns:
+        True once connections are refused, False if the port is still open at the timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = INITIAL_DELAY
+    while True:
+        if check_tcp(host, port, max(0.05, min(1.0, deadline - time.monotonic()))) is not None:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, MAX_DELAY)
@@ -0,0 +1,205 @@
+"""
+SQL statement statistics gathered from SQLAlchemy engine events.
+
+Every cursor execution is timed between ``before_cursor_execute`` and
+``after_cursor_execute`` and folded into per-shape and per-table aggregates.
+A shape is the statement with literals and bind parameters replaced by ``?``
+and ``IN``/``VALUES`` lists collapsed, so the same query issued once per item
+shows up as one shape with a large count: the signature of an N+1 loop.
+"""
+
+import heapq
+import math
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r'\s+')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_PARAM = re.compile(r'%\(\w+\)s|%s|:\w+|\?')
+_NUMBER = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN \((?:\?, )*\?\)', re.IGNORECASE)
+_VALUES_LIST = re.compile(r'\bVALUES (\([^()]*\))(?:, \([^()]*\))+', re.IGNORECASE)
+_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|TABLE)\s+[`"\[]?(\w+)', re.IGNORECASE)
+_PRAGMA_TARGET = re.compile(r'\("[^"]*"\)')
+
+# Pseudo-table for schema introspection (SQLite PRAGMAs issued by create_all/inspect)
+SCHEMA_TABLE = '(schema)'
+
+# Distinct statement strings seen by one engine are few; shapes are cached per string
+_SHAPE_CACHE_SIZE = 4096
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def statement_shape(statement: str) -> Tuple[str, str, str]:
+    """
+    Normalize a SQL statement into its shape.
+
+    Args:
+        statement: SQL text as sent to the DBAPI cursor
+
+    Returns:
+        (shape, verb, table) where table is the first table named, SCHEMA_TABLE or '-'
+    """
+    shape = _WHITESPACE.sub(' ', statement).strip()
+    shape = _STRING_LITERAL.sub('?', shape)
+    shape = _BIND_PARAM.sub('?', shape)
+    shape = _NUMBER.sub('?', shape)
+    shape = _IN_LIST.sub('IN (?...)', shape)
+    shape = _VALUES_LIST.sub(r'VALUES \1...', shape)
+
+    verb = shape.split(' ', 1)[0].upper() if shape else ''
+    if verb == 'PRAGMA':
+        return _PRAGMA_TARGET.sub('(?)', shape), verb, SCHEMA_TABLE
+    match = _TABLE.search(shape)
+    return shape, verb, match.group(1) if match else '-'
+
+
+class SQLStats:
+    """Aggregates statement counts, latency and affected rows for one engine"""
+
+    def __init__(self, slowest: int = 10):
+        self.slowest_limit = slowest
+
+        self.statement_count = 0
+        self.total_seconds = 0.0
+        self.rows_affected = 0
+
+        # shape -> {'verb', 'table', 'count', 'rows', 'timings'}
+        self._shapes: Dict[str, Dict[str, Any]] = {}
+        self._shape_cache: Dict[str, Tuple[str, str, str]] = {}
+        self._slowest: List[Tuple[float, int, str, str]] = []
+        self._lock = threading.Lock()
+        self._engine: Optional['Engine'] = None
+
+    def attach(self, engine: 'Engine') -> None:
+        """Start listening to an engine's cursor executions"""
+        # Imported here so the helpers above stay usable without loading SQLAlchemy
+        from sqlalchemy import event
+
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._engine = engine
+
+    def detach(self) -> None:
+        """Stop listening; collected statistics are kept"""
+        if self._engine is None:
+            return
+        from sqlalchemy import event
+
+        event.remove(self._engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.remove(self._engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._engine = None
+
+    def _before_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any,
+                               context: Any, executemany: bool) -> None:
+        conn.info.setdefault('silan_query_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any,
+                              context: Any, executemany: bool) -> None:
+        starts = conn.info.get('silan_query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+
+        shape_info = self._shape_cache.get(statement)
+        if shape_info is None:
+            shape_info = statement_shape(statement)
+            if len(self._shape_cache) < _SHAPE_CACHE_SIZE:
+                self._shape_cache[statement] = shape_info
+        shape, verb, table = shape_info
+
+        rows = 0
+        if verb in ('INSERT', 'UPDATE', 'DELETE'):
+            rowcount = getattr(cursor, 'rowcount', -1)
+            rows = rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
+
+        with self._lock:
+            self.statement_count += 1
+            self.total_seconds += elapsed
+            self.rows_affected += rows
+
+            entry = self._shapes.get(shape)
+            if entry is None:
+                entry = {'verb': verb, 'table': table, 'count': 0, 'rows': 0, 'timings': []}
+                self._shapes[shape] = entry
+            entry['count'] += 1
+            entry['rows'] += rows
+            entry['timings'].append(elapsed)
+
+            slow = (elapsed, self.statement_count, table, _WHITESPACE.sub(' ', statement).strip()[:500])
+            if len(self._slowest) < self.slowest_limit:
+                heapq.heappush(self._slowest, slow)
+            elif elapsed > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, slow)
+
+    def by_shape(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-shape aggregates, most total time first"""
+        with self._lock:
+            items = [
+                (shape, dict(entry, timings=list(entry['timings'])))
+                for shape, entry in self._shapes.items()
+            ]
+        rows = [
+            dict(self._aggregate(entry['timings']), shape=shape, verb=entry['verb'],
+                 table=entry['table'], rows=entry['rows'])
+            for shape, entry in items
+        ]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def by_table(self) -> List[Dict[str, Any]]:
+        """Per-table aggregates, most total time first"""
+        tables: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for entry in self._shapes.values():
+                table = tables.setdefault(entry['table'], {'timings': [], 'rows': 0})
+                table['timings'].extend(entry['timings'])
+                table['rows'] += entry['rows']
+        rows = [
+            dict(self._aggregate(table['timings']), table=name, rows=table['rows'])
+            for name, table in tables.items()
+        ]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        """The slowest individual statements, slowest first"""
+        with self._lock:
+            slowest = sorted(self._slowest, reverse=True)
+        return [
+            {'ms': round(elapsed * 1000, 3), 'table': table, 'statement': statement}
+            for elapsed, _, table, statement in slowest
+        ]
+
+    def summary(self, shape_limit: int = 25) -> Dict[str, Any]:
+        """JSON-serializable statistics for the sync summary file"""
+        return {
+            'statements': self.statement_count,
+            'total_ms': round(self.total_seconds * 1000, 3),
+            'rows_affected': self.rows_affected,
+            'by_table': self.by_table(),
+            'by_shape': self.by_shape(shape_limit),
+            'slowest': self.slowest(),
+        }
+
+    @staticmethod
+    def _aggregate(timings: List[float]) -> Dict[str, Any]:
+        ordered = sorted(timings)
+        return {
+            'count': len(ordered),
+            'total_ms': round(sum(ordered) * 1000, 3),
+            'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+            'max_ms': round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        }
@@ -0,0 +1,116 @@
+"""
+Durable progress of a database sync, so an interrupted run can resume.
+
+The checkpoint is an append-only journal of JSON lines: a header naming the
+database and shard the run writes to, then one line per committed batch with
+the content ids written and their content hashes. A line is flushed and
+fsynced only after its batch's transaction has committed, so the journal
+never claims more than the database holds; a line cut short by a crash is
+ignored on load. Appending keeps the cost per batch constant however many
+items were already written. A resumed run skips the recorded items whose
+hash still matches the files on disk and syncs everything else.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Optional
+
+CHECKPOINT_VERSION = 1
+
+
+class SyncCheckpoint:
+    """Journal of the batches a sync run has committed"""
+
+    def __init__(self, path: Path, identity: Dict[str, Any]):
+        """
+        Args:
+            path: Journal file, e.g. .silan/sync_checkpoint.jsonl
+            identity: What the run writes to (database, shard); a journal for
+                another identity is never resumed
+        """
+        self.path = Path(path)
+        self.identity = {'version': CHECKPOINT_VERSION, **identity}
+        self.completed: Dict[str, str] = {}
+        self.batches = 0
+        self.started_at: Optional[float] = None
+        self._file: Optional[IO[str]] = None
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> bool:
+        """
+        Read the items recorded by an earlier run with the same identity.
+
+        Returns:
+            False if there is no journal or it belongs to another database or shard
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+        except OSError:
+            return False
+
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return False
+        if header.get('identity') != self.identity:
+            return False
+
+        self.started_at = header.get('started_at')
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Empty trailing line, or a batch the crash interrupted mid-write
+                continue
+            self.completed.update(entry.get('items', {}))
+            self.batches += 1
+        return True
+
+    def open(self, resume: bool) -> None:
+        """Start journaling; a resumed run appends, a fresh one replaces the journal"""
+        if resume and self.completed:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # Drop a partial line left by the crash so the next entry starts on its own line
+            if self._file.tell() and not self.path.read_bytes().endswith(b'\n'):
+                self._file.write('\n')
+            return
+
+        self.completed = {}
+        self.batches = 0
+        self.started_at = time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._append({'identity': self.identity, 'started_at': self.started_at})
+
+    def record_batch(self, items: Dict[str, str]) -> None:
+        """Record committed items (content id -> content hash) durably"""
+        if not items or self._file is None:
+            return
+        self.batches += 1
+        self.completed.update(items)
+        self._append({'batch': self.batches, 'items': items})
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        assert self._file is not None
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Delete the journal once the run has finished cleanly"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
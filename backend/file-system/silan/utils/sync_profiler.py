@@ -0,0 +1,153 @@
+"""
+Per-stage timing for database sync runs.
+
+Stages are named spans (``discovery``, ``hashing``, ``parse.project._extract_sections``,
+``write._sync_project`` ...) that accumulate call counts, wall time and CPU time of
+the thread that ran them, so parse workers are measured correctly. Nested stages
+report inclusive time. A disabled profiler hands out one shared no-op context
+manager and leaves methods unwrapped, so it costs nothing outside ``--profile``.
+"""
+
+import cProfile
+import functools
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+_NULL_CONTEXT = nullcontext()
+
+
+class SyncProfiler:
+    """Accumulates wall and CPU time per named sync stage"""
+
+    def __init__(self, enabled: bool = False, cprofile_output: Optional[Path] = None):
+        self.enabled = enabled or cprofile_output is not None
+        self.cprofile_output = Path(cprofile_output) if cprofile_output else None
+
+        # name -> [calls, wall seconds, cpu seconds]
+        self._stages: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._wrapped_names: Dict[Tuple[type, str], List[str]] = {}
+
+        self._started_at: Optional[float] = None
+        self._cpu_started_at: Optional[float] = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def start(self) -> None:
+        """Start the overall run clock and, if requested, cProfile"""
+        if not self.enabled:
+            return
+        self._started_at = time.perf_counter()
+        self._cpu_started_at = time.process_time()
+        if self.cprofile_output:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stop the run clock and write cProfile stats if they were collected"""
+        if not self.enabled or self._started_at is None:
+            return
+        self.wall_seconds = time.perf_counter() - self._started_at
+        self.cpu_seconds = time.process_time() - (self._cpu_started_at or 0.0)
+        self._started_at = None
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self.cprofile_output.parent.mkdir(parents=True, exist_ok=True)
+            pstats.Stats(self._cprofile).sort_stats('cumulative').dump_stats(str(self.cprofile_output))
+            self._cprofile = None
+
+    def stage(self, name: str) -> ContextManager[Any]:
+        """Time a block under a stage name"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start)
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        """Add one timed call to a stage"""
+        with self._lock:
+            totals = self._stages.get(name)
+            if totals is None:
+                self._stages[name] = [1, wall, cpu]
+            else:
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+
+    def instrument(self, obj: Any, prefix: str, predicate: Callable[[str], bool]) -> None:
+        """
+        Wrap an instance's methods so each call is recorded as ``<prefix>.<method>``.
+
+        Args:
+            obj: Instance whose bound methods are replaced by timed wrappers
+            prefix: Stage name prefix, e.g. 'parse.project'
+            predicate: Selects method names to wrap
+        """
+        if not self.enabled:
+            return
+
+        key = (type(obj), prefix)
+        names = self._wrapped_names.get(key)
+        if names is None:
+            names = [
+                name for name in dir(type(obj))
+                if predicate(name) and callable(getattr(type(obj), name, None))
+            ]
+            self._wrapped_names[key] = names
+
+        for name in names:
+            method = getattr(obj, name)
+            if getattr(method, '_sync_profiled', False):
+                continue
+            setattr(obj, name, self._wrap(method, f"{prefix}.{name}"))
+
+    def _wrap(self, method: Callable[..., Any], name: str) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self._timed(name):
+                return method(*args, **kwargs)
+
+        timed._sync_profiled = True  # type: ignore[attr-defined]
+        return timed
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Stages sorted by wall time, with calls, totals and mean per call"""
+        with self._lock:
+            stages = sorted(self._stages.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {
+                'stage': name,
+                'calls': int(calls),
+                'wall_seconds': round(wall, 6),
+                'cpu_seconds': round(cpu, 6),
+                'mean_ms': round(wall / calls * 1000, 3) if calls else 0.0,
+            }
+            for name, (calls, wall, cpu) in stages
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-serializable profile for the sync summary file"""
+        return {
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'cprofile_output': str(self.cprofile_output) if self.cprofile_output else None,
+            'stages': self.report(),
+        }
+
+
+# Shared disabled profiler for components that are not being profiled
+NULL_PROFILER = SyncProfiler()
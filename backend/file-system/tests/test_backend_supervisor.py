@@ -0,0 +1,156 @@
+"""Tests for the multi-instance backend supervisor and rolling restarts"""
+
+import json
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from silan.logic.backend_logic import BackendLogic
+from silan.server.backend_supervisor import SPEC_FILE, STATE_FILE, BackendSupervisor
+
+# Serves HTTP on the given port, or exits at once when the "broken" marker file exists
+INSTANCE_SCRIPT = """
+import os, sys
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+if os.path.exists(sys.argv[2]):
+    sys.exit(1)
+HTTPServer(('127.0.0.1', int(sys.argv[1])), SimpleHTTPRequestHandler).serve_forever()
+"""
+
+
+def _free_ports(count):
+    sockets = [socket.socket() for _ in range(count)]
+    try:
+        for sock in sockets:
+            sock.bind(('127.0.0.1', 0))
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+@pytest.fixture
+def silan_dir(tmp_path):
+    """A .silan directory with a supervisor spec for two instances"""
+    directory = tmp_path / '.silan'
+    directory.mkdir()
+    script = tmp_path / 'instance.py'
+    script.write_text(INSTANCE_SCRIPT)
+    broken = tmp_path / 'broken'
+
+    spec = {
+        'host': '127.0.0.1',
+        'ready_timeout': 5,
+        'cwd': str(tmp_path),
+        'instances': [
+            {'index': index, 'port': port, 'command': [sys.executable, str(script), str(port), str(broken)]}
+            for index, port in enumerate(_free_ports(2))
+        ],
+    }
+    (directory / SPEC_FILE).write_text(json.dumps(spec))
+    return directory
+
+
+def _state(silan_dir):
+    return json.loads((silan_dir / STATE_FILE).read_text())
+
+
+def _json_lines(output):
+    # Log messages share stdout with the JSON lines here; the CLI sends them to stderr
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+
+
+def _start(supervisor):
+    for instance in supervisor.instances:
+        supervisor._start_instance(instance)
+
+
+def test_rollout_success_is_counted(silan_dir):
+    supervisor = BackendSupervisor(silan_dir)
+    _start(supervisor)
+    try:
+        supervisor._rolling_restart()
+        state = _state(silan_dir)
+    finally:
+        supervisor._stop_all()
+
+    assert state['rolling_restarts'] == 1
+    assert state['rollouts_finished'] == 1
+    assert state['last_rollout_error'] is None
+
+
+def test_failed_rollout_is_finished_but_not_counted(silan_dir):
+    supervisor = BackendSupervisor(silan_dir)
+    _start(supervisor)
+    try:
+        (silan_dir.parent / 'broken').touch()
+        supervisor._rolling_restart()
+        state = _state(silan_dir)
+    finally:
+        supervisor._stop_all()
+
+    assert state['rolling_restarts'] == 0
+    assert state['rollouts_finished'] == 1
+    assert state['last_rollout_error'].startswith('instance 0 not ready (exited')
+    # The second instance is left serving on its old process
+    assert state['instances'][1]['status'] == 'running'
+
+
+@pytest.mark.slow
+def test_cli_reports_failed_rollout_without_waiting_for_timeout(silan_dir, monkeypatch):
+    supervisor = subprocess.Popen([sys.executable, '-m', 'silan.server.backend_supervisor', str(silan_dir)])
+    try:
+        deadline = time.monotonic() + 10
+        while not (silan_dir / STATE_FILE).exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        monkeypatch.chdir(silan_dir.parent)
+        logic = BackendLogic()
+        logic._save_backend_pid(supervisor.pid)
+        errors = []
+        monkeypatch.setattr(logic, 'error', errors.append)
+
+        (silan_dir.parent / 'broken').touch()
+        started = time.monotonic()
+        assert not logic._rolling_restart()
+    finally:
+        supervisor.terminate()
+        supervisor.wait(timeout=30)
+
+    # Well before the 2 * (ready_timeout + STOP_TIMEOUT) deadline
+    assert time.monotonic() - started < 10
+    assert errors and errors[0].startswith('Rolling restart stopped: instance 0 not ready')
+
+
+@pytest.mark.slow
+def test_top_samples_every_instance(silan_dir, monkeypatch, capsys):
+    supervisor = subprocess.Popen([sys.executable, '-m', 'silan.server.backend_supervisor', str(silan_dir)])
+    try:
+        deadline = time.monotonic() + 10
+        while not (silan_dir / STATE_FILE).exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        instances = _state(silan_dir)['instances']
+
+        monkeypatch.chdir(silan_dir.parent)
+        logic = BackendLogic()
+        logic._save_backend_pid(supervisor.pid)
+
+        assert logic.monitor_backend(interval=0.1, count=2, json_output=True)
+        lines = _json_lines(capsys.readouterr().out)
+
+        assert logic.monitor_backend(interval=0.1, count=1, json_output=True, instance=1)
+        only_second = _json_lines(capsys.readouterr().out)
+    finally:
+        supervisor.terminate()
+        supervisor.wait(timeout=30)
+
+    # The Go servers are sampled, not the supervisor named by the PID file
+    sampled = {(line['sample']['instance'], line['sample']['pid']) for line in lines if 'sample' in line}
+    assert sampled == {(item['index'], item['pid']) for item in instances}
+    assert supervisor.pid not in {pid for _, pid in sampled}
+    assert len([line for line in lines if 'summary' in line]) == 2
+
+    assert {line['sample']['instance'] for line in only_second if 'sample' in line} == {1}
@@ -0,0 +1,65 @@
+"""Tests for diff_ordered_collection"""
+
+import uuid
+
+from silan.utils.collection_diff import diff_ordered_collection
+
+
+def _rows(*names):
+    return [{'name': name, 'sort_order': index} for index, name in enumerate(names)]
+
+
+def test_identical_collections_are_empty():
+    diff = diff_ordered_collection(_rows('a', 'b'), _rows('a', 'b'), ['name'], ['sort_order'])
+    assert diff.is_empty
+    assert diff.unchanged == 2
+
+
+def test_insert_update_delete():
+    existing = _rows('a', 'b', 'c')
+    desired = [{'name': 'a', 'sort_order': 0}, {'name': 'c', 'sort_order': 1}, {'name': 'd', 'sort_order': 2}]
+
+    diff = diff_ordered_collection(existing, desired, ['name'], ['sort_order'])
+
+    assert diff.inserts == [{'name': 'd', 'sort_order': 2}]
+    assert diff.updates == [(existing[2], {'sort_order': 1})]
+    assert diff.deletes == [existing[1]]
+    assert diff.unchanged == 1
+
+
+def test_reorder_only_updates_sort_order():
+    existing = _rows('a', 'b')
+    diff = diff_ordered_collection(existing, _rows('b', 'a'), ['name'], ['sort_order'])
+
+    assert not diff.inserts and not diff.deletes
+    assert sorted(changes['sort_order'] for _, changes in diff.updates) == [0, 1]
+
+
+def test_duplicate_keys_pair_in_order():
+    existing = [{'name': 'x', 'value': 1}, {'name': 'x', 'value': 2}]
+    desired = [{'name': 'x', 'value': 1}, {'name': 'x', 'value': 3}, {'name': 'x', 'value': 4}]
+
+    diff = diff_ordered_collection(existing, desired, ['name'], ['value'])
+
+    assert diff.unchanged == 1
+    assert diff.updates == [(existing[1], {'value': 3})]
+    assert diff.inserts == [{'name': 'x', 'value': 4}]
+    assert diff.deletes == []
+
+
+def test_round_trip_values_are_not_changes():
+    row_id = uuid.uuid4()
+    existing = [{'name': 'a', 'ref': row_id, 'note': None, 'label': ' Tag '}]
+    desired = [{'name': 'a', 'ref': str(row_id), 'note': '', 'label': 'Tag'}]
+
+    diff = diff_ordered_collection(existing, desired, ['name'], ['ref', 'note', 'label'])
+
+    assert diff.is_empty
+
+
+def test_key_normalization_matches_whitespace_and_uuid():
+    row_id = uuid.uuid4()
+    existing = [{'ref': row_id, 'name': 'a '}]
+    desired = [{'ref': str(row_id), 'name': 'a'}]
+
+    assert diff_ordered_collection(existing, desired, ['ref', 'name']).is_empty
@@ -0,0 +1,98 @@
+"""Tests for partitioning content items across db-sync shards"""
+
+import pytest
+
+from silan.logic.content_logic import ContentLogic
+
+
+def _write(path, text='---\ntitle: x\n---\n'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def project(tmp_path):
+    content = tmp_path / 'content'
+    for index in range(40):
+        _write(content / 'updates' / f"2024-01-{index % 28 + 1:02d}-update-{index}.md")
+    for index in range(10):
+        _write(content / 'projects' / f"project-{index}" / 'README.md')
+        _write(content / 'ideas' / f"idea-{index}" / 'README.md')
+    for index in range(6):
+        for language in ('en', 'zh', 'fr'):
+            _write(content / 'blog' / f"vlog.series-{index}" / f"{language}.md")
+    _write(content / 'resume' / 'resume.md')
+    return tmp_path
+
+
+def _item_ids(project, shard=None):
+    logic = ContentLogic(project)
+    logic.shard = shard
+    return [
+        (content_type, item['path'], item.get('folder_prefix'))
+        for content_type, item in logic.iter_content_items()
+    ]
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 7])
+def test_shards_partition_the_items(project, count):
+    everything = _item_ids(project)
+    shards = [_item_ids(project, (index, count)) for index in range(count)]
+
+    # Every item lands in exactly one shard
+    combined = [item for shard in shards for item in shard]
+    assert sorted(combined) == sorted(everything)
+    assert len(set(combined)) == len(combined)
+
+
+def test_prefixed_blog_folders_stay_together(project):
+    count = 4
+    owners = {}
+    for index in range(count):
+        for _, _, prefix in _item_ids(project, (index, count)):
+            if prefix:
+                owners.setdefault(prefix, set()).add(index)
+
+    assert len(owners) == 6
+    assert all(len(indexes) == 1 for indexes in owners.values())
+
+
+def test_assignment_is_stable(project):
+    # The key is relative to the content directory, so another checkout agrees
+    first = _item_ids(project, (1, 3))
+    assert first == _item_ids(project, (1, 3))
+
+    logic = ContentLogic(project)
+    keys = {logic.shard_key(content_type, item) for content_type, item in logic.iter_content_items()}
+    assert not any(str(project) in key for key in keys)
+
+
+def test_spread_is_not_degenerate(project):
+    sizes = [len(_item_ids(project, (index, 3))) for index in range(3)]
+    assert min(sizes) > 0
+
+
+def test_deleted_paths_mark_their_folders_changed(project):
+    logic = ContentLogic(project)
+    logic.limit_to_paths(
+        ['content/updates/2024-01-01-update-0.md'],
+        deleted=['content/projects/project-1/screenshot.png', 'content/blog/vlog.series-2/cover.png',
+                 'content/updates/2024-01-02-update-1.md']
+    )
+    found = {item['path'] for _, item in logic.iter_content_items()}
+    paths = {str(project / 'content' / path) for path in (
+        'updates/2024-01-01-update-0.md',
+        'projects/project-1',
+        'blog/vlog.series-2/en.md', 'blog/vlog.series-2/zh.md', 'blog/vlog.series-2/fr.md',
+    )}
+
+    # A deleted path resyncs the folder holding it but never matches a file item itself
+    assert found == paths
+
+
+def test_folder_manifests_are_dropped_once_parsed(project):
+    logic = ContentLogic(project)
+    for content_type, item in logic.iter_content_items():
+        logic.parse_sync_item(content_type, item)
+
+    assert logic._folder_manifests == {}
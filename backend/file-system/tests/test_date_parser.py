@@ -0,0 +1,76 @@
+"""Tests for the shared date parser"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from silan.utils.date_parser import date_from_path, parse_date, parse_date_range, parse_datetime
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2024-01-15', date(2024, 1, 15)),
+    ('2024-1-5', date(2024, 1, 5)),
+    ('2024-03', date(2024, 3, 1)),
+    ('2024', date(2024, 1, 1)),
+    ('2024-01-15T10:30:00', date(2024, 1, 15)),
+    ('01/15/2024', date(2024, 1, 15)),
+    ('01/15/24', date(2024, 1, 15)),
+    ('Jan 15, 2024', date(2024, 1, 15)),
+    ('January 15, 2024', date(2024, 1, 15)),
+    ('Mar 2021', date(2021, 3, 1)),
+    ('September 2021', date(2021, 9, 1)),
+    ('15 Jan 2024', date(2024, 1, 15)),
+    ('  2024-01-15  ', date(2024, 1, 15)),
+])
+def test_parse_date_formats(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', None, 'not a date', '2024-13-01', '2024-02-30', 'Foo 2024'])
+def test_parse_date_rejects_invalid(text):
+    assert parse_date(text) is None
+
+
+def test_parse_date_accepts_date_objects():
+    assert parse_date(datetime(2024, 1, 15, 8, 0)) == date(2024, 1, 15)
+    assert parse_date(date(2024, 1, 15)) == date(2024, 1, 15)
+
+
+def test_parse_datetime_converts_offsets_to_utc():
+    assert parse_datetime('2024-01-15T10:30:00Z') == datetime(2024, 1, 15, 10, 30)
+    assert parse_datetime('2024-01-15 10:30:00+08:00') == datetime(2024, 1, 15, 2, 30)
+    assert parse_datetime('2024-01-15 10:30:00') == datetime(2024, 1, 15, 10, 30)
+    assert parse_datetime('2024-01-15') == datetime(2024, 1, 15)
+    assert parse_datetime(date(2024, 1, 15)) == datetime(2024, 1, 15)
+
+    aware = datetime(2024, 1, 15, 1, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert parse_datetime(aware) == datetime(2024, 1, 14, 23, 0)
+
+    naive = datetime(2024, 1, 15, 8, 0)
+    assert parse_datetime(naive) is naive
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Jan 2020 - Dec 2021', (date(2020, 1, 1), date(2021, 12, 1))),
+    ('2019 – present', (date(2019, 1, 1), None)),
+    ('2018 to 2020', (date(2018, 1, 1), date(2020, 1, 1))),
+    ('2019-2021', (date(2019, 1, 1), date(2021, 1, 1))),
+    ('2020-01-15', (date(2020, 1, 15), None)),
+    ('Present', (None, None)),
+    ('', (None, None)),
+    ('sometime', (None, None)),
+])
+def test_parse_date_range(text, expected):
+    assert parse_date_range(text) == expected
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('updates/2024-01-15-milestone.md', date(2024, 1, 15)),
+    ('updates/release-20240115.md', date(2024, 1, 15)),
+    ('updates/01-15-2024-note.md', date(2024, 1, 15)),
+    ('updates/2024/03-march/launch.md', date(2024, 3, 1)),
+    ('updates/2024/launch.md', None),
+    ('updates/launch.md', None),
+])
+def test_date_from_path(path, expected):
+    assert date_from_path(path) == expected
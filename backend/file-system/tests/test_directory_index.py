@@ -0,0 +1,126 @@
+"""Tests for the persisted directory index"""
+
+import json
+import os
+
+from silan.utils.directory_index import DirectoryIndex
+
+# Comfortably older than the racy window, so cached listings are trusted
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+def _age(path, mtime_ns=OLD_MTIME_NS):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _build(tmp_path):
+    root = tmp_path / 'content'
+    (root / 'blog').mkdir(parents=True)
+    (root / 'blog' / 'a.md').write_text('a')
+    (root / 'notes.txt').write_text('n')
+    for directory in (root, root / 'blog'):
+        _age(directory)
+    return root, tmp_path / 'index.json'
+
+
+def _count_scans(index, monkeypatch):
+    scanned = []
+    original = index._scan
+    monkeypatch.setattr(index, '_scan', lambda directory: scanned.append(directory) or original(directory))
+    return scanned
+
+
+def test_listdir_and_walk(tmp_path):
+    root, index_file = _build(tmp_path)
+    index = DirectoryIndex(root, index_file)
+
+    assert index.listdir(root) == (['blog'], ['notes.txt'])
+    assert index.walk_files(root, '.md') == [root / 'blog' / 'a.md']
+    assert index.listdir(root / 'missing') == ([], [])
+
+
+def test_unchanged_directories_reuse_saved_listing(tmp_path, monkeypatch):
+    root, index_file = _build(tmp_path)
+    first = DirectoryIndex(root, index_file)
+    first.walk_files(root)
+    first.save()
+
+    second = DirectoryIndex(root, index_file)
+    scanned = _count_scans(second, monkeypatch)
+
+    assert second.walk_files(root, '.md') == [root / 'blog' / 'a.md']
+    assert scanned == []
+
+
+def test_mtime_change_invalidates_listing(tmp_path, monkeypatch):
+    root, index_file = _build(tmp_path)
+    first = DirectoryIndex(root, index_file)
+    first.walk_files(root)
+    first.save()
+
+    (root / 'blog' / 'b.md').write_text('b')
+    _age(root / 'blog', OLD_MTIME_NS + 1)
+
+    second = DirectoryIndex(root, index_file)
+    scanned = _count_scans(second, monkeypatch)
+
+    assert second.walk_files(root, '.md') == [root / 'blog' / 'a.md', root / 'blog' / 'b.md']
+    assert scanned == [root / 'blog']
+
+
+def test_racy_listing_is_rescanned(tmp_path, monkeypatch):
+    root, index_file = _build(tmp_path)
+    # Modified just now: a change within the same mtime tick would be invisible
+    os.utime(root / 'blog')
+    first = DirectoryIndex(root, index_file)
+    first.walk_files(root)
+    first.save()
+
+    # Added without moving the directory mtime, as on a coarse-timestamp filesystem
+    mtime_ns = os.stat(root / 'blog').st_mtime_ns
+    (root / 'blog' / 'b.md').write_text('b')
+    _age(root / 'blog', mtime_ns)
+
+    second = DirectoryIndex(root, index_file)
+    scanned = _count_scans(second, monkeypatch)
+
+    assert second.walk_files(root, '.md') == [root / 'blog' / 'a.md', root / 'blog' / 'b.md']
+    assert scanned == [root / 'blog']
+
+
+def test_invalidate_rechecks_within_a_run(tmp_path):
+    root, index_file = _build(tmp_path)
+    index = DirectoryIndex(root, index_file)
+    index.listdir(root / 'blog')
+
+    (root / 'blog' / 'b.md').write_text('b')
+    assert index.listdir(root / 'blog') == ([], ['a.md'])
+
+    index.invalidate()
+    assert index.listdir(root / 'blog') == ([], ['a.md', 'b.md'])
+
+
+def test_unreadable_or_old_index_is_ignored(tmp_path):
+    root, index_file = _build(tmp_path)
+
+    index_file.write_text('{not json')
+    assert DirectoryIndex(root, index_file).listdir(root) == (['blog'], ['notes.txt'])
+
+    index_file.write_text(json.dumps({'version': 0, 'entries': {'.': {'mtime_ns': OLD_MTIME_NS,
+                                                                        'dirs': [], 'files': ['stale']}}}))
+    assert DirectoryIndex(root, index_file).listdir(root) == (['blog'], ['notes.txt'])
+
+
+def test_symlinks_are_not_followed(tmp_path):
+    root, index_file = _build(tmp_path)
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'b.md').write_text('b')
+    (root / 'linked').symlink_to(outside, target_is_directory=True)
+    (root / 'blog' / 'alias.md').symlink_to(root / 'blog' / 'a.md')
+    (root / 'loop').symlink_to(root, target_is_directory=True)
+
+    index = DirectoryIndex(root, index_file)
+
+    assert index.listdir(root) == (['blog'], ['notes.txt'])
+    assert index.walk_files(root, '.md') == [root / 'blog' / 'a.md']
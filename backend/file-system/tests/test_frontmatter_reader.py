@@ -0,0 +1,66 @@
+"""Tests for the header-only frontmatter reader"""
+
+from silan.parsers.frontmatter_reader import MAX_HEADER_BYTES, read_frontmatter, read_frontmatter_bytes
+
+
+def _write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def test_reads_header_only(tmp_path):
+    post = _write(tmp_path / 'post.md', "---\ntitle: Hello\ntags: [a, b]\n---\n# Body\n\n---\nnot: header\n")
+
+    assert read_frontmatter(post) == {'title': 'Hello', 'tags': ['a', 'b']}
+    assert read_frontmatter_bytes(post) == b"title: Hello\ntags: [a, b]\n"
+
+
+def test_missing_or_unclosed_frontmatter(tmp_path):
+    assert read_frontmatter(_write(tmp_path / 'plain.md', "# Just a body\n")) == {}
+    assert read_frontmatter(_write(tmp_path / 'open.md', "---\ntitle: Hello\n")) == {}
+    assert read_frontmatter(_write(tmp_path / 'list.md', "---\n- a\n- b\n---\n")) == {}
+    assert read_frontmatter(_write(tmp_path / 'bad.md', "---\ntitle: [unclosed\n---\n")) == {}
+    assert read_frontmatter(tmp_path / 'missing.md') == {}
+
+
+def test_byte_order_mark_and_dot_fence(tmp_path):
+    post = tmp_path / 'bom.md'
+    post.write_bytes(b"\xef\xbb\xbf---\ntitle: Hello\n...\nbody\n")
+
+    assert read_frontmatter(post) == {'title': 'Hello'}
+
+
+def test_header_within_bound_is_read(tmp_path):
+    value = 'x' * (MAX_HEADER_BYTES - 100)
+    post = _write(tmp_path / 'big.md', f"---\ntitle: {value}\n---\nbody\n")
+
+    assert read_frontmatter(post) == {'title': value}
+
+
+def test_header_over_bound_is_treated_as_missing(tmp_path):
+    lines = ''.join(f"key{index}: {'x' * 100}\n" for index in range(MAX_HEADER_BYTES // 100 + 1))
+    post = _write(tmp_path / 'huge.md', f"---\n{lines}---\nbody\n")
+
+    assert read_frontmatter_bytes(post) == b''
+    assert read_frontmatter(post) == {}
+
+
+def test_single_line_over_bound_is_treated_as_missing(tmp_path):
+    post = _write(tmp_path / 'long.md', f"---\ntitle: {'x' * (MAX_HEADER_BYTES * 2)}\n---\n")
+
+    assert read_frontmatter(post) == {}
+
+
+def test_results_are_isolated_copies(tmp_path):
+    # Identical headers share one memoized parse; mutating a result must not leak
+    first = _write(tmp_path / 'a.md', "---\ntitle: Hello\ntags: [a]\nmeta: {k: v}\n---\n")
+    second = _write(tmp_path / 'b.md', "---\ntitle: Hello\ntags: [a]\nmeta: {k: v}\n---\n")
+
+    metadata = read_frontmatter(first)
+    metadata['title'] = 'Changed'
+    metadata['tags'].append('b')
+    metadata['meta']['k'] = 'changed'
+
+    expected = {'title': 'Hello', 'tags': ['a'], 'meta': {'k': 'v'}}
+    assert read_frontmatter(first) == expected
+    assert read_frontmatter(second) == expected
@@ -0,0 +1,108 @@
+"""Tests for git-based change detection"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from silan.utils.git_changes import changed_since, dirty_paths, head_commit, resolve_commit
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+
+PATHSPECS = ['content', 'silan.yaml']
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ['git', '-C', str(repo), '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def portfolio(tmp_path):
+    """A portfolio in a subdirectory of a repository, with one base commit"""
+    repo = tmp_path / 'repo'
+    project = repo / 'portfolio'
+    _write(project / 'silan.yaml', 'project: {}\n')
+    _write(project / 'content' / 'blog' / 'a.md', 'a\n')
+    _write(project / 'content' / 'blog' / 'b.md', 'b' * 200 + '\n')
+    _write(project / 'content' / 'ideas' / 'old.md', 'idea\n')
+    _write(repo / 'README.md', 'outside the portfolio\n')
+    _git(repo, 'init', '-q')
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'base')
+    return project
+
+
+def test_no_changes(portfolio):
+    changes = changed_since(portfolio, 'HEAD', PATHSPECS)
+
+    assert changes.empty
+    assert changes.base == changes.head == head_commit(portfolio)
+
+
+def test_committed_and_uncommitted_changes(portfolio):
+    base = head_commit(portfolio)
+    _write(portfolio / 'content' / 'blog' / 'a.md', 'a changed\n')
+    (portfolio / 'content' / 'ideas' / 'old.md').unlink()
+    _git(portfolio, 'commit', '-q', '-am', 'edit and delete')
+
+    # Uncommitted edit, untracked file and a change outside the pathspecs
+    _write(portfolio / 'silan.yaml', 'project: {name: x}\n')
+    _write(portfolio / 'content' / 'updates' / 'new.md', 'new\n')
+    _write(portfolio.parent / 'README.md', 'changed\n')
+
+    changes = changed_since(portfolio, base, PATHSPECS)
+
+    assert changes.base == base
+    assert changes.head == head_commit(portfolio)
+    assert changes.changed == ['content/blog/a.md', 'content/updates/new.md', 'silan.yaml']
+    assert changes.deleted == ['content/ideas/old.md']
+    assert changes.renamed == []
+
+
+def test_rename_reports_old_path_as_deleted(portfolio):
+    _git(portfolio, 'mv', 'content/blog/b.md', 'content/blog/c.md')
+
+    changes = changed_since(portfolio, 'HEAD', PATHSPECS)
+
+    assert changes.changed == ['content/blog/c.md']
+    assert changes.deleted == ['content/blog/b.md']
+    assert changes.renamed == [['content/blog/b.md', 'content/blog/c.md']]
+
+
+def test_path_deleted_and_recreated_is_only_changed(portfolio):
+    base = head_commit(portfolio)
+    _git(portfolio, 'rm', '-q', 'content/blog/a.md')
+    _git(portfolio, 'commit', '-q', '-m', 'remove')
+    _write(portfolio / 'content' / 'blog' / 'a.md', 'back\n')
+
+    changes = changed_since(portfolio, base, PATHSPECS)
+
+    assert changes.changed == ['content/blog/a.md']
+    assert changes.deleted == []
+
+
+def test_unknown_base_or_no_repository(portfolio, tmp_path):
+    assert changed_since(portfolio, '0' * 40, PATHSPECS) is None
+    assert resolve_commit(portfolio, 'no-such-branch') is None
+
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    assert changed_since(outside, 'HEAD', PATHSPECS) is None
+    assert head_commit(outside) is None
+
+
+def test_dirty_paths(portfolio):
+    assert dirty_paths(portfolio, PATHSPECS) == []
+
+    _write(portfolio / 'content' / 'blog' / 'a.md', 'edited\n')
+    _write(portfolio / 'content' / 'blog' / 'draft.md', 'draft\n')
+
+    assert dirty_paths(portfolio, PATHSPECS) == ['content/blog/a.md', 'content/blog/draft.md']
@@ -0,0 +1,52 @@
+"""Startup cost of the CLI entry point.
+
+Every command imports ``silan.silan`` before doing anything, so heavy
+dependencies must only be imported by the commands that use them.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ('sqlalchemy', 'markdown2', 'frontmatter', 'pyfiglet', 'PIL')
+
+# Cumulative import time of silan.silan, in microseconds. Around 85-120 ms on a
+# developer machine; best of three absorbs a slow run on a busy one.
+IMPORT_BUDGET_US = 150_000
+
+_PROBE = (
+    "import json, sys\n"
+    "import silan.silan\n"
+    "print(json.dumps(sorted(m for m in {modules!r} if m in sys.modules)))\n"
+).format(modules=HEAVY_MODULES)
+
+
+def _import_cli():
+    """Import the CLI in a fresh interpreter; returns (loaded heavy modules, cumulative us)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE],
+        capture_output=True, text=True, check=True
+    )
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == 'silan.silan':
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None, result.stderr[-2000:]
+    return json.loads(result.stdout), cumulative_us
+
+
+@pytest.mark.slow
+def test_cli_import_skips_heavy_dependencies():
+    loaded, _ = _import_cli()
+    assert loaded == []
+
+
+@pytest.mark.slow
+def test_cli_import_within_budget():
+    # Best of three, so one slow run on a busy machine does not fail the build
+    best_us = min(_import_cli()[1] for _ in range(3))
+    assert best_us < IMPORT_BUDGET_US, f"import silan.silan took {best_us / 1000:.0f} ms"
@@ -0,0 +1,139 @@
+"""Tests for tailing and following the backend log"""
+
+import os
+
+import pytest
+
+from silan.core.exceptions import ValidationError
+from silan.utils import log_tail
+from silan.utils.log_tail import LogFilter, follow, line_level, tail_lines
+
+
+class _Done(Exception):
+    pass
+
+
+def _write_lines(path, count):
+    path.write_text(''.join(f"line {index}\n" for index in range(count)))
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 64 * 1024])
+def test_tail_lines_across_block_boundaries(tmp_path, block_size):
+    log = tmp_path / 'backend.log'
+    _write_lines(log, 100)
+
+    assert tail_lines(str(log), 3, block_size=block_size) == ['line 97', 'line 98', 'line 99']
+    assert tail_lines(str(log), 500, block_size=block_size) == [f"line {index}" for index in range(100)]
+
+
+def test_tail_lines_edge_cases(tmp_path):
+    log = tmp_path / 'backend.log'
+
+    log.write_text('')
+    assert tail_lines(str(log), 5) == []
+
+    log.write_bytes(b"first\r\nsecond\r\nlast without newline")
+    assert tail_lines(str(log), 2, block_size=4) == ['second', 'last without newline']
+    assert tail_lines(str(log), 0) == []
+
+    log.write_text("a\n\nb\n")
+    assert tail_lines(str(log), 5) == ['a', '', 'b']
+
+
+def test_tail_lines_with_filter(tmp_path):
+    log = tmp_path / 'backend.log'
+    log.write_text(
+        '{"level":"info","content":"started"}\n'
+        'ERROR disk full\n'
+        'plain line\n'
+        '{"level":"error","content":"db down"}\n'
+        'WARN slow query\n'
+    )
+
+    errors = tail_lines(str(log), 5, LogFilter(level='error'), block_size=8)
+    assert errors == ['ERROR disk full', '{"level":"error","content":"db down"}']
+    assert tail_lines(str(log), 1, LogFilter(level='warn', pattern='db')) == ['{"level":"error","content":"db down"}']
+
+
+def test_line_level_and_filter_validation():
+    assert line_level('{"@timestamp":"x","level":"severe"}') == 'severe'
+    assert line_level('2024/01/01 WARNING something') == 'warning'
+    assert line_level('no level here') is None
+
+    with pytest.raises(ValidationError):
+        LogFilter(level='loud')
+    with pytest.raises(ValidationError):
+        LogFilter(pattern='(')
+    assert not LogFilter().active
+
+
+def _drive(monkeypatch, path, actions, line_filter=None):
+    """Run follow(), performing one action each time it goes idle; returns the lines yielded"""
+    pending = list(actions)
+
+    def fake_sleep(_seconds):
+        if not pending:
+            raise _Done()
+        pending.pop(0)()
+
+    monkeypatch.setattr(log_tail.time, 'sleep', fake_sleep)
+    lines = []
+    with pytest.raises(_Done):
+        for line in follow(str(path), line_filter, interval=0):
+            lines.append(line)
+    return lines
+
+
+def _append(path, text):
+    with open(path, 'a') as f:
+        f.write(text)
+
+
+def test_follow_starts_at_end_and_sees_appends(tmp_path, monkeypatch):
+    log = tmp_path / 'backend.log'
+    log.write_text("old\n")
+
+    lines = _drive(monkeypatch, log, [
+        lambda: _append(log, "one\ntwo"),
+        lambda: _append(log, " halves\n"),
+    ])
+
+    assert lines == ['one', 'two halves']
+
+
+def test_follow_handles_rotation(tmp_path, monkeypatch):
+    log = tmp_path / 'backend.log'
+    log.write_text("old\n")
+
+    def rotate():
+        # The writer's last partial line is flushed from the old file before switching
+        _append(log, "tail of old")
+        os.rename(log, tmp_path / 'backend.log.1')
+        log.write_text("new 1\nnew 2\n")
+
+    lines = _drive(monkeypatch, log, [rotate, lambda: _append(log, "new 3\n")])
+
+    assert lines == ['tail of old', 'new 1', 'new 2', 'new 3']
+
+
+def test_follow_handles_truncation(tmp_path, monkeypatch):
+    log = tmp_path / 'backend.log'
+    log.write_text("a fairly long first line\n")
+
+    def truncate():
+        with open(log, 'w') as f:
+            f.write("short\n")
+
+    lines = _drive(monkeypatch, log, [lambda: _append(log, "appended\n"), truncate])
+
+    assert lines == ['appended', 'short']
+
+
+def test_follow_waits_for_missing_file_and_filters(tmp_path, monkeypatch):
+    log = tmp_path / 'backend.log'
+
+    lines = _drive(monkeypatch, log, [lambda: log.write_text("INFO ready\nERROR failed\n")],
+                   LogFilter(level='error'))
+
+    # A file that appears later is read from its start
+    assert lines == ['ERROR failed']
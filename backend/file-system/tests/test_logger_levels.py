@@ -0,0 +1,22 @@
+"""Tests for logger levels and --verbose"""
+
+import logging
+
+from silan.parsers.blog_parser import BlogParser
+from silan.utils.logger import ROOT_LOGGER_NAME, ModernLogger
+
+
+def test_parsers_log_at_info_until_verbose(tmp_path):
+    parser = BlogParser(tmp_path)
+    pinned = ModernLogger(name="pinned_debug", level="debug")
+    try:
+        assert not parser.logger.isEnabledFor(logging.DEBUG)
+        assert pinned.logger.isEnabledFor(logging.DEBUG)
+
+        ModernLogger.set_verbose(True)
+        assert parser.logger.isEnabledFor(logging.DEBUG)
+    finally:
+        ModernLogger.set_verbose(False)
+
+    assert logging.getLogger(ROOT_LOGGER_NAME).level == logging.INFO
+    assert not parser.logger.isEnabledFor(logging.DEBUG)
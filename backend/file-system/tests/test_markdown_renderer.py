@@ -0,0 +1,50 @@
+"""Tests for header ids and the table of contents built from rendered HTML"""
+
+import pytest
+
+from silan.parsers.markdown_renderer import (
+    Markdown2Backend, MarkdownBackend, add_header_ids, build_toc, slugify
+)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Getting Started', 'getting-started'),
+    ('  Café & Crème! ', 'cafe-creme'),
+    ('C++ / Rust: a comparison', 'c-rust-a-comparison'),
+    ('日本語 タイトル', '日本語-タイトル'),
+])
+def test_slugify(text, expected):
+    assert slugify(text) == expected
+
+
+def test_add_header_ids_numbers_repeats_and_keeps_existing_ids():
+    rendered = '<h2>Intro</h2><h2 class="x">Intro</h2><h3 id="keep">Keep</h3><h2>!!!</h2>'
+
+    assert add_header_ids(rendered) == (
+        '<h2 id="intro">Intro</h2><h2 id="intro-2" class="x">Intro</h2>'
+        '<h3 id="keep">Keep</h3><h2>!!!</h2>'
+    )
+
+
+def test_build_toc_uses_heading_text_without_markup():
+    rendered = '<h1 id="a">A &amp; <em>B</em></h1><h2 id="empty"> </h2><h3>No id</h3><h2 id="c">C</h2>'
+
+    assert build_toc(rendered) == [
+        {'level': 1, 'id': 'a', 'title': 'A & B'},
+        {'level': 2, 'id': 'c', 'title': 'C'},
+    ]
+
+
+def test_backend_output_matches_its_toc():
+    rendered = Markdown2Backend().convert('# Title: subtitle\n\n## Part *one*\n\n## Part *one*\n')
+
+    assert build_toc(rendered) == [
+        {'level': 1, 'id': 'title-subtitle', 'title': 'Title: subtitle'},
+        {'level': 2, 'id': 'part-one', 'title': 'Part one'},
+        {'level': 2, 'id': 'part-one-2', 'title': 'Part one'},
+    ]
+
+
+def test_backend_requires_a_converter():
+    with pytest.raises(TypeError):
+        MarkdownBackend()
@@ -0,0 +1,48 @@
+"""Tests for limiting a sync to its own rows in a database with several owners"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from silan.core.exceptions import DatabaseError
+from silan.logic.database_sync_logic import DatabaseSyncLogic
+from silan.models import User
+
+
+def _logic(tmp_path):
+    logic = DatabaseSyncLogic(f"sqlite:///{tmp_path / 'portfolio.db'}", project_dir=tmp_path)
+    assert logic.prepare_database(True)
+    return logic
+
+
+def _add_user(logic, username):
+    with logic.session_factory() as session:
+        user = User(username=username, email=f"{username}@example.com", password_hash='x',
+                    first_name=username, last_name='User')
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def test_single_owner_is_not_scoped(tmp_path):
+    logic = _logic(tmp_path)
+    try:
+        logic._ensure_current_user()
+    finally:
+        logic._cleanup_database()
+
+    assert not logic.scope_to_owner
+
+
+def test_rows_of_another_owner_are_refused(tmp_path):
+    logic = _logic(tmp_path)
+    try:
+        other_id = _add_user(logic, 'someone-else')
+        logic._ensure_current_user()
+    finally:
+        logic._cleanup_database()
+
+    assert logic.scope_to_owner
+    logic._check_owner(SimpleNamespace(user_id=logic.current_user_id), 'Project', 'mine')
+    with pytest.raises(DatabaseError, match="slug 'theirs' already belongs"):
+        logic._check_owner(SimpleNamespace(user_id=other_id), 'Project', 'theirs')
@@ -0,0 +1,28 @@
+"""Tests for the dates parsers carry to the sync"""
+
+from datetime import datetime
+
+from silan.parsers.blog_parser import BlogParser
+
+
+def test_carried_dates_keep_time_of_day(tmp_path):
+    post = tmp_path / 'post.md'
+    post.write_text(
+        "---\n"
+        "title: Timed\n"
+        "date: 2024-01-15 10:30:00\n"
+        "updated_at: '2024-02-01T09:00:00+02:00'\n"
+        "created_at: 2023-12-31\n"
+        "published_at: 2024-03-01T08:00:00+01:00\n"
+        "---\n"
+        "Body\n"
+    )
+
+    extracted = BlogParser(tmp_path).parse_file(post)
+
+    assert extracted.dates == {
+        'date': datetime(2024, 1, 15, 10, 30),
+        'updated_at': datetime(2024, 2, 1, 7, 0),
+        'created_at': datetime(2023, 12, 31),
+        'published_at': datetime(2024, 3, 1, 7, 0),
+    }
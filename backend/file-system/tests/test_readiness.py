@@ -0,0 +1,160 @@
+"""Tests for backend readiness probing"""
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from silan.utils.readiness import port_in_use, probe_host, wait_until_ready, wait_until_released
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def http_server():
+    """Start an HTTP server answering with the given status codes in turn (the last one repeats)"""
+    servers = []
+
+    def start(*statuses, port=0):
+        answers = list(statuses)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status = answers.pop(0) if len(answers) > 1 else answers[0]
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_ready_once_http_answers(http_server):
+    server = http_server(404)
+
+    result = wait_until_ready('0.0.0.0', server.server_address[1], timeout=5)
+
+    assert result.ready
+    assert result.stage == 'http'
+    assert result.status_code == 404
+
+
+def test_server_errors_are_retried(http_server):
+    server = http_server(503, 500, 200)
+
+    result = wait_until_ready('127.0.0.1', server.server_address[1], timeout=5)
+
+    assert result.ready
+    assert result.status_code == 200
+    assert result.attempts >= 4
+
+
+def test_waits_for_a_server_that_starts_late(http_server):
+    port = _free_port()
+    timer = threading.Timer(0.3, http_server, args=(200,), kwargs={'port': port})
+    timer.start()
+    try:
+        result = wait_until_ready('127.0.0.1', port, timeout=5)
+    finally:
+        timer.join()
+
+    assert result.ready
+    assert result.elapsed >= 0.3
+
+
+def test_tcp_only_check():
+    with socket.socket() as listener:
+        listener.bind(('127.0.0.1', 0))
+        listener.listen()
+
+        result = wait_until_ready('127.0.0.1', listener.getsockname()[1], health_path=None, timeout=5)
+
+    assert result.ready
+    assert result.stage == 'tcp'
+    assert result.attempts == 1
+
+
+def test_timeout_reports_failing_stage():
+    started = time.monotonic()
+    result = wait_until_ready('127.0.0.1', _free_port(), timeout=0.3)
+
+    assert not result.ready
+    assert result.stage == 'tcp'
+    assert result.error
+    assert time.monotonic() - started < 2
+
+
+def test_persistent_server_error_times_out_in_http_stage(http_server):
+    server = http_server(500)
+
+    result = wait_until_ready('127.0.0.1', server.server_address[1], timeout=0.3)
+
+    assert not result.ready
+    assert result.stage == 'http'
+    assert result.error == 'HTTP 500'
+
+
+def test_exited_process_ends_wait():
+    result = wait_until_ready('127.0.0.1', _free_port(), timeout=30, is_alive=lambda: False)
+
+    assert not result.ready
+    assert result.stage == 'exited'
+    assert result.attempts == 0
+
+
+def test_wait_until_released():
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    port = listener.getsockname()[1]
+
+    assert not wait_until_released('127.0.0.1', port, timeout=0.2)
+    listener.close()
+    assert wait_until_released('127.0.0.1', port, timeout=2)
+
+
+@pytest.mark.parametrize('host, expected', [
+    ('0.0.0.0', '127.0.0.1'),
+    ('', '127.0.0.1'),
+    ('::', '::1'),
+    ('[::1]', '::1'),
+    ('example.local', 'example.local'),
+])
+def test_probe_host(host, expected):
+    assert probe_host(host) == expected
+
+
+def test_answer_from_another_server_after_exit_is_not_ready(http_server):
+    # The new process died failing to bind while a stale server keeps the port
+    server = http_server(200)
+    alive = iter([True, False])
+
+    result = wait_until_ready('127.0.0.1', server.server_address[1], health_path=None, timeout=5,
+                              is_alive=lambda: next(alive))
+
+    assert not result.ready
+    assert result.stage == 'exited'
+    assert 'another server' in result.error
+
+
+def test_port_in_use(http_server):
+    server = http_server(200)
+
+    assert port_in_use('127.0.0.1', server.server_address[1])
+    assert not port_in_use('127.0.0.1', _free_port())
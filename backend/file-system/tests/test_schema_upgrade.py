@@ -0,0 +1,73 @@
+"""Tests for adding new model columns to an existing database"""
+
+from sqlalchemy import create_engine, inspect, text
+
+from silan.logic.database_sync_logic import DatabaseSyncLogic
+from silan.models import Base
+
+
+def _columns(url, table):
+    engine = create_engine(url)
+    try:
+        return {column['name'] for column in inspect(engine).get_columns(table)}
+    finally:
+        engine.dispose()
+
+
+def _old_database(tmp_path):
+    """A database created before the blurhash and toc columns existed"""
+    url = f"sqlite:///{tmp_path / 'portfolio.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text('ALTER TABLE project_images DROP COLUMN blurhash'))
+        connection.execute(text('ALTER TABLE ideas DROP COLUMN toc'))
+    engine.dispose()
+    return url
+
+
+def _prepare(tmp_path, url, create_tables):
+    logic = DatabaseSyncLogic(url, project_dir=tmp_path)
+    try:
+        return logic.prepare_database(create_tables)
+    finally:
+        logic._cleanup_database()
+
+
+def test_sync_without_create_tables_leaves_schema_alone(tmp_path):
+    url = _old_database(tmp_path)
+
+    assert not _prepare(tmp_path, url, create_tables=False)
+    assert 'blurhash' not in _columns(url, 'project_images')
+
+
+def test_create_tables_adds_missing_columns(tmp_path):
+    url = _old_database(tmp_path)
+
+    assert _prepare(tmp_path, url, create_tables=True)
+    assert 'blurhash' in _columns(url, 'project_images')
+    assert 'toc' in _columns(url, 'ideas')
+
+    # Once upgraded, a plain sync needs no further changes
+    assert _prepare(tmp_path, url, create_tables=False)
+
+
+def test_column_added_by_another_shard_is_not_an_error(tmp_path):
+    url = _old_database(tmp_path)
+    logic = DatabaseSyncLogic(url, project_dir=tmp_path)
+    try:
+        logic._initialize_database()
+        missing = logic._missing_columns()
+
+        # Another shard wins the race between the inspection and the ALTER
+        other = create_engine(url)
+        with other.begin() as connection:
+            connection.execute(text('ALTER TABLE project_images ADD COLUMN blurhash VARCHAR(100)'))
+        other.dispose()
+
+        logic._missing_columns = lambda: missing
+        logic._add_missing_columns()
+    finally:
+        logic._cleanup_database()
+
+    assert 'toc' in _columns(url, 'ideas')
@@ -0,0 +1,105 @@
+"""Tests for the sync checkpoint journal"""
+
+import json
+
+from silan.utils.sync_checkpoint import SyncCheckpoint
+
+IDENTITY = {'database': 'sqlite:///portfolio.db', 'shard': None}
+
+
+def _journal(tmp_path):
+    return tmp_path / '.silan' / 'sync_checkpoint.jsonl'
+
+
+def _run(path, batches, resume=False):
+    checkpoint = SyncCheckpoint(path, IDENTITY)
+    if resume:
+        checkpoint.load()
+    checkpoint.open(resume)
+    for batch in batches:
+        checkpoint.record_batch(batch)
+    checkpoint.close()
+    return checkpoint
+
+
+def test_records_and_loads_batches(tmp_path):
+    path = _journal(tmp_path)
+    _run(path, [{'blog_a': 'h1', 'blog_b': 'h2'}, {}, {'ideas_x': 'h3'}])
+
+    checkpoint = SyncCheckpoint(path, IDENTITY)
+    assert checkpoint.load()
+    assert checkpoint.completed == {'blog_a': 'h1', 'blog_b': 'h2', 'ideas_x': 'h3'}
+    # Empty batches are not written
+    assert checkpoint.batches == 2
+    assert checkpoint.started_at is not None
+
+
+def test_other_identity_or_missing_journal_is_not_resumed(tmp_path):
+    path = _journal(tmp_path)
+    assert not SyncCheckpoint(path, IDENTITY).load()
+
+    _run(path, [{'blog_a': 'h1'}])
+    other = SyncCheckpoint(path, {'database': 'sqlite:///portfolio.db', 'shard': [1, 2]})
+    assert not other.load()
+    assert other.completed == {}
+
+
+def test_resume_after_partially_written_line(tmp_path):
+    path = _journal(tmp_path)
+    _run(path, [{'blog_a': 'h1'}, {'blog_b': 'h2'}])
+    # The crash cut the third batch short
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"batch":3,"items":{"blog_c":"h')
+
+    checkpoint = SyncCheckpoint(path, IDENTITY)
+    assert checkpoint.load()
+    assert checkpoint.completed == {'blog_a': 'h1', 'blog_b': 'h2'}
+
+    checkpoint.open(resume=True)
+    checkpoint.record_batch({'blog_c': 'h3'})
+    checkpoint.close()
+
+    # The new entry starts on its own line, and the torn one stays ignored
+    lines = path.read_text(encoding='utf-8').split('\n')
+    assert json.loads(lines[-2]) == {'batch': 3, 'items': {'blog_c': 'h3'}}
+
+    reloaded = SyncCheckpoint(path, IDENTITY)
+    assert reloaded.load()
+    assert reloaded.completed == {'blog_a': 'h1', 'blog_b': 'h2', 'blog_c': 'h3'}
+    assert reloaded.batches == 3
+
+
+def test_fresh_run_replaces_journal(tmp_path):
+    path = _journal(tmp_path)
+    _run(path, [{'blog_a': 'h1'}])
+
+    checkpoint = SyncCheckpoint(path, IDENTITY)
+    checkpoint.load()
+    checkpoint.open(resume=False)
+    checkpoint.record_batch({'blog_b': 'h2'})
+    checkpoint.close()
+
+    reloaded = SyncCheckpoint(path, IDENTITY)
+    assert reloaded.load()
+    assert reloaded.completed == {'blog_b': 'h2'}
+
+
+def test_resume_without_completed_items_starts_fresh(tmp_path):
+    path = _journal(tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_text('{"identity": {"version": 1, "database": "x"}, "started_at": 1}\n')
+
+    checkpoint = _run(path, [{'blog_a': 'h1'}], resume=True)
+
+    assert json.loads(path.read_text().split('\n')[0])['identity'] == checkpoint.identity
+
+
+def test_remove(tmp_path):
+    path = _journal(tmp_path)
+    checkpoint = SyncCheckpoint(path, IDENTITY)
+    checkpoint.open(resume=False)
+    assert checkpoint.exists
+
+    checkpoint.remove()
+    assert not checkpoint.exists
+    checkpoint.remove()
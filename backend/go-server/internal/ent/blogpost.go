@@ -3,6 +3,7 @@
 package ent
 
 import (
+	"encoding/json"
 	"fmt"
 	"silan-backend/internal/ent/blogcategory"
 	"silan-backend/internal/ent/blogpost"
@@ -62,6 +63,10 @@ type BlogPost struct {
 	CreatedAt time.Time `json:"created_at,omitempty"`
 	// UpdatedAt holds the value of the "updated_at" field.
 	UpdatedAt time.Time `json:"updated_at,omitempty"`
+	// ContentHTML holds the value of the "content_html" field.
+	ContentHTML string `json:"content_html,omitempty"`
+	// Toc holds the value of the "toc" field.
+	Toc []map[string]interface{} `json:"toc,omitempty"`
 	// Edges holds the relations/edges for other nodes in the graph.
 	// The values are being populated by the BlogPostQuery when eager-loading is set.
 	Edges        BlogPostEdges `json:"edges"`
@@ -176,11 +181,13 @@ func (*BlogPost) scanValues(columns []string) ([]any, error) {
 	values := make([]any, len(columns))
 	for i := range columns {
 		switch columns[i] {
+		case blogpost.FieldToc:
+			values[i] = new([]byte)
 		case blogpost.FieldIsFeatured:
 			values[i] = new(sql.NullBool)
 		case blogpost.FieldReadingTimeMinutes, blogpost.FieldViewCount, blogpost.FieldLikeCount, blogpost.FieldCommentCount, blogpost.FieldSeriesOrder:
 			values[i] = new(sql.NullInt64)
-		case blogpost.FieldTitle, blogpost.FieldSlug, blogpost.FieldExcerpt, blogpost.FieldContent, blogpost.FieldContentType, blogpost.FieldStatus, blogpost.FieldFeaturedImageURL:
+		case blogpost.FieldTitle, blogpost.FieldSlug, blogpost.FieldExcerpt, blogpost.FieldContent, blogpost.FieldContentType, blogpost.FieldStatus, blogpost.FieldFeaturedImageURL, blogpost.FieldContentHTML:
 			values[i] = new(sql.NullString)
 		case blogpost.FieldPublishedAt, blogpost.FieldCreatedAt, blogpost.FieldUpdatedAt:
 			values[i] = new(sql.NullTime)
@@ -327,6 +334,20 @@ func (bp *BlogPost) assignValues(columns []string, values []any) error {
 			} else if value.Valid {
 				bp.UpdatedAt = value.Time
 			}
+		case blogpost.FieldContentHTML:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field content_html", values[i])
+			} else if value.Valid {
+				bp.ContentHTML = value.String
+			}
+		case blogpost.FieldToc:
+			if value, ok := values[i].(*[]byte); !ok {
+				return fmt.Errorf("unexpected type %T for field toc", values[i])
+			} else if value != nil && len(*value) > 0 {
+				if err := json.Unmarshal(*value, &bp.Toc); err != nil {
+					return fmt.Errorf("unmarshal field toc: %w", err)
+				}
+			}
 		default:
 			bp.selectValues.Set(columns[i], values[i])
 		}
@@ -462,6 +483,12 @@ func (bp *BlogPost) String() string {
 	builder.WriteString(", ")
 	builder.WriteString("updated_at=")
 	builder.WriteString(bp.UpdatedAt.Format(time.ANSIC))
+	builder.WriteString(", ")
+	builder.WriteString("content_html=")
+	builder.WriteString(bp.ContentHTML)
+	builder.WriteString(", ")
+	builder.WriteString("toc=")
+	builder.WriteString(fmt.Sprintf("%v", bp.Toc))
 	builder.WriteByte(')')
 	return builder.String()
 }
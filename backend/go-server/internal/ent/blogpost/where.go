@@ -146,6 +146,11 @@ func UpdatedAt(v time.Time) predicate.BlogPost {
 	return predicate.BlogPost(sql.FieldEQ(FieldUpdatedAt, v))
 }
 
+// ContentHTML applies equality check predicate on the "content_html" field. It's identical to ContentHTMLEQ.
+func ContentHTML(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldEQ(FieldContentHTML, v))
+}
+
 // UserIDEQ applies the EQ predicate on the "user_id" field.
 func UserIDEQ(v uuid.UUID) predicate.BlogPost {
 	return predicate.BlogPost(sql.FieldEQ(FieldUserID, v))
@@ -1001,6 +1006,91 @@ func UpdatedAtLTE(v time.Time) predicate.BlogPost {
 	return predicate.BlogPost(sql.FieldLTE(FieldUpdatedAt, v))
 }
 
+// ContentHTMLEQ applies the EQ predicate on the "content_html" field.
+func ContentHTMLEQ(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLNEQ applies the NEQ predicate on the "content_html" field.
+func ContentHTMLNEQ(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldNEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLIn applies the In predicate on the "content_html" field.
+func ContentHTMLIn(vs ...string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLNotIn applies the NotIn predicate on the "content_html" field.
+func ContentHTMLNotIn(vs ...string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldNotIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLGT applies the GT predicate on the "content_html" field.
+func ContentHTMLGT(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldGT(FieldContentHTML, v))
+}
+
+// ContentHTMLGTE applies the GTE predicate on the "content_html" field.
+func ContentHTMLGTE(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldGTE(FieldContentHTML, v))
+}
+
+// ContentHTMLLT applies the LT predicate on the "content_html" field.
+func ContentHTMLLT(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldLT(FieldContentHTML, v))
+}
+
+// ContentHTMLLTE applies the LTE predicate on the "content_html" field.
+func ContentHTMLLTE(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldLTE(FieldContentHTML, v))
+}
+
+// ContentHTMLContains applies the Contains predicate on the "content_html" field.
+func ContentHTMLContains(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldContains(FieldContentHTML, v))
+}
+
+// ContentHTMLHasPrefix applies the HasPrefix predicate on the "content_html" field.
+func ContentHTMLHasPrefix(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldHasPrefix(FieldContentHTML, v))
+}
+
+// ContentHTMLHasSuffix applies the HasSuffix predicate on the "content_html" field.
+func ContentHTMLHasSuffix(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldHasSuffix(FieldContentHTML, v))
+}
+
+// ContentHTMLIsNil applies the IsNil predicate on the "content_html" field.
+func ContentHTMLIsNil() predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldIsNull(FieldContentHTML))
+}
+
+// ContentHTMLNotNil applies the NotNil predicate on the "content_html" field.
+func ContentHTMLNotNil() predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldNotNull(FieldContentHTML))
+}
+
+// ContentHTMLEqualFold applies the EqualFold predicate on the "content_html" field.
+func ContentHTMLEqualFold(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldEqualFold(FieldContentHTML, v))
+}
+
+// ContentHTMLContainsFold applies the ContainsFold predicate on the "content_html" field.
+func ContentHTMLContainsFold(v string) predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldContainsFold(FieldContentHTML, v))
+}
+
+// TocIsNil applies the IsNil predicate on the "toc" field.
+func TocIsNil() predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldIsNull(FieldToc))
+}
+
+// TocNotNil applies the NotNil predicate on the "toc" field.
+func TocNotNil() predicate.BlogPost {
+	return predicate.BlogPost(sql.FieldNotNull(FieldToc))
+}
+
 // HasUser applies the HasEdge predicate on the "user" edge.
 func HasUser() predicate.BlogPost {
 	return predicate.BlogPost(func(s *sql.Selector) {
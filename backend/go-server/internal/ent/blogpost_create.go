@@ -276,6 +276,26 @@ func (bpc *BlogPostCreate) SetNillableUpdatedAt(t *time.Time) *BlogPostCreate {
 	return bpc
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bpc *BlogPostCreate) SetContentHTML(s string) *BlogPostCreate {
+	bpc.mutation.SetContentHTML(s)
+	return bpc
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bpc *BlogPostCreate) SetNillableContentHTML(s *string) *BlogPostCreate {
+	if s != nil {
+		bpc.SetContentHTML(*s)
+	}
+	return bpc
+}
+
+// SetToc sets the "toc" field.
+func (bpc *BlogPostCreate) SetToc(m []map[string]interface{}) *BlogPostCreate {
+	bpc.mutation.SetToc(m)
+	return bpc
+}
+
 // SetID sets the "id" field.
 func (bpc *BlogPostCreate) SetID(u uuid.UUID) *BlogPostCreate {
 	bpc.mutation.SetID(u)
@@ -598,6 +618,14 @@ func (bpc *BlogPostCreate) createSpec() (*BlogPost, *sqlgraph.CreateSpec) {
 		_spec.SetField(blogpost.FieldUpdatedAt, field.TypeTime, value)
 		_node.UpdatedAt = value
 	}
+	if value, ok := bpc.mutation.ContentHTML(); ok {
+		_spec.SetField(blogpost.FieldContentHTML, field.TypeString, value)
+		_node.ContentHTML = value
+	}
+	if value, ok := bpc.mutation.Toc(); ok {
+		_spec.SetField(blogpost.FieldToc, field.TypeJSON, value)
+		_node.Toc = value
+	}
 	if nodes := bpc.mutation.UserIDs(); len(nodes) > 0 {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -19,6 +19,7 @@ import (
 
 	"entgo.io/ent/dialect/sql"
 	"entgo.io/ent/dialect/sql/sqlgraph"
+	"entgo.io/ent/dialect/sql/sqljson"
 	"entgo.io/ent/schema/field"
 	"github.com/google/uuid"
 )
@@ -377,6 +378,44 @@ func (bpu *BlogPostUpdate) SetUpdatedAt(t time.Time) *BlogPostUpdate {
 	return bpu
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bpu *BlogPostUpdate) SetContentHTML(s string) *BlogPostUpdate {
+	bpu.mutation.SetContentHTML(s)
+	return bpu
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bpu *BlogPostUpdate) SetNillableContentHTML(s *string) *BlogPostUpdate {
+	if s != nil {
+		bpu.SetContentHTML(*s)
+	}
+	return bpu
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (bpu *BlogPostUpdate) ClearContentHTML() *BlogPostUpdate {
+	bpu.mutation.ClearContentHTML()
+	return bpu
+}
+
+// SetToc sets the "toc" field.
+func (bpu *BlogPostUpdate) SetToc(m []map[string]interface{}) *BlogPostUpdate {
+	bpu.mutation.SetToc(m)
+	return bpu
+}
+
+// AppendToc appends m to the "toc" field.
+func (bpu *BlogPostUpdate) AppendToc(m []map[string]interface{}) *BlogPostUpdate {
+	bpu.mutation.AppendToc(m)
+	return bpu
+}
+
+// ClearToc clears the value of the "toc" field.
+func (bpu *BlogPostUpdate) ClearToc() *BlogPostUpdate {
+	bpu.mutation.ClearToc()
+	return bpu
+}
+
 // SetUser sets the "user" edge to the User entity.
 func (bpu *BlogPostUpdate) SetUser(u *User) *BlogPostUpdate {
 	return bpu.SetUserID(u.ID)
@@ -695,6 +734,23 @@ func (bpu *BlogPostUpdate) sqlSave(ctx context.Context) (n int, err error) {
 	if value, ok := bpu.mutation.UpdatedAt(); ok {
 		_spec.SetField(blogpost.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := bpu.mutation.ContentHTML(); ok {
+		_spec.SetField(blogpost.FieldContentHTML, field.TypeString, value)
+	}
+	if bpu.mutation.ContentHTMLCleared() {
+		_spec.ClearField(blogpost.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := bpu.mutation.Toc(); ok {
+		_spec.SetField(blogpost.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := bpu.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, blogpost.FieldToc, value)
+		})
+	}
+	if bpu.mutation.TocCleared() {
+		_spec.ClearField(blogpost.FieldToc, field.TypeJSON)
+	}
 	if bpu.mutation.UserCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -1319,6 +1375,44 @@ func (bpuo *BlogPostUpdateOne) SetUpdatedAt(t time.Time) *BlogPostUpdateOne {
 	return bpuo
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bpuo *BlogPostUpdateOne) SetContentHTML(s string) *BlogPostUpdateOne {
+	bpuo.mutation.SetContentHTML(s)
+	return bpuo
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bpuo *BlogPostUpdateOne) SetNillableContentHTML(s *string) *BlogPostUpdateOne {
+	if s != nil {
+		bpuo.SetContentHTML(*s)
+	}
+	return bpuo
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (bpuo *BlogPostUpdateOne) ClearContentHTML() *BlogPostUpdateOne {
+	bpuo.mutation.ClearContentHTML()
+	return bpuo
+}
+
+// SetToc sets the "toc" field.
+func (bpuo *BlogPostUpdateOne) SetToc(m []map[string]interface{}) *BlogPostUpdateOne {
+	bpuo.mutation.SetToc(m)
+	return bpuo
+}
+
+// AppendToc appends m to the "toc" field.
+func (bpuo *BlogPostUpdateOne) AppendToc(m []map[string]interface{}) *BlogPostUpdateOne {
+	bpuo.mutation.AppendToc(m)
+	return bpuo
+}
+
+// ClearToc clears the value of the "toc" field.
+func (bpuo *BlogPostUpdateOne) ClearToc() *BlogPostUpdateOne {
+	bpuo.mutation.ClearToc()
+	return bpuo
+}
+
 // SetUser sets the "user" edge to the User entity.
 func (bpuo *BlogPostUpdateOne) SetUser(u *User) *BlogPostUpdateOne {
 	return bpuo.SetUserID(u.ID)
@@ -1667,6 +1761,23 @@ func (bpuo *BlogPostUpdateOne) sqlSave(ctx context.Context) (_node *BlogPost, er
 	if value, ok := bpuo.mutation.UpdatedAt(); ok {
 		_spec.SetField(blogpost.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := bpuo.mutation.ContentHTML(); ok {
+		_spec.SetField(blogpost.FieldContentHTML, field.TypeString, value)
+	}
+	if bpuo.mutation.ContentHTMLCleared() {
+		_spec.ClearField(blogpost.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := bpuo.mutation.Toc(); ok {
+		_spec.SetField(blogpost.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := bpuo.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, blogpost.FieldToc, value)
+		})
+	}
+	if bpuo.mutation.TocCleared() {
+		_spec.ClearField(blogpost.FieldToc, field.TypeJSON)
+	}
 	if bpuo.mutation.UserCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -3,6 +3,7 @@
 package ent
 
 import (
+	"encoding/json"
 	"fmt"
 	"silan-backend/internal/ent/blogpost"
 	"silan-backend/internal/ent/blogposttranslation"
@@ -32,6 +33,10 @@ type BlogPostTranslation struct {
 	Content string `json:"content,omitempty"`
 	// CreatedAt holds the value of the "created_at" field.
 	CreatedAt time.Time `json:"created_at,omitempty"`
+	// ContentHTML holds the value of the "content_html" field.
+	ContentHTML string `json:"content_html,omitempty"`
+	// Toc holds the value of the "toc" field.
+	Toc []map[string]interface{} `json:"toc,omitempty"`
 	// Edges holds the relations/edges for other nodes in the graph.
 	// The values are being populated by the BlogPostTranslationQuery when eager-loading is set.
 	Edges        BlogPostTranslationEdges `json:"edges"`
@@ -76,7 +81,9 @@ func (*BlogPostTranslation) scanValues(columns []string) ([]any, error) {
 	values := make([]any, len(columns))
 	for i := range columns {
 		switch columns[i] {
-		case blogposttranslation.FieldLanguageCode, blogposttranslation.FieldTitle, blogposttranslation.FieldExcerpt, blogposttranslation.FieldContent:
+		case blogposttranslation.FieldToc:
+			values[i] = new([]byte)
+		case blogposttranslation.FieldLanguageCode, blogposttranslation.FieldTitle, blogposttranslation.FieldExcerpt, blogposttranslation.FieldContent, blogposttranslation.FieldContentHTML:
 			values[i] = new(sql.NullString)
 		case blogposttranslation.FieldCreatedAt:
 			values[i] = new(sql.NullTime)
@@ -139,6 +146,20 @@ func (bpt *BlogPostTranslation) assignValues(columns []string, values []any) err
 			} else if value.Valid {
 				bpt.CreatedAt = value.Time
 			}
+		case blogposttranslation.FieldContentHTML:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field content_html", values[i])
+			} else if value.Valid {
+				bpt.ContentHTML = value.String
+			}
+		case blogposttranslation.FieldToc:
+			if value, ok := values[i].(*[]byte); !ok {
+				return fmt.Errorf("unexpected type %T for field toc", values[i])
+			} else if value != nil && len(*value) > 0 {
+				if err := json.Unmarshal(*value, &bpt.Toc); err != nil {
+					return fmt.Errorf("unmarshal field toc: %w", err)
+				}
+			}
 		default:
 			bpt.selectValues.Set(columns[i], values[i])
 		}
@@ -202,6 +223,12 @@ func (bpt *BlogPostTranslation) String() string {
 	builder.WriteString(", ")
 	builder.WriteString("created_at=")
 	builder.WriteString(bpt.CreatedAt.Format(time.ANSIC))
+	builder.WriteString(", ")
+	builder.WriteString("content_html=")
+	builder.WriteString(bpt.ContentHTML)
+	builder.WriteString(", ")
+	builder.WriteString("toc=")
+	builder.WriteString(fmt.Sprintf("%v", bpt.Toc))
 	builder.WriteByte(')')
 	return builder.String()
 }
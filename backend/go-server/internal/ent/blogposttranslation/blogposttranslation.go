@@ -27,6 +27,10 @@ const (
 	FieldContent = "content"
 	// FieldCreatedAt holds the string denoting the created_at field in the database.
 	FieldCreatedAt = "created_at"
+	// FieldContentHTML holds the string denoting the content_html field in the database.
+	FieldContentHTML = "content_html"
+	// FieldToc holds the string denoting the toc field in the database.
+	FieldToc = "toc"
 	// EdgeBlogPost holds the string denoting the blog_post edge name in mutations.
 	EdgeBlogPost = "blog_post"
 	// EdgeLanguage holds the string denoting the language edge name in mutations.
@@ -60,6 +64,8 @@ var Columns = []string{
 	FieldExcerpt,
 	FieldContent,
 	FieldCreatedAt,
+	FieldContentHTML,
+	FieldToc,
 }
 
 // ValidColumn reports if the column name is valid (part of the table columns).
@@ -123,6 +129,11 @@ func ByCreatedAt(opts ...sql.OrderTermOption) OrderOption {
 	return sql.OrderByField(FieldCreatedAt, opts...).ToFunc()
 }
 
+// ByContentHTML orders the results by the content_html field.
+func ByContentHTML(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldContentHTML, opts...).ToFunc()
+}
+
 // ByBlogPostField orders the results by blog_post field.
 func ByBlogPostField(field string, opts ...sql.OrderTermOption) OrderOption {
 	return func(s *sql.Selector) {
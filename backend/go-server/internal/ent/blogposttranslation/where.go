@@ -86,6 +86,11 @@ func CreatedAt(v time.Time) predicate.BlogPostTranslation {
 	return predicate.BlogPostTranslation(sql.FieldEQ(FieldCreatedAt, v))
 }
 
+// ContentHTML applies equality check predicate on the "content_html" field. It's identical to ContentHTMLEQ.
+func ContentHTML(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldEQ(FieldContentHTML, v))
+}
+
 // BlogPostIDEQ applies the EQ predicate on the "blog_post_id" field.
 func BlogPostIDEQ(v uuid.UUID) predicate.BlogPostTranslation {
 	return predicate.BlogPostTranslation(sql.FieldEQ(FieldBlogPostID, v))
@@ -416,6 +421,91 @@ func CreatedAtLTE(v time.Time) predicate.BlogPostTranslation {
 	return predicate.BlogPostTranslation(sql.FieldLTE(FieldCreatedAt, v))
 }
 
+// ContentHTMLEQ applies the EQ predicate on the "content_html" field.
+func ContentHTMLEQ(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLNEQ applies the NEQ predicate on the "content_html" field.
+func ContentHTMLNEQ(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldNEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLIn applies the In predicate on the "content_html" field.
+func ContentHTMLIn(vs ...string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLNotIn applies the NotIn predicate on the "content_html" field.
+func ContentHTMLNotIn(vs ...string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldNotIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLGT applies the GT predicate on the "content_html" field.
+func ContentHTMLGT(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldGT(FieldContentHTML, v))
+}
+
+// ContentHTMLGTE applies the GTE predicate on the "content_html" field.
+func ContentHTMLGTE(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldGTE(FieldContentHTML, v))
+}
+
+// ContentHTMLLT applies the LT predicate on the "content_html" field.
+func ContentHTMLLT(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldLT(FieldContentHTML, v))
+}
+
+// ContentHTMLLTE applies the LTE predicate on the "content_html" field.
+func ContentHTMLLTE(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldLTE(FieldContentHTML, v))
+}
+
+// ContentHTMLContains applies the Contains predicate on the "content_html" field.
+func ContentHTMLContains(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldContains(FieldContentHTML, v))
+}
+
+// ContentHTMLHasPrefix applies the HasPrefix predicate on the "content_html" field.
+func ContentHTMLHasPrefix(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldHasPrefix(FieldContentHTML, v))
+}
+
+// ContentHTMLHasSuffix applies the HasSuffix predicate on the "content_html" field.
+func ContentHTMLHasSuffix(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldHasSuffix(FieldContentHTML, v))
+}
+
+// ContentHTMLIsNil applies the IsNil predicate on the "content_html" field.
+func ContentHTMLIsNil() predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldIsNull(FieldContentHTML))
+}
+
+// ContentHTMLNotNil applies the NotNil predicate on the "content_html" field.
+func ContentHTMLNotNil() predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldNotNull(FieldContentHTML))
+}
+
+// ContentHTMLEqualFold applies the EqualFold predicate on the "content_html" field.
+func ContentHTMLEqualFold(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldEqualFold(FieldContentHTML, v))
+}
+
+// ContentHTMLContainsFold applies the ContainsFold predicate on the "content_html" field.
+func ContentHTMLContainsFold(v string) predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldContainsFold(FieldContentHTML, v))
+}
+
+// TocIsNil applies the IsNil predicate on the "toc" field.
+func TocIsNil() predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldIsNull(FieldToc))
+}
+
+// TocNotNil applies the NotNil predicate on the "toc" field.
+func TocNotNil() predicate.BlogPostTranslation {
+	return predicate.BlogPostTranslation(sql.FieldNotNull(FieldToc))
+}
+
 // HasBlogPost applies the HasEdge predicate on the "blog_post" edge.
 func HasBlogPost() predicate.BlogPostTranslation {
 	return predicate.BlogPostTranslation(func(s *sql.Selector) {
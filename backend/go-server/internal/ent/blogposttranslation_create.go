@@ -75,6 +75,26 @@ func (bptc *BlogPostTranslationCreate) SetNillableCreatedAt(t *time.Time) *BlogP
 	return bptc
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bptc *BlogPostTranslationCreate) SetContentHTML(s string) *BlogPostTranslationCreate {
+	bptc.mutation.SetContentHTML(s)
+	return bptc
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bptc *BlogPostTranslationCreate) SetNillableContentHTML(s *string) *BlogPostTranslationCreate {
+	if s != nil {
+		bptc.SetContentHTML(*s)
+	}
+	return bptc
+}
+
+// SetToc sets the "toc" field.
+func (bptc *BlogPostTranslationCreate) SetToc(m []map[string]interface{}) *BlogPostTranslationCreate {
+	bptc.mutation.SetToc(m)
+	return bptc
+}
+
 // SetID sets the "id" field.
 func (bptc *BlogPostTranslationCreate) SetID(u uuid.UUID) *BlogPostTranslationCreate {
 	bptc.mutation.SetID(u)
@@ -239,6 +259,14 @@ func (bptc *BlogPostTranslationCreate) createSpec() (*BlogPostTranslation, *sqlg
 		_spec.SetField(blogposttranslation.FieldCreatedAt, field.TypeTime, value)
 		_node.CreatedAt = value
 	}
+	if value, ok := bptc.mutation.ContentHTML(); ok {
+		_spec.SetField(blogposttranslation.FieldContentHTML, field.TypeString, value)
+		_node.ContentHTML = value
+	}
+	if value, ok := bptc.mutation.Toc(); ok {
+		_spec.SetField(blogposttranslation.FieldToc, field.TypeJSON, value)
+		_node.Toc = value
+	}
 	if nodes := bptc.mutation.BlogPostIDs(); len(nodes) > 0 {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -13,6 +13,7 @@ import (
 
 	"entgo.io/ent/dialect/sql"
 	"entgo.io/ent/dialect/sql/sqlgraph"
+	"entgo.io/ent/dialect/sql/sqljson"
 	"entgo.io/ent/schema/field"
 	"github.com/google/uuid"
 )
@@ -106,6 +107,44 @@ func (bptu *BlogPostTranslationUpdate) SetNillableContent(s *string) *BlogPostTr
 	return bptu
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bptu *BlogPostTranslationUpdate) SetContentHTML(s string) *BlogPostTranslationUpdate {
+	bptu.mutation.SetContentHTML(s)
+	return bptu
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bptu *BlogPostTranslationUpdate) SetNillableContentHTML(s *string) *BlogPostTranslationUpdate {
+	if s != nil {
+		bptu.SetContentHTML(*s)
+	}
+	return bptu
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (bptu *BlogPostTranslationUpdate) ClearContentHTML() *BlogPostTranslationUpdate {
+	bptu.mutation.ClearContentHTML()
+	return bptu
+}
+
+// SetToc sets the "toc" field.
+func (bptu *BlogPostTranslationUpdate) SetToc(m []map[string]interface{}) *BlogPostTranslationUpdate {
+	bptu.mutation.SetToc(m)
+	return bptu
+}
+
+// AppendToc appends m to the "toc" field.
+func (bptu *BlogPostTranslationUpdate) AppendToc(m []map[string]interface{}) *BlogPostTranslationUpdate {
+	bptu.mutation.AppendToc(m)
+	return bptu
+}
+
+// ClearToc clears the value of the "toc" field.
+func (bptu *BlogPostTranslationUpdate) ClearToc() *BlogPostTranslationUpdate {
+	bptu.mutation.ClearToc()
+	return bptu
+}
+
 // SetBlogPost sets the "blog_post" edge to the BlogPost entity.
 func (bptu *BlogPostTranslationUpdate) SetBlogPost(b *BlogPost) *BlogPostTranslationUpdate {
 	return bptu.SetBlogPostID(b.ID)
@@ -216,6 +255,23 @@ func (bptu *BlogPostTranslationUpdate) sqlSave(ctx context.Context) (n int, err
 	if value, ok := bptu.mutation.Content(); ok {
 		_spec.SetField(blogposttranslation.FieldContent, field.TypeString, value)
 	}
+	if value, ok := bptu.mutation.ContentHTML(); ok {
+		_spec.SetField(blogposttranslation.FieldContentHTML, field.TypeString, value)
+	}
+	if bptu.mutation.ContentHTMLCleared() {
+		_spec.ClearField(blogposttranslation.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := bptu.mutation.Toc(); ok {
+		_spec.SetField(blogposttranslation.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := bptu.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, blogposttranslation.FieldToc, value)
+		})
+	}
+	if bptu.mutation.TocCleared() {
+		_spec.ClearField(blogposttranslation.FieldToc, field.TypeJSON)
+	}
 	if bptu.mutation.BlogPostCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -370,6 +426,44 @@ func (bptuo *BlogPostTranslationUpdateOne) SetNillableContent(s *string) *BlogPo
 	return bptuo
 }
 
+// SetContentHTML sets the "content_html" field.
+func (bptuo *BlogPostTranslationUpdateOne) SetContentHTML(s string) *BlogPostTranslationUpdateOne {
+	bptuo.mutation.SetContentHTML(s)
+	return bptuo
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (bptuo *BlogPostTranslationUpdateOne) SetNillableContentHTML(s *string) *BlogPostTranslationUpdateOne {
+	if s != nil {
+		bptuo.SetContentHTML(*s)
+	}
+	return bptuo
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (bptuo *BlogPostTranslationUpdateOne) ClearContentHTML() *BlogPostTranslationUpdateOne {
+	bptuo.mutation.ClearContentHTML()
+	return bptuo
+}
+
+// SetToc sets the "toc" field.
+func (bptuo *BlogPostTranslationUpdateOne) SetToc(m []map[string]interface{}) *BlogPostTranslationUpdateOne {
+	bptuo.mutation.SetToc(m)
+	return bptuo
+}
+
+// AppendToc appends m to the "toc" field.
+func (bptuo *BlogPostTranslationUpdateOne) AppendToc(m []map[string]interface{}) *BlogPostTranslationUpdateOne {
+	bptuo.mutation.AppendToc(m)
+	return bptuo
+}
+
+// ClearToc clears the value of the "toc" field.
+func (bptuo *BlogPostTranslationUpdateOne) ClearToc() *BlogPostTranslationUpdateOne {
+	bptuo.mutation.ClearToc()
+	return bptuo
+}
+
 // SetBlogPost sets the "blog_post" edge to the BlogPost entity.
 func (bptuo *BlogPostTranslationUpdateOne) SetBlogPost(b *BlogPost) *BlogPostTranslationUpdateOne {
 	return bptuo.SetBlogPostID(b.ID)
@@ -510,6 +604,23 @@ func (bptuo *BlogPostTranslationUpdateOne) sqlSave(ctx context.Context) (_node *
 	if value, ok := bptuo.mutation.Content(); ok {
 		_spec.SetField(blogposttranslation.FieldContent, field.TypeString, value)
 	}
+	if value, ok := bptuo.mutation.ContentHTML(); ok {
+		_spec.SetField(blogposttranslation.FieldContentHTML, field.TypeString, value)
+	}
+	if bptuo.mutation.ContentHTMLCleared() {
+		_spec.ClearField(blogposttranslation.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := bptuo.mutation.Toc(); ok {
+		_spec.SetField(blogposttranslation.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := bptuo.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, blogposttranslation.FieldToc, value)
+		})
+	}
+	if bptuo.mutation.TocCleared() {
+		_spec.ClearField(blogposttranslation.FieldToc, field.TypeJSON)
+	}
 	if bptuo.mutation.BlogPostCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -3,6 +3,7 @@
 package ent
 
 import (
+	"encoding/json"
 	"fmt"
 	"silan-backend/internal/ent/idea"
 	"silan-backend/internal/ent/user"
@@ -57,6 +58,10 @@ type Idea struct {
 	CreatedAt time.Time `json:"created_at,omitempty"`
 	// UpdatedAt holds the value of the "updated_at" field.
 	UpdatedAt time.Time `json:"updated_at,omitempty"`
+	// ContentHTML holds the value of the "content_html" field.
+	ContentHTML string `json:"content_html,omitempty"`
+	// Toc holds the value of the "toc" field.
+	Toc []map[string]interface{} `json:"toc,omitempty"`
 	// Edges holds the relations/edges for other nodes in the graph.
 	// The values are being populated by the IdeaQuery when eager-loading is set.
 	Edges        IdeaEdges `json:"edges"`
@@ -110,13 +115,15 @@ func (*Idea) scanValues(columns []string) ([]any, error) {
 	values := make([]any, len(columns))
 	for i := range columns {
 		switch columns[i] {
+		case idea.FieldToc:
+			values[i] = new([]byte)
 		case idea.FieldCollaborationNeeded, idea.FieldFundingRequired, idea.FieldIsPublic:
 			values[i] = new(sql.NullBool)
 		case idea.FieldEstimatedBudget:
 			values[i] = new(sql.NullFloat64)
 		case idea.FieldEstimatedDurationMonths, idea.FieldViewCount, idea.FieldLikeCount:
 			values[i] = new(sql.NullInt64)
-		case idea.FieldTitle, idea.FieldSlug, idea.FieldAbstract, idea.FieldMotivation, idea.FieldMethodology, idea.FieldExpectedOutcome, idea.FieldStatus, idea.FieldPriority, idea.FieldRequiredResources:
+		case idea.FieldTitle, idea.FieldSlug, idea.FieldAbstract, idea.FieldMotivation, idea.FieldMethodology, idea.FieldExpectedOutcome, idea.FieldStatus, idea.FieldPriority, idea.FieldRequiredResources, idea.FieldContentHTML:
 			values[i] = new(sql.NullString)
 		case idea.FieldCreatedAt, idea.FieldUpdatedAt:
 			values[i] = new(sql.NullTime)
@@ -257,6 +264,20 @@ func (i *Idea) assignValues(columns []string, values []any) error {
 			} else if value.Valid {
 				i.UpdatedAt = value.Time
 			}
+		case idea.FieldContentHTML:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field content_html", values[i])
+			} else if value.Valid {
+				i.ContentHTML = value.String
+			}
+		case idea.FieldToc:
+			if value, ok := values[i].(*[]byte); !ok {
+				return fmt.Errorf("unexpected type %T for field toc", values[i])
+			} else if value != nil && len(*value) > 0 {
+				if err := json.Unmarshal(*value, &i.Toc); err != nil {
+					return fmt.Errorf("unmarshal field toc: %w", err)
+				}
+			}
 		default:
 			i.selectValues.Set(columns[j], values[j])
 		}
@@ -364,6 +385,12 @@ func (i *Idea) String() string {
 	builder.WriteString(", ")
 	builder.WriteString("updated_at=")
 	builder.WriteString(i.UpdatedAt.Format(time.ANSIC))
+	builder.WriteString(", ")
+	builder.WriteString("content_html=")
+	builder.WriteString(i.ContentHTML)
+	builder.WriteString(", ")
+	builder.WriteString("toc=")
+	builder.WriteString(fmt.Sprintf("%v", i.Toc))
 	builder.WriteByte(')')
 	return builder.String()
 }
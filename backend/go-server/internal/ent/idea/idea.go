@@ -54,6 +54,10 @@ const (
 	FieldCreatedAt = "created_at"
 	// FieldUpdatedAt holds the string denoting the updated_at field in the database.
 	FieldUpdatedAt = "updated_at"
+	// FieldContentHTML holds the string denoting the content_html field in the database.
+	FieldContentHTML = "content_html"
+	// FieldToc holds the string denoting the toc field in the database.
+	FieldToc = "toc"
 	// EdgeUser holds the string denoting the user edge name in mutations.
 	EdgeUser = "user"
 	// EdgeTranslations holds the string denoting the translations edge name in mutations.
@@ -107,6 +111,8 @@ var Columns = []string{
 	FieldLikeCount,
 	FieldCreatedAt,
 	FieldUpdatedAt,
+	FieldContentHTML,
+	FieldToc,
 }
 
 // ValidColumn reports if the column name is valid (part of the table columns).
@@ -305,6 +311,11 @@ func ByUpdatedAt(opts ...sql.OrderTermOption) OrderOption {
 	return sql.OrderByField(FieldUpdatedAt, opts...).ToFunc()
 }
 
+// ByContentHTML orders the results by the content_html field.
+func ByContentHTML(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldContentHTML, opts...).ToFunc()
+}
+
 // ByUserField orders the results by user field.
 func ByUserField(field string, opts ...sql.OrderTermOption) OrderOption {
 	return func(s *sql.Selector) {
@@ -266,6 +266,26 @@ func (ic *IdeaCreate) SetNillableUpdatedAt(t *time.Time) *IdeaCreate {
 	return ic
 }
 
+// SetContentHTML sets the "content_html" field.
+func (ic *IdeaCreate) SetContentHTML(s string) *IdeaCreate {
+	ic.mutation.SetContentHTML(s)
+	return ic
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (ic *IdeaCreate) SetNillableContentHTML(s *string) *IdeaCreate {
+	if s != nil {
+		ic.SetContentHTML(*s)
+	}
+	return ic
+}
+
+// SetToc sets the "toc" field.
+func (ic *IdeaCreate) SetToc(m []map[string]interface{}) *IdeaCreate {
+	ic.mutation.SetToc(m)
+	return ic
+}
+
 // SetID sets the "id" field.
 func (ic *IdeaCreate) SetID(u uuid.UUID) *IdeaCreate {
 	ic.mutation.SetID(u)
@@ -560,6 +580,14 @@ func (ic *IdeaCreate) createSpec() (*Idea, *sqlgraph.CreateSpec) {
 		_spec.SetField(idea.FieldUpdatedAt, field.TypeTime, value)
 		_node.UpdatedAt = value
 	}
+	if value, ok := ic.mutation.ContentHTML(); ok {
+		_spec.SetField(idea.FieldContentHTML, field.TypeString, value)
+		_node.ContentHTML = value
+	}
+	if value, ok := ic.mutation.Toc(); ok {
+		_spec.SetField(idea.FieldToc, field.TypeJSON, value)
+		_node.Toc = value
+	}
 	if nodes := ic.mutation.UserIDs(); len(nodes) > 0 {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
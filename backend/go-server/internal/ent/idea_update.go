@@ -15,6 +15,7 @@ import (
 
 	"entgo.io/ent/dialect/sql"
 	"entgo.io/ent/dialect/sql/sqlgraph"
+	"entgo.io/ent/dialect/sql/sqljson"
 	"entgo.io/ent/schema/field"
 	"github.com/google/uuid"
 )
@@ -346,6 +347,44 @@ func (iu *IdeaUpdate) SetUpdatedAt(t time.Time) *IdeaUpdate {
 	return iu
 }
 
+// SetContentHTML sets the "content_html" field.
+func (iu *IdeaUpdate) SetContentHTML(s string) *IdeaUpdate {
+	iu.mutation.SetContentHTML(s)
+	return iu
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (iu *IdeaUpdate) SetNillableContentHTML(s *string) *IdeaUpdate {
+	if s != nil {
+		iu.SetContentHTML(*s)
+	}
+	return iu
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (iu *IdeaUpdate) ClearContentHTML() *IdeaUpdate {
+	iu.mutation.ClearContentHTML()
+	return iu
+}
+
+// SetToc sets the "toc" field.
+func (iu *IdeaUpdate) SetToc(m []map[string]interface{}) *IdeaUpdate {
+	iu.mutation.SetToc(m)
+	return iu
+}
+
+// AppendToc appends m to the "toc" field.
+func (iu *IdeaUpdate) AppendToc(m []map[string]interface{}) *IdeaUpdate {
+	iu.mutation.AppendToc(m)
+	return iu
+}
+
+// ClearToc clears the value of the "toc" field.
+func (iu *IdeaUpdate) ClearToc() *IdeaUpdate {
+	iu.mutation.ClearToc()
+	return iu
+}
+
 // SetUser sets the "user" edge to the User entity.
 func (iu *IdeaUpdate) SetUser(u *User) *IdeaUpdate {
 	return iu.SetUserID(u.ID)
@@ -594,6 +633,23 @@ func (iu *IdeaUpdate) sqlSave(ctx context.Context) (n int, err error) {
 	if value, ok := iu.mutation.UpdatedAt(); ok {
 		_spec.SetField(idea.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := iu.mutation.ContentHTML(); ok {
+		_spec.SetField(idea.FieldContentHTML, field.TypeString, value)
+	}
+	if iu.mutation.ContentHTMLCleared() {
+		_spec.ClearField(idea.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := iu.mutation.Toc(); ok {
+		_spec.SetField(idea.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := iu.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, idea.FieldToc, value)
+		})
+	}
+	if iu.mutation.TocCleared() {
+		_spec.ClearField(idea.FieldToc, field.TypeJSON)
+	}
 	if iu.mutation.UserCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -1047,6 +1103,44 @@ func (iuo *IdeaUpdateOne) SetUpdatedAt(t time.Time) *IdeaUpdateOne {
 	return iuo
 }
 
+// SetContentHTML sets the "content_html" field.
+func (iuo *IdeaUpdateOne) SetContentHTML(s string) *IdeaUpdateOne {
+	iuo.mutation.SetContentHTML(s)
+	return iuo
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (iuo *IdeaUpdateOne) SetNillableContentHTML(s *string) *IdeaUpdateOne {
+	if s != nil {
+		iuo.SetContentHTML(*s)
+	}
+	return iuo
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (iuo *IdeaUpdateOne) ClearContentHTML() *IdeaUpdateOne {
+	iuo.mutation.ClearContentHTML()
+	return iuo
+}
+
+// SetToc sets the "toc" field.
+func (iuo *IdeaUpdateOne) SetToc(m []map[string]interface{}) *IdeaUpdateOne {
+	iuo.mutation.SetToc(m)
+	return iuo
+}
+
+// AppendToc appends m to the "toc" field.
+func (iuo *IdeaUpdateOne) AppendToc(m []map[string]interface{}) *IdeaUpdateOne {
+	iuo.mutation.AppendToc(m)
+	return iuo
+}
+
+// ClearToc clears the value of the "toc" field.
+func (iuo *IdeaUpdateOne) ClearToc() *IdeaUpdateOne {
+	iuo.mutation.ClearToc()
+	return iuo
+}
+
 // SetUser sets the "user" edge to the User entity.
 func (iuo *IdeaUpdateOne) SetUser(u *User) *IdeaUpdateOne {
 	return iuo.SetUserID(u.ID)
@@ -1325,6 +1419,23 @@ func (iuo *IdeaUpdateOne) sqlSave(ctx context.Context) (_node *Idea, err error)
 	if value, ok := iuo.mutation.UpdatedAt(); ok {
 		_spec.SetField(idea.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := iuo.mutation.ContentHTML(); ok {
+		_spec.SetField(idea.FieldContentHTML, field.TypeString, value)
+	}
+	if iuo.mutation.ContentHTMLCleared() {
+		_spec.ClearField(idea.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := iuo.mutation.Toc(); ok {
+		_spec.SetField(idea.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := iuo.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, idea.FieldToc, value)
+		})
+	}
+	if iuo.mutation.TocCleared() {
+		_spec.ClearField(idea.FieldToc, field.TypeJSON)
+	}
 	if iuo.mutation.UserCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
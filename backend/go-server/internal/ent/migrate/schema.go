@@ -169,6 +169,8 @@ var (
 		{Name: "series_order", Type: field.TypeInt, Nullable: true},
 		{Name: "created_at", Type: field.TypeTime},
 		{Name: "updated_at", Type: field.TypeTime},
+		{Name: "content_html", Type: field.TypeString, Nullable: true, Size: 2147483647},
+		{Name: "toc", Type: field.TypeJSON, Nullable: true},
 		{Name: "category_id", Type: field.TypeUUID, Nullable: true},
 		{Name: "series_id", Type: field.TypeUUID, Nullable: true},
 		{Name: "ideas_id", Type: field.TypeUUID, Nullable: true},
@@ -182,25 +184,25 @@ var (
 		ForeignKeys: []*schema.ForeignKey{
 			{
 				Symbol:     "blog_posts_blog_categories_blog_posts",
-				Columns:    []*schema.Column{BlogPostsColumns[17]},
+				Columns:    []*schema.Column{BlogPostsColumns[19]},
 				RefColumns: []*schema.Column{BlogCategoriesColumns[0]},
 				OnDelete:   schema.SetNull,
 			},
 			{
 				Symbol:     "blog_posts_blog_series_blog_posts",
-				Columns:    []*schema.Column{BlogPostsColumns[18]},
+				Columns:    []*schema.Column{BlogPostsColumns[20]},
 				RefColumns: []*schema.Column{BlogSeriesColumns[0]},
 				OnDelete:   schema.SetNull,
 			},
 			{
 				Symbol:     "blog_posts_ideas_blog_posts",
-				Columns:    []*schema.Column{BlogPostsColumns[19]},
+				Columns:    []*schema.Column{BlogPostsColumns[21]},
 				RefColumns: []*schema.Column{IdeasColumns[0]},
 				OnDelete:   schema.SetNull,
 			},
 			{
 				Symbol:     "blog_posts_users_blog_posts",
-				Columns:    []*schema.Column{BlogPostsColumns[20]},
+				Columns:    []*schema.Column{BlogPostsColumns[22]},
 				RefColumns: []*schema.Column{UsersColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
@@ -239,6 +241,8 @@ var (
 		{Name: "excerpt", Type: field.TypeString, Nullable: true, Size: 2147483647},
 		{Name: "content", Type: field.TypeString, Size: 2147483647},
 		{Name: "created_at", Type: field.TypeTime},
+		{Name: "content_html", Type: field.TypeString, Nullable: true, Size: 2147483647},
+		{Name: "toc", Type: field.TypeJSON, Nullable: true},
 		{Name: "blog_post_id", Type: field.TypeUUID},
 		{Name: "language_code", Type: field.TypeString, Size: 5},
 	}
@@ -250,13 +254,13 @@ var (
 		ForeignKeys: []*schema.ForeignKey{
 			{
 				Symbol:     "blog_post_translations_blog_posts_translations",
-				Columns:    []*schema.Column{BlogPostTranslationsColumns[5]},
+				Columns:    []*schema.Column{BlogPostTranslationsColumns[7]},
 				RefColumns: []*schema.Column{BlogPostsColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
 			{
 				Symbol:     "blog_post_translations_languages_blog_post_translations",
-				Columns:    []*schema.Column{BlogPostTranslationsColumns[6]},
+				Columns:    []*schema.Column{BlogPostTranslationsColumns[8]},
 				RefColumns: []*schema.Column{LanguagesColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
@@ -458,6 +462,8 @@ var (
 		{Name: "like_count", Type: field.TypeInt, Default: 0},
 		{Name: "created_at", Type: field.TypeTime},
 		{Name: "updated_at", Type: field.TypeTime},
+		{Name: "content_html", Type: field.TypeString, Nullable: true, Size: 2147483647},
+		{Name: "toc", Type: field.TypeJSON, Nullable: true},
 		{Name: "user_id", Type: field.TypeUUID},
 	}
 	// IdeasTable holds the schema information for the "ideas" table.
@@ -468,7 +474,7 @@ var (
 		ForeignKeys: []*schema.ForeignKey{
 			{
 				Symbol:     "ideas_users_ideas",
-				Columns:    []*schema.Column{IdeasColumns[19]},
+				Columns:    []*schema.Column{IdeasColumns[21]},
 				RefColumns: []*schema.Column{UsersColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
@@ -632,6 +638,8 @@ var (
 		{Name: "version", Type: field.TypeString, Nullable: true, Size: 20},
 		{Name: "created_at", Type: field.TypeTime},
 		{Name: "updated_at", Type: field.TypeTime},
+		{Name: "content_html", Type: field.TypeString, Nullable: true, Size: 2147483647},
+		{Name: "toc", Type: field.TypeJSON, Nullable: true},
 		{Name: "project_id", Type: field.TypeUUID, Unique: true},
 	}
 	// ProjectDetailsTable holds the schema information for the "project_details" table.
@@ -642,7 +650,7 @@ var (
 		ForeignKeys: []*schema.ForeignKey{
 			{
 				Symbol:     "project_details_projects_details",
-				Columns:    []*schema.Column{ProjectDetailsColumns[11]},
+				Columns:    []*schema.Column{ProjectDetailsColumns[13]},
 				RefColumns: []*schema.Column{ProjectsColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
@@ -691,6 +699,11 @@ var (
 		{Name: "sort_order", Type: field.TypeInt, Default: 0},
 		{Name: "created_at", Type: field.TypeTime},
 		{Name: "updated_at", Type: field.TypeTime},
+		{Name: "content_hash", Type: field.TypeString, Nullable: true, Size: 64},
+		{Name: "width", Type: field.TypeInt, Nullable: true},
+		{Name: "height", Type: field.TypeInt, Nullable: true},
+		{Name: "blurhash", Type: field.TypeString, Nullable: true, Size: 100},
+		{Name: "derivatives", Type: field.TypeJSON, Nullable: true},
 		{Name: "project_id", Type: field.TypeUUID},
 	}
 	// ProjectImagesTable holds the schema information for the "project_images" table.
@@ -701,7 +714,7 @@ var (
 		ForeignKeys: []*schema.ForeignKey{
 			{
 				Symbol:     "project_images_projects_images",
-				Columns:    []*schema.Column{ProjectImagesColumns[8]},
+				Columns:    []*schema.Column{ProjectImagesColumns[13]},
 				RefColumns: []*schema.Column{ProjectsColumns[0]},
 				OnDelete:   schema.NoAction,
 			},
@@ -4856,6 +4856,9 @@ type BlogPostMutation struct {
 	addseries_order         *int
 	created_at              *time.Time
 	updated_at              *time.Time
+	content_html            *string
+	toc                     *[]map[string]interface{}
+	appendtoc               []map[string]interface{}
 	clearedFields           map[string]struct{}
 	user                    *uuid.UUID
 	cleareduser             bool
@@ -5909,6 +5912,120 @@ func (m *BlogPostMutation) ResetUpdatedAt() {
 	m.updated_at = nil
 }
 
+// SetContentHTML sets the "content_html" field.
+func (m *BlogPostMutation) SetContentHTML(s string) {
+	m.content_html = &s
+}
+
+// ContentHTML returns the value of the "content_html" field in the mutation.
+func (m *BlogPostMutation) ContentHTML() (r string, exists bool) {
+	v := m.content_html
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldContentHTML returns the old "content_html" field's value of the BlogPost entity.
+// If the BlogPost object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *BlogPostMutation) OldContentHTML(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldContentHTML is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldContentHTML requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldContentHTML: %w", err)
+	}
+	return oldValue.ContentHTML, nil
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (m *BlogPostMutation) ClearContentHTML() {
+	m.content_html = nil
+	m.clearedFields[blogpost.FieldContentHTML] = struct{}{}
+}
+
+// ContentHTMLCleared returns if the "content_html" field was cleared in this mutation.
+func (m *BlogPostMutation) ContentHTMLCleared() bool {
+	_, ok := m.clearedFields[blogpost.FieldContentHTML]
+	return ok
+}
+
+// ResetContentHTML resets all changes to the "content_html" field.
+func (m *BlogPostMutation) ResetContentHTML() {
+	m.content_html = nil
+	delete(m.clearedFields, blogpost.FieldContentHTML)
+}
+
+// SetToc sets the "toc" field.
+func (m *BlogPostMutation) SetToc(value []map[string]interface{}) {
+	m.toc = &value
+	m.appendtoc = nil
+}
+
+// Toc returns the value of the "toc" field in the mutation.
+func (m *BlogPostMutation) Toc() (r []map[string]interface{}, exists bool) {
+	v := m.toc
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldToc returns the old "toc" field's value of the BlogPost entity.
+// If the BlogPost object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *BlogPostMutation) OldToc(ctx context.Context) (v []map[string]interface{}, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldToc is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldToc requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldToc: %w", err)
+	}
+	return oldValue.Toc, nil
+}
+
+// AppendToc adds value to the "toc" field.
+func (m *BlogPostMutation) AppendToc(value []map[string]interface{}) {
+	m.appendtoc = append(m.appendtoc, value...)
+}
+
+// AppendedToc returns the list of values that were appended to the "toc" field in this mutation.
+func (m *BlogPostMutation) AppendedToc() ([]map[string]interface{}, bool) {
+	if len(m.appendtoc) == 0 {
+		return nil, false
+	}
+	return m.appendtoc, true
+}
+
+// ClearToc clears the value of the "toc" field.
+func (m *BlogPostMutation) ClearToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	m.clearedFields[blogpost.FieldToc] = struct{}{}
+}
+
+// TocCleared returns if the "toc" field was cleared in this mutation.
+func (m *BlogPostMutation) TocCleared() bool {
+	_, ok := m.clearedFields[blogpost.FieldToc]
+	return ok
+}
+
+// ResetToc resets all changes to the "toc" field.
+func (m *BlogPostMutation) ResetToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	delete(m.clearedFields, blogpost.FieldToc)
+}
+
 // ClearUser clears the "user" edge to the User entity.
 func (m *BlogPostMutation) ClearUser() {
 	m.cleareduser = true
@@ -6213,7 +6330,7 @@ func (m *BlogPostMutation) Type() string {
 // order to get all numeric fields that were incremented/decremented, call
 // AddedFields().
 func (m *BlogPostMutation) Fields() []string {
-	fields := make([]string, 0, 20)
+	fields := make([]string, 0, 22)
 	if m.user != nil {
 		fields = append(fields, blogpost.FieldUserID)
 	}
@@ -6274,6 +6391,12 @@ func (m *BlogPostMutation) Fields() []string {
 	if m.updated_at != nil {
 		fields = append(fields, blogpost.FieldUpdatedAt)
 	}
+	if m.content_html != nil {
+		fields = append(fields, blogpost.FieldContentHTML)
+	}
+	if m.toc != nil {
+		fields = append(fields, blogpost.FieldToc)
+	}
 	return fields
 }
 
@@ -6322,6 +6445,10 @@ func (m *BlogPostMutation) Field(name string) (ent.Value, bool) {
 		return m.CreatedAt()
 	case blogpost.FieldUpdatedAt:
 		return m.UpdatedAt()
+	case blogpost.FieldContentHTML:
+		return m.ContentHTML()
+	case blogpost.FieldToc:
+		return m.Toc()
 	}
 	return nil, false
 }
@@ -6371,6 +6498,10 @@ func (m *BlogPostMutation) OldField(ctx context.Context, name string) (ent.Value
 		return m.OldCreatedAt(ctx)
 	case blogpost.FieldUpdatedAt:
 		return m.OldUpdatedAt(ctx)
+	case blogpost.FieldContentHTML:
+		return m.OldContentHTML(ctx)
+	case blogpost.FieldToc:
+		return m.OldToc(ctx)
 	}
 	return nil, fmt.Errorf("unknown BlogPost field %s", name)
 }
@@ -6520,6 +6651,20 @@ func (m *BlogPostMutation) SetField(name string, value ent.Value) error {
 		}
 		m.SetUpdatedAt(v)
 		return nil
+	case blogpost.FieldContentHTML:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetContentHTML(v)
+		return nil
+	case blogpost.FieldToc:
+		v, ok := value.([]map[string]interface{})
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetToc(v)
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPost field %s", name)
 }
@@ -6637,6 +6782,12 @@ func (m *BlogPostMutation) ClearedFields() []string {
 	if m.FieldCleared(blogpost.FieldSeriesOrder) {
 		fields = append(fields, blogpost.FieldSeriesOrder)
 	}
+	if m.FieldCleared(blogpost.FieldContentHTML) {
+		fields = append(fields, blogpost.FieldContentHTML)
+	}
+	if m.FieldCleared(blogpost.FieldToc) {
+		fields = append(fields, blogpost.FieldToc)
+	}
 	return fields
 }
 
@@ -6675,6 +6826,12 @@ func (m *BlogPostMutation) ClearField(name string) error {
 	case blogpost.FieldSeriesOrder:
 		m.ClearSeriesOrder()
 		return nil
+	case blogpost.FieldContentHTML:
+		m.ClearContentHTML()
+		return nil
+	case blogpost.FieldToc:
+		m.ClearToc()
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPost nullable field %s", name)
 }
@@ -6743,6 +6900,12 @@ func (m *BlogPostMutation) ResetField(name string) error {
 	case blogpost.FieldUpdatedAt:
 		m.ResetUpdatedAt()
 		return nil
+	case blogpost.FieldContentHTML:
+		m.ResetContentHTML()
+		return nil
+	case blogpost.FieldToc:
+		m.ResetToc()
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPost field %s", name)
 }
@@ -7379,6 +7542,9 @@ type BlogPostTranslationMutation struct {
 	excerpt          *string
 	content          *string
 	created_at       *time.Time
+	content_html     *string
+	toc              *[]map[string]interface{}
+	appendtoc        []map[string]interface{}
 	clearedFields    map[string]struct{}
 	blog_post        *uuid.UUID
 	clearedblog_post bool
@@ -7722,6 +7888,120 @@ func (m *BlogPostTranslationMutation) ResetCreatedAt() {
 	m.created_at = nil
 }
 
+// SetContentHTML sets the "content_html" field.
+func (m *BlogPostTranslationMutation) SetContentHTML(s string) {
+	m.content_html = &s
+}
+
+// ContentHTML returns the value of the "content_html" field in the mutation.
+func (m *BlogPostTranslationMutation) ContentHTML() (r string, exists bool) {
+	v := m.content_html
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldContentHTML returns the old "content_html" field's value of the BlogPostTranslation entity.
+// If the BlogPostTranslation object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *BlogPostTranslationMutation) OldContentHTML(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldContentHTML is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldContentHTML requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldContentHTML: %w", err)
+	}
+	return oldValue.ContentHTML, nil
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (m *BlogPostTranslationMutation) ClearContentHTML() {
+	m.content_html = nil
+	m.clearedFields[blogposttranslation.FieldContentHTML] = struct{}{}
+}
+
+// ContentHTMLCleared returns if the "content_html" field was cleared in this mutation.
+func (m *BlogPostTranslationMutation) ContentHTMLCleared() bool {
+	_, ok := m.clearedFields[blogposttranslation.FieldContentHTML]
+	return ok
+}
+
+// ResetContentHTML resets all changes to the "content_html" field.
+func (m *BlogPostTranslationMutation) ResetContentHTML() {
+	m.content_html = nil
+	delete(m.clearedFields, blogposttranslation.FieldContentHTML)
+}
+
+// SetToc sets the "toc" field.
+func (m *BlogPostTranslationMutation) SetToc(value []map[string]interface{}) {
+	m.toc = &value
+	m.appendtoc = nil
+}
+
+// Toc returns the value of the "toc" field in the mutation.
+func (m *BlogPostTranslationMutation) Toc() (r []map[string]interface{}, exists bool) {
+	v := m.toc
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldToc returns the old "toc" field's value of the BlogPostTranslation entity.
+// If the BlogPostTranslation object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *BlogPostTranslationMutation) OldToc(ctx context.Context) (v []map[string]interface{}, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldToc is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldToc requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldToc: %w", err)
+	}
+	return oldValue.Toc, nil
+}
+
+// AppendToc adds value to the "toc" field.
+func (m *BlogPostTranslationMutation) AppendToc(value []map[string]interface{}) {
+	m.appendtoc = append(m.appendtoc, value...)
+}
+
+// AppendedToc returns the list of values that were appended to the "toc" field in this mutation.
+func (m *BlogPostTranslationMutation) AppendedToc() ([]map[string]interface{}, bool) {
+	if len(m.appendtoc) == 0 {
+		return nil, false
+	}
+	return m.appendtoc, true
+}
+
+// ClearToc clears the value of the "toc" field.
+func (m *BlogPostTranslationMutation) ClearToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	m.clearedFields[blogposttranslation.FieldToc] = struct{}{}
+}
+
+// TocCleared returns if the "toc" field was cleared in this mutation.
+func (m *BlogPostTranslationMutation) TocCleared() bool {
+	_, ok := m.clearedFields[blogposttranslation.FieldToc]
+	return ok
+}
+
+// ResetToc resets all changes to the "toc" field.
+func (m *BlogPostTranslationMutation) ResetToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	delete(m.clearedFields, blogposttranslation.FieldToc)
+}
+
 // ClearBlogPost clears the "blog_post" edge to the BlogPost entity.
 func (m *BlogPostTranslationMutation) ClearBlogPost() {
 	m.clearedblog_post = true
@@ -7823,7 +8103,7 @@ func (m *BlogPostTranslationMutation) Type() string {
 // order to get all numeric fields that were incremented/decremented, call
 // AddedFields().
 func (m *BlogPostTranslationMutation) Fields() []string {
-	fields := make([]string, 0, 6)
+	fields := make([]string, 0, 8)
 	if m.blog_post != nil {
 		fields = append(fields, blogposttranslation.FieldBlogPostID)
 	}
@@ -7842,6 +8122,12 @@ func (m *BlogPostTranslationMutation) Fields() []string {
 	if m.created_at != nil {
 		fields = append(fields, blogposttranslation.FieldCreatedAt)
 	}
+	if m.content_html != nil {
+		fields = append(fields, blogposttranslation.FieldContentHTML)
+	}
+	if m.toc != nil {
+		fields = append(fields, blogposttranslation.FieldToc)
+	}
 	return fields
 }
 
@@ -7862,6 +8148,10 @@ func (m *BlogPostTranslationMutation) Field(name string) (ent.Value, bool) {
 		return m.Content()
 	case blogposttranslation.FieldCreatedAt:
 		return m.CreatedAt()
+	case blogposttranslation.FieldContentHTML:
+		return m.ContentHTML()
+	case blogposttranslation.FieldToc:
+		return m.Toc()
 	}
 	return nil, false
 }
@@ -7883,6 +8173,10 @@ func (m *BlogPostTranslationMutation) OldField(ctx context.Context, name string)
 		return m.OldContent(ctx)
 	case blogposttranslation.FieldCreatedAt:
 		return m.OldCreatedAt(ctx)
+	case blogposttranslation.FieldContentHTML:
+		return m.OldContentHTML(ctx)
+	case blogposttranslation.FieldToc:
+		return m.OldToc(ctx)
 	}
 	return nil, fmt.Errorf("unknown BlogPostTranslation field %s", name)
 }
@@ -7934,6 +8228,20 @@ func (m *BlogPostTranslationMutation) SetField(name string, value ent.Value) err
 		}
 		m.SetCreatedAt(v)
 		return nil
+	case blogposttranslation.FieldContentHTML:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetContentHTML(v)
+		return nil
+	case blogposttranslation.FieldToc:
+		v, ok := value.([]map[string]interface{})
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetToc(v)
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPostTranslation field %s", name)
 }
@@ -7967,6 +8275,12 @@ func (m *BlogPostTranslationMutation) ClearedFields() []string {
 	if m.FieldCleared(blogposttranslation.FieldExcerpt) {
 		fields = append(fields, blogposttranslation.FieldExcerpt)
 	}
+	if m.FieldCleared(blogposttranslation.FieldContentHTML) {
+		fields = append(fields, blogposttranslation.FieldContentHTML)
+	}
+	if m.FieldCleared(blogposttranslation.FieldToc) {
+		fields = append(fields, blogposttranslation.FieldToc)
+	}
 	return fields
 }
 
@@ -7984,6 +8298,12 @@ func (m *BlogPostTranslationMutation) ClearField(name string) error {
 	case blogposttranslation.FieldExcerpt:
 		m.ClearExcerpt()
 		return nil
+	case blogposttranslation.FieldContentHTML:
+		m.ClearContentHTML()
+		return nil
+	case blogposttranslation.FieldToc:
+		m.ClearToc()
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPostTranslation nullable field %s", name)
 }
@@ -8010,6 +8330,12 @@ func (m *BlogPostTranslationMutation) ResetField(name string) error {
 	case blogposttranslation.FieldCreatedAt:
 		m.ResetCreatedAt()
 		return nil
+	case blogposttranslation.FieldContentHTML:
+		m.ResetContentHTML()
+		return nil
+	case blogposttranslation.FieldToc:
+		m.ResetToc()
+		return nil
 	}
 	return fmt.Errorf("unknown BlogPostTranslation field %s", name)
 }
@@ -14009,6 +14335,9 @@ type IdeaMutation struct {
 	addlike_count                *int
 	created_at                   *time.Time
 	updated_at                   *time.Time
+	content_html                 *string
+	toc                          *[]map[string]interface{}
+	appendtoc                    []map[string]interface{}
 	clearedFields                map[string]struct{}
 	user                         *uuid.UUID
 	cleareduser                  bool
@@ -14984,6 +15313,120 @@ func (m *IdeaMutation) ResetUpdatedAt() {
 	m.updated_at = nil
 }
 
+// SetContentHTML sets the "content_html" field.
+func (m *IdeaMutation) SetContentHTML(s string) {
+	m.content_html = &s
+}
+
+// ContentHTML returns the value of the "content_html" field in the mutation.
+func (m *IdeaMutation) ContentHTML() (r string, exists bool) {
+	v := m.content_html
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldContentHTML returns the old "content_html" field's value of the Idea entity.
+// If the Idea object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *IdeaMutation) OldContentHTML(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldContentHTML is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldContentHTML requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldContentHTML: %w", err)
+	}
+	return oldValue.ContentHTML, nil
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (m *IdeaMutation) ClearContentHTML() {
+	m.content_html = nil
+	m.clearedFields[idea.FieldContentHTML] = struct{}{}
+}
+
+// ContentHTMLCleared returns if the "content_html" field was cleared in this mutation.
+func (m *IdeaMutation) ContentHTMLCleared() bool {
+	_, ok := m.clearedFields[idea.FieldContentHTML]
+	return ok
+}
+
+// ResetContentHTML resets all changes to the "content_html" field.
+func (m *IdeaMutation) ResetContentHTML() {
+	m.content_html = nil
+	delete(m.clearedFields, idea.FieldContentHTML)
+}
+
+// SetToc sets the "toc" field.
+func (m *IdeaMutation) SetToc(value []map[string]interface{}) {
+	m.toc = &value
+	m.appendtoc = nil
+}
+
+// Toc returns the value of the "toc" field in the mutation.
+func (m *IdeaMutation) Toc() (r []map[string]interface{}, exists bool) {
+	v := m.toc
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldToc returns the old "toc" field's value of the Idea entity.
+// If the Idea object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *IdeaMutation) OldToc(ctx context.Context) (v []map[string]interface{}, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldToc is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldToc requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldToc: %w", err)
+	}
+	return oldValue.Toc, nil
+}
+
+// AppendToc adds value to the "toc" field.
+func (m *IdeaMutation) AppendToc(value []map[string]interface{}) {
+	m.appendtoc = append(m.appendtoc, value...)
+}
+
+// AppendedToc returns the list of values that were appended to the "toc" field in this mutation.
+func (m *IdeaMutation) AppendedToc() ([]map[string]interface{}, bool) {
+	if len(m.appendtoc) == 0 {
+		return nil, false
+	}
+	return m.appendtoc, true
+}
+
+// ClearToc clears the value of the "toc" field.
+func (m *IdeaMutation) ClearToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	m.clearedFields[idea.FieldToc] = struct{}{}
+}
+
+// TocCleared returns if the "toc" field was cleared in this mutation.
+func (m *IdeaMutation) TocCleared() bool {
+	_, ok := m.clearedFields[idea.FieldToc]
+	return ok
+}
+
+// ResetToc resets all changes to the "toc" field.
+func (m *IdeaMutation) ResetToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	delete(m.clearedFields, idea.FieldToc)
+}
+
 // ClearUser clears the "user" edge to the User entity.
 func (m *IdeaMutation) ClearUser() {
 	m.cleareduser = true
@@ -15153,7 +15596,7 @@ func (m *IdeaMutation) Type() string {
 // order to get all numeric fields that were incremented/decremented, call
 // AddedFields().
 func (m *IdeaMutation) Fields() []string {
-	fields := make([]string, 0, 19)
+	fields := make([]string, 0, 21)
 	if m.user != nil {
 		fields = append(fields, idea.FieldUserID)
 	}
@@ -15211,6 +15654,12 @@ func (m *IdeaMutation) Fields() []string {
 	if m.updated_at != nil {
 		fields = append(fields, idea.FieldUpdatedAt)
 	}
+	if m.content_html != nil {
+		fields = append(fields, idea.FieldContentHTML)
+	}
+	if m.toc != nil {
+		fields = append(fields, idea.FieldToc)
+	}
 	return fields
 }
 
@@ -15257,6 +15706,10 @@ func (m *IdeaMutation) Field(name string) (ent.Value, bool) {
 		return m.CreatedAt()
 	case idea.FieldUpdatedAt:
 		return m.UpdatedAt()
+	case idea.FieldContentHTML:
+		return m.ContentHTML()
+	case idea.FieldToc:
+		return m.Toc()
 	}
 	return nil, false
 }
@@ -15304,6 +15757,10 @@ func (m *IdeaMutation) OldField(ctx context.Context, name string) (ent.Value, er
 		return m.OldCreatedAt(ctx)
 	case idea.FieldUpdatedAt:
 		return m.OldUpdatedAt(ctx)
+	case idea.FieldContentHTML:
+		return m.OldContentHTML(ctx)
+	case idea.FieldToc:
+		return m.OldToc(ctx)
 	}
 	return nil, fmt.Errorf("unknown Idea field %s", name)
 }
@@ -15446,6 +15903,20 @@ func (m *IdeaMutation) SetField(name string, value ent.Value) error {
 		}
 		m.SetUpdatedAt(v)
 		return nil
+	case idea.FieldContentHTML:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetContentHTML(v)
+		return nil
+	case idea.FieldToc:
+		v, ok := value.([]map[string]interface{})
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetToc(v)
+		return nil
 	}
 	return fmt.Errorf("unknown Idea field %s", name)
 }
@@ -15548,6 +16019,12 @@ func (m *IdeaMutation) ClearedFields() []string {
 	if m.FieldCleared(idea.FieldEstimatedBudget) {
 		fields = append(fields, idea.FieldEstimatedBudget)
 	}
+	if m.FieldCleared(idea.FieldContentHTML) {
+		fields = append(fields, idea.FieldContentHTML)
+	}
+	if m.FieldCleared(idea.FieldToc) {
+		fields = append(fields, idea.FieldToc)
+	}
 	return fields
 }
 
@@ -15583,6 +16060,12 @@ func (m *IdeaMutation) ClearField(name string) error {
 	case idea.FieldEstimatedBudget:
 		m.ClearEstimatedBudget()
 		return nil
+	case idea.FieldContentHTML:
+		m.ClearContentHTML()
+		return nil
+	case idea.FieldToc:
+		m.ClearToc()
+		return nil
 	}
 	return fmt.Errorf("unknown Idea nullable field %s", name)
 }
@@ -15648,6 +16131,12 @@ func (m *IdeaMutation) ResetField(name string) error {
 	case idea.FieldUpdatedAt:
 		m.ResetUpdatedAt()
 		return nil
+	case idea.FieldContentHTML:
+		m.ResetContentHTML()
+		return nil
+	case idea.FieldToc:
+		m.ResetToc()
+		return nil
 	}
 	return fmt.Errorf("unknown Idea field %s", name)
 }
@@ -22871,6 +23360,9 @@ type ProjectDetailMutation struct {
 	version              *string
 	created_at           *time.Time
 	updated_at           *time.Time
+	content_html         *string
+	toc                  *[]map[string]interface{}
+	appendtoc            []map[string]interface{}
 	clearedFields        map[string]struct{}
 	project              *uuid.UUID
 	clearedproject       bool
@@ -23486,32 +23978,146 @@ func (m *ProjectDetailMutation) ResetUpdatedAt() {
 	m.updated_at = nil
 }
 
-// ClearProject clears the "project" edge to the Project entity.
-func (m *ProjectDetailMutation) ClearProject() {
-	m.clearedproject = true
-	m.clearedFields[projectdetail.FieldProjectID] = struct{}{}
-}
-
-// ProjectCleared reports if the "project" edge to the Project entity was cleared.
-func (m *ProjectDetailMutation) ProjectCleared() bool {
-	return m.clearedproject
+// SetContentHTML sets the "content_html" field.
+func (m *ProjectDetailMutation) SetContentHTML(s string) {
+	m.content_html = &s
 }
 
-// ProjectIDs returns the "project" edge IDs in the mutation.
-// Note that IDs always returns len(IDs) <= 1 for unique edges, and you should use
-// ProjectID instead. It exists only for internal usage by the builders.
-func (m *ProjectDetailMutation) ProjectIDs() (ids []uuid.UUID) {
-	if id := m.project; id != nil {
-		ids = append(ids, *id)
+// ContentHTML returns the value of the "content_html" field in the mutation.
+func (m *ProjectDetailMutation) ContentHTML() (r string, exists bool) {
+	v := m.content_html
+	if v == nil {
+		return
 	}
-	return
+	return *v, true
 }
 
-// ResetProject resets all changes to the "project" edge.
-func (m *ProjectDetailMutation) ResetProject() {
-	m.project = nil
-	m.clearedproject = false
-}
+// OldContentHTML returns the old "content_html" field's value of the ProjectDetail entity.
+// If the ProjectDetail object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectDetailMutation) OldContentHTML(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldContentHTML is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldContentHTML requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldContentHTML: %w", err)
+	}
+	return oldValue.ContentHTML, nil
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (m *ProjectDetailMutation) ClearContentHTML() {
+	m.content_html = nil
+	m.clearedFields[projectdetail.FieldContentHTML] = struct{}{}
+}
+
+// ContentHTMLCleared returns if the "content_html" field was cleared in this mutation.
+func (m *ProjectDetailMutation) ContentHTMLCleared() bool {
+	_, ok := m.clearedFields[projectdetail.FieldContentHTML]
+	return ok
+}
+
+// ResetContentHTML resets all changes to the "content_html" field.
+func (m *ProjectDetailMutation) ResetContentHTML() {
+	m.content_html = nil
+	delete(m.clearedFields, projectdetail.FieldContentHTML)
+}
+
+// SetToc sets the "toc" field.
+func (m *ProjectDetailMutation) SetToc(value []map[string]interface{}) {
+	m.toc = &value
+	m.appendtoc = nil
+}
+
+// Toc returns the value of the "toc" field in the mutation.
+func (m *ProjectDetailMutation) Toc() (r []map[string]interface{}, exists bool) {
+	v := m.toc
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldToc returns the old "toc" field's value of the ProjectDetail entity.
+// If the ProjectDetail object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectDetailMutation) OldToc(ctx context.Context) (v []map[string]interface{}, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldToc is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldToc requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldToc: %w", err)
+	}
+	return oldValue.Toc, nil
+}
+
+// AppendToc adds value to the "toc" field.
+func (m *ProjectDetailMutation) AppendToc(value []map[string]interface{}) {
+	m.appendtoc = append(m.appendtoc, value...)
+}
+
+// AppendedToc returns the list of values that were appended to the "toc" field in this mutation.
+func (m *ProjectDetailMutation) AppendedToc() ([]map[string]interface{}, bool) {
+	if len(m.appendtoc) == 0 {
+		return nil, false
+	}
+	return m.appendtoc, true
+}
+
+// ClearToc clears the value of the "toc" field.
+func (m *ProjectDetailMutation) ClearToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	m.clearedFields[projectdetail.FieldToc] = struct{}{}
+}
+
+// TocCleared returns if the "toc" field was cleared in this mutation.
+func (m *ProjectDetailMutation) TocCleared() bool {
+	_, ok := m.clearedFields[projectdetail.FieldToc]
+	return ok
+}
+
+// ResetToc resets all changes to the "toc" field.
+func (m *ProjectDetailMutation) ResetToc() {
+	m.toc = nil
+	m.appendtoc = nil
+	delete(m.clearedFields, projectdetail.FieldToc)
+}
+
+// ClearProject clears the "project" edge to the Project entity.
+func (m *ProjectDetailMutation) ClearProject() {
+	m.clearedproject = true
+	m.clearedFields[projectdetail.FieldProjectID] = struct{}{}
+}
+
+// ProjectCleared reports if the "project" edge to the Project entity was cleared.
+func (m *ProjectDetailMutation) ProjectCleared() bool {
+	return m.clearedproject
+}
+
+// ProjectIDs returns the "project" edge IDs in the mutation.
+// Note that IDs always returns len(IDs) <= 1 for unique edges, and you should use
+// ProjectID instead. It exists only for internal usage by the builders.
+func (m *ProjectDetailMutation) ProjectIDs() (ids []uuid.UUID) {
+	if id := m.project; id != nil {
+		ids = append(ids, *id)
+	}
+	return
+}
+
+// ResetProject resets all changes to the "project" edge.
+func (m *ProjectDetailMutation) ResetProject() {
+	m.project = nil
+	m.clearedproject = false
+}
 
 // AddTranslationIDs adds the "translations" edge to the ProjectDetailTranslation entity by ids.
 func (m *ProjectDetailMutation) AddTranslationIDs(ids ...uuid.UUID) {
@@ -23601,7 +24207,7 @@ func (m *ProjectDetailMutation) Type() string {
 // order to get all numeric fields that were incremented/decremented, call
 // AddedFields().
 func (m *ProjectDetailMutation) Fields() []string {
-	fields := make([]string, 0, 11)
+	fields := make([]string, 0, 13)
 	if m.project != nil {
 		fields = append(fields, projectdetail.FieldProjectID)
 	}
@@ -23635,6 +24241,12 @@ func (m *ProjectDetailMutation) Fields() []string {
 	if m.updated_at != nil {
 		fields = append(fields, projectdetail.FieldUpdatedAt)
 	}
+	if m.content_html != nil {
+		fields = append(fields, projectdetail.FieldContentHTML)
+	}
+	if m.toc != nil {
+		fields = append(fields, projectdetail.FieldToc)
+	}
 	return fields
 }
 
@@ -23665,6 +24277,10 @@ func (m *ProjectDetailMutation) Field(name string) (ent.Value, bool) {
 		return m.CreatedAt()
 	case projectdetail.FieldUpdatedAt:
 		return m.UpdatedAt()
+	case projectdetail.FieldContentHTML:
+		return m.ContentHTML()
+	case projectdetail.FieldToc:
+		return m.Toc()
 	}
 	return nil, false
 }
@@ -23696,6 +24312,10 @@ func (m *ProjectDetailMutation) OldField(ctx context.Context, name string) (ent.
 		return m.OldCreatedAt(ctx)
 	case projectdetail.FieldUpdatedAt:
 		return m.OldUpdatedAt(ctx)
+	case projectdetail.FieldContentHTML:
+		return m.OldContentHTML(ctx)
+	case projectdetail.FieldToc:
+		return m.OldToc(ctx)
 	}
 	return nil, fmt.Errorf("unknown ProjectDetail field %s", name)
 }
@@ -23782,6 +24402,20 @@ func (m *ProjectDetailMutation) SetField(name string, value ent.Value) error {
 		}
 		m.SetUpdatedAt(v)
 		return nil
+	case projectdetail.FieldContentHTML:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetContentHTML(v)
+		return nil
+	case projectdetail.FieldToc:
+		v, ok := value.([]map[string]interface{})
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetToc(v)
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectDetail field %s", name)
 }
@@ -23836,6 +24470,12 @@ func (m *ProjectDetailMutation) ClearedFields() []string {
 	if m.FieldCleared(projectdetail.FieldVersion) {
 		fields = append(fields, projectdetail.FieldVersion)
 	}
+	if m.FieldCleared(projectdetail.FieldContentHTML) {
+		fields = append(fields, projectdetail.FieldContentHTML)
+	}
+	if m.FieldCleared(projectdetail.FieldToc) {
+		fields = append(fields, projectdetail.FieldToc)
+	}
 	return fields
 }
 
@@ -23874,6 +24514,12 @@ func (m *ProjectDetailMutation) ClearField(name string) error {
 	case projectdetail.FieldVersion:
 		m.ClearVersion()
 		return nil
+	case projectdetail.FieldContentHTML:
+		m.ClearContentHTML()
+		return nil
+	case projectdetail.FieldToc:
+		m.ClearToc()
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectDetail nullable field %s", name)
 }
@@ -23915,6 +24561,12 @@ func (m *ProjectDetailMutation) ResetField(name string) error {
 	case projectdetail.FieldUpdatedAt:
 		m.ResetUpdatedAt()
 		return nil
+	case projectdetail.FieldContentHTML:
+		m.ResetContentHTML()
+		return nil
+	case projectdetail.FieldToc:
+		m.ResetToc()
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectDetail field %s", name)
 }
@@ -25029,6 +25681,14 @@ type ProjectImageMutation struct {
 	addsort_order       *int
 	created_at          *time.Time
 	updated_at          *time.Time
+	content_hash        *string
+	width               *int
+	addwidth            *int
+	height              *int
+	addheight           *int
+	blurhash            *string
+	derivatives         *[]map[string]interface{}
+	appendderivatives   []map[string]interface{}
 	clearedFields       map[string]struct{}
 	project             *uuid.UUID
 	clearedproject      bool
@@ -25491,6 +26151,309 @@ func (m *ProjectImageMutation) ResetUpdatedAt() {
 	m.updated_at = nil
 }
 
+// SetContentHash sets the "content_hash" field.
+func (m *ProjectImageMutation) SetContentHash(s string) {
+	m.content_hash = &s
+}
+
+// ContentHash returns the value of the "content_hash" field in the mutation.
+func (m *ProjectImageMutation) ContentHash() (r string, exists bool) {
+	v := m.content_hash
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldContentHash returns the old "content_hash" field's value of the ProjectImage entity.
+// If the ProjectImage object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectImageMutation) OldContentHash(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldContentHash is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldContentHash requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldContentHash: %w", err)
+	}
+	return oldValue.ContentHash, nil
+}
+
+// ClearContentHash clears the value of the "content_hash" field.
+func (m *ProjectImageMutation) ClearContentHash() {
+	m.content_hash = nil
+	m.clearedFields[projectimage.FieldContentHash] = struct{}{}
+}
+
+// ContentHashCleared returns if the "content_hash" field was cleared in this mutation.
+func (m *ProjectImageMutation) ContentHashCleared() bool {
+	_, ok := m.clearedFields[projectimage.FieldContentHash]
+	return ok
+}
+
+// ResetContentHash resets all changes to the "content_hash" field.
+func (m *ProjectImageMutation) ResetContentHash() {
+	m.content_hash = nil
+	delete(m.clearedFields, projectimage.FieldContentHash)
+}
+
+// SetWidth sets the "width" field.
+func (m *ProjectImageMutation) SetWidth(i int) {
+	m.width = &i
+	m.addwidth = nil
+}
+
+// Width returns the value of the "width" field in the mutation.
+func (m *ProjectImageMutation) Width() (r int, exists bool) {
+	v := m.width
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldWidth returns the old "width" field's value of the ProjectImage entity.
+// If the ProjectImage object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectImageMutation) OldWidth(ctx context.Context) (v int, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldWidth is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldWidth requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldWidth: %w", err)
+	}
+	return oldValue.Width, nil
+}
+
+// AddWidth adds i to the "width" field.
+func (m *ProjectImageMutation) AddWidth(i int) {
+	if m.addwidth != nil {
+		*m.addwidth += i
+	} else {
+		m.addwidth = &i
+	}
+}
+
+// AddedWidth returns the value that was added to the "width" field in this mutation.
+func (m *ProjectImageMutation) AddedWidth() (r int, exists bool) {
+	v := m.addwidth
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// ClearWidth clears the value of the "width" field.
+func (m *ProjectImageMutation) ClearWidth() {
+	m.width = nil
+	m.addwidth = nil
+	m.clearedFields[projectimage.FieldWidth] = struct{}{}
+}
+
+// WidthCleared returns if the "width" field was cleared in this mutation.
+func (m *ProjectImageMutation) WidthCleared() bool {
+	_, ok := m.clearedFields[projectimage.FieldWidth]
+	return ok
+}
+
+// ResetWidth resets all changes to the "width" field.
+func (m *ProjectImageMutation) ResetWidth() {
+	m.width = nil
+	m.addwidth = nil
+	delete(m.clearedFields, projectimage.FieldWidth)
+}
+
+// SetHeight sets the "height" field.
+func (m *ProjectImageMutation) SetHeight(i int) {
+	m.height = &i
+	m.addheight = nil
+}
+
+// Height returns the value of the "height" field in the mutation.
+func (m *ProjectImageMutation) Height() (r int, exists bool) {
+	v := m.height
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldHeight returns the old "height" field's value of the ProjectImage entity.
+// If the ProjectImage object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectImageMutation) OldHeight(ctx context.Context) (v int, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldHeight is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldHeight requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldHeight: %w", err)
+	}
+	return oldValue.Height, nil
+}
+
+// AddHeight adds i to the "height" field.
+func (m *ProjectImageMutation) AddHeight(i int) {
+	if m.addheight != nil {
+		*m.addheight += i
+	} else {
+		m.addheight = &i
+	}
+}
+
+// AddedHeight returns the value that was added to the "height" field in this mutation.
+func (m *ProjectImageMutation) AddedHeight() (r int, exists bool) {
+	v := m.addheight
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// ClearHeight clears the value of the "height" field.
+func (m *ProjectImageMutation) ClearHeight() {
+	m.height = nil
+	m.addheight = nil
+	m.clearedFields[projectimage.FieldHeight] = struct{}{}
+}
+
+// HeightCleared returns if the "height" field was cleared in this mutation.
+func (m *ProjectImageMutation) HeightCleared() bool {
+	_, ok := m.clearedFields[projectimage.FieldHeight]
+	return ok
+}
+
+// ResetHeight resets all changes to the "height" field.
+func (m *ProjectImageMutation) ResetHeight() {
+	m.height = nil
+	m.addheight = nil
+	delete(m.clearedFields, projectimage.FieldHeight)
+}
+
+// SetBlurhash sets the "blurhash" field.
+func (m *ProjectImageMutation) SetBlurhash(s string) {
+	m.blurhash = &s
+}
+
+// Blurhash returns the value of the "blurhash" field in the mutation.
+func (m *ProjectImageMutation) Blurhash() (r string, exists bool) {
+	v := m.blurhash
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldBlurhash returns the old "blurhash" field's value of the ProjectImage entity.
+// If the ProjectImage object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectImageMutation) OldBlurhash(ctx context.Context) (v string, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldBlurhash is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldBlurhash requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldBlurhash: %w", err)
+	}
+	return oldValue.Blurhash, nil
+}
+
+// ClearBlurhash clears the value of the "blurhash" field.
+func (m *ProjectImageMutation) ClearBlurhash() {
+	m.blurhash = nil
+	m.clearedFields[projectimage.FieldBlurhash] = struct{}{}
+}
+
+// BlurhashCleared returns if the "blurhash" field was cleared in this mutation.
+func (m *ProjectImageMutation) BlurhashCleared() bool {
+	_, ok := m.clearedFields[projectimage.FieldBlurhash]
+	return ok
+}
+
+// ResetBlurhash resets all changes to the "blurhash" field.
+func (m *ProjectImageMutation) ResetBlurhash() {
+	m.blurhash = nil
+	delete(m.clearedFields, projectimage.FieldBlurhash)
+}
+
+// SetDerivatives sets the "derivatives" field.
+func (m *ProjectImageMutation) SetDerivatives(value []map[string]interface{}) {
+	m.derivatives = &value
+	m.appendderivatives = nil
+}
+
+// Derivatives returns the value of the "derivatives" field in the mutation.
+func (m *ProjectImageMutation) Derivatives() (r []map[string]interface{}, exists bool) {
+	v := m.derivatives
+	if v == nil {
+		return
+	}
+	return *v, true
+}
+
+// OldDerivatives returns the old "derivatives" field's value of the ProjectImage entity.
+// If the ProjectImage object wasn't provided to the builder, the object is fetched from the database.
+// An error is returned if the mutation operation is not UpdateOne, or the database query fails.
+func (m *ProjectImageMutation) OldDerivatives(ctx context.Context) (v []map[string]interface{}, err error) {
+	if !m.op.Is(OpUpdateOne) {
+		return v, errors.New("OldDerivatives is only allowed on UpdateOne operations")
+	}
+	if m.id == nil || m.oldValue == nil {
+		return v, errors.New("OldDerivatives requires an ID field in the mutation")
+	}
+	oldValue, err := m.oldValue(ctx)
+	if err != nil {
+		return v, fmt.Errorf("querying old value for OldDerivatives: %w", err)
+	}
+	return oldValue.Derivatives, nil
+}
+
+// AppendDerivatives adds value to the "derivatives" field.
+func (m *ProjectImageMutation) AppendDerivatives(value []map[string]interface{}) {
+	m.appendderivatives = append(m.appendderivatives, value...)
+}
+
+// AppendedDerivatives returns the list of values that were appended to the "derivatives" field in this mutation.
+func (m *ProjectImageMutation) AppendedDerivatives() ([]map[string]interface{}, bool) {
+	if len(m.appendderivatives) == 0 {
+		return nil, false
+	}
+	return m.appendderivatives, true
+}
+
+// ClearDerivatives clears the value of the "derivatives" field.
+func (m *ProjectImageMutation) ClearDerivatives() {
+	m.derivatives = nil
+	m.appendderivatives = nil
+	m.clearedFields[projectimage.FieldDerivatives] = struct{}{}
+}
+
+// DerivativesCleared returns if the "derivatives" field was cleared in this mutation.
+func (m *ProjectImageMutation) DerivativesCleared() bool {
+	_, ok := m.clearedFields[projectimage.FieldDerivatives]
+	return ok
+}
+
+// ResetDerivatives resets all changes to the "derivatives" field.
+func (m *ProjectImageMutation) ResetDerivatives() {
+	m.derivatives = nil
+	m.appendderivatives = nil
+	delete(m.clearedFields, projectimage.FieldDerivatives)
+}
+
 // ClearProject clears the "project" edge to the Project entity.
 func (m *ProjectImageMutation) ClearProject() {
 	m.clearedproject = true
@@ -25606,7 +26569,7 @@ func (m *ProjectImageMutation) Type() string {
 // order to get all numeric fields that were incremented/decremented, call
 // AddedFields().
 func (m *ProjectImageMutation) Fields() []string {
-	fields := make([]string, 0, 8)
+	fields := make([]string, 0, 13)
 	if m.project != nil {
 		fields = append(fields, projectimage.FieldProjectID)
 	}
@@ -25631,6 +26594,21 @@ func (m *ProjectImageMutation) Fields() []string {
 	if m.updated_at != nil {
 		fields = append(fields, projectimage.FieldUpdatedAt)
 	}
+	if m.content_hash != nil {
+		fields = append(fields, projectimage.FieldContentHash)
+	}
+	if m.width != nil {
+		fields = append(fields, projectimage.FieldWidth)
+	}
+	if m.height != nil {
+		fields = append(fields, projectimage.FieldHeight)
+	}
+	if m.blurhash != nil {
+		fields = append(fields, projectimage.FieldBlurhash)
+	}
+	if m.derivatives != nil {
+		fields = append(fields, projectimage.FieldDerivatives)
+	}
 	return fields
 }
 
@@ -25655,6 +26633,16 @@ func (m *ProjectImageMutation) Field(name string) (ent.Value, bool) {
 		return m.CreatedAt()
 	case projectimage.FieldUpdatedAt:
 		return m.UpdatedAt()
+	case projectimage.FieldContentHash:
+		return m.ContentHash()
+	case projectimage.FieldWidth:
+		return m.Width()
+	case projectimage.FieldHeight:
+		return m.Height()
+	case projectimage.FieldBlurhash:
+		return m.Blurhash()
+	case projectimage.FieldDerivatives:
+		return m.Derivatives()
 	}
 	return nil, false
 }
@@ -25680,6 +26668,16 @@ func (m *ProjectImageMutation) OldField(ctx context.Context, name string) (ent.V
 		return m.OldCreatedAt(ctx)
 	case projectimage.FieldUpdatedAt:
 		return m.OldUpdatedAt(ctx)
+	case projectimage.FieldContentHash:
+		return m.OldContentHash(ctx)
+	case projectimage.FieldWidth:
+		return m.OldWidth(ctx)
+	case projectimage.FieldHeight:
+		return m.OldHeight(ctx)
+	case projectimage.FieldBlurhash:
+		return m.OldBlurhash(ctx)
+	case projectimage.FieldDerivatives:
+		return m.OldDerivatives(ctx)
 	}
 	return nil, fmt.Errorf("unknown ProjectImage field %s", name)
 }
@@ -25745,6 +26743,41 @@ func (m *ProjectImageMutation) SetField(name string, value ent.Value) error {
 		}
 		m.SetUpdatedAt(v)
 		return nil
+	case projectimage.FieldContentHash:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetContentHash(v)
+		return nil
+	case projectimage.FieldWidth:
+		v, ok := value.(int)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetWidth(v)
+		return nil
+	case projectimage.FieldHeight:
+		v, ok := value.(int)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetHeight(v)
+		return nil
+	case projectimage.FieldBlurhash:
+		v, ok := value.(string)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetBlurhash(v)
+		return nil
+	case projectimage.FieldDerivatives:
+		v, ok := value.([]map[string]interface{})
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.SetDerivatives(v)
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectImage field %s", name)
 }
@@ -25756,6 +26789,12 @@ func (m *ProjectImageMutation) AddedFields() []string {
 	if m.addsort_order != nil {
 		fields = append(fields, projectimage.FieldSortOrder)
 	}
+	if m.addwidth != nil {
+		fields = append(fields, projectimage.FieldWidth)
+	}
+	if m.addheight != nil {
+		fields = append(fields, projectimage.FieldHeight)
+	}
 	return fields
 }
 
@@ -25766,6 +26805,10 @@ func (m *ProjectImageMutation) AddedField(name string) (ent.Value, bool) {
 	switch name {
 	case projectimage.FieldSortOrder:
 		return m.AddedSortOrder()
+	case projectimage.FieldWidth:
+		return m.AddedWidth()
+	case projectimage.FieldHeight:
+		return m.AddedHeight()
 	}
 	return nil, false
 }
@@ -25782,6 +26825,20 @@ func (m *ProjectImageMutation) AddField(name string, value ent.Value) error {
 		}
 		m.AddSortOrder(v)
 		return nil
+	case projectimage.FieldWidth:
+		v, ok := value.(int)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.AddWidth(v)
+		return nil
+	case projectimage.FieldHeight:
+		v, ok := value.(int)
+		if !ok {
+			return fmt.Errorf("unexpected type %T for field %s", value, name)
+		}
+		m.AddHeight(v)
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectImage numeric field %s", name)
 }
@@ -25799,6 +26856,21 @@ func (m *ProjectImageMutation) ClearedFields() []string {
 	if m.FieldCleared(projectimage.FieldImageType) {
 		fields = append(fields, projectimage.FieldImageType)
 	}
+	if m.FieldCleared(projectimage.FieldContentHash) {
+		fields = append(fields, projectimage.FieldContentHash)
+	}
+	if m.FieldCleared(projectimage.FieldWidth) {
+		fields = append(fields, projectimage.FieldWidth)
+	}
+	if m.FieldCleared(projectimage.FieldHeight) {
+		fields = append(fields, projectimage.FieldHeight)
+	}
+	if m.FieldCleared(projectimage.FieldBlurhash) {
+		fields = append(fields, projectimage.FieldBlurhash)
+	}
+	if m.FieldCleared(projectimage.FieldDerivatives) {
+		fields = append(fields, projectimage.FieldDerivatives)
+	}
 	return fields
 }
 
@@ -25822,6 +26894,21 @@ func (m *ProjectImageMutation) ClearField(name string) error {
 	case projectimage.FieldImageType:
 		m.ClearImageType()
 		return nil
+	case projectimage.FieldContentHash:
+		m.ClearContentHash()
+		return nil
+	case projectimage.FieldWidth:
+		m.ClearWidth()
+		return nil
+	case projectimage.FieldHeight:
+		m.ClearHeight()
+		return nil
+	case projectimage.FieldBlurhash:
+		m.ClearBlurhash()
+		return nil
+	case projectimage.FieldDerivatives:
+		m.ClearDerivatives()
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectImage nullable field %s", name)
 }
@@ -25854,6 +26941,21 @@ func (m *ProjectImageMutation) ResetField(name string) error {
 	case projectimage.FieldUpdatedAt:
 		m.ResetUpdatedAt()
 		return nil
+	case projectimage.FieldContentHash:
+		m.ResetContentHash()
+		return nil
+	case projectimage.FieldWidth:
+		m.ResetWidth()
+		return nil
+	case projectimage.FieldHeight:
+		m.ResetHeight()
+		return nil
+	case projectimage.FieldBlurhash:
+		m.ResetBlurhash()
+		return nil
+	case projectimage.FieldDerivatives:
+		m.ResetDerivatives()
+		return nil
 	}
 	return fmt.Errorf("unknown ProjectImage field %s", name)
 }
@@ -3,6 +3,7 @@
 package ent
 
 import (
+	"encoding/json"
 	"fmt"
 	"silan-backend/internal/ent/project"
 	"silan-backend/internal/ent/projectdetail"
@@ -41,6 +42,10 @@ type ProjectDetail struct {
 	CreatedAt time.Time `json:"created_at,omitempty"`
 	// UpdatedAt holds the value of the "updated_at" field.
 	UpdatedAt time.Time `json:"updated_at,omitempty"`
+	// ContentHTML holds the value of the "content_html" field.
+	ContentHTML string `json:"content_html,omitempty"`
+	// Toc holds the value of the "toc" field.
+	Toc []map[string]interface{} `json:"toc,omitempty"`
 	// Edges holds the relations/edges for other nodes in the graph.
 	// The values are being populated by the ProjectDetailQuery when eager-loading is set.
 	Edges        ProjectDetailEdges `json:"edges"`
@@ -83,7 +88,9 @@ func (*ProjectDetail) scanValues(columns []string) ([]any, error) {
 	values := make([]any, len(columns))
 	for i := range columns {
 		switch columns[i] {
-		case projectdetail.FieldDetailedDescription, projectdetail.FieldGoals, projectdetail.FieldChallenges, projectdetail.FieldSolutions, projectdetail.FieldLessonsLearned, projectdetail.FieldFutureEnhancements, projectdetail.FieldLicense, projectdetail.FieldVersion:
+		case projectdetail.FieldToc:
+			values[i] = new([]byte)
+		case projectdetail.FieldDetailedDescription, projectdetail.FieldGoals, projectdetail.FieldChallenges, projectdetail.FieldSolutions, projectdetail.FieldLessonsLearned, projectdetail.FieldFutureEnhancements, projectdetail.FieldLicense, projectdetail.FieldVersion, projectdetail.FieldContentHTML:
 			values[i] = new(sql.NullString)
 		case projectdetail.FieldCreatedAt, projectdetail.FieldUpdatedAt:
 			values[i] = new(sql.NullTime)
@@ -176,6 +183,20 @@ func (pd *ProjectDetail) assignValues(columns []string, values []any) error {
 			} else if value.Valid {
 				pd.UpdatedAt = value.Time
 			}
+		case projectdetail.FieldContentHTML:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field content_html", values[i])
+			} else if value.Valid {
+				pd.ContentHTML = value.String
+			}
+		case projectdetail.FieldToc:
+			if value, ok := values[i].(*[]byte); !ok {
+				return fmt.Errorf("unexpected type %T for field toc", values[i])
+			} else if value != nil && len(*value) > 0 {
+				if err := json.Unmarshal(*value, &pd.Toc); err != nil {
+					return fmt.Errorf("unmarshal field toc: %w", err)
+				}
+			}
 		default:
 			pd.selectValues.Set(columns[i], values[i])
 		}
@@ -254,6 +275,12 @@ func (pd *ProjectDetail) String() string {
 	builder.WriteString(", ")
 	builder.WriteString("updated_at=")
 	builder.WriteString(pd.UpdatedAt.Format(time.ANSIC))
+	builder.WriteString(", ")
+	builder.WriteString("content_html=")
+	builder.WriteString(pd.ContentHTML)
+	builder.WriteString(", ")
+	builder.WriteString("toc=")
+	builder.WriteString(fmt.Sprintf("%v", pd.Toc))
 	builder.WriteByte(')')
 	return builder.String()
 }
@@ -111,6 +111,11 @@ func UpdatedAt(v time.Time) predicate.ProjectDetail {
 	return predicate.ProjectDetail(sql.FieldEQ(FieldUpdatedAt, v))
 }
 
+// ContentHTML applies equality check predicate on the "content_html" field. It's identical to ContentHTMLEQ.
+func ContentHTML(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldEQ(FieldContentHTML, v))
+}
+
 // ProjectIDEQ applies the EQ predicate on the "project_id" field.
 func ProjectIDEQ(v uuid.UUID) predicate.ProjectDetail {
 	return predicate.ProjectDetail(sql.FieldEQ(FieldProjectID, v))
@@ -811,6 +816,91 @@ func UpdatedAtLTE(v time.Time) predicate.ProjectDetail {
 	return predicate.ProjectDetail(sql.FieldLTE(FieldUpdatedAt, v))
 }
 
+// ContentHTMLEQ applies the EQ predicate on the "content_html" field.
+func ContentHTMLEQ(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLNEQ applies the NEQ predicate on the "content_html" field.
+func ContentHTMLNEQ(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldNEQ(FieldContentHTML, v))
+}
+
+// ContentHTMLIn applies the In predicate on the "content_html" field.
+func ContentHTMLIn(vs ...string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLNotIn applies the NotIn predicate on the "content_html" field.
+func ContentHTMLNotIn(vs ...string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldNotIn(FieldContentHTML, vs...))
+}
+
+// ContentHTMLGT applies the GT predicate on the "content_html" field.
+func ContentHTMLGT(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldGT(FieldContentHTML, v))
+}
+
+// ContentHTMLGTE applies the GTE predicate on the "content_html" field.
+func ContentHTMLGTE(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldGTE(FieldContentHTML, v))
+}
+
+// ContentHTMLLT applies the LT predicate on the "content_html" field.
+func ContentHTMLLT(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldLT(FieldContentHTML, v))
+}
+
+// ContentHTMLLTE applies the LTE predicate on the "content_html" field.
+func ContentHTMLLTE(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldLTE(FieldContentHTML, v))
+}
+
+// ContentHTMLContains applies the Contains predicate on the "content_html" field.
+func ContentHTMLContains(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldContains(FieldContentHTML, v))
+}
+
+// ContentHTMLHasPrefix applies the HasPrefix predicate on the "content_html" field.
+func ContentHTMLHasPrefix(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldHasPrefix(FieldContentHTML, v))
+}
+
+// ContentHTMLHasSuffix applies the HasSuffix predicate on the "content_html" field.
+func ContentHTMLHasSuffix(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldHasSuffix(FieldContentHTML, v))
+}
+
+// ContentHTMLIsNil applies the IsNil predicate on the "content_html" field.
+func ContentHTMLIsNil() predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldIsNull(FieldContentHTML))
+}
+
+// ContentHTMLNotNil applies the NotNil predicate on the "content_html" field.
+func ContentHTMLNotNil() predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldNotNull(FieldContentHTML))
+}
+
+// ContentHTMLEqualFold applies the EqualFold predicate on the "content_html" field.
+func ContentHTMLEqualFold(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldEqualFold(FieldContentHTML, v))
+}
+
+// ContentHTMLContainsFold applies the ContainsFold predicate on the "content_html" field.
+func ContentHTMLContainsFold(v string) predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldContainsFold(FieldContentHTML, v))
+}
+
+// TocIsNil applies the IsNil predicate on the "toc" field.
+func TocIsNil() predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldIsNull(FieldToc))
+}
+
+// TocNotNil applies the NotNil predicate on the "toc" field.
+func TocNotNil() predicate.ProjectDetail {
+	return predicate.ProjectDetail(sql.FieldNotNull(FieldToc))
+}
+
 // HasProject applies the HasEdge predicate on the "project" edge.
 func HasProject() predicate.ProjectDetail {
 	return predicate.ProjectDetail(func(s *sql.Selector) {
@@ -169,6 +169,26 @@ func (pdc *ProjectDetailCreate) SetNillableUpdatedAt(t *time.Time) *ProjectDetai
 	return pdc
 }
 
+// SetContentHTML sets the "content_html" field.
+func (pdc *ProjectDetailCreate) SetContentHTML(s string) *ProjectDetailCreate {
+	pdc.mutation.SetContentHTML(s)
+	return pdc
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (pdc *ProjectDetailCreate) SetNillableContentHTML(s *string) *ProjectDetailCreate {
+	if s != nil {
+		pdc.SetContentHTML(*s)
+	}
+	return pdc
+}
+
+// SetToc sets the "toc" field.
+func (pdc *ProjectDetailCreate) SetToc(m []map[string]interface{}) *ProjectDetailCreate {
+	pdc.mutation.SetToc(m)
+	return pdc
+}
+
 // SetID sets the "id" field.
 func (pdc *ProjectDetailCreate) SetID(u uuid.UUID) *ProjectDetailCreate {
 	pdc.mutation.SetID(u)
@@ -351,6 +371,14 @@ func (pdc *ProjectDetailCreate) createSpec() (*ProjectDetail, *sqlgraph.CreateSp
 		_spec.SetField(projectdetail.FieldUpdatedAt, field.TypeTime, value)
 		_node.UpdatedAt = value
 	}
+	if value, ok := pdc.mutation.ContentHTML(); ok {
+		_spec.SetField(projectdetail.FieldContentHTML, field.TypeString, value)
+		_node.ContentHTML = value
+	}
+	if value, ok := pdc.mutation.Toc(); ok {
+		_spec.SetField(projectdetail.FieldToc, field.TypeJSON, value)
+		_node.Toc = value
+	}
 	if nodes := pdc.mutation.ProjectIDs(); len(nodes) > 0 {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.O2O,
@@ -14,6 +14,7 @@ import (
 
 	"entgo.io/ent/dialect/sql"
 	"entgo.io/ent/dialect/sql/sqlgraph"
+	"entgo.io/ent/dialect/sql/sqljson"
 	"entgo.io/ent/schema/field"
 	"github.com/google/uuid"
 )
@@ -211,6 +212,44 @@ func (pdu *ProjectDetailUpdate) SetUpdatedAt(t time.Time) *ProjectDetailUpdate {
 	return pdu
 }
 
+// SetContentHTML sets the "content_html" field.
+func (pdu *ProjectDetailUpdate) SetContentHTML(s string) *ProjectDetailUpdate {
+	pdu.mutation.SetContentHTML(s)
+	return pdu
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (pdu *ProjectDetailUpdate) SetNillableContentHTML(s *string) *ProjectDetailUpdate {
+	if s != nil {
+		pdu.SetContentHTML(*s)
+	}
+	return pdu
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (pdu *ProjectDetailUpdate) ClearContentHTML() *ProjectDetailUpdate {
+	pdu.mutation.ClearContentHTML()
+	return pdu
+}
+
+// SetToc sets the "toc" field.
+func (pdu *ProjectDetailUpdate) SetToc(m []map[string]interface{}) *ProjectDetailUpdate {
+	pdu.mutation.SetToc(m)
+	return pdu
+}
+
+// AppendToc appends m to the "toc" field.
+func (pdu *ProjectDetailUpdate) AppendToc(m []map[string]interface{}) *ProjectDetailUpdate {
+	pdu.mutation.AppendToc(m)
+	return pdu
+}
+
+// ClearToc clears the value of the "toc" field.
+func (pdu *ProjectDetailUpdate) ClearToc() *ProjectDetailUpdate {
+	pdu.mutation.ClearToc()
+	return pdu
+}
+
 // SetProject sets the "project" edge to the Project entity.
 func (pdu *ProjectDetailUpdate) SetProject(p *Project) *ProjectDetailUpdate {
 	return pdu.SetProjectID(p.ID)
@@ -380,6 +419,23 @@ func (pdu *ProjectDetailUpdate) sqlSave(ctx context.Context) (n int, err error)
 	if value, ok := pdu.mutation.UpdatedAt(); ok {
 		_spec.SetField(projectdetail.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := pdu.mutation.ContentHTML(); ok {
+		_spec.SetField(projectdetail.FieldContentHTML, field.TypeString, value)
+	}
+	if pdu.mutation.ContentHTMLCleared() {
+		_spec.ClearField(projectdetail.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := pdu.mutation.Toc(); ok {
+		_spec.SetField(projectdetail.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := pdu.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, projectdetail.FieldToc, value)
+		})
+	}
+	if pdu.mutation.TocCleared() {
+		_spec.ClearField(projectdetail.FieldToc, field.TypeJSON)
+	}
 	if pdu.mutation.ProjectCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.O2O,
@@ -654,6 +710,44 @@ func (pduo *ProjectDetailUpdateOne) SetUpdatedAt(t time.Time) *ProjectDetailUpda
 	return pduo
 }
 
+// SetContentHTML sets the "content_html" field.
+func (pduo *ProjectDetailUpdateOne) SetContentHTML(s string) *ProjectDetailUpdateOne {
+	pduo.mutation.SetContentHTML(s)
+	return pduo
+}
+
+// SetNillableContentHTML sets the "content_html" field if the given value is not nil.
+func (pduo *ProjectDetailUpdateOne) SetNillableContentHTML(s *string) *ProjectDetailUpdateOne {
+	if s != nil {
+		pduo.SetContentHTML(*s)
+	}
+	return pduo
+}
+
+// ClearContentHTML clears the value of the "content_html" field.
+func (pduo *ProjectDetailUpdateOne) ClearContentHTML() *ProjectDetailUpdateOne {
+	pduo.mutation.ClearContentHTML()
+	return pduo
+}
+
+// SetToc sets the "toc" field.
+func (pduo *ProjectDetailUpdateOne) SetToc(m []map[string]interface{}) *ProjectDetailUpdateOne {
+	pduo.mutation.SetToc(m)
+	return pduo
+}
+
+// AppendToc appends m to the "toc" field.
+func (pduo *ProjectDetailUpdateOne) AppendToc(m []map[string]interface{}) *ProjectDetailUpdateOne {
+	pduo.mutation.AppendToc(m)
+	return pduo
+}
+
+// ClearToc clears the value of the "toc" field.
+func (pduo *ProjectDetailUpdateOne) ClearToc() *ProjectDetailUpdateOne {
+	pduo.mutation.ClearToc()
+	return pduo
+}
+
 // SetProject sets the "project" edge to the Project entity.
 func (pduo *ProjectDetailUpdateOne) SetProject(p *Project) *ProjectDetailUpdateOne {
 	return pduo.SetProjectID(p.ID)
@@ -853,6 +947,23 @@ func (pduo *ProjectDetailUpdateOne) sqlSave(ctx context.Context) (_node *Project
 	if value, ok := pduo.mutation.UpdatedAt(); ok {
 		_spec.SetField(projectdetail.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := pduo.mutation.ContentHTML(); ok {
+		_spec.SetField(projectdetail.FieldContentHTML, field.TypeString, value)
+	}
+	if pduo.mutation.ContentHTMLCleared() {
+		_spec.ClearField(projectdetail.FieldContentHTML, field.TypeString)
+	}
+	if value, ok := pduo.mutation.Toc(); ok {
+		_spec.SetField(projectdetail.FieldToc, field.TypeJSON, value)
+	}
+	if value, ok := pduo.mutation.AppendedToc(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, projectdetail.FieldToc, value)
+		})
+	}
+	if pduo.mutation.TocCleared() {
+		_spec.ClearField(projectdetail.FieldToc, field.TypeJSON)
+	}
 	if pduo.mutation.ProjectCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.O2O,
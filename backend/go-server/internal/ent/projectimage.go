@@ -3,6 +3,7 @@
 package ent
 
 import (
+	"encoding/json"
 	"fmt"
 	"silan-backend/internal/ent/project"
 	"silan-backend/internal/ent/projectimage"
@@ -35,6 +36,16 @@ type ProjectImage struct {
 	CreatedAt time.Time `json:"created_at,omitempty"`
 	// UpdatedAt holds the value of the "updated_at" field.
 	UpdatedAt time.Time `json:"updated_at,omitempty"`
+	// ContentHash holds the value of the "content_hash" field.
+	ContentHash string `json:"content_hash,omitempty"`
+	// Width holds the value of the "width" field.
+	Width int `json:"width,omitempty"`
+	// Height holds the value of the "height" field.
+	Height int `json:"height,omitempty"`
+	// Blurhash holds the value of the "blurhash" field.
+	Blurhash string `json:"blurhash,omitempty"`
+	// Derivatives holds the value of the "derivatives" field.
+	Derivatives []map[string]interface{} `json:"derivatives,omitempty"`
 	// Edges holds the relations/edges for other nodes in the graph.
 	// The values are being populated by the ProjectImageQuery when eager-loading is set.
 	Edges        ProjectImageEdges `json:"edges"`
@@ -77,9 +88,11 @@ func (*ProjectImage) scanValues(columns []string) ([]any, error) {
 	values := make([]any, len(columns))
 	for i := range columns {
 		switch columns[i] {
-		case projectimage.FieldSortOrder:
+		case projectimage.FieldDerivatives:
+			values[i] = new([]byte)
+		case projectimage.FieldSortOrder, projectimage.FieldWidth, projectimage.FieldHeight:
 			values[i] = new(sql.NullInt64)
-		case projectimage.FieldImageURL, projectimage.FieldAltText, projectimage.FieldCaption, projectimage.FieldImageType:
+		case projectimage.FieldImageURL, projectimage.FieldAltText, projectimage.FieldCaption, projectimage.FieldImageType, projectimage.FieldContentHash, projectimage.FieldBlurhash:
 			values[i] = new(sql.NullString)
 		case projectimage.FieldCreatedAt, projectimage.FieldUpdatedAt:
 			values[i] = new(sql.NullTime)
@@ -154,6 +167,38 @@ func (pi *ProjectImage) assignValues(columns []string, values []any) error {
 			} else if value.Valid {
 				pi.UpdatedAt = value.Time
 			}
+		case projectimage.FieldContentHash:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field content_hash", values[i])
+			} else if value.Valid {
+				pi.ContentHash = value.String
+			}
+		case projectimage.FieldWidth:
+			if value, ok := values[i].(*sql.NullInt64); !ok {
+				return fmt.Errorf("unexpected type %T for field width", values[i])
+			} else if value.Valid {
+				pi.Width = int(value.Int64)
+			}
+		case projectimage.FieldHeight:
+			if value, ok := values[i].(*sql.NullInt64); !ok {
+				return fmt.Errorf("unexpected type %T for field height", values[i])
+			} else if value.Valid {
+				pi.Height = int(value.Int64)
+			}
+		case projectimage.FieldBlurhash:
+			if value, ok := values[i].(*sql.NullString); !ok {
+				return fmt.Errorf("unexpected type %T for field blurhash", values[i])
+			} else if value.Valid {
+				pi.Blurhash = value.String
+			}
+		case projectimage.FieldDerivatives:
+			if value, ok := values[i].(*[]byte); !ok {
+				return fmt.Errorf("unexpected type %T for field derivatives", values[i])
+			} else if value != nil && len(*value) > 0 {
+				if err := json.Unmarshal(*value, &pi.Derivatives); err != nil {
+					return fmt.Errorf("unmarshal field derivatives: %w", err)
+				}
+			}
 		default:
 			pi.selectValues.Set(columns[i], values[i])
 		}
@@ -223,6 +268,21 @@ func (pi *ProjectImage) String() string {
 	builder.WriteString(", ")
 	builder.WriteString("updated_at=")
 	builder.WriteString(pi.UpdatedAt.Format(time.ANSIC))
+	builder.WriteString(", ")
+	builder.WriteString("content_hash=")
+	builder.WriteString(pi.ContentHash)
+	builder.WriteString(", ")
+	builder.WriteString("width=")
+	builder.WriteString(fmt.Sprintf("%v", pi.Width))
+	builder.WriteString(", ")
+	builder.WriteString("height=")
+	builder.WriteString(fmt.Sprintf("%v", pi.Height))
+	builder.WriteString(", ")
+	builder.WriteString("blurhash=")
+	builder.WriteString(pi.Blurhash)
+	builder.WriteString(", ")
+	builder.WriteString("derivatives=")
+	builder.WriteString(fmt.Sprintf("%v", pi.Derivatives))
 	builder.WriteByte(')')
 	return builder.String()
 }
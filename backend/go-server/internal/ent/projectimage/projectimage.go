@@ -31,6 +31,16 @@ const (
 	FieldCreatedAt = "created_at"
 	// FieldUpdatedAt holds the string denoting the updated_at field in the database.
 	FieldUpdatedAt = "updated_at"
+	// FieldContentHash holds the string denoting the content_hash field in the database.
+	FieldContentHash = "content_hash"
+	// FieldWidth holds the string denoting the width field in the database.
+	FieldWidth = "width"
+	// FieldHeight holds the string denoting the height field in the database.
+	FieldHeight = "height"
+	// FieldBlurhash holds the string denoting the blurhash field in the database.
+	FieldBlurhash = "blurhash"
+	// FieldDerivatives holds the string denoting the derivatives field in the database.
+	FieldDerivatives = "derivatives"
 	// EdgeProject holds the string denoting the project edge name in mutations.
 	EdgeProject = "project"
 	// EdgeTranslations holds the string denoting the translations edge name in mutations.
@@ -64,6 +74,11 @@ var Columns = []string{
 	FieldSortOrder,
 	FieldCreatedAt,
 	FieldUpdatedAt,
+	FieldContentHash,
+	FieldWidth,
+	FieldHeight,
+	FieldBlurhash,
+	FieldDerivatives,
 }
 
 // ValidColumn reports if the column name is valid (part of the table columns).
@@ -91,6 +106,10 @@ var (
 	DefaultUpdatedAt func() time.Time
 	// UpdateDefaultUpdatedAt holds the default value on update for the "updated_at" field.
 	UpdateDefaultUpdatedAt func() time.Time
+	// ContentHashValidator is a validator for the "content_hash" field. It is called by the builders before save.
+	ContentHashValidator func(string) error
+	// BlurhashValidator is a validator for the "blurhash" field. It is called by the builders before save.
+	BlurhashValidator func(string) error
 	// DefaultID holds the default value on creation for the "id" field.
 	DefaultID func() uuid.UUID
 )
@@ -143,6 +162,26 @@ func ByUpdatedAt(opts ...sql.OrderTermOption) OrderOption {
 	return sql.OrderByField(FieldUpdatedAt, opts...).ToFunc()
 }
 
+// ByContentHash orders the results by the content_hash field.
+func ByContentHash(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldContentHash, opts...).ToFunc()
+}
+
+// ByWidth orders the results by the width field.
+func ByWidth(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldWidth, opts...).ToFunc()
+}
+
+// ByHeight orders the results by the height field.
+func ByHeight(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldHeight, opts...).ToFunc()
+}
+
+// ByBlurhash orders the results by the blurhash field.
+func ByBlurhash(opts ...sql.OrderTermOption) OrderOption {
+	return sql.OrderByField(FieldBlurhash, opts...).ToFunc()
+}
+
 // ByProjectField orders the results by project field.
 func ByProjectField(field string, opts ...sql.OrderTermOption) OrderOption {
 	return func(s *sql.Selector) {
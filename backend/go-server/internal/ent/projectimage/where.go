@@ -96,6 +96,26 @@ func UpdatedAt(v time.Time) predicate.ProjectImage {
 	return predicate.ProjectImage(sql.FieldEQ(FieldUpdatedAt, v))
 }
 
+// ContentHash applies equality check predicate on the "content_hash" field. It's identical to ContentHashEQ.
+func ContentHash(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldContentHash, v))
+}
+
+// Width applies equality check predicate on the "width" field. It's identical to WidthEQ.
+func Width(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldWidth, v))
+}
+
+// Height applies equality check predicate on the "height" field. It's identical to HeightEQ.
+func Height(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldHeight, v))
+}
+
+// Blurhash applies equality check predicate on the "blurhash" field. It's identical to BlurhashEQ.
+func Blurhash(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldBlurhash, v))
+}
+
 // ProjectIDEQ applies the EQ predicate on the "project_id" field.
 func ProjectIDEQ(v uuid.UUID) predicate.ProjectImage {
 	return predicate.ProjectImage(sql.FieldEQ(FieldProjectID, v))
@@ -526,6 +546,266 @@ func UpdatedAtLTE(v time.Time) predicate.ProjectImage {
 	return predicate.ProjectImage(sql.FieldLTE(FieldUpdatedAt, v))
 }
 
+// ContentHashEQ applies the EQ predicate on the "content_hash" field.
+func ContentHashEQ(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldContentHash, v))
+}
+
+// ContentHashNEQ applies the NEQ predicate on the "content_hash" field.
+func ContentHashNEQ(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNEQ(FieldContentHash, v))
+}
+
+// ContentHashIn applies the In predicate on the "content_hash" field.
+func ContentHashIn(vs ...string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIn(FieldContentHash, vs...))
+}
+
+// ContentHashNotIn applies the NotIn predicate on the "content_hash" field.
+func ContentHashNotIn(vs ...string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotIn(FieldContentHash, vs...))
+}
+
+// ContentHashGT applies the GT predicate on the "content_hash" field.
+func ContentHashGT(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGT(FieldContentHash, v))
+}
+
+// ContentHashGTE applies the GTE predicate on the "content_hash" field.
+func ContentHashGTE(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGTE(FieldContentHash, v))
+}
+
+// ContentHashLT applies the LT predicate on the "content_hash" field.
+func ContentHashLT(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLT(FieldContentHash, v))
+}
+
+// ContentHashLTE applies the LTE predicate on the "content_hash" field.
+func ContentHashLTE(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLTE(FieldContentHash, v))
+}
+
+// ContentHashContains applies the Contains predicate on the "content_hash" field.
+func ContentHashContains(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldContains(FieldContentHash, v))
+}
+
+// ContentHashHasPrefix applies the HasPrefix predicate on the "content_hash" field.
+func ContentHashHasPrefix(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldHasPrefix(FieldContentHash, v))
+}
+
+// ContentHashHasSuffix applies the HasSuffix predicate on the "content_hash" field.
+func ContentHashHasSuffix(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldHasSuffix(FieldContentHash, v))
+}
+
+// ContentHashIsNil applies the IsNil predicate on the "content_hash" field.
+func ContentHashIsNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIsNull(FieldContentHash))
+}
+
+// ContentHashNotNil applies the NotNil predicate on the "content_hash" field.
+func ContentHashNotNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotNull(FieldContentHash))
+}
+
+// ContentHashEqualFold applies the EqualFold predicate on the "content_hash" field.
+func ContentHashEqualFold(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEqualFold(FieldContentHash, v))
+}
+
+// ContentHashContainsFold applies the ContainsFold predicate on the "content_hash" field.
+func ContentHashContainsFold(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldContainsFold(FieldContentHash, v))
+}
+
+// WidthEQ applies the EQ predicate on the "width" field.
+func WidthEQ(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldWidth, v))
+}
+
+// WidthNEQ applies the NEQ predicate on the "width" field.
+func WidthNEQ(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNEQ(FieldWidth, v))
+}
+
+// WidthIn applies the In predicate on the "width" field.
+func WidthIn(vs ...int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIn(FieldWidth, vs...))
+}
+
+// WidthNotIn applies the NotIn predicate on the "width" field.
+func WidthNotIn(vs ...int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotIn(FieldWidth, vs...))
+}
+
+// WidthGT applies the GT predicate on the "width" field.
+func WidthGT(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGT(FieldWidth, v))
+}
+
+// WidthGTE applies the GTE predicate on the "width" field.
+func WidthGTE(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGTE(FieldWidth, v))
+}
+
+// WidthLT applies the LT predicate on the "width" field.
+func WidthLT(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLT(FieldWidth, v))
+}
+
+// WidthLTE applies the LTE predicate on the "width" field.
+func WidthLTE(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLTE(FieldWidth, v))
+}
+
+// WidthIsNil applies the IsNil predicate on the "width" field.
+func WidthIsNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIsNull(FieldWidth))
+}
+
+// WidthNotNil applies the NotNil predicate on the "width" field.
+func WidthNotNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotNull(FieldWidth))
+}
+
+// HeightEQ applies the EQ predicate on the "height" field.
+func HeightEQ(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldHeight, v))
+}
+
+// HeightNEQ applies the NEQ predicate on the "height" field.
+func HeightNEQ(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNEQ(FieldHeight, v))
+}
+
+// HeightIn applies the In predicate on the "height" field.
+func HeightIn(vs ...int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIn(FieldHeight, vs...))
+}
+
+// HeightNotIn applies the NotIn predicate on the "height" field.
+func HeightNotIn(vs ...int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotIn(FieldHeight, vs...))
+}
+
+// HeightGT applies the GT predicate on the "height" field.
+func HeightGT(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGT(FieldHeight, v))
+}
+
+// HeightGTE applies the GTE predicate on the "height" field.
+func HeightGTE(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGTE(FieldHeight, v))
+}
+
+// HeightLT applies the LT predicate on the "height" field.
+func HeightLT(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLT(FieldHeight, v))
+}
+
+// HeightLTE applies the LTE predicate on the "height" field.
+func HeightLTE(v int) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLTE(FieldHeight, v))
+}
+
+// HeightIsNil applies the IsNil predicate on the "height" field.
+func HeightIsNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIsNull(FieldHeight))
+}
+
+// HeightNotNil applies the NotNil predicate on the "height" field.
+func HeightNotNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotNull(FieldHeight))
+}
+
+// BlurhashEQ applies the EQ predicate on the "blurhash" field.
+func BlurhashEQ(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEQ(FieldBlurhash, v))
+}
+
+// BlurhashNEQ applies the NEQ predicate on the "blurhash" field.
+func BlurhashNEQ(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNEQ(FieldBlurhash, v))
+}
+
+// BlurhashIn applies the In predicate on the "blurhash" field.
+func BlurhashIn(vs ...string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIn(FieldBlurhash, vs...))
+}
+
+// BlurhashNotIn applies the NotIn predicate on the "blurhash" field.
+func BlurhashNotIn(vs ...string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotIn(FieldBlurhash, vs...))
+}
+
+// BlurhashGT applies the GT predicate on the "blurhash" field.
+func BlurhashGT(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGT(FieldBlurhash, v))
+}
+
+// BlurhashGTE applies the GTE predicate on the "blurhash" field.
+func BlurhashGTE(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldGTE(FieldBlurhash, v))
+}
+
+// BlurhashLT applies the LT predicate on the "blurhash" field.
+func BlurhashLT(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLT(FieldBlurhash, v))
+}
+
+// BlurhashLTE applies the LTE predicate on the "blurhash" field.
+func BlurhashLTE(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldLTE(FieldBlurhash, v))
+}
+
+// BlurhashContains applies the Contains predicate on the "blurhash" field.
+func BlurhashContains(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldContains(FieldBlurhash, v))
+}
+
+// BlurhashHasPrefix applies the HasPrefix predicate on the "blurhash" field.
+func BlurhashHasPrefix(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldHasPrefix(FieldBlurhash, v))
+}
+
+// BlurhashHasSuffix applies the HasSuffix predicate on the "blurhash" field.
+func BlurhashHasSuffix(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldHasSuffix(FieldBlurhash, v))
+}
+
+// BlurhashIsNil applies the IsNil predicate on the "blurhash" field.
+func BlurhashIsNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIsNull(FieldBlurhash))
+}
+
+// BlurhashNotNil applies the NotNil predicate on the "blurhash" field.
+func BlurhashNotNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotNull(FieldBlurhash))
+}
+
+// BlurhashEqualFold applies the EqualFold predicate on the "blurhash" field.
+func BlurhashEqualFold(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldEqualFold(FieldBlurhash, v))
+}
+
+// BlurhashContainsFold applies the ContainsFold predicate on the "blurhash" field.
+func BlurhashContainsFold(v string) predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldContainsFold(FieldBlurhash, v))
+}
+
+// DerivativesIsNil applies the IsNil predicate on the "derivatives" field.
+func DerivativesIsNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldIsNull(FieldDerivatives))
+}
+
+// DerivativesNotNil applies the NotNil predicate on the "derivatives" field.
+func DerivativesNotNil() predicate.ProjectImage {
+	return predicate.ProjectImage(sql.FieldNotNull(FieldDerivatives))
+}
+
 // HasProject applies the HasEdge predicate on the "project" edge.
 func HasProject() predicate.ProjectImage {
 	return predicate.ProjectImage(func(s *sql.Selector) {
@@ -119,6 +119,68 @@ func (pic *ProjectImageCreate) SetNillableUpdatedAt(t *time.Time) *ProjectImageC
 	return pic
 }
 
+// SetContentHash sets the "content_hash" field.
+func (pic *ProjectImageCreate) SetContentHash(s string) *ProjectImageCreate {
+	pic.mutation.SetContentHash(s)
+	return pic
+}
+
+// SetNillableContentHash sets the "content_hash" field if the given value is not nil.
+func (pic *ProjectImageCreate) SetNillableContentHash(s *string) *ProjectImageCreate {
+	if s != nil {
+		pic.SetContentHash(*s)
+	}
+	return pic
+}
+
+// SetWidth sets the "width" field.
+func (pic *ProjectImageCreate) SetWidth(i int) *ProjectImageCreate {
+	pic.mutation.SetWidth(i)
+	return pic
+}
+
+// SetNillableWidth sets the "width" field if the given value is not nil.
+func (pic *ProjectImageCreate) SetNillableWidth(i *int) *ProjectImageCreate {
+	if i != nil {
+		pic.SetWidth(*i)
+	}
+	return pic
+}
+
+// SetHeight sets the "height" field.
+func (pic *ProjectImageCreate) SetHeight(i int) *ProjectImageCreate {
+	pic.mutation.SetHeight(i)
+	return pic
+}
+
+// SetNillableHeight sets the "height" field if the given value is not nil.
+func (pic *ProjectImageCreate) SetNillableHeight(i *int) *ProjectImageCreate {
+	if i != nil {
+		pic.SetHeight(*i)
+	}
+	return pic
+}
+
+// SetBlurhash sets the "blurhash" field.
+func (pic *ProjectImageCreate) SetBlurhash(s string) *ProjectImageCreate {
+	pic.mutation.SetBlurhash(s)
+	return pic
+}
+
+// SetNillableBlurhash sets the "blurhash" field if the given value is not nil.
+func (pic *ProjectImageCreate) SetNillableBlurhash(s *string) *ProjectImageCreate {
+	if s != nil {
+		pic.SetBlurhash(*s)
+	}
+	return pic
+}
+
+// SetDerivatives sets the "derivatives" field.
+func (pic *ProjectImageCreate) SetDerivatives(m []map[string]interface{}) *ProjectImageCreate {
+	pic.mutation.SetDerivatives(m)
+	return pic
+}
+
 // SetID sets the "id" field.
 func (pic *ProjectImageCreate) SetID(u uuid.UUID) *ProjectImageCreate {
 	pic.mutation.SetID(u)
@@ -238,6 +300,16 @@ func (pic *ProjectImageCreate) check() error {
 	if _, ok := pic.mutation.UpdatedAt(); !ok {
 		return &ValidationError{Name: "updated_at", err: errors.New(`ent: missing required field "ProjectImage.updated_at"`)}
 	}
+	if v, ok := pic.mutation.ContentHash(); ok {
+		if err := projectimage.ContentHashValidator(v); err != nil {
+			return &ValidationError{Name: "content_hash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.content_hash": %w`, err)}
+		}
+	}
+	if v, ok := pic.mutation.Blurhash(); ok {
+		if err := projectimage.BlurhashValidator(v); err != nil {
+			return &ValidationError{Name: "blurhash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.blurhash": %w`, err)}
+		}
+	}
 	if len(pic.mutation.ProjectIDs()) == 0 {
 		return &ValidationError{Name: "project", err: errors.New(`ent: missing required edge "ProjectImage.project"`)}
 	}
@@ -304,6 +376,26 @@ func (pic *ProjectImageCreate) createSpec() (*ProjectImage, *sqlgraph.CreateSpec
 		_spec.SetField(projectimage.FieldUpdatedAt, field.TypeTime, value)
 		_node.UpdatedAt = value
 	}
+	if value, ok := pic.mutation.ContentHash(); ok {
+		_spec.SetField(projectimage.FieldContentHash, field.TypeString, value)
+		_node.ContentHash = value
+	}
+	if value, ok := pic.mutation.Width(); ok {
+		_spec.SetField(projectimage.FieldWidth, field.TypeInt, value)
+		_node.Width = value
+	}
+	if value, ok := pic.mutation.Height(); ok {
+		_spec.SetField(projectimage.FieldHeight, field.TypeInt, value)
+		_node.Height = value
+	}
+	if value, ok := pic.mutation.Blurhash(); ok {
+		_spec.SetField(projectimage.FieldBlurhash, field.TypeString, value)
+		_node.Blurhash = value
+	}
+	if value, ok := pic.mutation.Derivatives(); ok {
+		_spec.SetField(projectimage.FieldDerivatives, field.TypeJSON, value)
+		_node.Derivatives = value
+	}
 	if nodes := pic.mutation.ProjectIDs(); len(nodes) > 0 {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
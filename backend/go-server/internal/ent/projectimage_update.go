@@ -14,6 +14,7 @@ import (
 
 	"entgo.io/ent/dialect/sql"
 	"entgo.io/ent/dialect/sql/sqlgraph"
+	"entgo.io/ent/dialect/sql/sqljson"
 	"entgo.io/ent/schema/field"
 	"github.com/google/uuid"
 )
@@ -146,6 +147,118 @@ func (piu *ProjectImageUpdate) SetUpdatedAt(t time.Time) *ProjectImageUpdate {
 	return piu
 }
 
+// SetContentHash sets the "content_hash" field.
+func (piu *ProjectImageUpdate) SetContentHash(s string) *ProjectImageUpdate {
+	piu.mutation.SetContentHash(s)
+	return piu
+}
+
+// SetNillableContentHash sets the "content_hash" field if the given value is not nil.
+func (piu *ProjectImageUpdate) SetNillableContentHash(s *string) *ProjectImageUpdate {
+	if s != nil {
+		piu.SetContentHash(*s)
+	}
+	return piu
+}
+
+// ClearContentHash clears the value of the "content_hash" field.
+func (piu *ProjectImageUpdate) ClearContentHash() *ProjectImageUpdate {
+	piu.mutation.ClearContentHash()
+	return piu
+}
+
+// SetWidth sets the "width" field.
+func (piu *ProjectImageUpdate) SetWidth(i int) *ProjectImageUpdate {
+	piu.mutation.ResetWidth()
+	piu.mutation.SetWidth(i)
+	return piu
+}
+
+// SetNillableWidth sets the "width" field if the given value is not nil.
+func (piu *ProjectImageUpdate) SetNillableWidth(i *int) *ProjectImageUpdate {
+	if i != nil {
+		piu.SetWidth(*i)
+	}
+	return piu
+}
+
+// AddWidth adds i to the "width" field.
+func (piu *ProjectImageUpdate) AddWidth(i int) *ProjectImageUpdate {
+	piu.mutation.AddWidth(i)
+	return piu
+}
+
+// ClearWidth clears the value of the "width" field.
+func (piu *ProjectImageUpdate) ClearWidth() *ProjectImageUpdate {
+	piu.mutation.ClearWidth()
+	return piu
+}
+
+// SetHeight sets the "height" field.
+func (piu *ProjectImageUpdate) SetHeight(i int) *ProjectImageUpdate {
+	piu.mutation.ResetHeight()
+	piu.mutation.SetHeight(i)
+	return piu
+}
+
+// SetNillableHeight sets the "height" field if the given value is not nil.
+func (piu *ProjectImageUpdate) SetNillableHeight(i *int) *ProjectImageUpdate {
+	if i != nil {
+		piu.SetHeight(*i)
+	}
+	return piu
+}
+
+// AddHeight adds i to the "height" field.
+func (piu *ProjectImageUpdate) AddHeight(i int) *ProjectImageUpdate {
+	piu.mutation.AddHeight(i)
+	return piu
+}
+
+// ClearHeight clears the value of the "height" field.
+func (piu *ProjectImageUpdate) ClearHeight() *ProjectImageUpdate {
+	piu.mutation.ClearHeight()
+	return piu
+}
+
+// SetBlurhash sets the "blurhash" field.
+func (piu *ProjectImageUpdate) SetBlurhash(s string) *ProjectImageUpdate {
+	piu.mutation.SetBlurhash(s)
+	return piu
+}
+
+// SetNillableBlurhash sets the "blurhash" field if the given value is not nil.
+func (piu *ProjectImageUpdate) SetNillableBlurhash(s *string) *ProjectImageUpdate {
+	if s != nil {
+		piu.SetBlurhash(*s)
+	}
+	return piu
+}
+
+// ClearBlurhash clears the value of the "blurhash" field.
+func (piu *ProjectImageUpdate) ClearBlurhash() *ProjectImageUpdate {
+	piu.mutation.ClearBlurhash()
+	return piu
+}
+
+// SetDerivatives sets the "derivatives" field.
+func (piu *ProjectImageUpdate) SetDerivatives(m []map[string]interface{}) *ProjectImageUpdate {
+	piu.mutation.SetDerivatives(m)
+	return piu
+}
+
+// AppendDerivatives appends m to the "derivatives" field.
+func (piu *ProjectImageUpdate) AppendDerivatives(m []map[string]interface{}) *ProjectImageUpdate {
+	piu.mutation.AppendDerivatives(m)
+	return piu
+}
+
+// ClearDerivatives clears the value of the "derivatives" field.
+func (piu *ProjectImageUpdate) ClearDerivatives() *ProjectImageUpdate {
+	piu.mutation.ClearDerivatives()
+	return piu
+}
+
 // SetProject sets the "project" edge to the Project entity.
 func (piu *ProjectImageUpdate) SetProject(p *Project) *ProjectImageUpdate {
 	return piu.SetProjectID(p.ID)
@@ -251,6 +364,16 @@ func (piu *ProjectImageUpdate) check() error {
 			return &ValidationError{Name: "image_type", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.image_type": %w`, err)}
 		}
 	}
+	if v, ok := piu.mutation.ContentHash(); ok {
+		if err := projectimage.ContentHashValidator(v); err != nil {
+			return &ValidationError{Name: "content_hash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.content_hash": %w`, err)}
+		}
+	}
+	if v, ok := piu.mutation.Blurhash(); ok {
+		if err := projectimage.BlurhashValidator(v); err != nil {
+			return &ValidationError{Name: "blurhash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.blurhash": %w`, err)}
+		}
+	}
 	if piu.mutation.ProjectCleared() && len(piu.mutation.ProjectIDs()) > 0 {
 		return errors.New(`ent: clearing a required unique edge "ProjectImage.project"`)
 	}
@@ -299,6 +422,47 @@ func (piu *ProjectImageUpdate) sqlSave(ctx context.Context) (n int, err error) {
 	if value, ok := piu.mutation.UpdatedAt(); ok {
 		_spec.SetField(projectimage.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := piu.mutation.ContentHash(); ok {
+		_spec.SetField(projectimage.FieldContentHash, field.TypeString, value)
+	}
+	if piu.mutation.ContentHashCleared() {
+		_spec.ClearField(projectimage.FieldContentHash, field.TypeString)
+	}
+	if value, ok := piu.mutation.Width(); ok {
+		_spec.SetField(projectimage.FieldWidth, field.TypeInt, value)
+	}
+	if value, ok := piu.mutation.AddedWidth(); ok {
+		_spec.AddField(projectimage.FieldWidth, field.TypeInt, value)
+	}
+	if piu.mutation.WidthCleared() {
+		_spec.ClearField(projectimage.FieldWidth, field.TypeInt)
+	}
+	if value, ok := piu.mutation.Height(); ok {
+		_spec.SetField(projectimage.FieldHeight, field.TypeInt, value)
+	}
+	if value, ok := piu.mutation.AddedHeight(); ok {
+		_spec.AddField(projectimage.FieldHeight, field.TypeInt, value)
+	}
+	if piu.mutation.HeightCleared() {
+		_spec.ClearField(projectimage.FieldHeight, field.TypeInt)
+	}
+	if value, ok := piu.mutation.Blurhash(); ok {
+		_spec.SetField(projectimage.FieldBlurhash, field.TypeString, value)
+	}
+	if piu.mutation.BlurhashCleared() {
+		_spec.ClearField(projectimage.FieldBlurhash, field.TypeString)
+	}
+	if value, ok := piu.mutation.Derivatives(); ok {
+		_spec.SetField(projectimage.FieldDerivatives, field.TypeJSON, value)
+	}
+	if value, ok := piu.mutation.AppendedDerivatives(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, projectimage.FieldDerivatives, value)
+		})
+	}
+	if piu.mutation.DerivativesCleared() {
+		_spec.ClearField(projectimage.FieldDerivatives, field.TypeJSON)
+	}
 	if piu.mutation.ProjectCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -508,6 +672,118 @@ func (piuo *ProjectImageUpdateOne) SetUpdatedAt(t time.Time) *ProjectImageUpdate
 	return piuo
 }
 
+// SetContentHash sets the "content_hash" field.
+func (piuo *ProjectImageUpdateOne) SetContentHash(s string) *ProjectImageUpdateOne {
+	piuo.mutation.SetContentHash(s)
+	return piuo
+}
+
+// SetNillableContentHash sets the "content_hash" field if the given value is not nil.
+func (piuo *ProjectImageUpdateOne) SetNillableContentHash(s *string) *ProjectImageUpdateOne {
+	if s != nil {
+		piuo.SetContentHash(*s)
+	}
+	return piuo
+}
+
+// ClearContentHash clears the value of the "content_hash" field.
+func (piuo *ProjectImageUpdateOne) ClearContentHash() *ProjectImageUpdateOne {
+	piuo.mutation.ClearContentHash()
+	return piuo
+}
+
+// SetWidth sets the "width" field.
+func (piuo *ProjectImageUpdateOne) SetWidth(i int) *ProjectImageUpdateOne {
+	piuo.mutation.ResetWidth()
+	piuo.mutation.SetWidth(i)
+	return piuo
+}
+
+// SetNillableWidth sets the "width" field if the given value is not nil.
+func (piuo *ProjectImageUpdateOne) SetNillableWidth(i *int) *ProjectImageUpdateOne {
+	if i != nil {
+		piuo.SetWidth(*i)
+	}
+	return piuo
+}
+
+// AddWidth adds i to the "width" field.
+func (piuo *ProjectImageUpdateOne) AddWidth(i int) *ProjectImageUpdateOne {
+	piuo.mutation.AddWidth(i)
+	return piuo
+}
+
+// ClearWidth clears the value of the "width" field.
+func (piuo *ProjectImageUpdateOne) ClearWidth() *ProjectImageUpdateOne {
+	piuo.mutation.ClearWidth()
+	return piuo
+}
+
+// SetHeight sets the "height" field.
+func (piuo *ProjectImageUpdateOne) SetHeight(i int) *ProjectImageUpdateOne {
+	piuo.mutation.ResetHeight()
+	piuo.mutation.SetHeight(i)
+	return piuo
+}
+
+// SetNillableHeight sets the "height" field if the given value is not nil.
+func (piuo *ProjectImageUpdateOne) SetNillableHeight(i *int) *ProjectImageUpdateOne {
+	if i != nil {
+		piuo.SetHeight(*i)
+	}
+	return piuo
+}
+
+// AddHeight adds i to the "height" field.
+func (piuo *ProjectImageUpdateOne) AddHeight(i int) *ProjectImageUpdateOne {
+	piuo.mutation.AddHeight(i)
+	return piuo
+}
+
+// ClearHeight clears the value of the "height" field.
+func (piuo *ProjectImageUpdateOne) ClearHeight() *ProjectImageUpdateOne {
+	piuo.mutation.ClearHeight()
+	return piuo
+}
+
+// SetBlurhash sets the "blurhash" field.
+func (piuo *ProjectImageUpdateOne) SetBlurhash(s string) *ProjectImageUpdateOne {
+	piuo.mutation.SetBlurhash(s)
+	return piuo
+}
+
+// SetNillableBlurhash sets the "blurhash" field if the given value is not nil.
+func (piuo *ProjectImageUpdateOne) SetNillableBlurhash(s *string) *ProjectImageUpdateOne {
+	if s != nil {
+		piuo.SetBlurhash(*s)
+	}
+	return piuo
+}
+
+// ClearBlurhash clears the value of the "blurhash" field.
+func (piuo *ProjectImageUpdateOne) ClearBlurhash() *ProjectImageUpdateOne {
+	piuo.mutation.ClearBlurhash()
+	return piuo
+}
+
+// SetDerivatives sets the "derivatives" field.
+func (piuo *ProjectImageUpdateOne) SetDerivatives(m []map[string]interface{}) *ProjectImageUpdateOne {
+	piuo.mutation.SetDerivatives(m)
+	return piuo
+}
+
+// AppendDerivatives appends m to the "derivatives" field.
+func (piuo *ProjectImageUpdateOne) AppendDerivatives(m []map[string]interface{}) *ProjectImageUpdateOne {
+	piuo.mutation.AppendDerivatives(m)
+	return piuo
+}
+
+// ClearDerivatives clears the value of the "derivatives" field.
+func (piuo *ProjectImageUpdateOne) ClearDerivatives() *ProjectImageUpdateOne {
+	piuo.mutation.ClearDerivatives()
+	return piuo
+}
+
 // SetProject sets the "project" edge to the Project entity.
 func (piuo *ProjectImageUpdateOne) SetProject(p *Project) *ProjectImageUpdateOne {
 	return piuo.SetProjectID(p.ID)
@@ -626,6 +902,16 @@ func (piuo *ProjectImageUpdateOne) check() error {
 			return &ValidationError{Name: "image_type", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.image_type": %w`, err)}
 		}
 	}
+	if v, ok := piuo.mutation.ContentHash(); ok {
+		if err := projectimage.ContentHashValidator(v); err != nil {
+			return &ValidationError{Name: "content_hash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.content_hash": %w`, err)}
+		}
+	}
+	if v, ok := piuo.mutation.Blurhash(); ok {
+		if err := projectimage.BlurhashValidator(v); err != nil {
+			return &ValidationError{Name: "blurhash", err: fmt.Errorf(`ent: validator failed for field "ProjectImage.blurhash": %w`, err)}
+		}
+	}
 	if piuo.mutation.ProjectCleared() && len(piuo.mutation.ProjectIDs()) > 0 {
 		return errors.New(`ent: clearing a required unique edge "ProjectImage.project"`)
 	}
@@ -691,6 +977,47 @@ func (piuo *ProjectImageUpdateOne) sqlSave(ctx context.Context) (_node *ProjectI
 	if value, ok := piuo.mutation.UpdatedAt(); ok {
 		_spec.SetField(projectimage.FieldUpdatedAt, field.TypeTime, value)
 	}
+	if value, ok := piuo.mutation.ContentHash(); ok {
+		_spec.SetField(projectimage.FieldContentHash, field.TypeString, value)
+	}
+	if piuo.mutation.ContentHashCleared() {
+		_spec.ClearField(projectimage.FieldContentHash, field.TypeString)
+	}
+	if value, ok := piuo.mutation.Width(); ok {
+		_spec.SetField(projectimage.FieldWidth, field.TypeInt, value)
+	}
+	if value, ok := piuo.mutation.AddedWidth(); ok {
+		_spec.AddField(projectimage.FieldWidth, field.TypeInt, value)
+	}
+	if piuo.mutation.WidthCleared() {
+		_spec.ClearField(projectimage.FieldWidth, field.TypeInt)
+	}
+	if value, ok := piuo.mutation.Height(); ok {
+		_spec.SetField(projectimage.FieldHeight, field.TypeInt, value)
+	}
+	if value, ok := piuo.mutation.AddedHeight(); ok {
+		_spec.AddField(projectimage.FieldHeight, field.TypeInt, value)
+	}
+	if piuo.mutation.HeightCleared() {
+		_spec.ClearField(projectimage.FieldHeight, field.TypeInt)
+	}
+	if value, ok := piuo.mutation.Blurhash(); ok {
+		_spec.SetField(projectimage.FieldBlurhash, field.TypeString, value)
+	}
+	if piuo.mutation.BlurhashCleared() {
+		_spec.ClearField(projectimage.FieldBlurhash, field.TypeString)
+	}
+	if value, ok := piuo.mutation.Derivatives(); ok {
+		_spec.SetField(projectimage.FieldDerivatives, field.TypeJSON, value)
+	}
+	if value, ok := piuo.mutation.AppendedDerivatives(); ok {
+		_spec.AddModifier(func(u *sql.UpdateBuilder) {
+			sqljson.Append(u, projectimage.FieldDerivatives, value)
+		})
+	}
+	if piuo.mutation.DerivativesCleared() {
+		_spec.ClearField(projectimage.FieldDerivatives, field.TypeJSON)
+	}
 	if piuo.mutation.ProjectCleared() {
 		edge := &sqlgraph.EdgeSpec{
 			Rel:     sqlgraph.M2O,
@@ -1214,6 +1214,14 @@ func init() {
 	projectimage.DefaultUpdatedAt = projectimageDescUpdatedAt.Default.(func() time.Time)
 	// projectimage.UpdateDefaultUpdatedAt holds the default value on update for the updated_at field.
 	projectimage.UpdateDefaultUpdatedAt = projectimageDescUpdatedAt.UpdateDefault.(func() time.Time)
+	// projectimageDescContentHash is the schema descriptor for content_hash field.
+	projectimageDescContentHash := projectimageFields[9].Descriptor()
+	// projectimage.ContentHashValidator is a validator for the "content_hash" field. It is called by the builders before save.
+	projectimage.ContentHashValidator = projectimageDescContentHash.Validators[0].(func(string) error)
+	// projectimageDescBlurhash is the schema descriptor for blurhash field.
+	projectimageDescBlurhash := projectimageFields[12].Descriptor()
+	// projectimage.BlurhashValidator is a validator for the "blurhash" field. It is called by the builders before save.
+	projectimage.BlurhashValidator = projectimageDescBlurhash.Validators[0].(func(string) error)
 	// projectimageDescID is the schema descriptor for id field.
 	projectimageDescID := projectimageFields[0].Descriptor()
 	// projectimage.DefaultID holds the default value on creation for the id field.
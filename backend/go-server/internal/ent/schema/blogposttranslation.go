@@ -44,6 +44,11 @@ func (BlogPostTranslation) Fields() []ent.Field {
 		field.Time("created_at").
 			Default(time.Now).
 			Immutable(),
+		// Rendered from the markdown content at sync time
+		field.Text("content_html").
+			Optional(),
+		field.JSON("toc", []map[string]interface{}{}).
+			Optional(),
 	}
 }
 
@@ -55,6 +55,11 @@ func (ProjectDetail) Fields() []ent.Field {
 		field.Time("updated_at").
 			Default(time.Now).
 			UpdateDefault(time.Now),
+		// Rendered from the markdown content at sync time
+		field.Text("content_html").
+			Optional(),
+		field.JSON("toc", []map[string]interface{}{}).
+			Optional(),
 	}
 }
 
@@ -50,6 +50,19 @@ func (ProjectImage) Fields() []ent.Field {
 		field.Time("updated_at").
 			Default(time.Now).
 			UpdateDefault(time.Now),
+		// Derivative metadata filled by the optional image stage of db-sync
+		field.String("content_hash").
+			Optional().
+			MaxLen(64),
+		field.Int("width").
+			Optional(),
+		field.Int("height").
+			Optional(),
+		field.String("blurhash").
+			Optional().
+			MaxLen(100),
+		field.JSON("derivatives", []map[string]interface{}{}).
+			Optional(),
 	}
 }
 
@@ -110,5 +110,7 @@ func (l *GetBlogPostByIdLogic) GetBlogPostById(req *types.BlogByIdRequest) (resp
 		SeriesDescription: seriesDescription,
 		EpisodeNumber:     episodeNumber,
 		TotalEpisodes:     totalEpisodes,
+		ContentHTML:       post.ContentHTML,
+		Toc:               types.NewTocEntries(post.Toc),
 	}, nil
 }
@@ -103,5 +103,7 @@ func (l *GetBlogPostLogic) GetBlogPost(req *types.BlogRequest) (resp *types.Blog
 		SeriesDescription: seriesDescription,
 		EpisodeNumber:     episodeNumber,
 		TotalEpisodes:     totalEpisodes,
+		ContentHTML:       post.ContentHTML,
+		Toc:               types.NewTocEntries(post.Toc),
 	}, nil
 }
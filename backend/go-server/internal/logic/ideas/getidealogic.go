@@ -158,5 +158,7 @@ func (l *GetIdeaLogic) GetIdea(req *types.IdeaRequest) (resp *types.IdeaData, er
 		Keywords:             keywords,
 		EstimatedDuration:    estimatedDuration,
 		FundingStatus:        requiredResources,
+		ContentHTML:          ideaEntity.ContentHTML,
+		Toc:                  types.NewTocEntries(ideaEntity.Toc),
 	}, nil
 }
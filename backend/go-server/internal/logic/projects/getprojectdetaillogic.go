@@ -77,6 +77,8 @@ func (l *GetProjectDetailLogic) GetProjectDetail(req *types.ProjectDetailRequest
 	var detailID string
 	var detailedDescription, goals, challenges, solutions, lessonsLearned, futureEnhancements, license, version string
 	var createdAt, updatedAt string
+	var contentHTML string
+	var toc []types.TocEntry
 
 	if proj.Edges.Details != nil {
 		detail := proj.Edges.Details
@@ -89,6 +91,8 @@ func (l *GetProjectDetailLogic) GetProjectDetail(req *types.ProjectDetailRequest
 		futureEnhancements = detail.FutureEnhancements
 		license = detail.License
 		version = detail.Version
+		contentHTML = detail.ContentHTML
+		toc = types.NewTocEntries(detail.Toc)
 		createdAt = detail.CreatedAt.Format("2006-01-02 15:04:05")
 		updatedAt = detail.UpdatedAt.Format("2006-01-02 15:04:05")
 	} else {
@@ -115,6 +119,8 @@ func (l *GetProjectDetailLogic) GetProjectDetail(req *types.ProjectDetailRequest
 		Timeline:            timeline,
 		Metrics:             metrics,
 		RelatedBlogs:        []types.ProjectBlogRef{}, // This would need to be implemented
+		ContentHTML:         contentHTML,
+		Toc:                 toc,
 		CreatedAt:           createdAt,
 		UpdatedAt:           updatedAt,
 	}, nil
@@ -0,0 +1,20 @@
+package types
+
+// NewTocEntries converts a table of contents stored by the sync into API entries
+func NewTocEntries(toc []map[string]interface{}) []TocEntry {
+	entries := make([]TocEntry, 0, len(toc))
+	for _, item := range toc {
+		var entry TocEntry
+		// JSON columns decode numbers as float64
+		switch level := item["level"].(type) {
+		case float64:
+			entry.Level = int(level)
+		case int:
+			entry.Level = level
+		}
+		entry.ID, _ = item["id"].(string)
+		entry.Title, _ = item["title"].(string)
+		entries = append(entries, entry)
+	}
+	return entries
+}
@@ -93,6 +93,8 @@ type BlogData struct {
 	EpisodeNumber       int           `json:"episode_number,omitempty"`
 	TotalEpisodes       int           `json:"total_episodes,omitempty"`
 	SeriesImage         string        `json:"series_image,omitempty"`
+	ContentHTML         string        `json:"content_html,omitempty"`
+	Toc                 []TocEntry    `json:"toc,omitempty"`
 }
 
 type BlogListRequest struct {
@@ -311,6 +313,8 @@ type IdeaData struct {
 	Keywords             []string             `json:"keywords,omitempty"`
 	EstimatedDuration    string               `json:"estimated_duration,omitempty"`
 	FundingStatus        string               `json:"funding_status,omitempty"`
+	ContentHTML          string               `json:"content_html,omitempty"`
+	Toc                  []TocEntry           `json:"toc,omitempty"`
 }
 
 type IdeaListRequest struct {
@@ -433,6 +437,8 @@ type ProjectDetail struct {
 	Timeline            ProjectTimeline  `json:"timeline"`
 	Metrics             ProjectMetrics   `json:"metrics"`
 	RelatedBlogs        []ProjectBlogRef `json:"related_blogs"`
+	ContentHTML         string           `json:"content_html,omitempty"`
+	Toc                 []TocEntry       `json:"toc,omitempty"`
 	CreatedAt           string           `json:"created_at"`
 	UpdatedAt           string           `json:"updated_at"`
 }
@@ -620,6 +626,12 @@ type SocialLink struct {
 	SortOrder   int    `json:"sort_order"`
 }
 
+type TocEntry struct {
+	Level int    `json:"level"`
+	ID    string `json:"id"`
+	Title string `json:"title"`
+}
+
 type UpdateBlogLikesRequest struct {
 	ID        string `path:"id"`
 	Increment bool   `json:"increment,default=true"`